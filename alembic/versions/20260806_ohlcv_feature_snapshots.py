@@ -0,0 +1,77 @@
+"""Add the ohlcv_feature_snapshots read model.
+
+One row per (market, symbol, period) holding the latest indicator vector
+computed from closed bars. Additive only; the daily candle sync fills it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20260806_ohlcv_features"
+down_revision: str | Sequence[str] | None = "20260805_toss_merge"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "ohlcv_feature_snapshots"
+
+
+def upgrade() -> None:
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("market", sa.String(8), nullable=False),
+        sa.Column("symbol", sa.String(32), nullable=False),
+        sa.Column("period", sa.String(8), nullable=False),
+        sa.Column("bar_time", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("bars_used", sa.Integer(), nullable=False),
+        sa.Column("close", sa.Numeric(20, 6), nullable=False),
+        sa.Column("features", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "computed_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "market",
+            "symbol",
+            "period",
+            name="uq_ohlcv_feature_snapshots_market_symbol_period",
+        ),
+        sa.CheckConstraint(
+            "market IN ('kr', 'us', 'crypto')",
+            name="ck_ohlcv_feature_snapshots_market",
+        ),
+        sa.CheckConstraint(
+            "period IN ('day')",
+            name="ck_ohlcv_feature_snapshots_period",
+        ),
+    )
+    op.create_index(
+        "ix_ohlcv_feature_snapshots_market_period_bar",
+        _TABLE,
+        ["market", "period", "bar_time"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ohlcv_feature_snapshots_market_period_bar", table_name=_TABLE)
+    op.drop_table(_TABLE)
@@ -29,6 +29,8 @@ import time
 from collections import deque
 from collections.abc import Awaitable, Callable
 
+from app.monitoring.metrics import RATE_LIMITER_WAIT_SECONDS
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,6 +131,7 @@ class AsyncSlidingWindowRateLimiter:
                     if wait_time > 0:
                         self._throttled_requests += 1
                         self._total_wait_time += wait_time
+                        RATE_LIMITER_WAIT_SECONDS.labels(self.name).observe(wait_time)
 
                         logger.warning(
                             "[%s] Rate limit reached (%d/%.1fs), waiting %.3fs",
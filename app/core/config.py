@@ -97,6 +97,7 @@ DEFAULT_UPBIT_API_RATE_LIMITS: ApiRateLimitMap = {
     "GET /v1/accounts": {"rate": 30, "period": 1.0},
     "GET /v1/order": {"rate": 30, "period": 1.0},
     "GET /v1/orders/closed": {"rate": 30, "period": 1.0},
+    "GET /v1/orderbook": {"rate": 10, "period": 1.0},
     "GET /v1/ticker": {"rate": 10, "period": 1.0},
 }
 
@@ -316,6 +317,22 @@ class Settings(BaseSettings):
     invest_quotes_toss_first_kr: bool = False
     invest_quotes_toss_first_us: bool = False
 
+    # Conditional-GET layer for the /invest/api read endpoints. ETag/304 and
+    # gzip are always on; the Redis body cache (keyed by user, params and the
+    # snapshot/ingestion watermark) is opt-in and fail-open. Its TTL bounds the
+    # staleness of the live parts of a view (holdings, quotes) between polls.
+    invest_api_body_cache_enabled: bool = False
+    invest_api_body_cache_ttl_seconds: int = 15
+    invest_api_gzip_min_bytes: int = 1024
+
+    # Shared last-price snapshot for portfolio views (process-local). Within
+    # the TTL every view reuses one quote per (market, symbol); 0 disables
+    # reuse while concurrent reads of a symbol are still coalesced. KIS and
+    # Yahoo quotes are per-symbol calls, bounded per provider.
+    last_price_snapshot_ttl_seconds: float = 5.0
+    last_price_kis_concurrency: int = 8
+    last_price_yahoo_concurrency: int = 8
+
     # ROB-576 — Toss fill notifications are inert until explicitly enabled by
     # the operator. Toss auto-reconcile gates live with the task flags below.
     toss_fill_notify_enabled: bool = False
@@ -409,6 +426,25 @@ class Settings(BaseSettings):
     naver_peer_cache_enabled: bool = True
     naver_peer_cache_ttl_seconds: int = 600
 
+    # TvScreener stock capability matrix persisted in Redis per (screener
+    # class, market, tvscreener version). Entries older than the TTL are still
+    # served and re-probed in the background. Forced off in tests.
+    tvscreener_capability_cache_enabled: bool = True
+    tvscreener_capability_ttl_seconds: int = 86400
+    tvscreener_capability_probe_concurrency: int = 4
+
+    # Precomputed exchange-calendar session index artifact
+    # (market_events.session_index). Created owner-only (0700); a directory
+    # other users can write to is ignored. Unset = XDG cache dir
+    # ($XDG_CACHE_HOME or ~/.cache)/auto_trader/session_index.
+    session_index_artifact_dir: str | None = None
+
+    # Conditional-request (ETag/Last-Modified) revalidation for the rarely
+    # changing Naver HTML pages (sector members, report bodies, company
+    # overview). Process-local LRU; a 304 reuses the stored body.
+    naver_page_revalidate_enabled: bool = True
+    naver_page_cache_max_entries: int = 512
+
     # API Rate Limit Retry Settings (429 handling)
     api_rate_limit_retry_429_max: int = 2  # 429 에러 시 최대 재시도 횟수
     api_rate_limit_retry_429_base_delay: float = 0.2  # 지수 백오프 기본 대기 시간 (초)
@@ -618,6 +654,15 @@ class Settings(BaseSettings):
     # Monitoring test route exposure
     EXPOSE_MONITORING_TEST_ROUTES: bool = False
 
+    # Prometheus /metrics on the API and MCP servers (404 when disabled). Off by
+    # default; when enabled, scrapes must present metrics_bearer_token (unset =
+    # every scrape is refused). Workers expose the same registry on
+    # metrics_worker_port (unset = no worker exporter). Set
+    # PROMETHEUS_MULTIPROC_DIR to aggregate samples across processes.
+    metrics_enabled: bool = False
+    metrics_bearer_token: str | None = None
+    metrics_worker_port: int | None = None
+
     # External AI agent gateway integration (formerly OpenClaw)
     AGENT_GATEWAY_URL: str = "http://localhost:18789/hooks/agent"
     AGENT_GATEWAY_TOKEN: str = ""
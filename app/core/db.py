@@ -1,17 +1,36 @@
 import os
+import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
+from app.monitoring.metrics import DB_POOL_CHECKOUT_SECONDS
 
 # MCP 서버에서는 stdout 오염 방지를 위해 echo=False 필수
 _echo = os.getenv("SQLALCHEMY_ECHO", "false").lower() in ("true", "1", "yes")
 
 
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time.
+
+    ``_do_get`` is where a checkout blocks on an exhausted pool (up to
+    ``pool_timeout``) or opens a new connection, so timing it measures pool
+    pressure without touching the checkout/return hot path otherwise.
+    ``recreate()`` (``engine.dispose()``) keeps the subclass.
+    """
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+
+
 def build_engine(database_url: str | None = None) -> AsyncEngine:
     """Build the shared async engine.
 
@@ -28,7 +47,8 @@ def build_engine(database_url: str | None = None) -> AsyncEngine:
       DB_POOL_TIMEOUT_S (10)
 
     NOTE: never pass the sync ``QueuePool`` class to an async engine — SQLAlchemy
-    raises ArgumentError. Omitting ``poolclass`` selects AsyncAdaptedQueuePool.
+    raises ArgumentError. The queue path uses ``TimedAsyncAdaptedQueuePool`` (an
+    AsyncAdaptedQueuePool subclass) so checkout waits reach /metrics.
     """
     url = database_url if database_url is not None else settings.DATABASE_URL
     pool_class = os.getenv("DB_POOL_CLASS", "queue").strip().lower()
@@ -40,6 +60,7 @@ def build_engine(database_url: str | None = None) -> AsyncEngine:
         url,
         echo=_echo,
         pool_pre_ping=True,
+        poolclass=TimedAsyncAdaptedQueuePool,
         pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
         max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
         pool_recycle=int(os.getenv("DB_POOL_RECYCLE_S", "1800")),
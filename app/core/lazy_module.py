@@ -0,0 +1,43 @@
+"""Deferred third-party module imports.
+
+``LazyModule("yfinance")`` stands in for ``import yfinance as yf`` at module
+scope: the real import happens on first attribute access, so importing a
+module that only *references* a heavy dependency (e.g. to register MCP tools)
+does not pay for it. Attribute writes and deletes are forwarded to the real
+module, so ``patch("pkg.mod.yf.Ticker")`` behaves exactly as it did against
+the eagerly imported module.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_module", None)
+
+    def _load(self) -> ModuleType:
+        module = self._lazy_module
+        if module is None:
+            module = import_module(self._lazy_name)
+            object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "deferred"
+        return f"<LazyModule {self._lazy_name!r} ({state})>"
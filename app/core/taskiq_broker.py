@@ -1,6 +1,7 @@
 import logging
+from typing import Any
 
-from taskiq import TaskiqMiddleware
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
 from taskiq.middlewares import SmartRetryMiddleware
 from taskiq_redis import (
     ListQueueBroker,
@@ -10,6 +11,7 @@ from taskiq_redis import (
 
 from app.core.config import settings
 from app.core.logging_config import configure_dependency_log_levels
+from app.monitoring.metrics import TASKIQ_JOB_SECONDS, start_worker_metrics_server
 from app.monitoring.sentry import init_sentry
 from app.monitoring.trade_notifier.runtime import configure_trade_notifier_from_settings
 
@@ -28,12 +30,23 @@ class WorkerInitMiddleware(TaskiqMiddleware):
             )
 
             configure_trade_notifier_from_settings(log_context="Worker trade notifier")
+            start_worker_metrics_server(settings.metrics_worker_port)
             return
 
         if getattr(self.broker, "is_scheduler_process", False):
             init_sentry(service_name="auto-trader-scheduler")
 
 
+class TaskMetricsMiddleware(TaskiqMiddleware):
+    """Record each task's execution time (as measured by taskiq) per task name."""
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        outcome = type(result.error).__name__ if result.is_err else "ok"
+        TASKIQ_JOB_SECONDS.labels(message.task_name, outcome).observe(
+            result.execution_time
+        )
+
+
 result_backend = RedisAsyncResultBackend(
     redis_url=settings.get_redis_url(),
     result_ex_time=3600,
@@ -51,6 +64,7 @@ broker = (
     .with_result_backend(result_backend)
     .with_middlewares(
         WorkerInitMiddleware(),
+        TaskMetricsMiddleware(),
         SmartRetryMiddleware(
             default_retry_label=False,
             default_retry_count=3,
@@ -50,6 +50,7 @@ from app.routers import (
     investment_stage_runs,
     kospi200,
     market_events,
+    metrics,
     news_analysis,
     news_issues,
     news_radar,
@@ -179,6 +180,7 @@ def create_app() -> FastAPI:
     app.include_router(admin_router)
     app.include_router(screener.router)
     app.include_router(health.router)
+    app.include_router(metrics.router)
     app.include_router(news_analysis.router)
     app.include_router(agent_callback.router)
     app.include_router(user_defaults.router)
@@ -16,7 +16,7 @@ from typing import TYPE_CHECKING
 
 from fastmcp.server.lifespan import lifespan as fastmcp_lifespan
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from app.core.config import settings
 from app.mcp_server.env_utils import (
@@ -25,6 +25,7 @@ from app.mcp_server.env_utils import (
     get_mcp_heartbeat_path,
 )
 from app.mcp_server.heartbeat import heartbeat_loop
+from app.monitoring.metrics import render_latest, scrape_authorized
 from app.monitoring.trade_notifier.runtime import (
     configure_trade_notifier_from_settings,
     shutdown_trade_notifier,
@@ -65,6 +66,23 @@ def register_health_route(
         )
 
 
+def register_metrics_route(mcp: FastMCP) -> None:
+    """Register GET /metrics (Prometheus exposition) next to /health.
+
+    Like /health it sits outside the /mcp auth wrapper; ``metrics_enabled``
+    and ``metrics_bearer_token`` (required, fails closed) gate it instead.
+    """
+
+    @mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        if not settings.metrics_enabled:
+            return Response(status_code=404)
+        if not scrape_authorized(request.headers.get("authorization")):
+            return Response(status_code=401)
+        body, content_type = render_latest()
+        return Response(body, media_type=content_type)
+
+
 def build_server_lifespan(*, service: str = "auto-trader-mcp"):
     """Build a FastMCP lifespan that logs startup-complete and shutdown.
 
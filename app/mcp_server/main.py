@@ -42,7 +42,9 @@ from app.mcp_server.caller_identity_middleware import (  # noqa: E402
 from app.mcp_server.lifecycle import (  # noqa: E402
     build_server_lifespan,
     register_health_route,
+    register_metrics_route,
 )
+from app.mcp_server.metrics_middleware import McpToolMetricsMiddleware  # noqa: E402
 from app.mcp_server.sentry_middleware import McpToolCallSentryMiddleware  # noqa: E402
 from app.mcp_server.timeout_middleware import ToolTimeoutMiddleware  # noqa: E402
 from app.mcp_server.tooling import register_all_tools  # noqa: E402
@@ -172,6 +174,8 @@ mcp = FastMCP(
 # consumer before the request-scoped contextvars are reset.
 mcp.add_middleware(CallerIdentityMiddleware())
 mcp.add_middleware(McpToolCallSentryMiddleware())
+# Latency is observed outside the timeout so timed-out calls are counted too.
+mcp.add_middleware(McpToolMetricsMiddleware())
 # ROB-469 PR2: per-tool timeout — added LAST so it is the INNERMOST middleware
 # (wraps the tool) while Sentry still wraps timeout execution and captures the
 # ToolError with caller/tool context. Bounds the single event loop so one slow
@@ -186,6 +190,7 @@ register_all_tools(mcp, profile=_mcp_profile)
 # ROB-469: unauthenticated, dependency-free liveness probe for HAProxy / native
 # healthcheck / docker healthcheck. Registered after tools so the count is final.
 register_health_route(mcp, version="0.1.0")
+register_metrics_route(mcp)
 
 
 def _validate_caller_agent_id_fallback(mcp_type: str) -> None:
@@ -0,0 +1,62 @@
+"""Prometheus latency middleware for MCP tool calls."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from fastmcp.server.middleware import Middleware
+
+from app.monitoring.metrics import MCP_TOOL_SECONDS
+
+if TYPE_CHECKING:
+    import mcp.types as mt
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+    from fastmcp.tools.tool import ToolResult
+
+# Label for calls naming a tool the server does not register, so client-chosen
+# names never become label values.
+UNREGISTERED_TOOL_LABEL = "unregistered"
+
+
+class McpToolMetricsMiddleware(Middleware):
+    """Observe ``tools/call`` latency per tool into ``MCP_TOOL_SECONDS``.
+
+    ``outcome`` is ``ok`` or the raised exception class name (``ToolError`` for
+    timeouts converted by ``ToolTimeoutMiddleware``). The ``tool`` label is the
+    called name only when the server registers it; the registered names are
+    read once, on the first call, since registration finishes at boot.
+    """
+
+    def __init__(self) -> None:
+        self._tool_names: frozenset[str] | None = None
+
+    async def _tool_label(
+        self, context: MiddlewareContext[mt.CallToolRequestParams]
+    ) -> str:
+        if self._tool_names is None:
+            fastmcp_context = context.fastmcp_context
+            if fastmcp_context is None:
+                return UNREGISTERED_TOOL_LABEL
+            tools = await fastmcp_context.fastmcp.list_tools(run_middleware=False)
+            self._tool_names = frozenset(tool.name for tool in tools)
+        name = context.message.name
+        return name if name in self._tool_names else UNREGISTERED_TOOL_LABEL
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        tool = await self._tool_label(context)
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            return await call_next(context)
+        except BaseException as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            MCP_TOOL_SECONDS.labels(tool, outcome).observe(
+                time.perf_counter() - started
+            )
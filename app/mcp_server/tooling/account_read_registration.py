@@ -4,42 +4,34 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from app.mcp_server.tooling.analysis_artifact_registration import (
-    ANALYSIS_ARTIFACT_TOOL_NAMES,
-)
-from app.mcp_server.tooling.analysis_readonly_registration import _AllowlistedMCP
-from app.mcp_server.tooling.forecast_registration import FORECAST_TOOL_NAMES
+from app.mcp_server.tooling.allowlist import _AllowlistedMCP
 from app.mcp_server.tooling.orders_kis_variants import (
-    KIS_LIVE_ORDER_TOOL_NAMES,
-    KIS_MOCK_ORDER_TOOL_NAMES,
-    LIVE_RECONCILE_TOOL_NAMES,
     register_kis_live_order_tools,
 )
-from app.mcp_server.tooling.orders_kiwoom_us_variants import (
-    KIWOOM_MOCK_US_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kiwoom_variants import (
-    KIWOOM_MOCK_TOOL_NAMES,
-)
 from app.mcp_server.tooling.orders_kiwoom_variants import (
     register as register_kiwoom_mock_tools,
 )
 from app.mcp_server.tooling.orders_registration import (
-    ORDER_TOOL_NAMES,
     register_order_tools,
 )
 from app.mcp_server.tooling.orders_toss_variants import (
-    TOSS_LIVE_ORDER_TOOL_NAMES,
     register_toss_live_order_tools,
 )
-from app.mcp_server.tooling.paper_limit_order_handler import (
-    PAPER_LIMIT_ORDER_TOOL_NAMES,
-)
 from app.mcp_server.tooling.portfolio_registration import register_portfolio_tools
-from app.mcp_server.tooling.session_context_registration import (
+from app.mcp_server.tooling.tool_names import (
+    ANALYSIS_ARTIFACT_TOOL_NAMES,
+    FORECAST_TOOL_NAMES,
+    KIS_LIVE_ORDER_TOOL_NAMES,
+    KIS_MOCK_ORDER_TOOL_NAMES,
+    KIWOOM_MOCK_TOOL_NAMES,
+    KIWOOM_MOCK_US_TOOL_NAMES,
+    LIVE_RECONCILE_TOOL_NAMES,
+    ORDER_TOOL_NAMES,
+    PAPER_LIMIT_ORDER_TOOL_NAMES,
     SESSION_CONTEXT_TOOL_NAMES,
+    TOSS_LIVE_ORDER_TOOL_NAMES,
+    USER_SETTINGS_TOOL_NAMES,
 )
-from app.mcp_server.tooling.user_settings_registration import USER_SETTINGS_TOOL_NAMES
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
@@ -13,6 +13,9 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 
+from app.mcp_server.tooling.tool_names import (
+    ALPACA_PAPER_READONLY_TOOL_NAMES,
+)
 from app.services.alpaca_paper_account_modes import (
     ALPACA_PAPER_ACCOUNT_MODE,
     normalize_alpaca_paper_account_mode,
@@ -24,22 +27,6 @@ if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-ALPACA_PAPER_READONLY_TOOL_NAMES: set[str] = {
-    "alpaca_paper_get_account",
-    "alpaca_paper_get_cash",
-    "alpaca_paper_list_positions",
-    "alpaca_paper_list_orders",
-    "alpaca_paper_get_order",
-    "alpaca_paper_list_assets",
-    "alpaca_paper_list_fills",
-    # ROB-84/ROB-90/ROB-92/ROB-93 ledger read and anomaly preflight tools
-    "alpaca_paper_ledger_list_recent",
-    "alpaca_paper_ledger_get",
-    "alpaca_paper_ledger_get_by_correlation",
-    "alpaca_paper_roundtrip_report",
-    "alpaca_paper_execution_preflight_check",
-}
-
 ServiceFactory = Callable[[], AlpacaPaperBrokerService]
 
 
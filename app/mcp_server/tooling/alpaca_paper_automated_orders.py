@@ -34,6 +34,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.db import AsyncSessionLocal
 from app.mcp_server.tooling.alpaca_paper_preview import PreviewOrderInput
+from app.mcp_server.tooling.tool_names import (
+    ALPACA_PAPER_AUTOMATED_TOOL_NAMES,
+)
 from app.services.alpaca_paper_order_application import AlpacaPaperOrderApplication
 from app.services.alpaca_paper_submit_service import (
     build_canonical_payload,
@@ -43,11 +46,6 @@ from app.services.brokers.alpaca.service import AlpacaPaperBrokerService
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-ALPACA_PAPER_AUTOMATED_TOOL_NAMES: set[str] = {
-    "alpaca_paper_automated_preview_order",
-    "alpaca_paper_automated_submit_order",
-}
-
 DEFAULT_PREVIEW_TTL_SECONDS = 300
 
 SessionFactory = Callable[[], async_sessionmaker[AsyncSession]]
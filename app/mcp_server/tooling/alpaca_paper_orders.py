@@ -26,6 +26,9 @@ from app.mcp_server.tooling.alpaca_paper_preview import (
     ALPACA_PAPER_CRYPTO_MAX_NOTIONAL_USD,
     PreviewOrderInput,
 )
+from app.mcp_server.tooling.tool_names import (
+    ALPACA_PAPER_MUTATING_TOOL_NAMES,
+)
 from app.services.alpaca_paper_account_modes import (
     ALPACA_PAPER_ACCOUNT_MODE,
     ALPACA_PAPER_LAB_ACCOUNT_MODE,
@@ -43,7 +46,10 @@ from app.services.alpaca_paper_market_evidence import (
     MarketEvidenceError,
     load_market_evidence,
 )
-from app.services.alpaca_paper_reconcile_service import AlpacaPaperReconcileService
+from app.services.alpaca_paper_reconcile_service import (
+    AlpacaPaperReconcileService,
+    FillActivityWatermark,
+)
 from app.services.alpaca_paper_submit_service import (
     AlpacaPaperSubmitCoordinator,
     build_canonical_payload,
@@ -58,12 +64,6 @@ if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-ALPACA_PAPER_MUTATING_TOOL_NAMES: set[str] = {
-    "alpaca_paper_submit_order",
-    "alpaca_paper_cancel_order",
-    "alpaca_paper_reconcile_orders",
-}
-
 SUBMIT_MAX_QTY: Decimal = Decimal("5")
 SUBMIT_MAX_NOTIONAL_USD: Decimal = Decimal("1000")
 ORDER_ID_SAFE_SEGMENT_RE = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
@@ -85,6 +85,10 @@ def _default_session_factory() -> async_sessionmaker[AsyncSession]:
 
 _service_factory: ServiceFactory = _default_service_factory
 _session_factory: SessionFactory = _default_session_factory
+# Per-account FILL activity memo so repeated reconciles only page new fills.
+# Keyed by normalized account mode (a fixed set); each memo is capped at the
+# reconcile fill window.
+_fill_watermarks: dict[str, FillActivityWatermark] = {}
 
 
 def set_alpaca_paper_orders_session_factory(factory: SessionFactory) -> None:
@@ -115,6 +119,13 @@ def _service_for_account_mode(account_mode: str) -> AlpacaPaperBrokerService:
     return AlpacaPaperBrokerService(profile=profile)
 
 
+def _fill_watermark_for(account_mode: str) -> FillActivityWatermark | None:
+    # Injected (test/fake) brokers never share a memo with the real account.
+    if _service_factory is not _default_service_factory:
+        return None
+    return _fill_watermarks.setdefault(account_mode, FillActivityWatermark())
+
+
 def _model_to_jsonable(value: Any) -> Any:
     if isinstance(value, BaseModel):
         return value.model_dump(mode="json", by_alias=True)
@@ -516,6 +527,7 @@ async def alpaca_paper_reconcile_orders(
         reconcile = AlpacaPaperReconcileService(
             AlpacaPaperLedgerService(db, account_mode=selected_account_mode),
             _service_for_account_mode(selected_account_mode),
+            fill_watermark=_fill_watermark_for(selected_account_mode),
         )
         result = await reconcile.reconcile(
             symbol=clean_symbol,
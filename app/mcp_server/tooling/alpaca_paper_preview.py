@@ -14,6 +14,9 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, field_validator, model_validator
 
+from app.mcp_server.tooling.tool_names import (
+    ALPACA_PAPER_PREVIEW_TOOL_NAMES,
+)
 from app.services.alpaca_paper_account_modes import (
     ALPACA_PAPER_ACCOUNT_MODE,
     ALPACA_PAPER_LAB_ACCOUNT_MODE,
@@ -31,7 +34,6 @@ from app.services.brokers.alpaca.service import AlpacaPaperBrokerService
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-ALPACA_PAPER_PREVIEW_TOOL_NAMES: set[str] = {"alpaca_paper_preview_order"}
 ALPACA_PAPER_CRYPTO_ALLOWED_SYMBOLS: frozenset[str] = frozenset(
     {
         "BTC/USD",
@@ -3,14 +3,14 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 import sentry_sdk
-import yfinance as yf
 
 from app.core import analyze_cache
+from app.core.lazy_module import LazyModule
 from app.core.timezone import now_kst
 from app.mcp_server.tooling.fundamentals_sources_finnhub import (
     _fetch_company_profile_finnhub,
@@ -72,6 +72,11 @@ DEFAULT_ANALYZE_STOCK_INDICATORS: tuple[str, ...] = (
     "stoch_rsi",
 )
 
+if TYPE_CHECKING:
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 
 async def _get_quote_impl(symbol: str, market_type: str) -> dict[str, Any] | None:
     if market_type == "crypto":
@@ -9,18 +9,14 @@ from app.mcp_server.tooling.analysis_artifact_tools import (
     analysis_artifact_list,
     analysis_artifact_save,
 )
+from app.mcp_server.tooling.tool_names import (
+    ANALYSIS_ARTIFACT_TOOL_NAMES,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-ANALYSIS_ARTIFACT_TOOL_NAMES: set[str] = {
-    "analysis_artifact_save",
-    "analysis_artifact_list",
-    "analysis_artifact_get",
-}
-
-
 def register_analysis_artifact_tools(mcp: FastMCP) -> None:
     _ = mcp.tool(
         name="analysis_artifact_save",
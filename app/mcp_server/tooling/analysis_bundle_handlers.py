@@ -8,6 +8,9 @@ from typing import TYPE_CHECKING, Any
 
 from app.core.db import AsyncSessionLocal
 from app.mcp_server.tooling.analysis_tool_handlers import analyze_stock_batch_impl
+from app.mcp_server.tooling.tool_names import (
+    ANALYSIS_BUNDLE_TOOL_NAMES,
+)
 from app.schemas.analysis_snapshot_bundle import AnalysisBundleCreateRequest
 from app.services.action_report.snapshot_backed.collectors.registry import (
     production_collector_registry,
@@ -26,12 +29,6 @@ if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-ANALYSIS_BUNDLE_TOOL_NAMES: set[str] = {
-    "analysis_bundle_create",
-    "analysis_bundle_get",
-}
-
-
 async def analysis_bundle_create_impl(
     market: str,
     account_scope: str | None,
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from typing import Any
-
-import yfinance as yf
+from typing import TYPE_CHECKING, Any
 
 import app.services.brokers.upbit.client as upbit_service
+from app.core.lazy_module import LazyModule
 from app.monitoring import yfinance_tracing_session
 
+if TYPE_CHECKING:
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 
 async def get_us_rankings_impl(
     ranking_type: str,
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from app.core.config import settings
 from app.mcp_server.tooling.account_routing_registration import (
     register_account_routing_tools,
 )
+from app.mcp_server.tooling.allowlist import _AllowlistedMCP
 from app.mcp_server.tooling.analysis_artifact_tools import (
     analysis_artifact_get as _analysis_artifact_get,
 )
@@ -25,23 +25,9 @@ from app.mcp_server.tooling.market_data_registration import register_market_data
 from app.mcp_server.tooling.operating_briefing_registration import (
     register_operating_briefing_tools,
 )
-from app.mcp_server.tooling.orders_kis_variants import (
-    KIS_LIVE_ORDER_TOOL_NAMES,
-    KIS_MOCK_ORDER_TOOL_NAMES,
-    LIVE_RECONCILE_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kiwoom_us_variants import (
-    KIWOOM_MOCK_US_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kiwoom_variants import KIWOOM_MOCK_TOOL_NAMES
-from app.mcp_server.tooling.orders_registration import ORDER_TOOL_NAMES
 from app.mcp_server.tooling.orders_toss_variants import (
-    TOSS_LIVE_ORDER_TOOL_NAMES,
     register_toss_live_order_tools,
 )
-from app.mcp_server.tooling.paper_limit_order_handler import (
-    PAPER_LIMIT_ORDER_TOOL_NAMES,
-)
 from app.mcp_server.tooling.portfolio_registration import register_portfolio_tools
 from app.mcp_server.tooling.route_request_registration import (
     register_route_request_tools,
@@ -52,6 +38,16 @@ from app.mcp_server.tooling.session_context_tools import (
 from app.mcp_server.tooling.session_context_tools import (
     session_context_get_recent as _session_context_get_recent,
 )
+from app.mcp_server.tooling.tool_names import (
+    KIS_LIVE_ORDER_TOOL_NAMES,
+    KIS_MOCK_ORDER_TOOL_NAMES,
+    KIWOOM_MOCK_TOOL_NAMES,
+    KIWOOM_MOCK_US_TOOL_NAMES,
+    LIVE_RECONCILE_TOOL_NAMES,
+    ORDER_TOOL_NAMES,
+    PAPER_LIMIT_ORDER_TOOL_NAMES,
+    TOSS_LIVE_ORDER_TOOL_NAMES,
+)
 from app.mcp_server.tooling.trading_policy_registration import (
     register_trading_policy_tools,
 )
@@ -59,8 +55,6 @@ from app.mcp_server.tooling.trading_policy_registration import (
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-_F = TypeVar("_F", bound=Callable[..., Any])
-
 
 ANALYSIS_READONLY_TOOL_NAMES: set[str] = {
     "get_operating_briefing",
@@ -116,32 +110,6 @@ ANALYSIS_READONLY_FORBIDDEN_TOOL_NAMES: set[str] = (
 )
 
 
-class _AllowlistedMCP:
-    """Proxy that makes existing group registrars physically register only allowed names."""
-
-    def __init__(self, inner: Any, allowed_names: set[str]) -> None:
-        self._inner = inner
-        self._allowed_names = allowed_names
-
-    def tool(self, *args: Any, **kwargs: Any) -> Callable[[_F], _F]:
-        name = kwargs.get("name")
-        if name is None and args:
-            name = args[0]
-        if str(name) in self._allowed_names:
-            return cast(Callable[[_F], _F], self._inner.tool(*args, **kwargs))
-
-        def decorator(func: _F) -> _F:
-            return func
-
-        return decorator
-
-    def list_tools(self) -> Any:
-        lister = getattr(self._inner, "list_tools", None)
-        if lister is None:
-            return []
-        return lister()
-
-
 def _created_by_required(tool_name: str) -> dict[str, Any]:
     return {
         "success": False,
@@ -9,12 +9,13 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import math
 from collections.abc import Callable
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
-import yfinance as yf
 
+from app.core.lazy_module import LazyModule
 from app.mcp_server.tooling import analysis_screening, foreigners_liquidity
 from app.mcp_server.tooling.analysis_screen_core import normalize_screen_request
 from app.mcp_server.tooling.earnings_context import (
@@ -29,6 +30,7 @@ from app.mcp_server.tooling.market_session import (
     DATA_STATE_FRESH,
     kr_market_data_state,
 )
+from app.mcp_server.tooling.return_panel import cached_return_panel
 from app.mcp_server.tooling.shared import (
     is_crypto_market as _is_crypto_market,
 )
@@ -42,6 +44,12 @@ from app.services.market_valuation_snapshots.normalized_market_cap import (
     fetch_normalized_kr_market_caps,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 logger = logging.getLogger(__name__)
 
 # ROB-629: the legacy "foreigners" ranking is split into directional foreign
@@ -507,12 +515,12 @@ async def get_correlation_impl(
     source_map = {"crypto": "upbit", "equity_kr": "kis", "equity_us": "yahoo"}
     errors: list[str] = []
     company_name_validation_errors: list[str] = []
-    price_data: dict[str, list[float]] = {}
+    price_data: dict[str, pd.DataFrame] = {}
     market_types: dict[str, str] = {}
 
     async def fetch_prices(
         symbol: str,
-    ) -> tuple[str | None, str | None, list[float] | None, str | None, bool]:
+    ) -> tuple[str | None, str | None, pd.DataFrame | None, str | None, bool]:
         try:
             market_type, normalized_symbol = _resolve_correlation_symbol_input(symbol)
         except Exception as exc:
@@ -535,8 +543,7 @@ async def get_correlation_impl(
             if "close" not in df.columns:
                 raise ValueError(f"Missing close price data for symbol '{symbol}'")
 
-            prices = df["close"].tolist()
-            return normalized_symbol, market_type, prices, None, False
+            return normalized_symbol, market_type, df, None, False
         except Exception as exc:
             return None, None, None, f"{symbol}: {str(exc)}", False
 
@@ -567,38 +574,22 @@ async def get_correlation_impl(
             ),
         }
 
-    correlation_matrix: list[list[float]] = []
     sorted_symbols = sorted(price_data.keys())
-
-    for i, sym_a in enumerate(sorted_symbols):
-        row: list[float] = []
-        prices_a = price_data[sym_a]
-        min_len = len(prices_a)
-
-        for j, sym_b in enumerate(sorted_symbols):
-            prices_b = price_data[sym_b]
-            actual_len = min(len(prices_b), min_len)
-
-            corr = 0.0
-            if i <= j:
-                truncated_a = prices_a[-actual_len:]
-                truncated_b = prices_b[-actual_len:]
-                corr = (
-                    analysis_screening._calculate_pearson_correlation(
-                        truncated_a, truncated_b
-                    )
-                    if len(truncated_a) >= 2
-                    else 0.0
-                )
-            else:
-                corr = correlation_matrix[j][i]
-
-            row.append(corr)
-        correlation_matrix.append(row)
+    # Returns are correlated on the dates both symbols traded, so crypto and
+    # equity series are never paired across mismatched days.
+    panel = cached_return_panel(
+        {sym: price_data[sym] for sym in sorted_symbols}, period=period
+    )
+    correlation_matrix = [
+        [value if math.isfinite(value) else 0.0 for value in row]
+        for row in panel.correlation.tolist()
+    ]
 
     metadata = {
         "period_days": period,
         "symbols": sorted_symbols,
+        "alignment": "date" if panel.aligned_by_date else "tail",
+        "return_observations": panel.observations.tolist(),
         "market_types": {
             sym: market_types.get(sym, "unknown") for sym in sorted_symbols
         },
@@ -11,13 +11,9 @@ from app.mcp_server.tooling.forecast_tools import (
     get_forecast_calibration,
     get_forecasts,
 )
-
-FORECAST_TOOL_NAMES: set[str] = {
-    "forecast_save",
-    "forecast_resolve",
-    "get_forecasts",
-    "get_forecast_calibration",
-}
+from app.mcp_server.tooling.tool_names import (
+    FORECAST_TOOL_NAMES,
+)
 
 
 def register_forecast_tools(mcp: Any) -> None:
@@ -16,9 +16,8 @@ from app.services.invalid_sample_eligibility.contract import CONTRACT_VERSION
 from app.services.trade_journal.forecast_service import (
     ForecastValidationError,
     build_forecast_calibration_aggregate,
-    list_due_forecasts,
-    list_due_quarantined_forecasts,
     list_forecasts,
+    resolve_due_forecasts,
     resolve_forecast,
     save_forecast,
     serialize_forecast,
@@ -133,18 +132,15 @@ async def forecast_resolve(
                     "success": False,
                     "error": "manual resolution requires an explicit forecast_id",
                 }
-            quarantined = await list_due_quarantined_forecasts(db, limit=limit)
-            due = await list_due_forecasts(db, limit=limit)
+            batch = await resolve_due_forecasts(
+                db,
+                persist=persist,
+                limit=limit,
+                backfill_missing=backfill_missing,
+            )
             results: list[dict[str, Any]] = []
             changed_any = False
-            for row in [*quarantined, *due]:
-                r = await resolve_forecast(
-                    db,
-                    forecast_id=row.forecast_id,
-                    persist=persist,
-                    backfill_missing=backfill_missing,
-                )
-
+            for row, r in batch.results:
                 changed_any = changed_any or bool(r.get("changed"))
                 item: dict[str, Any] = {
                     "forecast_id": str(row.forecast_id),
@@ -167,8 +163,8 @@ async def forecast_resolve(
                 "success": True,
                 "dry_run": dry_run,
                 "mode": "due_batch",
-                "due_count": len(due),
-                "quarantined_count": len(quarantined),
+                "due_count": len(batch.due),
+                "quarantined_count": len(batch.quarantined),
                 "by_status": by_status,
                 "results": results,
             }
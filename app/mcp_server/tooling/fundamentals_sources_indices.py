@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import pandas as pd
-import yfinance as yf
 
+from app.core.lazy_module import LazyModule
 from app.monitoring import yfinance_tracing_session
 from app.services.external.btc_dominance import fetch_btc_dominance
 
+if TYPE_CHECKING:
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 _INDEX_META: dict[str, dict[str, str]] = {
     "KOSPI": {"name": "코스피", "source": "naver", "naver_code": "KOSPI"},
     "KOSDAQ": {"name": "코스닥", "source": "naver", "naver_code": "KOSDAQ"},
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
-import yfinance as yf
 
+from app.core.lazy_module import LazyModule
 from app.mcp_server.tooling.fundamentals_sources_common import (
     _fetch_screen_enrichment_payload,
 )
@@ -27,6 +27,11 @@ from app.services.analyst_normalizer import (
     rating_to_bucket,
 )
 
+if TYPE_CHECKING:
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 
 @dataclass
 class _YFinanceSnapshot:
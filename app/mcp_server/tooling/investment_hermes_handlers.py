@@ -39,6 +39,9 @@ from typing import TYPE_CHECKING, Any
 
 from app.core.config import settings
 from app.core.db import AsyncSessionLocal
+from app.mcp_server.tooling.tool_names import (
+    INVESTMENT_HERMES_TOOL_NAMES,
+)
 from app.schemas.hermes_composition import (
     HermesCompositionIngestRequest,
     HermesCompositionResult,
@@ -48,9 +51,6 @@ from app.schemas.investment_snapshots_mcp import EnsureBundleRequest
 from app.services.action_report.common.snapshot_bundle import (
     SnapshotBundleEnsureService,
 )
-from app.services.action_report.snapshot_backed.collectors.registry import (
-    production_collector_registry,
-)
 from app.services.investment_reports.delta_service import DeltaService
 from app.services.investment_stages.hermes_context import (
     HermesContextExporter,
@@ -65,18 +65,28 @@ from app.services.investment_stages.hermes_ingest import (
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.services.action_report.snapshot_backed.collectors.registry import (
+        SnapshotCollectorRegistry,
+    )
 
 
 logger = logging.getLogger(__name__)
 
 
-INVESTMENT_HERMES_TOOL_NAMES: set[str] = {
-    "investment_report_prepare_bundle",
-    "investment_report_get_hermes_context",
-    "investment_report_create_from_hermes_composition",
-    "investment_stage_artifacts_ingest_from_hermes",
-    "investment_report_prepare_intraday_context",
-}
+def production_collector_registry(db: AsyncSession) -> SnapshotCollectorRegistry:
+    """Build the production collectors, importing their pandas/Naver tree lazily.
+
+    The collector registry is only needed when a bundle is prepared; keeping
+    it out of module import lets read-only profiles (shadow-replay) register
+    ``investment_report_get_hermes_context`` without loading it.
+    """
+    from app.services.action_report.snapshot_backed.collectors.registry import (
+        production_collector_registry as build_registry,
+    )
+
+    return build_registry(db)
 
 
 INTRADAY_UPDATE_REPORT_TYPE = "intraday_update_v1"
@@ -17,6 +17,9 @@ from uuid import UUID
 from pydantic import ValidationError
 
 from app.core.db import AsyncSessionLocal
+from app.mcp_server.tooling.tool_names import (
+    INVESTMENT_REPORT_TOOL_NAMES,
+)
 from app.schemas.investment_reports import (
     ActivateWatchRequest,
     AddReportItemsRequest,
@@ -68,27 +71,6 @@ from app.services.investment_reports.watch_recommendation_policy import (
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-INVESTMENT_REPORT_TOOL_NAMES: set[str] = {
-    "investment_report_create",
-    "investment_report_list",
-    "investment_report_get",
-    "investment_report_decide_item",
-    "investment_report_activate_watch",
-    "investment_report_context_get",
-    "investment_report_delta_get",
-    "investment_report_generate_from_bundle",
-    "investment_watch_recommend",
-    "investment_report_set_status",
-    "investment_report_add_items",
-    "investment_report_update",
-    # ROB-768 — direct watch create (independent of report flow).
-    "investment_watch_create",
-    # ROB-971 — explicit lifecycle controls for operational watch cleanup.
-    "investment_watch_void",
-    "investment_watch_expire",
-    "sweep_expired_watches",
-}
-
 # ROB-352 — mirror of the generator's canonical market/account_scope pairs.
 # A drift-guard test asserts this equals ``generator._MARKET_ACCOUNT_PAIRS``.
 # Kept here as a literal so the handler can fail closed BEFORE importing or
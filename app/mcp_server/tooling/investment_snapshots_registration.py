@@ -16,18 +16,14 @@ from app.mcp_server.tooling.investment_snapshots_tools import (
     investment_snapshot_bundle_list,
     investment_snapshot_list,
 )
+from app.mcp_server.tooling.tool_names import (
+    INVESTMENT_SNAPSHOTS_TOOL_NAMES,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-INVESTMENT_SNAPSHOTS_TOOL_NAMES: set[str] = {
-    "investment_snapshot_bundle_get",
-    "investment_snapshot_bundle_list",
-    "investment_snapshot_list",
-}
-
-
 def register_investment_snapshots_tools(mcp: FastMCP) -> None:
     _ = mcp.tool(
         name="investment_snapshot_bundle_get",
@@ -41,21 +41,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, cast
 
 from app.core.config import settings
-from app.mcp_server.tooling.analysis_bundle_handlers import ANALYSIS_BUNDLE_TOOL_NAMES
-from app.mcp_server.tooling.analysis_readonly_registration import _AllowlistedMCP
-from app.mcp_server.tooling.investment_hermes_handlers import (
-    INVESTMENT_HERMES_TOOL_NAMES,
+from app.mcp_server.tooling.allowlist import _AllowlistedMCP
+from app.mcp_server.tooling.orders_kiwoom_variants import (
+    register as register_kiwoom_mock_tools,
 )
-from app.mcp_server.tooling.investment_snapshots_registration import (
+from app.mcp_server.tooling.tool_names import (
+    ANALYSIS_BUNDLE_TOOL_NAMES,
+    INVESTMENT_HERMES_TOOL_NAMES,
     INVESTMENT_SNAPSHOTS_TOOL_NAMES,
-)
-from app.mcp_server.tooling.order_proposal_tools import ORDER_PROPOSAL_TOOL_NAMES
-from app.mcp_server.tooling.orders_kiwoom_us_variants import (
+    KIWOOM_MOCK_TOOL_NAMES,
     KIWOOM_MOCK_US_MUTATION_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kiwoom_variants import KIWOOM_MOCK_TOOL_NAMES
-from app.mcp_server.tooling.orders_kiwoom_variants import (
-    register as register_kiwoom_mock_tools,
+    ORDER_PROPOSAL_TOOL_NAMES,
 )
 
 if TYPE_CHECKING:
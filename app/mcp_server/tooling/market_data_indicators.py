@@ -703,6 +703,23 @@ def _calculate_obv(
     }
 
 
+def _fibonacci_levels(
+    swing_high_price: float, swing_low_price: float, high_is_later: bool
+) -> tuple[str, dict[str, float]]:
+    """Trend label and rounded retracement prices for a swing high/low pair."""
+    if high_is_later:
+        return "retracement_from_high", {
+            str(lvl): round(
+                swing_high_price - lvl * (swing_high_price - swing_low_price), 2
+            )
+            for lvl in FIBONACCI_LEVELS
+        }
+    return "bounce_from_low", {
+        str(lvl): round(swing_low_price + lvl * (swing_high_price - swing_low_price), 2)
+        for lvl in FIBONACCI_LEVELS
+    }
+
+
 def _calculate_fibonacci(df: pd.DataFrame, current_price: float) -> dict[str, Any]:
     high = df["high"].astype(float)
     low = df["low"].astype(float)
@@ -725,22 +742,9 @@ def _calculate_fibonacci(df: pd.DataFrame, current_price: float) -> dict[str, An
     swing_high_date = _to_date_str(df.iloc[swing_high_pos])
     swing_low_date = _to_date_str(df.iloc[swing_low_pos])
 
-    if swing_high_pos > swing_low_pos:
-        trend = "retracement_from_high"
-        levels = {
-            str(lvl): round(
-                swing_high_price - lvl * (swing_high_price - swing_low_price), 2
-            )
-            for lvl in FIBONACCI_LEVELS
-        }
-    else:
-        trend = "bounce_from_low"
-        levels = {
-            str(lvl): round(
-                swing_low_price + lvl * (swing_high_price - swing_low_price), 2
-            )
-            for lvl in FIBONACCI_LEVELS
-        }
+    trend, levels = _fibonacci_levels(
+        swing_high_price, swing_low_price, swing_high_pos > swing_low_pos
+    )
 
     nearest_support: dict[str, Any] | None = None
     nearest_resistance: dict[str, Any] | None = None
@@ -834,40 +838,34 @@ def _cluster_price_levels(
     levels: list[tuple[float, str]],
     tolerance_pct: float = 0.02,
 ) -> list[dict[str, Any]]:
+    """Greedy ascending sort-and-sweep clustering, O(n log n).
+
+    A level joins the open cluster when it is within ``tolerance_pct`` of that
+    cluster's running mean. Levels arrive in ascending order, so once a level
+    opens a new cluster no later level can reach an earlier one: the mean of a
+    closed cluster never moves again and every later price is further above
+    it. Only the open cluster is ever compared.
+    """
     if not levels:
         return []
 
-    clusters: list[dict[str, Any]] = []
+    clusters: list[tuple[list[float], list[str]]] = []
+    center = 0.0
     for price, source in sorted(levels, key=lambda item: item[0]):
         if price <= 0:
             continue
-
-        matched_cluster: dict[str, Any] | None = None
-        for cluster in clusters:
-            center = _to_float(cluster.get("center"), default=0.0)
-            if center <= 0:
-                continue
-            if abs(price - center) / center <= tolerance_pct:
-                matched_cluster = cluster
-                break
-
-        if matched_cluster is None:
-            clusters.append({"prices": [price], "sources": [source], "center": price})
+        if clusters and abs(price - center) / center <= tolerance_pct:
+            prices, sources = clusters[-1]
+            prices.append(price)
+            if source not in sources:
+                sources.append(source)
+            center = sum(prices) / len(prices)
             continue
-
-        prices = matched_cluster["prices"]
-        sources = matched_cluster["sources"]
-        prices.append(price)
-        if source not in sources:
-            sources.append(source)
-        matched_cluster["center"] = sum(prices) / len(prices)
+        clusters.append(([price], [source]))
+        center = price
 
     clustered: list[dict[str, Any]] = []
-    for cluster in clusters:
-        prices = cluster.get("prices", [])
-        if not prices:
-            continue
-        level_sources = cluster.get("sources", [])
+    for prices, level_sources in clusters:
         source_count = len(level_sources)
         if source_count >= 3:
             strength = "strong"
@@ -931,6 +929,43 @@ def _normalize_number(value: float, decimals: int = 6) -> float | int:
     return rounded
 
 
+def _bin_volumes(
+    candle_low: np.ndarray,
+    candle_high: np.ndarray,
+    candle_volume: np.ndarray,
+    bin_edges: np.ndarray,
+) -> np.ndarray:
+    """Spread each candle's volume over the bins its [low, high] range overlaps.
+
+    Zero-width candles (or ranges that miss every bin) put their whole volume
+    in the bin holding their low / midpoint. All candles are evaluated as one
+    (candles × bins) matrix; the row-wise sum adds candles in order, so the
+    totals equal the candle-by-candle accumulation.
+    """
+    bins = len(bin_edges) - 1
+    active = candle_volume > 0
+    low = candle_low[active]
+    high = candle_high[active]
+    volume = candle_volume[active]
+
+    overlaps = np.minimum(bin_edges[1:], high[:, None]) - np.maximum(
+        bin_edges[:-1], low[:, None]
+    )
+    overlaps = np.clip(overlaps, 0.0, None)
+    overlap_sum = overlaps.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shares = volume[:, None] * (overlaps / overlap_sum[:, None])
+
+    flat = high <= low
+    point = flat | (overlap_sum <= 0)
+    if point.any():
+        anchor = np.where(flat, low, (low + high) / 2)[point]
+        idx = np.clip(np.searchsorted(bin_edges, anchor, side="right") - 1, 0, bins - 1)
+        shares[point] = 0.0
+        shares[np.flatnonzero(point), idx] = volume[point]
+    return np.add.reduce(shares, axis=0, initial=0.0)
+
+
 def _calculate_volume_profile(
     df: pd.DataFrame,
     bins: int,
@@ -948,19 +983,33 @@ def _calculate_volume_profile(
     if df.empty:
         raise ValueError("No OHLCV data available")
 
-    low = pd.to_numeric(df["low"], errors="coerce")
-    high = pd.to_numeric(df["high"], errors="coerce")
-    volume = pd.to_numeric(df["volume"], errors="coerce")
+    def _column(name: str) -> np.ndarray:
+        return pd.to_numeric(df[name], errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
+
+    return _volume_profile_from_arrays(
+        _column("low"), _column("high"), _column("volume"), bins, value_area_ratio
+    )
+
 
-    valid_mask = low.notna() & high.notna() & volume.notna()
+def _volume_profile_from_arrays(
+    low: np.ndarray,
+    high: np.ndarray,
+    volume: np.ndarray,
+    bins: int,
+    value_area_ratio: float = 0.70,
+) -> dict[str, Any]:
+    """``_calculate_volume_profile`` over float arrays (NaN marks a missing value)."""
+    valid_mask = ~(np.isnan(low) | np.isnan(high) | np.isnan(volume))
     if not valid_mask.any():
         raise ValueError("No valid OHLCV rows with low/high/volume")
 
-    low_values = low[valid_mask].astype(float).to_numpy()
-    high_values = high[valid_mask].astype(float).to_numpy()
+    low_values = low[valid_mask]
+    high_values = high[valid_mask]
     candle_low = np.minimum(low_values, high_values)
     candle_high = np.maximum(low_values, high_values)
-    candle_volume = volume[valid_mask].astype(float).to_numpy()
+    candle_volume = volume[valid_mask]
 
     price_low = float(candle_low.min())
     price_high = float(candle_high.max())
@@ -975,39 +1024,7 @@ def _calculate_volume_profile(
     else:
         bin_edges = np.linspace(price_low, price_high, bins + 1)
 
-    bin_volumes = np.zeros(bins, dtype=float)
-    for low_i, high_i, vol_i in zip(
-        candle_low, candle_high, candle_volume, strict=False
-    ):
-        if vol_i <= 0:
-            continue
-
-        if high_i <= low_i:
-            idx = int(
-                np.clip(
-                    np.searchsorted(bin_edges, low_i, side="right") - 1, 0, bins - 1
-                )
-            )
-            bin_volumes[idx] += vol_i
-            continue
-
-        overlaps = np.minimum(bin_edges[1:], high_i) - np.maximum(bin_edges[:-1], low_i)
-        overlaps = np.clip(overlaps, 0.0, None)
-        overlap_sum = float(overlaps.sum())
-
-        if overlap_sum <= 0:
-            mid_price = (low_i + high_i) / 2
-            idx = int(
-                np.clip(
-                    np.searchsorted(bin_edges, mid_price, side="right") - 1,
-                    0,
-                    bins - 1,
-                )
-            )
-            bin_volumes[idx] += vol_i
-            continue
-
-        bin_volumes += vol_i * (overlaps / overlap_sum)
+    bin_volumes = _bin_volumes(candle_low, candle_high, candle_volume, bin_edges)
 
     total_volume = float(bin_volumes.sum())
     if total_volume <= 0:
@@ -1111,6 +1128,7 @@ __all__ = [
     "_calculate_stoch_rsi",
     "_calculate_obv",
     "_calculate_fibonacci",
+    "_fibonacci_levels",
     "_compute_indicators",
     "_format_fibonacci_source",
     "_cluster_price_levels",
@@ -1118,4 +1136,5 @@ __all__ = [
     "_compute_rsi_weights",
     "_normalize_number",
     "_calculate_volume_profile",
+    "_volume_profile_from_arrays",
 ]
@@ -0,0 +1,419 @@
+"""Universe-wide indicator computation over (symbols × bars) matrices.
+
+``IndicatorBatch`` holds right-aligned OHLCV matrices: every row ends at its
+symbol's latest bar, shorter histories are NaN-padded on the left and
+``lengths`` records how many real bars each row has. ``compute_indicator_batch``
+evaluates the requested indicators for every row at once and returns one
+array per output value (``NaN`` where the value is not computable);
+``indicator_rows`` turns those columns back into the per-symbol dicts that
+``_compute_indicators`` produces.
+
+Parity with the per-symbol helpers is exact, not approximate: elementwise
+steps are NumPy, and the recursive/windowed steps (``ewm``, ``rolling``,
+``cumsum``) run on pandas' column-wise kernels over the whole matrix — the
+same kernels the helpers call on a single Series. Those kernels skip leading
+NaNs exactly as if the history were absent, so left padding never leaks into
+a row's result. Columns are unrounded; rounding happens in ``indicator_rows``
+where the per-symbol helpers round.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from app.mcp_server.tooling.market_data_indicators import (
+    DEFAULT_ADX_PERIOD,
+    DEFAULT_ATR_PERIOD,
+    DEFAULT_BOLLINGER_PERIOD,
+    DEFAULT_BOLLINGER_STD,
+    DEFAULT_EMA_PERIODS,
+    DEFAULT_MACD_FAST,
+    DEFAULT_MACD_SIGNAL,
+    DEFAULT_MACD_SLOW,
+    DEFAULT_OBV_SIGNAL_PERIOD,
+    DEFAULT_RSI_PERIOD,
+    DEFAULT_SMA_PERIODS,
+    DEFAULT_STOCH_RSI_D_PERIOD,
+    DEFAULT_STOCH_RSI_K_PERIOD,
+    DEFAULT_STOCH_RSI_PERIOD,
+    IndicatorScalar,
+    IndicatorType,
+)
+
+BatchResult = dict[str, dict[str, np.ndarray]]
+
+_COLUMNS = ("close", "high", "low", "volume")
+
+_ROUNDED: dict[str, frozenset[str]] = {
+    "rsi": frozenset({str(DEFAULT_RSI_PERIOD)}),
+    "adx": frozenset({"adx", "plus_di", "minus_di"}),
+    "stoch_rsi": frozenset({"k", "d"}),
+    "pivot": frozenset({"p", "r1", "r2", "r3", "s1", "s2", "s3"}),
+    "obv": frozenset({"obv", "signal"}),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorBatch:
+    """Right-aligned ``(len(symbols), n_bars)`` float64 OHLCV matrices."""
+
+    symbols: tuple[str, ...]
+    lengths: np.ndarray
+    close: np.ndarray
+    high: np.ndarray | None = None
+    low: np.ndarray | None = None
+    volume: np.ndarray | None = None
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> IndicatorBatch:
+        """Stack per-symbol OHLCV frames (ascending bars).
+
+        ``high`` / ``low`` / ``volume`` are stacked only when every frame has
+        the column; ``close`` is required.
+        """
+        symbols = tuple(frames)
+        lengths = np.array([len(frames[s]) for s in symbols], dtype=np.int64)
+        n_bars = int(lengths.max()) if len(symbols) else 0
+
+        def stack(column: str) -> np.ndarray | None:
+            if not all(column in frames[s].columns for s in symbols):
+                return None
+            matrix = np.full((len(symbols), n_bars), np.nan)
+            for row, symbol in enumerate(symbols):
+                if lengths[row]:
+                    values = frames[symbol][column].to_numpy(
+                        dtype=float, na_value=np.nan
+                    )
+                    matrix[row, n_bars - lengths[row] :] = values
+            return matrix
+
+        stacked = {column: stack(column) for column in _COLUMNS}
+        if stacked["close"] is None:
+            raise ValueError("Missing required columns: {'close'}")
+        return cls(
+            symbols=symbols,
+            lengths=lengths,
+            close=stacked["close"],
+            high=stacked["high"],
+            low=stacked["low"],
+            volume=stacked["volume"],
+        )
+
+    @property
+    def mask(self) -> np.ndarray:
+        """``True`` where a row has a real (non-padding) bar."""
+        n_bars = self.close.shape[1]
+        return np.arange(n_bars)[None, :] >= (n_bars - self.lengths)[:, None]
+
+
+def _bars(matrix: np.ndarray) -> pd.DataFrame:
+    """Bars × symbols frame so pandas' window kernels run per symbol column."""
+    return pd.DataFrame(matrix.T)
+
+
+def _last(frame: pd.DataFrame) -> np.ndarray:
+    if frame.empty:
+        return np.full(frame.shape[1], np.nan)
+    return frame.iloc[-1].to_numpy(dtype=float)
+
+
+def _where_valid(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    return np.where(valid, values, np.nan)
+
+
+def _ewm(frame: pd.DataFrame, *, min_periods: int = 0, **kwargs) -> pd.DataFrame:
+    return frame.ewm(min_periods=min_periods, adjust=False, **kwargs).mean()
+
+
+def _sma(batch: IndicatorBatch) -> dict[str, np.ndarray]:
+    out: dict[str, np.ndarray] = {}
+    for period in DEFAULT_SMA_PERIODS:
+        window = batch.close[:, -period:]
+        observed = ~np.isnan(window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(observed, window, 0.0).sum(axis=1) / observed.sum(axis=1)
+        out[str(period)] = _where_valid(mean, batch.lengths >= period)
+    return out
+
+
+def _ema(close: pd.DataFrame, lengths: np.ndarray) -> dict[str, np.ndarray]:
+    return {
+        str(period): _where_valid(_last(_ewm(close, span=period)), lengths >= period)
+        for period in DEFAULT_EMA_PERIODS
+    }
+
+
+def _rsi_frame(
+    close: pd.DataFrame, valid_bars: np.ndarray, period: int
+) -> pd.DataFrame:
+    delta = close.diff()
+    # ``where(delta > 0, 0.0)`` turns the first-bar NaN into 0.0 exactly as the
+    # per-symbol helper does; padding must stay NaN to remain "absent".
+    gain = delta.where(delta > 0, 0.0).where(valid_bars)
+    loss = (-delta).where(delta < 0, 0.0).where(valid_bars)
+    avg_gain = _ewm(gain, alpha=1 / period, min_periods=period)
+    avg_loss = _ewm(loss, alpha=1 / period, min_periods=period)
+    rs = avg_gain / avg_loss.replace(0, np.nan)
+    return 100 - (100 / (1 + rs))
+
+
+def _true_range(
+    high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame
+) -> pd.DataFrame:
+    prev_close = close.shift(1)
+    tr1 = (high - low).to_numpy()
+    tr2 = (high - prev_close).abs().to_numpy()
+    tr3 = (low - prev_close).abs().to_numpy()
+    # Same NaN-skipping max as ``pd.concat([...], axis=1).max(axis=1)``.
+    return pd.DataFrame(np.fmax(np.fmax(tr1, tr2), tr3))
+
+
+def _macd(close: pd.DataFrame, lengths: np.ndarray) -> dict[str, np.ndarray]:
+    macd_line = _ewm(close, span=DEFAULT_MACD_FAST) - _ewm(
+        close, span=DEFAULT_MACD_SLOW
+    )
+    signal_line = _ewm(macd_line, span=DEFAULT_MACD_SIGNAL)
+    valid = lengths >= DEFAULT_MACD_SLOW + DEFAULT_MACD_SIGNAL
+    return {
+        "macd": _where_valid(_last(macd_line), valid),
+        "signal": _where_valid(_last(signal_line), valid),
+        "histogram": _where_valid(_last(macd_line - signal_line), valid),
+    }
+
+
+def _bollinger(close: pd.DataFrame, lengths: np.ndarray) -> dict[str, np.ndarray]:
+    rolling = close.rolling(window=DEFAULT_BOLLINGER_PERIOD)
+    sma = rolling.mean()
+    rolling_std = rolling.std()
+    valid = lengths >= DEFAULT_BOLLINGER_PERIOD
+    return {
+        "upper": _where_valid(_last(sma + rolling_std * DEFAULT_BOLLINGER_STD), valid),
+        "middle": _where_valid(_last(sma), valid),
+        "lower": _where_valid(_last(sma - rolling_std * DEFAULT_BOLLINGER_STD), valid),
+    }
+
+
+def _atr(
+    high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame, lengths: np.ndarray
+) -> dict[str, np.ndarray]:
+    atr = _ewm(
+        _true_range(high, low, close),
+        alpha=1 / DEFAULT_ATR_PERIOD,
+        min_periods=DEFAULT_ATR_PERIOD,
+    )
+    return {
+        str(DEFAULT_ATR_PERIOD): _where_valid(
+            _last(atr), lengths >= DEFAULT_ATR_PERIOD + 1
+        )
+    }
+
+
+def _pivot(batch: IndicatorBatch) -> dict[str, np.ndarray]:
+    assert batch.high is not None and batch.low is not None
+    if batch.close.shape[1] < 2:
+        nan = np.full(len(batch.symbols), np.nan)
+        return {key: nan.copy() for key in ("p", "r1", "r2", "r3", "s1", "s2", "s3")}
+    prev_high = batch.high[:, -2]
+    prev_low = batch.low[:, -2]
+    prev_close = batch.close[:, -2]
+    p = (prev_high + prev_low + prev_close) / 3
+    valid = batch.lengths >= 2
+    return {
+        "p": _where_valid(p, valid),
+        "r1": _where_valid(2 * p - prev_low, valid),
+        "r2": _where_valid(p + (prev_high - prev_low), valid),
+        "r3": _where_valid(prev_high + 2 * (p - prev_low), valid),
+        "s1": _where_valid(2 * p - prev_high, valid),
+        "s2": _where_valid(p - (prev_high - prev_low), valid),
+        "s3": _where_valid(prev_low - 2 * (prev_high - p), valid),
+    }
+
+
+def _adx(
+    high: pd.DataFrame,
+    low: pd.DataFrame,
+    close: pd.DataFrame,
+    valid_bars: np.ndarray,
+    lengths: np.ndarray,
+) -> dict[str, np.ndarray]:
+    period = DEFAULT_ADX_PERIOD
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+    plus_dm = up_move.where((up_move > down_move) & (up_move > 0), 0.0).where(
+        valid_bars
+    )
+    minus_dm = down_move.where((down_move > up_move) & (down_move > 0), 0.0).where(
+        valid_bars
+    )
+
+    atr = _ewm(_true_range(high, low, close), alpha=1 / period, min_periods=period)
+    smoothed_plus_dm = _ewm(plus_dm, alpha=1 / period, min_periods=period)
+    smoothed_minus_dm = _ewm(minus_dm, alpha=1 / period, min_periods=period)
+
+    plus_di = 100 * (smoothed_plus_dm / atr.replace(0, np.nan))
+    minus_di = 100 * (smoothed_minus_dm / atr.replace(0, np.nan))
+    dx = 100 * ((plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan))
+    adx = _ewm(dx, alpha=1 / period, min_periods=period)
+
+    valid = lengths >= period * 2
+    return {
+        "adx": _where_valid(_last(adx), valid),
+        "plus_di": _where_valid(_last(plus_di), valid),
+        "minus_di": _where_valid(_last(minus_di), valid),
+    }
+
+
+def _stoch_rsi(
+    close: pd.DataFrame, valid_bars: np.ndarray, lengths: np.ndarray
+) -> dict[str, np.ndarray]:
+    rsi = _rsi_frame(close, valid_bars, DEFAULT_STOCH_RSI_PERIOD)
+    rsi_min = rsi.rolling(window=DEFAULT_STOCH_RSI_PERIOD, min_periods=1).min()
+    rsi_max = rsi.rolling(window=DEFAULT_STOCH_RSI_PERIOD, min_periods=1).max()
+    stoch_rsi = (rsi - rsi_min) / (rsi_max - rsi_min).replace(0, np.nan)
+    percent_k = (
+        stoch_rsi.rolling(
+            window=DEFAULT_STOCH_RSI_K_PERIOD, min_periods=DEFAULT_STOCH_RSI_K_PERIOD
+        ).mean()
+        * 100
+    )
+    percent_d = percent_k.rolling(
+        window=DEFAULT_STOCH_RSI_D_PERIOD, min_periods=DEFAULT_STOCH_RSI_D_PERIOD
+    ).mean()
+    valid = lengths >= (
+        DEFAULT_STOCH_RSI_PERIOD
+        + DEFAULT_STOCH_RSI_K_PERIOD
+        + DEFAULT_STOCH_RSI_D_PERIOD
+    )
+    return {
+        "k": _where_valid(_last(percent_k), valid),
+        "d": _where_valid(_last(percent_d), valid),
+    }
+
+
+def _obv(batch: IndicatorBatch, valid_bars: np.ndarray) -> dict[str, np.ndarray]:
+    assert batch.volume is not None
+    close = batch.close
+    prev = np.concatenate([np.full((close.shape[0], 1), np.nan), close[:, :-1]], 1)
+    direction = np.where(close > prev, 1, np.where(close < prev, -1, 0))
+    flow = np.where(valid_bars.T, batch.volume * direction, np.nan)
+    obv_frame = _bars(flow).cumsum()
+    obv = obv_frame.to_numpy().T
+    signal = _last(_ewm(obv_frame, span=DEFAULT_OBV_SIGNAL_PERIOD))
+
+    n_rows = close.shape[0]
+    divergence = np.full(n_rows, None, dtype=object)
+    valid = batch.lengths >= DEFAULT_OBV_SIGNAL_PERIOD
+    lookback = np.minimum(10, batch.lengths - 1)
+    if close.shape[1]:
+        base = np.clip(close.shape[1] - 1 - lookback, 0, close.shape[1] - 1)[:, None]
+        rows = np.arange(n_rows)
+        price_change = close[:, -1] - np.take_along_axis(close, base, 1)[:, 0]
+        obv_change = obv[:, -1] - np.take_along_axis(obv, base, 1)[:, 0]
+        divergence[valid] = "none"
+        bullish = valid & (lookback >= 2) & (price_change < 0) & (obv_change > 0)
+        bearish = valid & (lookback >= 2) & (price_change > 0) & (obv_change < 0)
+        divergence[rows[bullish]] = "bullish"
+        divergence[rows[bearish]] = "bearish"
+        last_obv = obv[:, -1]
+    else:
+        last_obv = np.full(n_rows, np.nan)
+    return {
+        "obv": _where_valid(last_obv, valid),
+        "signal": _where_valid(signal, valid),
+        "divergence": divergence,
+    }
+
+
+def compute_indicator_batch(
+    batch: IndicatorBatch, indicators: Sequence[IndicatorType]
+) -> BatchResult:
+    """Columnar ``{indicator: {output: array[len(symbols)]}}`` for the batch."""
+    required = {"close"}
+    if {"atr", "pivot", "adx"} & set(indicators):
+        required |= {"high", "low"}
+    if "obv" in indicators:
+        required |= {"volume"}
+    missing = {name for name in required if getattr(batch, name) is None}
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    valid_bars = batch.mask.T
+    close = _bars(batch.close)
+    high = _bars(batch.high) if batch.high is not None else None
+    low = _bars(batch.low) if batch.low is not None else None
+
+    results: BatchResult = {}
+    for indicator in indicators:
+        if indicator == "sma":
+            results["sma"] = _sma(batch)
+        elif indicator == "ema":
+            results["ema"] = _ema(close, batch.lengths)
+        elif indicator == "rsi":
+            rsi = _rsi_frame(close, valid_bars, DEFAULT_RSI_PERIOD)
+            results["rsi"] = {
+                str(DEFAULT_RSI_PERIOD): _where_valid(
+                    _last(rsi), batch.lengths >= DEFAULT_RSI_PERIOD + 1
+                )
+            }
+        elif indicator == "macd":
+            results["macd"] = _macd(close, batch.lengths)
+        elif indicator == "bollinger":
+            results["bollinger"] = _bollinger(close, batch.lengths)
+        elif indicator == "atr":
+            assert high is not None and low is not None
+            results["atr"] = _atr(high, low, close, batch.lengths)
+        elif indicator == "pivot":
+            results["pivot"] = _pivot(batch)
+        elif indicator == "adx":
+            assert high is not None and low is not None
+            results["adx"] = _adx(high, low, close, valid_bars, batch.lengths)
+        elif indicator == "stoch_rsi":
+            results["stoch_rsi"] = _stoch_rsi(close, valid_bars, batch.lengths)
+        elif indicator == "obv":
+            results["obv"] = _obv(batch, valid_bars)
+    return results
+
+
+def _scalar(indicator: str, key: str, value: object) -> IndicatorScalar:
+    if value is None or isinstance(value, str):
+        return value
+    number = float(value)  # type: ignore[arg-type]
+    if indicator == "pivot":
+        # The per-symbol pivot rounds without a NaN guard once two bars exist.
+        return round(number, 2)
+    if np.isnan(number):
+        return None
+    if key in _ROUNDED.get(indicator, frozenset()):
+        return round(number, 2)
+    return number
+
+
+def indicator_rows(
+    batch: IndicatorBatch, results: BatchResult
+) -> dict[str, dict[str, dict[str, IndicatorScalar]]]:
+    """Per-symbol dicts identical to ``_compute_indicators`` for each row."""
+    rows: dict[str, dict[str, dict[str, IndicatorScalar]]] = {}
+    for index, symbol in enumerate(batch.symbols):
+        row: dict[str, dict[str, IndicatorScalar]] = {}
+        for indicator, columns in results.items():
+            if indicator == "pivot" and batch.lengths[index] < 2:
+                row[indicator] = dict.fromkeys(columns)
+                continue
+            row[indicator] = {
+                key: _scalar(indicator, key, values[index])
+                for key, values in columns.items()
+            }
+        rows[symbol] = row
+    return rows
+
+
+__all__ = [
+    "BatchResult",
+    "IndicatorBatch",
+    "compute_indicator_batch",
+    "indicator_rows",
+]
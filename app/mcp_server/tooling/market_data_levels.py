@@ -0,0 +1,186 @@
+"""Support/resistance level engine shared by the MCP tool and snapshot builders.
+
+Levels come from three precomputed sources — Fibonacci retracements, the
+volume profile (POC and value-area bounds) and the Bollinger bands — and are
+merged by ``_cluster_price_levels``' sort-and-sweep pass, then split around
+the current price.
+
+``support_resistance_levels`` serves one frame (``get_support_resistance``);
+``support_resistance_batch`` serves a whole universe: the frames are stacked
+once into an :class:`IndicatorBatch`, the Bollinger bands of every symbol come
+from one vectorized pass, and the Fibonacci swings and volume profile read the
+stacked rows directly instead of re-coercing each frame's columns. A failing
+symbol is reported in place rather than aborting the batch. Both produce
+identical levels for the same frame.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.mcp_server.tooling.market_data_indicators import (
+    _calculate_fibonacci,
+    _calculate_volume_profile,
+    _cluster_price_levels,
+    _compute_indicators,
+    _fibonacci_levels,
+    _format_fibonacci_source,
+    _split_support_resistance_levels,
+    _volume_profile_from_arrays,
+)
+from app.mcp_server.tooling.market_data_indicators_batch import (
+    IndicatorBatch,
+    compute_indicator_batch,
+    indicator_rows,
+)
+from app.mcp_server.tooling.shared import to_optional_float as _to_optional_float
+
+LEVEL_TOLERANCE_PCT = 0.02
+VOLUME_PROFILE_BINS = 20
+
+Levels = tuple[list[dict[str, Any]], list[dict[str, Any]]]
+
+_REQUIRED_COLUMNS = ("high", "low", "close")
+
+
+def _positive(value: Any) -> float | None:
+    price = _to_optional_float(value)
+    return price if price is not None and price > 0 else None
+
+
+def collect_price_levels(
+    fib_levels: Mapping[str, Any],
+    volume_profile: Mapping[str, Any],
+    bollinger: Mapping[str, Any],
+) -> list[tuple[float, str]]:
+    """``(price, source)`` pairs from the three level sources (positive only)."""
+    price_levels: list[tuple[float, str]] = []
+    for level_key, price in fib_levels.items():
+        level_price = _positive(price)
+        if level_price is not None:
+            price_levels.append((level_price, _format_fibonacci_source(str(level_key))))
+
+    value_area = volume_profile.get("value_area") or {}
+    for price, source in (
+        ((volume_profile.get("poc") or {}).get("price"), "volume_poc"),
+        (value_area.get("high"), "volume_value_area_high"),
+        (value_area.get("low"), "volume_value_area_low"),
+        (bollinger.get("upper"), "bb_upper"),
+        (bollinger.get("middle"), "bb_middle"),
+        (bollinger.get("lower"), "bb_lower"),
+    ):
+        level_price = _positive(price)
+        if level_price is not None:
+            price_levels.append((level_price, source))
+    return price_levels
+
+
+def _check_columns(frame: pd.DataFrame) -> None:
+    if frame.empty:
+        raise ValueError("No OHLCV data available")
+    for col in _REQUIRED_COLUMNS:
+        if col not in frame.columns:
+            raise ValueError(f"Missing required column: {col}")
+
+
+def _levels_from(
+    fib_levels: Mapping[str, Any],
+    volume_profile: Mapping[str, Any],
+    bollinger: Mapping[str, Any],
+    current_price: float,
+) -> Levels:
+    if not fib_levels:
+        raise ValueError("Failed to calculate Fibonacci levels")
+    if current_price <= 0:
+        raise ValueError("failed to resolve current price")
+
+    clustered = _cluster_price_levels(
+        collect_price_levels(fib_levels, volume_profile, bollinger),
+        tolerance_pct=LEVEL_TOLERANCE_PCT,
+    )
+    return _split_support_resistance_levels(clustered, current_price)
+
+
+def support_resistance_levels(frame: pd.DataFrame, current_price: float) -> Levels:
+    """``(supports, resistances)`` for one OHLCV frame; raises ``ValueError``."""
+    _check_columns(frame)
+    fib_result = _calculate_fibonacci(frame, current_price)
+    volume_result = _calculate_volume_profile(frame, bins=VOLUME_PROFILE_BINS)
+    bollinger = _compute_indicators(frame, ["bollinger"])["bollinger"]
+    return _levels_from(fib_result["levels"], volume_result, bollinger, current_price)
+
+
+def _row_levels(
+    batch: IndicatorBatch,
+    row: int,
+    frame: pd.DataFrame,
+    bollinger: Mapping[str, Any],
+    current_price: float,
+) -> Levels:
+    start = batch.close.shape[1] - int(batch.lengths[row])
+    high = batch.high[row, start:]
+    low = batch.low[row, start:]
+    # Same swing selection as ``_calculate_fibonacci``: NaN-skipping max/min
+    # for the prices, the raw arg-extremum for the positions.
+    _, fib_levels = _fibonacci_levels(
+        round(float(np.fmax.reduce(high)), 2),
+        round(float(np.fmin.reduce(low)), 2),
+        int(high.argmax()) > int(low.argmin()),
+    )
+    if batch.volume is None:
+        volume_result = _calculate_volume_profile(frame, bins=VOLUME_PROFILE_BINS)
+    else:
+        volume_result = _volume_profile_from_arrays(
+            low, high, batch.volume[row, start:], bins=VOLUME_PROFILE_BINS
+        )
+    return _levels_from(fib_levels, volume_result, bollinger, current_price)
+
+
+def support_resistance_batch(
+    frames: Mapping[str, pd.DataFrame],
+    current_prices: Mapping[str, float] | None = None,
+) -> dict[str, Levels | Exception]:
+    """``support_resistance_levels`` for every frame in one pass.
+
+    ``current_prices`` defaults to each frame's last close (rounded to cents,
+    as the MCP tool does). A symbol whose levels cannot be computed maps to
+    the exception instead of ``(supports, resistances)``.
+    """
+    results: dict[str, Levels | Exception] = {}
+    usable: dict[str, pd.DataFrame] = {}
+    for symbol, frame in frames.items():
+        try:
+            _check_columns(frame)
+        except ValueError as exc:
+            results[symbol] = exc
+        else:
+            usable[symbol] = frame
+
+    batch = IndicatorBatch.from_frames(usable)
+    bands = indicator_rows(batch, compute_indicator_batch(batch, ["bollinger"]))
+    for row, (symbol, frame) in enumerate(usable.items()):
+        try:
+            if current_prices is not None and symbol in current_prices:
+                current_price = float(current_prices[symbol])
+            else:
+                current_price = round(float(batch.close[row, -1]), 2)
+            results[symbol] = _row_levels(
+                batch, row, frame, bands[symbol]["bollinger"], current_price
+            )
+        except Exception as exc:  # noqa: BLE001 - per-symbol fail-soft batch
+            results[symbol] = exc
+    return {symbol: results[symbol] for symbol in frames}
+
+
+__all__ = [
+    "LEVEL_TOLERANCE_PCT",
+    "VOLUME_PROFILE_BINS",
+    "Levels",
+    "collect_price_levels",
+    "support_resistance_batch",
+    "support_resistance_levels",
+]
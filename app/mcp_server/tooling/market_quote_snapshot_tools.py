@@ -10,6 +10,9 @@ from app.jobs.market_quote_snapshots import (
     MarketQuoteSnapshotBuildRequest,
     run_market_quote_snapshot_build,
 )
+from app.mcp_server.tooling.tool_names import (
+    MARKET_QUOTE_SNAPSHOT_TOOL_NAMES as MARKET_QUOTE_SNAPSHOT_TOOL_NAMES,
+)
 from app.models.market_quote_snapshot import MarketQuoteSnapshot
 
 if TYPE_CHECKING:
@@ -18,11 +21,6 @@ if TYPE_CHECKING:
 # Matches _MANUAL_QUOTE_MAX_AGE from app/mcp_server/tooling/alpaca_paper_orders.py
 _MANUAL_QUOTE_MAX_AGE = dt.timedelta(minutes=5)
 
-MARKET_QUOTE_SNAPSHOT_TOOL_NAMES: set[str] = {
-    "market_quote_snapshot_latest",
-    "market_quote_snapshot_ensure",
-}
-
 
 async def check_submit_ready(
     db: Any, snap: MarketQuoteSnapshot
@@ -5,8 +5,9 @@ from typing import Any
 from app.mcp_server.tooling.mirror_counterfactual_tools import (
     kis_mock_mirror_execute_report,
 )
-
-MIRROR_COUNTERFACTUAL_TOOL_NAMES: set[str] = {"kis_mock_mirror_execute_report"}
+from app.mcp_server.tooling.tool_names import (
+    MIRROR_COUNTERFACTUAL_TOOL_NAMES as MIRROR_COUNTERFACTUAL_TOOL_NAMES,
+)
 
 
 def register_mirror_counterfactual_tools(mcp: Any) -> None:
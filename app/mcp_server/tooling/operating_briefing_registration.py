@@ -8,17 +8,14 @@ from app.mcp_server.tooling.operating_briefing import (
     get_operating_briefing_impl,
     list_active_watches_impl,
 )
+from app.mcp_server.tooling.tool_names import (
+    OPERATING_BRIEFING_TOOL_NAMES,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-OPERATING_BRIEFING_TOOL_NAMES: set[str] = {
-    "list_active_watches",
-    "get_operating_briefing",
-}
-
-
 def register_operating_briefing_tools(mcp: FastMCP) -> None:
     mcp.tool(
         name="list_active_watches",
@@ -21,6 +21,9 @@ from typing import TYPE_CHECKING, Any
 from app.core.config import settings
 from app.core.db import AsyncSessionLocal
 from app.core.timezone import now_kst
+from app.mcp_server.tooling.tool_names import (
+    ORDER_PROPOSAL_TOOL_NAMES,
+)
 from app.services.order_proposals import OrderProposalsService
 from app.services.order_proposals.alerts import send_approval_dispatch_alert
 from app.services.order_proposals.approval_window import ApprovalWindowDecision
@@ -58,16 +61,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-ORDER_PROPOSAL_TOOL_NAMES: set[str] = {
-    "order_proposal_create",
-    "order_proposal_get",
-    "order_proposal_list",
-    "order_proposal_void",
-    "order_proposal_expire_sweep",
-    "order_proposal_list_expired_defensive",
-    "order_proposal_redispatch",
-}
-
 _MARKET_ALIASES = {"kr": "equity_kr", "us": "equity_us"}
 
 
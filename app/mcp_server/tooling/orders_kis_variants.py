@@ -28,6 +28,11 @@ from app.mcp_server.tooling.orders_modify_cancel import (
     cancel_order_impl,
     modify_order_impl,
 )
+from app.mcp_server.tooling.tool_names import (
+    KIS_LIVE_ORDER_TOOL_NAMES,
+    KIS_MOCK_ORDER_TOOL_NAMES,
+    LIVE_RECONCILE_TOOL_NAMES,
+)
 from app.services.brokers.toss.client import TossReadClient
 from app.services.brokers.toss.warnings_guard import (
     WarningsGuardResult,
@@ -39,28 +44,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-KIS_LIVE_ORDER_TOOL_NAMES: set[str] = {
-    "kis_live_place_order",
-    "kis_live_cancel_order",
-    "kis_live_modify_order",
-    "kis_live_get_order_history",
-    "kis_live_reconcile_orders",
-}
-
-KIS_MOCK_ORDER_TOOL_NAMES: set[str] = {
-    "kis_mock_place_order",
-    "kis_mock_cancel_order",
-    "kis_mock_modify_order",
-    "kis_mock_get_order_history",
-}
-
-# US/overseas + crypto live reconcile (ROB-407 generic ledger). Registered
-# separately from the KIS KR live variants so the crypto profile can expose
-# order reconcile without pulling in the KIS KR live order surface.
-LIVE_RECONCILE_TOOL_NAMES: set[str] = {
-    "live_reconcile_orders",
-}
-
 
 # ---------------------------------------------------------------------------
 # Shared guard/delegation helpers
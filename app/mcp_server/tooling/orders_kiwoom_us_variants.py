@@ -11,6 +11,15 @@ from app.mcp_server.tooling.orders_kiwoom_shared import (
     finalize_broker_response,
     finalize_place_broker_response,
 )
+from app.mcp_server.tooling.tool_names import (
+    KIWOOM_MOCK_US_MUTATION_TOOL_NAMES as KIWOOM_MOCK_US_MUTATION_TOOL_NAMES,
+)
+from app.mcp_server.tooling.tool_names import (
+    KIWOOM_MOCK_US_READ_TOOL_NAMES as KIWOOM_MOCK_US_READ_TOOL_NAMES,
+)
+from app.mcp_server.tooling.tool_names import (
+    KIWOOM_MOCK_US_TOOL_NAMES as KIWOOM_MOCK_US_TOOL_NAMES,
+)
 from app.services.brokers.kiwoom import constants
 from app.services.brokers.kiwoom.client import KiwoomPreDispatchError
 from app.services.brokers.kiwoom.normalization import (
@@ -38,21 +47,6 @@ ACCOUNT_MODE_KIWOOM_MOCK_US = "kiwoom_mock_us"
 SUPPORTED_MCP_TRDE_TYPES = ("00", "03")
 _US_ALLOWED_PROVENANCE_MODES = frozenset({ACCOUNT_MODE_KIWOOM_MOCK_US})
 
-KIWOOM_MOCK_US_READ_TOOL_NAMES = {
-    "kiwoom_mock_us_get_order_history",
-    "kiwoom_mock_us_get_positions",
-    "kiwoom_mock_us_get_orderable_cash",
-}
-KIWOOM_MOCK_US_MUTATION_TOOL_NAMES = {
-    "kiwoom_mock_us_preview_order",
-    "kiwoom_mock_us_place_order",
-    "kiwoom_mock_us_modify_order",
-    "kiwoom_mock_us_cancel_order",
-}
-KIWOOM_MOCK_US_TOOL_NAMES = (
-    KIWOOM_MOCK_US_READ_TOOL_NAMES | KIWOOM_MOCK_US_MUTATION_TOOL_NAMES
-)
-
 
 class _TrustedValidationError(ValueError):
     """Locally generated, operator-actionable validation failure."""
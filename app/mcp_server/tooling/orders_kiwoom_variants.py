@@ -25,6 +25,9 @@ from app.mcp_server.tooling.orders_kiwoom_shared import (
 from app.mcp_server.tooling.orders_kiwoom_shared import (
     finalize_broker_response as _finalize_broker_response,
 )
+from app.mcp_server.tooling.tool_names import (
+    KIWOOM_MOCK_TOOL_NAMES as KIWOOM_MOCK_TOOL_NAMES,
+)
 from app.services.brokers.kiwoom import constants
 from app.services.brokers.kiwoom.client import KiwoomMockClient, KiwoomPreDispatchError
 from app.services.brokers.kiwoom.domestic_account import KiwoomDomesticAccountClient
@@ -60,17 +63,6 @@ ACCOUNT_MODE_KIWOOM_MOCK = "kiwoom_mock"
 _CASH_SOURCE_DEPOSIT = "deposit"
 _CASH_SOURCE_DEPOSIT_FALLBACK = "deposit_fallback_kt00010_unsupported"
 
-KIWOOM_MOCK_TOOL_NAMES: set[str] = {
-    "kiwoom_mock_preview_order",
-    "kiwoom_mock_place_order",
-    "kiwoom_mock_cancel_order",
-    "kiwoom_mock_modify_order",
-    "kiwoom_mock_get_order_history",
-    "kiwoom_mock_get_order_detail",
-    "kiwoom_mock_get_positions",
-    "kiwoom_mock_get_orderable_cash",
-}
-
 # ROB-1155 — kt00007 read scope -> official qry_tp. The official values are
 # "1:주문순, 2:역순, 3:미체결, 4:체결내역만"; these names keep the MCP surface
 # self-describing without leaking Kiwoom enum digits into prompts.
@@ -18,6 +18,7 @@ from app.mcp_server.tooling.paper_order_handler import (
     _get_paper_order_history,
     _place_paper_order,
 )
+from app.mcp_server.tooling.tool_names import ORDER_TOOL_NAMES
 from app.services.orders.ladder_fill_safety import (
     LadderRung,
     evaluate_ladder_fill_safety,
@@ -26,16 +27,6 @@ from app.services.orders.ladder_fill_safety import (
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-ORDER_TOOL_NAMES: set[str] = {
-    "place_order",
-    "modify_order",
-    "cancel_order",
-    "get_order_history",
-    "kis_mock_reconciliation_run",
-    "sell_ladder_fill_preview",
-    "buy_ladder_fill_preview",
-}
-
 
 def _ladder_fill_preview_response(
     *,
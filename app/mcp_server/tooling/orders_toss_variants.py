@@ -34,6 +34,9 @@ from app.mcp_server.tooling.order_validation import (
     evaluate_sell_price_guards,
 )
 from app.mcp_server.tooling.portfolio_cash import get_account_costs_setting
+from app.mcp_server.tooling.tool_names import (
+    TOSS_LIVE_ORDER_TOOL_NAMES as TOSS_LIVE_ORDER_TOOL_NAMES,
+)
 from app.mcp_server.tooling.toss_approval import (
     APPROVAL_TTL_SECONDS,
     build_canonical_payload,
@@ -99,17 +102,6 @@ def _accepts_pre_send_hook(method: Callable[..., Awaitable[Any]]) -> bool:
     )
 
 
-TOSS_LIVE_ORDER_TOOL_NAMES: set[str] = {
-    "toss_preview_order",
-    "toss_place_order",
-    "toss_modify_order",
-    "toss_cancel_order",
-    "toss_get_order_history",
-    "toss_get_positions",
-    "toss_get_orderable_cash",
-    "toss_reconcile_orders",
-}
-
 _BPS = Decimal("10000")
 _PRICE_CONTEXT_UNAVAILABLE = "price_context_unavailable"
 
@@ -19,18 +19,14 @@ from typing import TYPE_CHECKING, Any, Literal, cast
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.db import AsyncSessionLocal
+from app.mcp_server.tooling.tool_names import (
+    PAPER_LIMIT_ORDER_TOOL_NAMES,
+)
 from app.services.paper_limit_order_service import PaperLimitOrderService
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-PAPER_LIMIT_ORDER_TOOL_NAMES: set[str] = {
-    "paper_place_limit_order",
-    "paper_reconcile_orders",
-    "paper_cancel_pending_order",
-    "paper_list_pending_orders",
-}
-
 
 def _session_factory() -> async_sessionmaker[AsyncSession]:
     return cast(async_sessionmaker[AsyncSession], cast(object, AsyncSessionLocal))
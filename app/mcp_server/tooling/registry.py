@@ -85,144 +85,449 @@ Profile → tool surface mapping
   default-off, bearer-authenticated at process startup, and returns before the
   normal "Always" block. It exposes no venue-native, generic, or live tool.
 
+Registration manifest
+────────────────────────────────────────────────────────────────────────────
+Registrar modules are imported on first use, not at module import time.
+``_REGISTRARS`` maps every registrar name to its ``(module, attribute)`` and
+``PROFILE_REGISTRARS`` lists the registrars each profile may invoke, so a
+profile container only imports the tool modules (and their pandas / yfinance /
+tvscreener / broker-client dependencies) that its surface actually wires.
+Invoking a registrar outside its profile's manifest raises, so the manifest
+cannot silently drift from the branches below.
+
 See app/mcp_server/profiles.py and docs in app/mcp_server/README.md.
 """
 
 from __future__ import annotations
 
 import inspect
+from collections.abc import Callable
 from functools import wraps
-from typing import TYPE_CHECKING
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from app.core.config import settings
 from app.mcp_server.profiles import McpProfile
-from app.mcp_server.tooling import orders_kiwoom_variants
-from app.mcp_server.tooling.account_read_registration import (
-    register_account_read_tools,
-)
-from app.mcp_server.tooling.account_routing_registration import (
-    register_account_routing_tools,
-)
-from app.mcp_server.tooling.alpaca_paper import register_alpaca_paper_tools
-from app.mcp_server.tooling.alpaca_paper_ledger_read import (
-    register_alpaca_paper_ledger_read_tools,
-)
-from app.mcp_server.tooling.alpaca_paper_orders import (
-    register_alpaca_paper_orders_tools,
-)
-from app.mcp_server.tooling.alpaca_paper_preview import (
-    register_alpaca_paper_preview_tools,
-)
-from app.mcp_server.tooling.analysis_artifact_registration import (
-    register_analysis_artifact_tools,
-)
-from app.mcp_server.tooling.analysis_bundle_handlers import (
-    register_analysis_bundle_tools,
-)
-from app.mcp_server.tooling.analysis_readonly_registration import (
-    register_analysis_readonly_tools,
-)
-from app.mcp_server.tooling.analysis_registration import register_analysis_tools
-from app.mcp_server.tooling.downside_watch_registration import (
-    register_downside_watch_tools,
-)
-from app.mcp_server.tooling.execution_ledger_events import (
-    register_execution_ledger_event_tools,
-)
-from app.mcp_server.tooling.forecast_registration import register_forecast_tools
-from app.mcp_server.tooling.fundamentals_registration import register_fundamentals_tools
-from app.mcp_server.tooling.investment_hermes_handlers import (
-    register_hermes_context_read_only,
-    register_investment_hermes_tools,
-)
-from app.mcp_server.tooling.investment_reports_handlers import (
-    register_investment_report_tools,
-)
-from app.mcp_server.tooling.investment_snapshots_registration import (
-    register_investment_snapshots_tools,
-)
-from app.mcp_server.tooling.market_brief_registration import (
-    register_market_brief_tools,
-)
-from app.mcp_server.tooling.market_data_registration import register_market_data_tools
-from app.mcp_server.tooling.market_quote_snapshot_tools import (
-    register_market_quote_snapshot_tools,
-)
-from app.mcp_server.tooling.mirror_counterfactual_registration import (
-    register_mirror_counterfactual_tools,
-)
-from app.mcp_server.tooling.mock_loop_retro_registration import (
-    register_mock_loop_retro_tools,
-)
-from app.mcp_server.tooling.news_registration import register_news_tools
-from app.mcp_server.tooling.operating_briefing_registration import (
-    register_operating_briefing_tools,
-)
-from app.mcp_server.tooling.order_proposal_tools import register_order_proposal_tools
-from app.mcp_server.tooling.orders_kis_variants import (
-    register_kis_live_order_tools,
-    register_kis_mock_order_tools,
-    register_live_reconcile_tools,
-)
-from app.mcp_server.tooling.orders_registration import register_order_tools
-from app.mcp_server.tooling.orders_toss_variants import (
-    register_toss_live_order_tools,
-)
-from app.mcp_server.tooling.paper_account_registration import (
-    register_paper_account_tools,
-)
-from app.mcp_server.tooling.paper_analytics_registration import (
-    register_paper_analytics_tools,
-)
-from app.mcp_server.tooling.paper_cohort_control_registration import (
-    register_paper_cohort_control_tools,
-)
-from app.mcp_server.tooling.paper_execution_registration import (
-    register_paper_execution_tools,
-)
-from app.mcp_server.tooling.paper_journal_registration import (
-    register_paper_journal_tools,
-)
-from app.mcp_server.tooling.paper_limit_order_handler import (
-    register_paper_limit_order_tools,
-)
-from app.mcp_server.tooling.paper_validation_registration import (
-    register_paper_validation_tools,
-)
-from app.mcp_server.tooling.portfolio_registration import register_portfolio_tools
-from app.mcp_server.tooling.route_request_registration import (
-    register_route_request_tools,
-)
-from app.mcp_server.tooling.session_context_registration import (
-    register_session_context_tools,
-)
-from app.mcp_server.tooling.toss_manual_activity_tools import (
-    register_toss_manual_activity_tools,
-)
-from app.mcp_server.tooling.trade_journal_registration import (
-    register_trade_journal_tools,
-)
-from app.mcp_server.tooling.trade_retrospective_registration import (
-    register_trade_retrospective_tools,
-)
-from app.mcp_server.tooling.trading_policy_registration import (
-    register_trading_policy_tools,
-)
-from app.mcp_server.tooling.trading_scoreboard_registration import (
-    register_trading_scoreboard_tools,
-)
-from app.mcp_server.tooling.tradingcodex_execution_registration import (
-    register_tradingcodex_execution_tools,
-)
-from app.mcp_server.tooling.us_dual_paper import register_us_dual_paper_tools
-from app.mcp_server.tooling.user_settings_registration import (
-    register_user_settings_tools,
-)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
+_TOOLING = "app.mcp_server.tooling"
+
+# Registrar name -> (module, attribute). Names match the historical top-level
+# imports so ``registry.register_*`` attribute access (and monkeypatching)
+# keeps working through the module ``__getattr__`` below.
+_REGISTRARS: dict[str, tuple[str, str]] = {
+    "register_account_read_tools": (
+        f"{_TOOLING}.account_read_registration",
+        "register_account_read_tools",
+    ),
+    "register_account_routing_tools": (
+        f"{_TOOLING}.account_routing_registration",
+        "register_account_routing_tools",
+    ),
+    "register_alpaca_paper_tools": (
+        f"{_TOOLING}.alpaca_paper",
+        "register_alpaca_paper_tools",
+    ),
+    "register_alpaca_paper_automated_orders_tools": (
+        f"{_TOOLING}.alpaca_paper_automated_orders",
+        "register_alpaca_paper_automated_orders_tools",
+    ),
+    "register_alpaca_paper_ledger_read_tools": (
+        f"{_TOOLING}.alpaca_paper_ledger_read",
+        "register_alpaca_paper_ledger_read_tools",
+    ),
+    "register_alpaca_paper_orders_tools": (
+        f"{_TOOLING}.alpaca_paper_orders",
+        "register_alpaca_paper_orders_tools",
+    ),
+    "register_alpaca_paper_preview_tools": (
+        f"{_TOOLING}.alpaca_paper_preview",
+        "register_alpaca_paper_preview_tools",
+    ),
+    "register_analysis_artifact_tools": (
+        f"{_TOOLING}.analysis_artifact_registration",
+        "register_analysis_artifact_tools",
+    ),
+    "register_analysis_bundle_tools": (
+        f"{_TOOLING}.analysis_bundle_handlers",
+        "register_analysis_bundle_tools",
+    ),
+    "register_analysis_readonly_tools": (
+        f"{_TOOLING}.analysis_readonly_registration",
+        "register_analysis_readonly_tools",
+    ),
+    "register_analysis_tools": (
+        f"{_TOOLING}.analysis_registration",
+        "register_analysis_tools",
+    ),
+    # Phase 3 / ROB-907 read-only Binance demo ledger status tool.
+    "register_binance_demo_ledger_status_tool": (
+        f"{_TOOLING}.binance_demo_ledger_status_read",
+        "register_binance_demo_ledger_status_tool",
+    ),
+    "register_downside_watch_tools": (
+        f"{_TOOLING}.downside_watch_registration",
+        "register_downside_watch_tools",
+    ),
+    "register_execution_ledger_event_tools": (
+        f"{_TOOLING}.execution_ledger_events",
+        "register_execution_ledger_event_tools",
+    ),
+    "register_forecast_tools": (
+        f"{_TOOLING}.forecast_registration",
+        "register_forecast_tools",
+    ),
+    "register_fundamentals_tools": (
+        f"{_TOOLING}.fundamentals_registration",
+        "register_fundamentals_tools",
+    ),
+    "register_hermes_context_read_only": (
+        f"{_TOOLING}.investment_hermes_handlers",
+        "register_hermes_context_read_only",
+    ),
+    "register_investment_hermes_tools": (
+        f"{_TOOLING}.investment_hermes_handlers",
+        "register_investment_hermes_tools",
+    ),
+    "register_investment_report_tools": (
+        f"{_TOOLING}.investment_reports_handlers",
+        "register_investment_report_tools",
+    ),
+    "register_investment_snapshots_tools": (
+        f"{_TOOLING}.investment_snapshots_registration",
+        "register_investment_snapshots_tools",
+    ),
+    "register_kis_live_order_tools": (
+        f"{_TOOLING}.orders_kis_variants",
+        "register_kis_live_order_tools",
+    ),
+    "register_kis_mock_order_tools": (
+        f"{_TOOLING}.orders_kis_variants",
+        "register_kis_mock_order_tools",
+    ),
+    "register_kiwoom_kr_tools": (
+        f"{_TOOLING}.kiwoom_kr_registration",
+        "register_kiwoom_kr_tools",
+    ),
+    "register_kiwoom_mock_tools": (
+        f"{_TOOLING}.orders_kiwoom_variants",
+        "register",
+    ),
+    "register_kiwoom_us": (
+        f"{_TOOLING}.orders_kiwoom_us_variants",
+        "register",
+    ),
+    "register_live_reconcile_tools": (
+        f"{_TOOLING}.orders_kis_variants",
+        "register_live_reconcile_tools",
+    ),
+    "register_market_brief_tools": (
+        f"{_TOOLING}.market_brief_registration",
+        "register_market_brief_tools",
+    ),
+    "register_market_data_tools": (
+        f"{_TOOLING}.market_data_registration",
+        "register_market_data_tools",
+    ),
+    "register_market_quote_snapshot_tools": (
+        f"{_TOOLING}.market_quote_snapshot_tools",
+        "register_market_quote_snapshot_tools",
+    ),
+    "register_mirror_counterfactual_tools": (
+        f"{_TOOLING}.mirror_counterfactual_registration",
+        "register_mirror_counterfactual_tools",
+    ),
+    "register_mock_loop_retro_tools": (
+        f"{_TOOLING}.mock_loop_retro_registration",
+        "register_mock_loop_retro_tools",
+    ),
+    "register_news_tools": (
+        f"{_TOOLING}.news_registration",
+        "register_news_tools",
+    ),
+    "register_operating_briefing_tools": (
+        f"{_TOOLING}.operating_briefing_registration",
+        "register_operating_briefing_tools",
+    ),
+    "register_order_proposal_tools": (
+        f"{_TOOLING}.order_proposal_tools",
+        "register_order_proposal_tools",
+    ),
+    "register_order_tools": (
+        f"{_TOOLING}.orders_registration",
+        "register_order_tools",
+    ),
+    "register_paper_account_tools": (
+        f"{_TOOLING}.paper_account_registration",
+        "register_paper_account_tools",
+    ),
+    "register_paper_analytics_tools": (
+        f"{_TOOLING}.paper_analytics_registration",
+        "register_paper_analytics_tools",
+    ),
+    "register_paper_cohort_control_tools": (
+        f"{_TOOLING}.paper_cohort_control_registration",
+        "register_paper_cohort_control_tools",
+    ),
+    "register_paper_execution_tools": (
+        f"{_TOOLING}.paper_execution_registration",
+        "register_paper_execution_tools",
+    ),
+    "register_paper_journal_tools": (
+        f"{_TOOLING}.paper_journal_registration",
+        "register_paper_journal_tools",
+    ),
+    "register_paper_limit_order_tools": (
+        f"{_TOOLING}.paper_limit_order_handler",
+        "register_paper_limit_order_tools",
+    ),
+    "register_paper_validation_tools": (
+        f"{_TOOLING}.paper_validation_registration",
+        "register_paper_validation_tools",
+    ),
+    "register_portfolio_tools": (
+        f"{_TOOLING}.portfolio_registration",
+        "register_portfolio_tools",
+    ),
+    "register_route_request_tools": (
+        f"{_TOOLING}.route_request_registration",
+        "register_route_request_tools",
+    ),
+    "register_session_context_tools": (
+        f"{_TOOLING}.session_context_registration",
+        "register_session_context_tools",
+    ),
+    "register_toss_live_order_tools": (
+        f"{_TOOLING}.orders_toss_variants",
+        "register_toss_live_order_tools",
+    ),
+    "register_toss_manual_activity_tools": (
+        f"{_TOOLING}.toss_manual_activity_tools",
+        "register_toss_manual_activity_tools",
+    ),
+    "register_trade_journal_tools": (
+        f"{_TOOLING}.trade_journal_registration",
+        "register_trade_journal_tools",
+    ),
+    "register_trade_retrospective_tools": (
+        f"{_TOOLING}.trade_retrospective_registration",
+        "register_trade_retrospective_tools",
+    ),
+    "register_trading_policy_tools": (
+        f"{_TOOLING}.trading_policy_registration",
+        "register_trading_policy_tools",
+    ),
+    "register_trading_scoreboard_tools": (
+        f"{_TOOLING}.trading_scoreboard_registration",
+        "register_trading_scoreboard_tools",
+    ),
+    "register_tradingcodex_execution_tools": (
+        f"{_TOOLING}.tradingcodex_execution_registration",
+        "register_tradingcodex_execution_tools",
+    ),
+    "register_us_dual_paper_tools": (
+        f"{_TOOLING}.us_dual_paper",
+        "register_us_dual_paper_tools",
+    ),
+    "register_user_settings_tools": (
+        f"{_TOOLING}.user_settings_registration",
+        "register_user_settings_tools",
+    ),
+    # ROB-1173 — whole-profile exact-set proxy for KIWOOM_KR (not a registrar,
+    # but loaded the same way so the KR profile pays only for what it wires).
+    "restrict_kiwoom_kr_profile_tools": (
+        f"{_TOOLING}.kiwoom_kr_registration",
+        "restrict_kiwoom_kr_profile_tools",
+    ),
+}
+
+# Research/read-only registrars shared by every broad ("Always" block) profile.
+_SHARED_REGISTRARS: frozenset[str] = frozenset(
+    {
+        "register_market_data_tools",
+        "register_fundamentals_tools",
+        "register_analysis_tools",
+        "register_investment_report_tools",
+        "register_session_context_tools",
+        "register_analysis_artifact_tools",
+        "register_analysis_bundle_tools",
+        "register_operating_briefing_tools",
+        "register_trading_policy_tools",
+        "register_route_request_tools",
+        "register_investment_hermes_tools",
+        "register_user_settings_tools",
+        "register_news_tools",
+        "register_market_brief_tools",
+        "register_portfolio_tools",
+        "register_account_routing_tools",
+        "register_trade_journal_tools",
+        "register_downside_watch_tools",
+        "register_execution_ledger_event_tools",
+        "register_mock_loop_retro_tools",
+        "register_trade_retrospective_tools",
+        "register_forecast_tools",
+        "register_trading_scoreboard_tools",
+        "register_mirror_counterfactual_tools",
+        "register_investment_snapshots_tools",
+        "register_order_proposal_tools",
+    }
+)
+
+_ALPACA_PAPER_REGISTRARS: frozenset[str] = frozenset(
+    {
+        "register_alpaca_paper_tools",
+        "register_alpaca_paper_preview_tools",
+        "register_us_dual_paper_tools",
+        "register_alpaca_paper_orders_tools",
+        "register_alpaca_paper_ledger_read_tools",
+        "register_market_quote_snapshot_tools",
+    }
+)
+
+# Account-surface registrars the allowlist-only profiles delegate to through
+# their exact-set proxies (see ``allowlist._AllowlistedMCP``).
+_ACCOUNT_READ_DELEGATES: frozenset[str] = frozenset(
+    {
+        "register_account_read_tools",
+        "register_portfolio_tools",
+        "register_order_tools",
+        "register_kis_live_order_tools",
+        "register_toss_live_order_tools",
+        "register_kiwoom_mock_tools",
+    }
+)
+
+# Profile -> every registrar the profile may invoke, directly or through an
+# allowlist registrar (including flag-gated ones). This is the import
+# manifest: no other registrar module is loaded for the profile.
+PROFILE_REGISTRARS: dict[McpProfile, frozenset[str]] = {
+    McpProfile.DEFAULT: _SHARED_REGISTRARS
+    | _ALPACA_PAPER_REGISTRARS
+    | {
+        "register_paper_limit_order_tools",
+        "register_order_tools",
+        "register_kis_live_order_tools",
+        "register_kis_mock_order_tools",
+        "register_live_reconcile_tools",
+        "register_toss_live_order_tools",
+        "register_toss_manual_activity_tools",
+        "register_kiwoom_mock_tools",
+        "register_kiwoom_us",
+        "register_binance_demo_ledger_status_tool",
+    },
+    McpProfile.HERMES_PAPER_KIS: _SHARED_REGISTRARS | {"register_kis_mock_order_tools"},
+    McpProfile.CRYPTO: _SHARED_REGISTRARS
+    | {"register_order_tools", "register_live_reconcile_tools"},
+    McpProfile.US_PAPER: _SHARED_REGISTRARS
+    | _ALPACA_PAPER_REGISTRARS
+    | {"register_alpaca_paper_automated_orders_tools"},
+    McpProfile.DB_PAPER: _SHARED_REGISTRARS
+    | {
+        "register_paper_account_tools",
+        "register_paper_analytics_tools",
+        "register_paper_journal_tools",
+    },
+    McpProfile.KIWOOM: _SHARED_REGISTRARS
+    | {"register_kiwoom_mock_tools", "register_kiwoom_us"},
+    McpProfile.KIWOOM_KR: _SHARED_REGISTRARS
+    | {
+        "restrict_kiwoom_kr_profile_tools",
+        "register_kiwoom_kr_tools",
+        "register_kiwoom_mock_tools",
+    },
+    McpProfile.SHADOW_REPLAY: frozenset(
+        {
+            "register_hermes_context_read_only",
+            "register_trading_policy_tools",
+            "register_route_request_tools",
+        }
+    ),
+    McpProfile.ANALYSIS_READONLY: frozenset(
+        {
+            "register_analysis_readonly_tools",
+            "register_operating_briefing_tools",
+            "register_trading_policy_tools",
+            "register_route_request_tools",
+            "register_market_data_tools",
+            "register_fundamentals_tools",
+            "register_analysis_tools",
+            "register_portfolio_tools",
+            "register_account_routing_tools",
+            "register_toss_live_order_tools",
+            "register_forecast_tools",
+            "register_analysis_bundle_tools",
+        }
+    ),
+    McpProfile.ACCOUNT_READ: _ACCOUNT_READ_DELEGATES,
+    McpProfile.TRADINGCODEX_EXECUTION: _ACCOUNT_READ_DELEGATES
+    | {
+        "register_tradingcodex_execution_tools",
+        "register_account_routing_tools",
+        "register_fundamentals_tools",
+        "register_trading_policy_tools",
+        "register_route_request_tools",
+        "register_operating_briefing_tools",
+        "register_investment_report_tools",
+        "register_forecast_tools",
+        "register_trade_retrospective_tools",
+        "register_order_proposal_tools",
+    },
+    McpProfile.PAPER_EXECUTION: frozenset(
+        {
+            "register_paper_execution_tools",
+            "register_paper_validation_tools",
+            "register_paper_cohort_control_tools",
+        }
+    ),
+    McpProfile.ALPACA_PAPER_CLEAN: frozenset(
+        {
+            "register_alpaca_paper_tools",
+            "register_alpaca_paper_preview_tools",
+            "register_alpaca_paper_ledger_read_tools",
+        }
+    ),
+}
+
+
+def profile_tool_modules(profile: McpProfile) -> frozenset[str]:
+    """Return the registrar modules ``profile`` is allowed to import."""
+    return frozenset(_REGISTRARS[name][0] for name in PROFILE_REGISTRARS[profile])
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``registry.register_*`` lazily from the registration manifest."""
+    try:
+        module_name, attr_name = _REGISTRARS[name]
+    except KeyError as exc:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def _profile_loader(profile: McpProfile) -> Callable[[str], Callable[..., Any]]:
+    """Return a registrar getter that fails closed outside ``profile``'s manifest."""
+    allowed = PROFILE_REGISTRARS[profile]
+
+    def load(name: str) -> Callable[..., Any]:
+        if name not in allowed:
+            raise RuntimeError(
+                f"registrar {name!r} is not in the MCP_PROFILE={profile.value} "
+                "registration manifest"
+            )
+        # globals() first so a monkeypatched/previously-resolved attribute wins.
+        value = globals().get(name)
+        if value is None:
+            value = __getattr__(name)
+        return value
+
+    return load
+
+
 class _AccountPinnedMCP:
     """Registration proxy that binds every registered tool to one account.
 
@@ -279,37 +584,45 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
     Side-effect order tool registration depends on profile:
       - DEFAULT: legacy ambiguous tools + typed kis_live_* + typed kis_mock_*
       - HERMES_PAPER_KIS: typed kis_mock_* only (live surface absent)
+
+    Registrar modules are imported on demand from ``PROFILE_REGISTRARS``, so
+    only the profile's own tool tree is loaded.
     """
+    load = _profile_loader(profile)
     if profile is McpProfile.SHADOW_REPLAY:
         # ROB-697 M1 — frozen-context replay ONLY: read the bundle + policy +
         # lane procedure. Deliberately NO live-fetch (market_data/analysis/
         # news), NO mutation, NO report-write. The agent returns its decision
         # as JSON; it does not persist. This early return is the load-bearing
         # validity guard, so it must come before the "Always" block below.
-        register_hermes_context_read_only(mcp)  # investment_report_get_hermes_context
-        register_trading_policy_tools(mcp)  # get_trading_policy (versioned thresholds)
-        register_route_request_tools(mcp)  # route_request (lane procedure)
+        load("register_hermes_context_read_only")(
+            mcp
+        )  # investment_report_get_hermes_context
+        load("register_trading_policy_tools")(
+            mcp
+        )  # get_trading_policy (versioned thresholds)
+        load("register_route_request_tools")(mcp)  # route_request (lane procedure)
         return
 
     if profile is McpProfile.ANALYSIS_READONLY:
         # ROB-745 — Codex/headless analysis surface. Allowlist-only and returns
         # before the normal "Always" block so unlisted research, account,
         # settings, watch, report-write, and order tools are physically absent.
-        register_analysis_readonly_tools(mcp)
+        load("register_analysis_readonly_tools")(mcp)
         return
 
     if profile is McpProfile.ACCOUNT_READ:
         # ROB-760 — TradingCodex account adapter surface. Allowlist-only and
         # returns before the normal "Always" block so research, persistence,
         # settings, watch, preview, reconcile, and mutation tools are absent.
-        register_account_read_tools(mcp)
+        load("register_account_read_tools")(mcp)
         return
 
     if profile is McpProfile.TRADINGCODEX_EXECUTION:
         # ROB-762 — TradingCodex broker execution surface. Allowlist-only and
         # returns before the normal default block so broad research, settings,
         # watch, modify, reconcile, and persistence tools are physically absent.
-        register_tradingcodex_execution_tools(mcp)
+        load("register_tradingcodex_execution_tools")(mcp)
         return
 
     if profile is McpProfile.PAPER_EXECUTION:
@@ -318,9 +631,9 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
         # startup fails even earlier in main.py. This branch must remain above
         # the broad "Always" registrations below.
         if settings.PAPER_EXECUTION_ENABLED:
-            register_paper_execution_tools(mcp)
-            register_paper_validation_tools(mcp)
-            register_paper_cohort_control_tools(mcp)
+            load("register_paper_execution_tools")(mcp)
+            load("register_paper_validation_tools")(mcp)
+            load("register_paper_cohort_control_tools")(mcp)
         return
 
     if profile is McpProfile.ALPACA_PAPER_CLEAN:
@@ -329,9 +642,9 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
         # registered, and every one is pinned to its account mode.
         if settings.alpaca_paper_crypto_enabled:
             clean_mcp = _AccountPinnedMCP(mcp, account_mode="alpaca_paper_crypto")
-            register_alpaca_paper_tools(clean_mcp)
-            register_alpaca_paper_preview_tools(clean_mcp)
-            register_alpaca_paper_ledger_read_tools(clean_mcp)
+            load("register_alpaca_paper_tools")(clean_mcp)
+            load("register_alpaca_paper_preview_tools")(clean_mcp)
+            load("register_alpaca_paper_ledger_read_tools")(clean_mcp)
         return
 
     if profile is McpProfile.KIWOOM_KR:
@@ -339,16 +652,12 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
         # runs. This exact-set registration proxy is independent of central
         # mutation-name lists, so an unclassified foreign alias is dropped
         # fail-closed even when it is newly introduced in an "Always" registrar.
-        from app.mcp_server.tooling.kiwoom_kr_registration import (
-            restrict_kiwoom_kr_profile_tools,
-        )
-
-        mcp = restrict_kiwoom_kr_profile_tools(mcp)
+        mcp = load("restrict_kiwoom_kr_profile_tools")(mcp)
 
     # Always: side-effect-free research + read-only tools
-    register_market_data_tools(mcp)
-    register_fundamentals_tools(mcp)
-    register_analysis_tools(mcp)
+    load("register_market_data_tools")(mcp)
+    load("register_fundamentals_tools")(mcp)
+    load("register_analysis_tools")(mcp)
     # ROB-488 — snapshot-backed report generation/Hermes tools are default-off
     # by physical registration, matching the investment_snapshot gate. The
     # implementation functions keep their disabled checks for direct/internal
@@ -356,51 +665,51 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
     snapshot_report_generator_enabled = (
         settings.SNAPSHOT_BACKED_REPORT_GENERATOR_ENABLED
     )
-    register_investment_report_tools(
+    load("register_investment_report_tools")(
         mcp,
         include_snapshot_generator=snapshot_report_generator_enabled,
     )
-    register_session_context_tools(mcp)
-    register_analysis_artifact_tools(mcp)
+    load("register_session_context_tools")(mcp)
+    load("register_analysis_artifact_tools")(mcp)
     if settings.ANALYSIS_SNAPSHOT_BUNDLES_MCP_ENABLED:
-        register_analysis_bundle_tools(mcp)
-    register_operating_briefing_tools(mcp)
+        load("register_analysis_bundle_tools")(mcp)
+    load("register_operating_briefing_tools")(mcp)
     # ROB-646 — read-only policy thresholds + version stamp; always registered
     # so every profile can cite the stamp when recording a verdict.
-    register_trading_policy_tools(mcp)
+    load("register_trading_policy_tools")(mcp)
     # ROB-649 — advisory lane router; always registered (read-only, no order
     # surface). Intersects lane tool sequences with the live-registered surface.
-    register_route_request_tools(mcp)
+    load("register_route_request_tools")(mcp)
     if snapshot_report_generator_enabled:
-        register_investment_hermes_tools(mcp)
+        load("register_investment_hermes_tools")(mcp)
     # ROB-447: register_market_report_tools removed — its get_market_reports /
     # get_latest_market_brief were silently shadowed by register_market_brief_tools
     # (registered later, default on_duplicate="warn" = last wins). The brief판
     # (per-symbol AI analysis history) is the operator-observed surface. The report판
     # SERVICE (app/services/market_report_service.py) stays — it is the n8n write path
     # + weekly_summary consumer; only its dead MCP tool registration is dropped.
-    register_user_settings_tools(mcp)
-    register_news_tools(mcp)
-    register_market_brief_tools(mcp)
+    load("register_user_settings_tools")(mcp)
+    load("register_news_tools")(mcp)
+    load("register_market_brief_tools")(mcp)
 
     # Always: live/mock account read-only tools and journals.
-    register_portfolio_tools(mcp)
-    register_account_routing_tools(mcp)
-    register_trade_journal_tools(mcp)
+    load("register_portfolio_tools")(mcp)
+    load("register_account_routing_tools")(mcp)
+    load("register_trade_journal_tools")(mcp)
     # ROB-928 — downside watch auto-register sweep; read-only advisory
     # (notify-only watch registration only, no broker/order mutation).
-    register_downside_watch_tools(mcp)
+    load("register_downside_watch_tools")(mcp)
     # ROB-755 — execution ledger fill event read tool; read-only, always registered.
-    register_execution_ledger_event_tools(mcp)
-    register_mock_loop_retro_tools(mcp)
-    register_trade_retrospective_tools(mcp)
-    register_forecast_tools(mcp)
-    register_trading_scoreboard_tools(mcp)
+    load("register_execution_ledger_event_tools")(mcp)
+    load("register_mock_loop_retro_tools")(mcp)
+    load("register_trade_retrospective_tools")(mcp)
+    load("register_forecast_tools")(mcp)
+    load("register_trading_scoreboard_tools")(mcp)
     # ROB-1173: this is a direct KIS mock broker mutation despite its report
     # name. The KR-only Kiwoom profile must not inherit it from the broad shared
     # block; its only broker mutation surface is the typed Kiwoom KR namespace.
     if profile is not McpProfile.KIWOOM_KR:
-        register_mirror_counterfactual_tools(mcp)
+        load("register_mirror_counterfactual_tools")(mcp)
     # ROB-713 — setup-tagged trade-journal aggregates; read-only, registered
     # unconditionally like the forecast tools it parallels.
 
@@ -408,27 +717,27 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
     # ``settings.INVESTMENT_SNAPSHOTS_MCP_ENABLED`` so the 3 read tools are
     # physically absent unless the flag is flipped post-PR-merge.
     if settings.INVESTMENT_SNAPSHOTS_MCP_ENABLED:
-        register_investment_snapshots_tools(mcp)
+        load("register_investment_snapshots_tools")(mcp)
 
     # ROB-816 — order_proposals SOT ledger read/create surface. Gated by
     # ``settings.ORDER_PROPOSALS_ENABLED`` (default off). No approve/submit
     # tool is registered anywhere — approval is Telegram-only (PR 2).
     if settings.ORDER_PROPOSALS_ENABLED:
-        register_order_proposal_tools(mcp)
+        load("register_order_proposal_tools")(mcp)
 
     # Profile-gated: side-effect order surfaces
     if profile is McpProfile.DEFAULT:
         # ROB-703: paper resting-limit sim tools (pure simulation, no live/Upbit mutation).
-        register_paper_limit_order_tools(mcp)
+        load("register_paper_limit_order_tools")(mcp)
         # Preserve today's behavior: ambiguous account_mode tools for legacy callers.
         # Typed kis_live_* and kis_mock_* are additive — new typed callers use them.
-        register_order_tools(mcp)
-        register_kis_live_order_tools(mcp)
-        register_kis_mock_order_tools(mcp)
-        register_live_reconcile_tools(mcp)
-        register_toss_live_order_tools(mcp)
+        load("register_order_tools")(mcp)
+        load("register_kis_live_order_tools")(mcp)
+        load("register_kis_mock_order_tools")(mcp)
+        load("register_live_reconcile_tools")(mcp)
+        load("register_toss_live_order_tools")(mcp)
         # ROB-866: Toss manual-activity detection sweep (read-only; alert-only).
-        register_toss_manual_activity_tools(mcp)
+        load("register_toss_manual_activity_tools")(mcp)
         # ROB-601: optionally surface kiwoom_mock_* in the operator DEFAULT
         # session so analyze→approval→order can run through kiwoom mock without
         # switching to the isolated KIWOOM profile (which drops every other
@@ -436,28 +745,20 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
         # the tools are physically absent unless the operator opts in; each tool
         # still fail-closes on missing credentials at call time.
         if settings.kiwoom_mock_enabled:
-            orders_kiwoom_variants.register(mcp)
+            load("register_kiwoom_mock_tools")(mcp)
         # ROB-867: US-equity kiwoom mock namespace — same flag-gated pattern
         # as the KR namespace but reading exclusively from
         # ``kiwoom_mock_us_*`` settings. Each tool still fail-closes on
         # missing US credentials at call time.
         if settings.kiwoom_mock_us_enabled:
-            from app.mcp_server.tooling.orders_kiwoom_us_variants import (
-                register as register_kiwoom_us,
-            )
-
-            register_kiwoom_us(mcp)
+            load("register_kiwoom_us")(mcp)
         if settings.binance_demo_scalping_enabled:
             # ROB-1147: the mutation-path scalping submit-decision tool was
             # removed with the rest of the demo-scalping auto-order
             # orchestration lane. This read-only ledger status tool (ROB-907)
             # is unrelated to that lane (no executor/scheduler import) and
             # stays gated on the same flag for Demo-scalping observability.
-            from app.mcp_server.tooling.binance_demo_ledger_status_read import (
-                register_binance_demo_ledger_status_tool,
-            )
-
-            register_binance_demo_ledger_status_tool(mcp)
+            load("register_binance_demo_ledger_status_tool")(mcp)
         # ROB-908: surface the Alpaca paper surface in the operator DEFAULT
         # session so the mock_alpaca lane (account/positions/ledger reads,
         # confirm-gated round-trip) works without standing up a separate
@@ -471,39 +772,31 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
         # is a ROB-842 governance deny-list tool and must never appear in
         # DEFAULT; it stays US_PAPER-only below.
         if settings.alpaca_paper_default_tools_enabled:
-            register_alpaca_paper_tools(mcp)
-            register_alpaca_paper_preview_tools(mcp)
-            register_us_dual_paper_tools(mcp)
-            register_alpaca_paper_orders_tools(mcp)
-            register_alpaca_paper_ledger_read_tools(mcp)
-            register_market_quote_snapshot_tools(mcp)
+            load("register_alpaca_paper_tools")(mcp)
+            load("register_alpaca_paper_preview_tools")(mcp)
+            load("register_us_dual_paper_tools")(mcp)
+            load("register_alpaca_paper_orders_tools")(mcp)
+            load("register_alpaca_paper_ledger_read_tools")(mcp)
+            load("register_market_quote_snapshot_tools")(mcp)
     elif profile is McpProfile.HERMES_PAPER_KIS:
         # Paper-only: only mock-pinned order surface. Live surface is physically absent.
-        register_kis_mock_order_tools(mcp)
+        load("register_kis_mock_order_tools")(mcp)
         # Intentionally NOT: register_order_tools, register_kis_live_order_tools
     elif profile is McpProfile.US_PAPER:
-        from app.mcp_server.tooling.alpaca_paper_automated_orders import (
-            register_alpaca_paper_automated_orders_tools,
-        )
-
-        register_alpaca_paper_tools(mcp)
-        register_alpaca_paper_preview_tools(mcp)
-        register_us_dual_paper_tools(mcp)
-        register_alpaca_paper_orders_tools(mcp)
-        register_alpaca_paper_automated_orders_tools(mcp)
-        register_alpaca_paper_ledger_read_tools(mcp)
-        register_market_quote_snapshot_tools(mcp)
+        load("register_alpaca_paper_tools")(mcp)
+        load("register_alpaca_paper_preview_tools")(mcp)
+        load("register_us_dual_paper_tools")(mcp)
+        load("register_alpaca_paper_orders_tools")(mcp)
+        load("register_alpaca_paper_automated_orders_tools")(mcp)
+        load("register_alpaca_paper_ledger_read_tools")(mcp)
+        load("register_market_quote_snapshot_tools")(mcp)
     elif profile is McpProfile.DB_PAPER:
-        register_paper_account_tools(mcp)
-        register_paper_analytics_tools(mcp)
-        register_paper_journal_tools(mcp)
+        load("register_paper_account_tools")(mcp)
+        load("register_paper_analytics_tools")(mcp)
+        load("register_paper_journal_tools")(mcp)
     elif profile is McpProfile.KIWOOM:
-        orders_kiwoom_variants.register(mcp)
-        from app.mcp_server.tooling.orders_kiwoom_us_variants import (
-            register as register_kiwoom_us,
-        )
-
-        register_kiwoom_us(mcp)
+        load("register_kiwoom_mock_tools")(mcp)
+        load("register_kiwoom_us")(mcp)
     elif profile is McpProfile.KIWOOM_KR:
         # ROB-1159 — KR-only Kiwoom mock surface. Same shared read-only
         # research/account block as KIWOOM above, but the kiwoom_mock_us_*
@@ -513,18 +806,14 @@ def register_all_tools(mcp: FastMCP, profile: McpProfile = McpProfile.DEFAULT) -
         # dropped instead of widening this profile. KR order-path behavior (KRX
         # pinning, dry_run/confirm double gate) is unchanged — only the
         # registered set differs.
-        from app.mcp_server.tooling.kiwoom_kr_registration import (
-            register_kiwoom_kr_tools,
-        )
-
-        register_kiwoom_kr_tools(mcp)
+        load("register_kiwoom_kr_tools")(mcp)
     elif profile is McpProfile.CRYPTO:
         # Crypto live trading enters through the generic account_mode order
         # tools (the only MCP entry point for Upbit orders, with ROB-407
         # inline reconcile) and settles through live_reconcile_orders.
         # Without these a crypto session could research but never trade.
-        register_order_tools(mcp)
-        register_live_reconcile_tools(mcp)
+        load("register_order_tools")(mcp)
+        load("register_live_reconcile_tools")(mcp)
 
 
 __all__ = ["register_all_tools"]
@@ -0,0 +1,319 @@
+"""Date-aligned return panel shared by correlation and portfolio risk views.
+
+A :class:`ReturnPanel` stacks each symbol's daily closes on one date axis (the
+union of every symbol's candle dates) and derives simple returns between
+*consecutive axis dates* only. A return therefore always spans the same
+interval for every symbol: when crypto (7-day) and equity (trading-day)
+series share a panel, an equity's Friday→Monday move has no Sunday→Monday
+crypto counterpart and is left out instead of being paired with it, and a
+market holiday blanks only that market's return into and out of the day.
+
+Statistics are pairwise-complete (each pair uses the dates on which both
+returns exist, like ``DataFrame.corr``/``DataFrame.cov``) and computed for
+every pair at once from a handful of matrix products. They are cached on the
+panel, and panels themselves are cached per (universe, period, close-date)
+by :func:`cached_return_panel`.
+
+Frames without a ``date`` column (or ``DatetimeIndex``) cannot be placed on a
+calendar; a panel with any such frame falls back to aligning series by their
+most recent rows, as the correlation tool historically did.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+PanelKey = tuple[tuple[str, ...], int, Any]
+
+_PANEL_CACHE_MAX_ENTRIES = 64
+
+_panel_cache: OrderedDict[PanelKey, tuple[tuple[float, ...], ReturnPanel]] = (
+    OrderedDict()
+)
+
+
+def _frame_dates(frame: pd.DataFrame) -> np.ndarray | None:
+    if "date" in frame.columns:
+        values = pd.Index(frame["date"])
+    elif isinstance(frame.index, pd.DatetimeIndex):
+        values = frame.index
+    else:
+        return None
+    if not isinstance(values, pd.DatetimeIndex):
+        try:
+            values = pd.DatetimeIndex(pd.to_datetime(values))
+        except (TypeError, ValueError):
+            # Mixed UTC offsets: each value's date at its own offset.
+            return np.array(
+                [
+                    np.datetime64("NaT")
+                    if pd.isna(value)
+                    else pd.Timestamp(value).date()
+                    for value in values
+                ],
+                dtype="datetime64[D]",
+            )
+    if values.tz is not None:
+        # The calendar date in the frame's own timezone; numpy would take UTC's.
+        values = values.tz_localize(None)
+    return values.to_numpy().astype("datetime64[D]")
+
+
+def _frame_closes(frame: pd.DataFrame) -> np.ndarray:
+    closes = pd.to_numeric(frame["close"], errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan
+    )
+    # Non-positive closes cannot anchor a return; treat them as missing.
+    return np.where(closes > 0, closes, np.nan)
+
+
+def _average_ranks(values: np.ndarray) -> np.ndarray:
+    """1-based ranks with ties averaged (``Series.rank(method="average")``)."""
+    order = np.argsort(values, kind="mergesort")
+    ordered = values[order]
+    boundaries = np.flatnonzero(np.diff(ordered)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [ordered.size]))
+    ranks = np.empty(ordered.size, dtype=float)
+    ranks[order] = np.repeat((starts + ends + 1) / 2.0, ends - starts)
+    return ranks
+
+
+def _pairwise_moments(
+    returns: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Pair counts, centered co-moments and per-pair variances for all pairs.
+
+    ``sxy[i, j]`` is the centered sum of products over the dates on which both
+    ``i`` and ``j`` have a return; ``vx[i, j]`` is the centered sum of squares
+    of ``i`` over those same dates (so ``vx.T`` is ``j``'s).
+    """
+    valid = ~np.isnan(returns)
+    x = np.where(valid, returns, 0.0)
+    m = valid.astype(float)
+    n = m.T @ m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sx = x.T @ m
+        sxx = (x * x).T @ m
+        sxy = x.T @ x - sx * sx.T / n
+        vx = sxx - sx * sx / n
+    return n, sxy, vx, vx.T
+
+
+def _pearson(returns: np.ndarray, min_periods: int) -> np.ndarray:
+    n, sxy, vx, vy = _pairwise_moments(returns)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = sxy / np.sqrt(vx * vy)
+    corr = np.clip(corr, -1.0, 1.0)
+    corr[(n < min_periods) | ~(vx > 0) | ~(vy > 0)] = np.nan
+    diagonal = np.diagonal(corr).copy()
+    np.fill_diagonal(corr, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return corr
+
+
+@dataclass(frozen=True)
+class ReturnPanel:
+    """Daily closes and returns of several symbols on one date axis."""
+
+    symbols: tuple[str, ...]
+    dates: np.ndarray
+    closes: np.ndarray
+    aligned_by_date: bool
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> ReturnPanel:
+        """Build a panel from OHLCV frames keyed by symbol (``close`` required).
+
+        Symbols keep the mapping's order. A date repeated within one frame
+        keeps its last row.
+        """
+        symbols = tuple(frames)
+        closes_by_symbol = [_frame_closes(frames[symbol]) for symbol in symbols]
+        dates_by_symbol = [_frame_dates(frames[symbol]) for symbol in symbols]
+        aligned_by_date = bool(symbols) and all(
+            dates is not None for dates in dates_by_symbol
+        )
+        if not aligned_by_date:
+            # Row offsets from each frame's end stand in for dates.
+            dates_by_symbol = [
+                np.arange(-closes.size + 1, 1) for closes in closes_by_symbol
+            ]
+
+        axis = (
+            np.unique(np.concatenate(dates_by_symbol))
+            if symbols
+            else np.array([], dtype="datetime64[D]")
+        )
+        matrix = np.full((axis.size, len(symbols)), np.nan)
+        for column, (dates, closes) in enumerate(
+            zip(dates_by_symbol, closes_by_symbol, strict=True)
+        ):
+            matrix[np.searchsorted(axis, dates), column] = closes
+        return cls(
+            symbols=symbols,
+            dates=axis,
+            closes=matrix,
+            aligned_by_date=aligned_by_date,
+        )
+
+    @property
+    def close_date(self) -> date | None:
+        """Last date on the axis (``None`` for an empty or undated panel)."""
+        if not self.aligned_by_date or self.dates.size == 0:
+            return None
+        return self.dates[-1].astype(date)
+
+    @cached_property
+    def returns(self) -> np.ndarray:
+        """(dates × symbols) simple returns; NaN unless both closes exist."""
+        returns = np.full_like(self.closes, np.nan)
+        returns[1:] = self.closes[1:] / self.closes[:-1] - 1.0
+        return returns
+
+    @cached_property
+    def observations(self) -> np.ndarray:
+        """Pairwise count of dates on which both symbols have a return."""
+        valid = (~np.isnan(self.returns)).astype(np.int64)
+        return valid.T @ valid
+
+    @cached_property
+    def correlation(self) -> np.ndarray:
+        """Pairwise-complete Pearson correlation of returns."""
+        return self.correlation_matrix("pearson")
+
+    @cached_property
+    def covariance(self) -> np.ndarray:
+        """Pairwise-complete sample covariance (ddof=1) of returns."""
+        n, sxy, _, _ = _pairwise_moments(self.returns)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = sxy / (n - 1)
+        cov[n < 2] = np.nan
+        return cov
+
+    def correlation_matrix(
+        self,
+        method: Literal["pearson", "spearman"] = "pearson",
+        *,
+        min_periods: int = 2,
+    ) -> np.ndarray:
+        """Pairwise-complete correlation; NaN where a pair is undefined."""
+        min_periods = max(min_periods, 2)
+        if method == "pearson":
+            return _pearson(self.returns, min_periods)
+        if method != "spearman":
+            raise ValueError(f"Unsupported correlation method: {method}")
+
+        valid = ~np.isnan(self.returns)
+        ranks = np.full_like(self.returns, np.nan)
+        for column in range(ranks.shape[1]):
+            ranks[valid[:, column], column] = _average_ranks(
+                self.returns[valid[:, column], column]
+            )
+        corr = _pearson(ranks, min_periods)
+        # Ranks depend on which dates a pair shares; only pairs whose return
+        # dates differ need re-ranking over their common dates.
+        for i, j in zip(*np.triu_indices(ranks.shape[1], k=1), strict=True):
+            if np.array_equal(valid[:, i], valid[:, j]):
+                continue
+            common = valid[:, i] & valid[:, j]
+            pair = np.column_stack(
+                (
+                    _average_ranks(self.returns[common, i]),
+                    _average_ranks(self.returns[common, j]),
+                )
+            )
+            corr[i, j] = corr[j, i] = _pearson(pair, min_periods)[0, 1]
+        return corr
+
+    def rolling_beta(self, benchmark: str, window: int) -> np.ndarray:
+        """(dates × symbols) beta to ``benchmark`` over trailing ``window`` returns.
+
+        A value is defined only where both series have all ``window`` returns
+        ending at that date (``Series.rolling(window)`` semantics).
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        column = self.symbols.index(benchmark)
+        returns = self.returns
+        bench = returns[:, [column]]
+        valid = ~np.isnan(returns) & ~np.isnan(bench)
+        x = np.where(valid, returns, 0.0)
+        b = np.where(valid, bench, 0.0)
+
+        def window_sum(values: np.ndarray) -> np.ndarray:
+            totals = np.cumsum(values, axis=0)
+            totals[window:] = totals[window:] - totals[:-window]
+            totals[: window - 1] = np.nan
+            return totals
+
+        count = window_sum(valid.astype(float))
+        sb = window_sum(b)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = window_sum(x * b) - window_sum(x) * sb / window
+            var = window_sum(b * b) - sb * sb / window
+            beta = cov / var
+        beta[(count != window) | ~(var > 0)] = np.nan
+        return beta
+
+
+def clear_return_panel_cache() -> None:
+    _panel_cache.clear()
+
+
+def _latest_closes(frames: Mapping[str, pd.DataFrame]) -> tuple[float, ...]:
+    latest: list[float] = []
+    for frame in frames.values():
+        closes = _frame_closes(frame)
+        latest.append(float(closes[-1]) if closes.size else float("nan"))
+    return tuple(latest)
+
+
+def cached_return_panel(
+    frames: Mapping[str, pd.DataFrame],
+    *,
+    period: int,
+) -> ReturnPanel:
+    """``ReturnPanel.from_frames`` memoized per (universe, period, close-date).
+
+    The close-date is the newest candle date across ``frames``. A cached
+    panel is reused only while every symbol's latest close is unchanged, so a
+    still-forming daily candle (crypto's current UTC day) invalidates it.
+    Statistics already computed on a cached panel are reused with it.
+    """
+    close_date = max(
+        (
+            dates[-1]
+            for frame in frames.values()
+            if (dates := _frame_dates(frame.tail(1))) is not None and dates.size
+        ),
+        default=None,
+    )
+    key: PanelKey = (tuple(frames), period, close_date)
+    latest = _latest_closes(frames)
+    entry = _panel_cache.get(key)
+    if entry is not None and np.array_equal(entry[0], latest, equal_nan=True):
+        _panel_cache.move_to_end(key)
+        return entry[1]
+
+    panel = ReturnPanel.from_frames(frames)
+    _panel_cache[key] = (latest, panel)
+    _panel_cache.move_to_end(key)
+    while len(_panel_cache) > _PANEL_CACHE_MAX_ENTRIES:
+        _panel_cache.popitem(last=False)
+    return panel
+
+
+__all__ = [
+    "PanelKey",
+    "ReturnPanel",
+    "cached_return_panel",
+    "clear_return_panel_cache",
+]
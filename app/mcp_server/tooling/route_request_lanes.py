@@ -12,31 +12,23 @@ from __future__ import annotations
 
 from typing import Any
 
-from app.mcp_server.tooling.alpaca_paper import ALPACA_PAPER_READONLY_TOOL_NAMES
-from app.mcp_server.tooling.alpaca_paper_automated_orders import (
+from app.mcp_server.tooling.tool_names import (
     ALPACA_PAPER_AUTOMATED_TOOL_NAMES,
-)
-from app.mcp_server.tooling.alpaca_paper_orders import ALPACA_PAPER_MUTATING_TOOL_NAMES
-from app.mcp_server.tooling.alpaca_paper_preview import ALPACA_PAPER_PREVIEW_TOOL_NAMES
-from app.mcp_server.tooling.market_quote_snapshot_tools import (
-    MARKET_QUOTE_SNAPSHOT_TOOL_NAMES,
-)
-from app.mcp_server.tooling.mirror_counterfactual_registration import (
-    MIRROR_COUNTERFACTUAL_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kis_variants import (
+    ALPACA_PAPER_MUTATING_TOOL_NAMES,
+    ALPACA_PAPER_PREVIEW_TOOL_NAMES,
+    ALPACA_PAPER_READONLY_TOOL_NAMES,
     KIS_LIVE_ORDER_TOOL_NAMES,
     KIS_MOCK_ORDER_TOOL_NAMES,
-    LIVE_RECONCILE_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kiwoom_us_variants import (
+    KIWOOM_MOCK_TOOL_NAMES,
     KIWOOM_MOCK_US_MUTATION_TOOL_NAMES,
     KIWOOM_MOCK_US_READ_TOOL_NAMES,
+    LIVE_RECONCILE_TOOL_NAMES,
+    MARKET_QUOTE_SNAPSHOT_TOOL_NAMES,
+    MIRROR_COUNTERFACTUAL_TOOL_NAMES,
+    ORDER_TOOL_NAMES,
+    TOSS_LIVE_ORDER_TOOL_NAMES,
+    US_DUAL_PAPER_TOOL_NAMES,
 )
-from app.mcp_server.tooling.orders_kiwoom_variants import KIWOOM_MOCK_TOOL_NAMES
-from app.mcp_server.tooling.orders_registration import ORDER_TOOL_NAMES
-from app.mcp_server.tooling.orders_toss_variants import TOSS_LIVE_ORDER_TOOL_NAMES
-from app.mcp_server.tooling.us_dual_paper import US_DUAL_PAPER_TOOL_NAMES
 
 # intent enum (the only free LLM choice) -> playbook lane
 INTENT_TO_LANE: dict[str, str] = {
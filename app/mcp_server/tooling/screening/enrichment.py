@@ -37,6 +37,7 @@ from app.services.invest_screener_snapshots.repository import (
 from app.services.invest_view_model.screener_service import (
     calculate_consecutive_up_days,
 )
+from app.services.ohlcv_features.freshness import load_features
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +169,57 @@ async def _hydrate_from_snapshots(
                 row.setdefault("close", float(snap.latest_close))
 
 
+async def _hydrate_rsi_from_feature_store(
+    rows: list[dict[str, Any]],
+    *,
+    market: str,
+    session: AsyncSession | None = None,
+    now: dt.datetime | None = None,
+) -> int:
+    """Fill missing ``rsi`` from fresh stored daily feature vectors.
+
+    One bulk query for every row; stale or absent vectors leave the row
+    untouched. Fail-open: a DB failure hydrates nothing. Returns the number
+    of rows filled.
+    """
+    symbols = {
+        symbol
+        for row in rows
+        if row.get("rsi") is None and (symbol := _streak_symbol(row))
+    }
+    if not symbols:
+        return 0
+    try:
+        if session is not None:
+            stored = await load_features(
+                session, market=market, symbols=symbols, now=now
+            )
+        else:
+            from app.core.db import AsyncSessionLocal
+
+            async with AsyncSessionLocal() as own_session:
+                stored = await load_features(
+                    own_session, market=market, symbols=symbols, now=now
+                )
+    except Exception as exc:
+        logger.debug("ohlcv feature store unavailable for %s rsi: %s", market, exc)
+        return 0
+
+    filled = 0
+    for row in rows:
+        if row.get("rsi") is not None:
+            continue
+        symbol = _streak_symbol(row)
+        entry = stored.get(symbol) if symbol else None
+        if entry is None or entry.state != "fresh":
+            continue
+        rsi = _to_optional_float(entry.features.get("rsi", {}).get("14"))
+        if rsi is not None:
+            row["rsi"] = rsi
+            filled += 1
+    return filled
+
+
 _SCREEN_ENRICHMENT_FIELDS = (
     "sector",
     "analyst_buy",
@@ -23,7 +23,10 @@ from app.mcp_server.tooling.screening.common import (
     _timeout_seconds,
     _to_optional_float,
 )
-from app.mcp_server.tooling.screening.enrichment import _pick_display_name
+from app.mcp_server.tooling.screening.enrichment import (
+    _hydrate_rsi_from_feature_store,
+    _pick_display_name,
+)
 from app.mcp_server.tooling.screening.instrument_type import classify_kr_instrument
 from app.mcp_server.tooling.screening.kr_ranking_snapshot import (
     load_kr_ranking_snapshot,
@@ -166,6 +169,11 @@ async def _screen_kr(
     except Exception:
         pass
 
+    # KRX listings carry no RSI; without stored daily vectors a max_rsi filter
+    # (or an rsi sort) would see None for every candidate.
+    if max_rsi is not None or sort_by == "rsi":
+        await _hydrate_rsi_from_feature_store(candidates, market="kr")
+
     advanced_filters_applied = {
         "min_market_cap": min_market_cap,
         "max_per": max_per,
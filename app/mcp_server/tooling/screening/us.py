@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, cast
-
-import yfinance as yf
+from typing import TYPE_CHECKING, Any, cast
 
+from app.core.lazy_module import LazyModule
 from app.mcp_server.tooling.screening.common import (
     _aggregate_analyst_recommendations,
     _apply_basic_filters,
@@ -45,6 +44,11 @@ from app.services.tvscreener_service import (
 )
 from app.services.us_symbol_universe_service import get_us_common_stock_flags
 
+if TYPE_CHECKING:
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 logger = logging.getLogger(__name__)
 
 _US_SCREENING_USD_KRW_FALLBACK_RATE = 1300.0
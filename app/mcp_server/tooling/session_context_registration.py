@@ -8,17 +8,14 @@ from app.mcp_server.tooling.session_context_tools import (
     session_context_append,
     session_context_get_recent,
 )
+from app.mcp_server.tooling.tool_names import (
+    SESSION_CONTEXT_TOOL_NAMES,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-SESSION_CONTEXT_TOOL_NAMES: set[str] = {
-    "session_context_append",
-    "session_context_get_recent",
-}
-
-
 def register_session_context_tools(mcp: FastMCP) -> None:
     _ = mcp.tool(
         name="session_context_append",
@@ -0,0 +1,242 @@
+"""Dependency-free MCP tool-name sets.
+
+Tool-name constants used for registry partitioning (``route_request_lanes``,
+profile allowlists) live here so classifying a name never imports the broker,
+pandas, or DB stack behind the tool implementations. The implementing modules
+re-export their sets from here for existing callers.
+"""
+
+from __future__ import annotations
+
+# alpaca_paper
+ALPACA_PAPER_READONLY_TOOL_NAMES: set[str] = {
+    "alpaca_paper_get_account",
+    "alpaca_paper_get_cash",
+    "alpaca_paper_list_positions",
+    "alpaca_paper_list_orders",
+    "alpaca_paper_get_order",
+    "alpaca_paper_list_assets",
+    "alpaca_paper_list_fills",
+    # ROB-84/ROB-90/ROB-92/ROB-93 ledger read and anomaly preflight tools
+    "alpaca_paper_ledger_list_recent",
+    "alpaca_paper_ledger_get",
+    "alpaca_paper_ledger_get_by_correlation",
+    "alpaca_paper_roundtrip_report",
+    "alpaca_paper_execution_preflight_check",
+}
+
+# alpaca_paper_automated_orders
+ALPACA_PAPER_AUTOMATED_TOOL_NAMES: set[str] = {
+    "alpaca_paper_automated_preview_order",
+    "alpaca_paper_automated_submit_order",
+}
+
+# alpaca_paper_orders
+ALPACA_PAPER_MUTATING_TOOL_NAMES: set[str] = {
+    "alpaca_paper_submit_order",
+    "alpaca_paper_cancel_order",
+    "alpaca_paper_reconcile_orders",
+}
+
+# alpaca_paper_preview
+ALPACA_PAPER_PREVIEW_TOOL_NAMES: set[str] = {"alpaca_paper_preview_order"}
+
+# market_quote_snapshot_tools
+MARKET_QUOTE_SNAPSHOT_TOOL_NAMES: set[str] = {
+    "market_quote_snapshot_latest",
+    "market_quote_snapshot_ensure",
+}
+
+# mirror_counterfactual_registration
+MIRROR_COUNTERFACTUAL_TOOL_NAMES: set[str] = {"kis_mock_mirror_execute_report"}
+
+# orders_kis_variants
+KIS_LIVE_ORDER_TOOL_NAMES: set[str] = {
+    "kis_live_place_order",
+    "kis_live_cancel_order",
+    "kis_live_modify_order",
+    "kis_live_get_order_history",
+    "kis_live_reconcile_orders",
+}
+
+# orders_kis_variants
+KIS_MOCK_ORDER_TOOL_NAMES: set[str] = {
+    "kis_mock_place_order",
+    "kis_mock_cancel_order",
+    "kis_mock_modify_order",
+    "kis_mock_get_order_history",
+}
+
+# orders_kis_variants
+# US/overseas + crypto live reconcile (ROB-407 generic ledger). Registered
+# separately from the KIS KR live variants so the crypto profile can expose
+# order reconcile without pulling in the KIS KR live order surface.
+LIVE_RECONCILE_TOOL_NAMES: set[str] = {
+    "live_reconcile_orders",
+}
+
+# orders_kiwoom_us_variants
+KIWOOM_MOCK_US_READ_TOOL_NAMES: set[str] = {
+    "kiwoom_mock_us_get_order_history",
+    "kiwoom_mock_us_get_positions",
+    "kiwoom_mock_us_get_orderable_cash",
+}
+
+# orders_kiwoom_us_variants
+KIWOOM_MOCK_US_MUTATION_TOOL_NAMES: set[str] = {
+    "kiwoom_mock_us_preview_order",
+    "kiwoom_mock_us_place_order",
+    "kiwoom_mock_us_modify_order",
+    "kiwoom_mock_us_cancel_order",
+}
+
+# orders_kiwoom_variants
+KIWOOM_MOCK_TOOL_NAMES: set[str] = {
+    "kiwoom_mock_preview_order",
+    "kiwoom_mock_place_order",
+    "kiwoom_mock_cancel_order",
+    "kiwoom_mock_modify_order",
+    "kiwoom_mock_get_order_history",
+    "kiwoom_mock_get_order_detail",
+    "kiwoom_mock_get_positions",
+    "kiwoom_mock_get_orderable_cash",
+}
+
+# orders_registration
+ORDER_TOOL_NAMES: set[str] = {
+    "place_order",
+    "modify_order",
+    "cancel_order",
+    "get_order_history",
+    "kis_mock_reconciliation_run",
+    "sell_ladder_fill_preview",
+    "buy_ladder_fill_preview",
+}
+
+# orders_toss_variants
+TOSS_LIVE_ORDER_TOOL_NAMES: set[str] = {
+    "toss_preview_order",
+    "toss_place_order",
+    "toss_modify_order",
+    "toss_cancel_order",
+    "toss_get_order_history",
+    "toss_get_positions",
+    "toss_get_orderable_cash",
+    "toss_reconcile_orders",
+}
+
+# us_dual_paper
+US_DUAL_PAPER_TOOL_NAMES: set[str] = {
+    "us_dual_paper_capability_matrix",
+    "us_dual_paper_account_states",
+    "us_dual_paper_preview",
+}
+
+# analysis_artifact_registration
+ANALYSIS_ARTIFACT_TOOL_NAMES: set[str] = {
+    "analysis_artifact_save",
+    "analysis_artifact_list",
+    "analysis_artifact_get",
+}
+
+# forecast_registration
+FORECAST_TOOL_NAMES: set[str] = {
+    "forecast_save",
+    "forecast_resolve",
+    "get_forecasts",
+    "get_forecast_calibration",
+}
+
+# paper_limit_order_handler
+PAPER_LIMIT_ORDER_TOOL_NAMES: set[str] = {
+    "paper_place_limit_order",
+    "paper_reconcile_orders",
+    "paper_cancel_pending_order",
+    "paper_list_pending_orders",
+}
+
+# session_context_registration
+SESSION_CONTEXT_TOOL_NAMES: set[str] = {
+    "session_context_append",
+    "session_context_get_recent",
+}
+
+# user_settings_registration
+USER_SETTINGS_TOOL_NAMES: set[str] = {
+    "get_user_setting",
+    "set_user_setting",
+}
+
+# orders_kiwoom_us_variants
+KIWOOM_MOCK_US_TOOL_NAMES: set[str] = (
+    KIWOOM_MOCK_US_READ_TOOL_NAMES | KIWOOM_MOCK_US_MUTATION_TOOL_NAMES
+)
+
+# trade_retrospective_registration
+TRADE_RETROSPECTIVE_TOOL_NAMES: set[str] = {
+    "save_trade_retrospective",
+    "get_trade_retrospectives",
+    "get_retrospective_aggregate",
+    "trade_retrospective_pending",
+}
+
+# operating_briefing_registration
+OPERATING_BRIEFING_TOOL_NAMES: set[str] = {
+    "list_active_watches",
+    "get_operating_briefing",
+}
+
+# investment_reports_handlers
+INVESTMENT_REPORT_TOOL_NAMES: set[str] = {
+    "investment_report_create",
+    "investment_report_list",
+    "investment_report_get",
+    "investment_report_decide_item",
+    "investment_report_activate_watch",
+    "investment_report_context_get",
+    "investment_report_delta_get",
+    "investment_report_generate_from_bundle",
+    "investment_watch_recommend",
+    "investment_report_set_status",
+    "investment_report_add_items",
+    "investment_report_update",
+    # ROB-768 — direct watch create (independent of report flow).
+    "investment_watch_create",
+    # ROB-971 — explicit lifecycle controls for operational watch cleanup.
+    "investment_watch_void",
+    "investment_watch_expire",
+    "sweep_expired_watches",
+}
+
+# order_proposal_tools
+ORDER_PROPOSAL_TOOL_NAMES: set[str] = {
+    "order_proposal_create",
+    "order_proposal_get",
+    "order_proposal_list",
+    "order_proposal_void",
+    "order_proposal_expire_sweep",
+    "order_proposal_list_expired_defensive",
+    "order_proposal_redispatch",
+}
+
+# analysis_bundle_handlers
+ANALYSIS_BUNDLE_TOOL_NAMES: set[str] = {
+    "analysis_bundle_create",
+    "analysis_bundle_get",
+}
+
+# investment_hermes_handlers
+INVESTMENT_HERMES_TOOL_NAMES: set[str] = {
+    "investment_report_prepare_bundle",
+    "investment_report_get_hermes_context",
+    "investment_report_create_from_hermes_composition",
+    "investment_stage_artifacts_ingest_from_hermes",
+    "investment_report_prepare_intraday_context",
+}
+
+# investment_snapshots_registration
+INVESTMENT_SNAPSHOTS_TOOL_NAMES: set[str] = {
+    "investment_snapshot_bundle_get",
+    "investment_snapshot_bundle_list",
+    "investment_snapshot_list",
+}
@@ -5,6 +5,9 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.mcp_server.tooling.tool_names import (
+    TRADE_RETROSPECTIVE_TOOL_NAMES,
+)
 from app.mcp_server.tooling.trade_retrospective_tools import (
     get_retrospective_aggregate,
     get_trade_retrospectives,
@@ -12,13 +15,6 @@ from app.mcp_server.tooling.trade_retrospective_tools import (
     trade_retrospective_pending,
 )
 
-TRADE_RETROSPECTIVE_TOOL_NAMES: set[str] = {
-    "save_trade_retrospective",
-    "get_trade_retrospectives",
-    "get_retrospective_aggregate",
-    "trade_retrospective_pending",
-}
-
 
 def register_trade_retrospective_tools(mcp: Any) -> None:
     _ = mcp.tool(
@@ -13,66 +13,59 @@ from app.mcp_server.tooling.account_read_registration import ACCOUNT_READ_TOOL_N
 from app.mcp_server.tooling.account_routing_registration import (
     register_account_routing_tools,
 )
-from app.mcp_server.tooling.analysis_artifact_registration import (
-    ANALYSIS_ARTIFACT_TOOL_NAMES,
-)
-from app.mcp_server.tooling.analysis_readonly_registration import _AllowlistedMCP
+from app.mcp_server.tooling.allowlist import _AllowlistedMCP
 from app.mcp_server.tooling.forecast_registration import (
-    FORECAST_TOOL_NAMES,
     register_forecast_tools,
 )
 from app.mcp_server.tooling.forecast_tools import forecast_save as _forecast_save
 from app.mcp_server.tooling.fundamentals_registration import register_fundamentals_tools
 from app.mcp_server.tooling.investment_reports_handlers import (
-    INVESTMENT_REPORT_TOOL_NAMES,
-    register_investment_report_tools,
+    investment_watch_create_impl as _investment_watch_create,
 )
 from app.mcp_server.tooling.investment_reports_handlers import (
-    investment_watch_create_impl as _investment_watch_create,
+    register_investment_report_tools,
 )
 from app.mcp_server.tooling.operating_briefing_registration import (
-    OPERATING_BRIEFING_TOOL_NAMES,
     register_operating_briefing_tools,
 )
 from app.mcp_server.tooling.order_proposal_tools import (
-    ORDER_PROPOSAL_TOOL_NAMES,
     register_order_proposal_tools,
 )
 from app.mcp_server.tooling.orders_kis_variants import (
-    KIS_LIVE_ORDER_TOOL_NAMES,
-    KIS_MOCK_ORDER_TOOL_NAMES,
-    LIVE_RECONCILE_TOOL_NAMES,
     register_kis_live_order_tools,
 )
-from app.mcp_server.tooling.orders_kiwoom_us_variants import (
-    KIWOOM_MOCK_US_TOOL_NAMES,
-)
-from app.mcp_server.tooling.orders_kiwoom_variants import (
-    KIWOOM_MOCK_TOOL_NAMES,
-)
 from app.mcp_server.tooling.orders_kiwoom_variants import (
     register as register_kiwoom_mock_tools,
 )
 from app.mcp_server.tooling.orders_registration import (
-    ORDER_TOOL_NAMES,
     register_order_tools,
 )
 from app.mcp_server.tooling.orders_toss_variants import (
-    TOSS_LIVE_ORDER_TOOL_NAMES,
     register_toss_live_order_tools,
 )
-from app.mcp_server.tooling.paper_limit_order_handler import (
-    PAPER_LIMIT_ORDER_TOOL_NAMES,
-)
 from app.mcp_server.tooling.portfolio_registration import register_portfolio_tools
 from app.mcp_server.tooling.route_request_registration import (
     register_route_request_tools,
 )
-from app.mcp_server.tooling.session_context_registration import (
+from app.mcp_server.tooling.tool_names import (
+    ANALYSIS_ARTIFACT_TOOL_NAMES,
+    FORECAST_TOOL_NAMES,
+    INVESTMENT_REPORT_TOOL_NAMES,
+    KIS_LIVE_ORDER_TOOL_NAMES,
+    KIS_MOCK_ORDER_TOOL_NAMES,
+    KIWOOM_MOCK_TOOL_NAMES,
+    KIWOOM_MOCK_US_TOOL_NAMES,
+    LIVE_RECONCILE_TOOL_NAMES,
+    OPERATING_BRIEFING_TOOL_NAMES,
+    ORDER_PROPOSAL_TOOL_NAMES,
+    ORDER_TOOL_NAMES,
+    PAPER_LIMIT_ORDER_TOOL_NAMES,
     SESSION_CONTEXT_TOOL_NAMES,
+    TOSS_LIVE_ORDER_TOOL_NAMES,
+    TRADE_RETROSPECTIVE_TOOL_NAMES,
+    USER_SETTINGS_TOOL_NAMES,
 )
 from app.mcp_server.tooling.trade_retrospective_registration import (
-    TRADE_RETROSPECTIVE_TOOL_NAMES,
     register_trade_retrospective_tools,
 )
 from app.mcp_server.tooling.trade_retrospective_tools import (
@@ -81,7 +74,6 @@ from app.mcp_server.tooling.trade_retrospective_tools import (
 from app.mcp_server.tooling.trading_policy_registration import (
     register_trading_policy_tools,
 )
-from app.mcp_server.tooling.user_settings_registration import USER_SETTINGS_TOOL_NAMES
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
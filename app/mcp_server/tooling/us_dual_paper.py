@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from app.mcp_server.tooling.tool_names import US_DUAL_PAPER_TOOL_NAMES
 from app.schemas.us_dual_paper import DualPaperBrokerStatus
 from app.services.us_dual_paper.adapters.alpaca import AlpacaPaperAdapter
 from app.services.us_dual_paper.adapters.base import BrokerPreviewAdapter
@@ -14,12 +15,6 @@ from app.services.us_dual_paper.packet import build_packet
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-US_DUAL_PAPER_TOOL_NAMES: set[str] = {
-    "us_dual_paper_capability_matrix",
-    "us_dual_paper_account_states",
-    "us_dual_paper_preview",
-}
-
 
 def _adapters() -> list[BrokerPreviewAdapter]:
     return [KisMockUsAdapter(), AlpacaPaperAdapter()]
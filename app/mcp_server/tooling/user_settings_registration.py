@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from app.mcp_server.tooling.tool_names import (
+    USER_SETTINGS_TOOL_NAMES,
+)
 from app.mcp_server.tooling.user_settings_tools import (
     get_user_setting,
     set_user_setting,
@@ -10,11 +13,6 @@ from app.mcp_server.tooling.user_settings_tools import (
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
-USER_SETTINGS_TOOL_NAMES: set[str] = {
-    "get_user_setting",
-    "set_user_setting",
-}
-
 
 def register_user_settings_tools(mcp: FastMCP) -> None:
     _ = mcp.tool(
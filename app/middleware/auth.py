@@ -12,6 +12,7 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 from app.auth.web_router import get_current_user_from_session
 from app.core.config import settings
 from app.core.db import AsyncSessionLocal
+from app.monitoring.metrics import scrape_authorized
 from app.routers.deprecated_pages import LEGACY_PREFIXES
 
 
@@ -61,6 +62,7 @@ class AuthMiddleware:
     HERMES_INGEST_PATH_PREFIX: ClassVar[str] = "/trading/api/investment-reports/hermes/"
     NEWS_RELEVANCE_PATH_PREFIX: ClassVar[str] = "/trading/api/news-relevance/"
     TELEGRAM_CALLBACK_PATH_PREFIX: ClassVar[str] = "/trading/api/telegram/"
+    METRICS_PATH: ClassVar[str] = "/metrics"
     LEGACY_DEPRECATED_PREFIXES: ClassVar[tuple[str, ...]] = LEGACY_PREFIXES
 
     def __init__(self, app: ASGIApp):
@@ -164,6 +166,22 @@ class AuthMiddleware:
                 )
             return None
 
+        # Prometheus scrape: machine-to-machine bearer token, never a session.
+        if path == self.METRICS_PATH:
+            if not settings.metrics_enabled:
+                return JSONResponse(status_code=404, content={"detail": "Not Found"})
+            if not settings.metrics_bearer_token:
+                return JSONResponse(
+                    status_code=403,
+                    content={"detail": "Metrics bearer token not configured"},
+                )
+            if not scrape_authorized(request.headers.get("authorization")):
+                return JSONResponse(
+                    status_code=401,
+                    content={"detail": "Invalid metrics bearer token"},
+                )
+            return None
+
         # research-reports bulk ingest API: machine-to-machine token auth.
         if path == self.RESEARCH_REPORTS_BULK_INGEST_PATH:
             expected_token = settings.RESEARCH_REPORTS_INGEST_TOKEN
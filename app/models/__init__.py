@@ -53,6 +53,7 @@ from .market_report import MarketReport
 from .market_valuation_snapshot import MarketValuationSnapshot
 from .naver_research_detail_cache import NaverResearchDetailCache
 from .news import NewsAnalysisResult, NewsArticle, NewsIngestionRun, Sentiment
+from .ohlcv_feature_snapshot import OhlcvFeatureSnapshot
 from .order_proposals import (
     OrderProposal,
     OrderProposalApprovalBatch,
@@ -247,6 +248,7 @@ __all__ = [
     "MarketQuoteSnapshot",
     "MarketValuationSnapshot",
     "NaverResearchDetailCache",
+    "OhlcvFeatureSnapshot",
     "FinancialFundamentalsSnapshot",
     "Trade",
     "TossLiveOrderLedger",
@@ -0,0 +1,71 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    TIMESTAMP,
+    BigInteger,
+    CheckConstraint,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class OhlcvFeatureSnapshot(Base):
+    """Latest indicator vector per (market, symbol, period), as of ``bar_time``.
+
+    ``bar_time`` is the open time of the last *closed* bar the vector was
+    computed from; the row is replaced only when a newer bar closes.
+    """
+
+    __tablename__ = "ohlcv_feature_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "market",
+            "symbol",
+            "period",
+            name="uq_ohlcv_feature_snapshots_market_symbol_period",
+        ),
+        CheckConstraint(
+            "market IN ('kr', 'us', 'crypto')",
+            name="ck_ohlcv_feature_snapshots_market",
+        ),
+        CheckConstraint(
+            "period IN ('day')",
+            name="ck_ohlcv_feature_snapshots_period",
+        ),
+        Index(
+            "ix_ohlcv_feature_snapshots_market_period_bar",
+            "market",
+            "period",
+            "bar_time",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    market: Mapped[str] = mapped_column(String(8), nullable=False)
+    symbol: Mapped[str] = mapped_column(String(32), nullable=False)
+    period: Mapped[str] = mapped_column(String(8), nullable=False)
+    bar_time: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    bars_used: Mapped[int] = mapped_column(Integer, nullable=False)
+    close: Mapped[Decimal] = mapped_column(Numeric(20, 6), nullable=False)
+    features: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
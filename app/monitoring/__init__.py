@@ -1,10 +1,25 @@
-from app.monitoring.yfinance_sentry import (
-    SentryTracingCurlSession,
-    build_yfinance_tracing_session,
-    close_yfinance_session,
-    yfinance_tracing_session,
+from typing import Any
+
+# Resolved on first access so importing ``app.monitoring.metrics`` (broker
+# clients, MCP profiles) does not drag in sentry_sdk/curl_cffi.
+_YFINANCE_SENTRY_EXPORTS = frozenset(
+    {
+        "SentryTracingCurlSession",
+        "build_yfinance_tracing_session",
+        "close_yfinance_session",
+        "yfinance_tracing_session",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    if name in _YFINANCE_SENTRY_EXPORTS:
+        from app.monitoring import yfinance_sentry
+
+        return getattr(yfinance_sentry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "SentryTracingCurlSession",
     "build_yfinance_tracing_session",
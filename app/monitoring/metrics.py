@@ -0,0 +1,191 @@
+"""Prometheus metrics shared by the API, MCP and worker processes.
+
+One module-level set of collectors; instrumentation sites only call
+``.labels(...).observe()/.inc()`` (a dict lookup plus a locked add), so the
+per-call overhead stays in the microseconds.
+
+Multiprocess: when ``PROMETHEUS_MULTIPROC_DIR`` is set before this module is
+imported, prometheus_client writes every sample to mmap files in that
+directory and ``render_latest()`` aggregates all live and exited processes of
+the host (uvicorn workers, taskiq workers, the MCP server) through a
+``MultiProcessCollector``. Without it each process exposes only its own
+samples. The directory must be wiped on deploy (see prometheus_client docs).
+
+Label values are kept low-cardinality: broker endpoints are the KIS
+``api_name`` or a path normalized by ``endpoint_label``, never raw URLs,
+symbols or order ids; MCP tool names are limited to the registered tools.
+"""
+
+from __future__ import annotations
+
+import hmac
+import logging
+import os
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client import multiprocess as _multiprocess
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+_JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 900.0, 1800.0)
+_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+BROKER_REQUEST_SECONDS = Histogram(
+    "auto_trader_broker_request_seconds",
+    "Broker HTTP call latency (including in-call 429 retries).",
+    ("broker", "endpoint", "outcome"),
+    buckets=_LATENCY_BUCKETS,
+)
+OHLCV_CACHE_EVENTS = Counter(
+    "auto_trader_ohlcv_cache_events_total",
+    "OHLCV cache read-through outcomes.",
+    ("cache", "event"),
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "auto_trader_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled DB connection (includes new connects).",
+    buckets=_WAIT_BUCKETS,
+)
+MCP_TOOL_SECONDS = Histogram(
+    "auto_trader_mcp_tool_seconds",
+    "MCP tools/call latency.",
+    ("tool", "outcome"),
+    buckets=_LATENCY_BUCKETS,
+)
+TASKIQ_JOB_SECONDS = Histogram(
+    "auto_trader_taskiq_job_seconds",
+    "taskiq task execution time.",
+    ("task", "outcome"),
+    buckets=_JOB_BUCKETS,
+)
+RATE_LIMITER_WAIT_SECONDS = Histogram(
+    "auto_trader_rate_limiter_wait_seconds",
+    "Client-side rate-limiter throttle waits.",
+    ("limiter",),
+    buckets=_WAIT_BUCKETS,
+)
+
+_ID_SEGMENT = re.compile(r"^(?:v\d+|[a-z][A-Za-z_\-]*)$")
+
+
+def endpoint_label(path: str) -> str:
+    """Collapse a request path to a bounded label (ids/symbols → ``{id}``)."""
+    segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+    return "/" + "/".join(
+        segment if _ID_SEGMENT.match(segment) else "{id}" for segment in segments
+    )
+
+
+@contextmanager
+def observe_broker_request(broker: str, endpoint: str) -> Iterator[None]:
+    """Time a broker call; ``outcome`` is ``ok`` or the exception class name."""
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException as exc:
+        outcome = type(exc).__name__
+        raise
+    finally:
+        BROKER_REQUEST_SECONDS.labels(broker, endpoint, outcome).observe(
+            time.perf_counter() - started
+        )
+
+
+def record_ohlcv_cache(cache: str, event: str) -> None:
+    OHLCV_CACHE_EVENTS.labels(cache, event).inc()
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def collector_registry() -> CollectorRegistry:
+    """Registry to expose: the host-wide aggregate in multiprocess mode."""
+    if not multiprocess_enabled():
+        return REGISTRY
+    registry = CollectorRegistry()
+    _multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Prometheus text exposition and its content type."""
+    return generate_latest(collector_registry()), CONTENT_TYPE_LATEST
+
+
+def scrape_authorized(authorization: str | None) -> bool:
+    """Check an ``Authorization`` header against ``metrics_bearer_token``.
+
+    Fails closed: without a configured token no scrape is authorized.
+    """
+    token = settings.metrics_bearer_token
+    if not token:
+        return False
+    scheme, _, credentials = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(
+        credentials.strip(), token
+    )
+
+
+def start_worker_metrics_server(port: int | None) -> bool:
+    """Serve ``/metrics`` from a worker process on ``port`` (best effort).
+
+    With several taskiq worker processes only the first one binds the port; in
+    multiprocess mode it already exposes its siblings' samples, so the others
+    skip quietly.
+    """
+    if not port:
+        return False
+    try:
+        start_http_server(port, registry=collector_registry())
+    except OSError as exc:
+        logger.debug("metrics: worker exporter not started on %s: %s", port, exc)
+        return False
+    return True
+
+
+__all__ = [
+    "BROKER_REQUEST_SECONDS",
+    "DB_POOL_CHECKOUT_SECONDS",
+    "MCP_TOOL_SECONDS",
+    "OHLCV_CACHE_EVENTS",
+    "RATE_LIMITER_WAIT_SECONDS",
+    "TASKIQ_JOB_SECONDS",
+    "collector_registry",
+    "endpoint_label",
+    "multiprocess_enabled",
+    "observe_broker_request",
+    "record_ohlcv_cache",
+    "render_latest",
+    "scrape_authorized",
+    "start_worker_metrics_server",
+]
@@ -9,11 +9,12 @@ from __future__ import annotations
 from datetime import UTC, date, datetime, time
 from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import AsyncSessionLocal, get_db
 from app.routers.dependencies import get_authenticated_user
+from app.routers.invest_http_cache import InvestConditionalRoute, conditional_get
 from app.schemas.invest_account_panel import AccountPanelResponse
 from app.schemas.invest_action_readiness import KrActionReadinessResponse
 from app.schemas.invest_benchmark_gap import BenchmarkGapMatrixResponse
@@ -130,6 +131,13 @@ from app.services.invest_view_model.stock_detail_symbol_resolver import (
     SymbolNotFound,
     resolve_symbol,
 )
+from app.services.invest_view_model.watermarks import (
+    market_events_watermark,
+    momentum_snapshot_watermark,
+    news_ingestion_watermark,
+    research_report_watermark,
+    screener_snapshot_watermark,
+)
 from app.services.invest_view_model.weekly_summary_service import build_weekly_summary
 from app.services.investment_reports.linked_orders import (
     list_live_orders_for_symbol,
@@ -148,7 +156,33 @@ def _parse_paper_sources(value: str | None) -> frozenset[str] | None:
     return frozenset(parts) if parts else None
 
 
-router = APIRouter(prefix="/invest/api", tags=["invest"])
+router = APIRouter(
+    prefix="/invest/api", tags=["invest"], route_class=InvestConditionalRoute
+)
+
+
+def _market_param(request: Request) -> str:
+    return request.query_params.get("market") or "kr"
+
+
+async def _screener_version(db: AsyncSession, request: Request) -> str | None:
+    return await screener_snapshot_watermark(db, market=_market_param(request))
+
+
+async def _momentum_version(db: AsyncSession, request: Request) -> str | None:
+    return await momentum_snapshot_watermark(db, market=_market_param(request))
+
+
+async def _calendar_version(db: AsyncSession, request: Request) -> str | None:
+    return await market_events_watermark(db)
+
+
+async def _news_version(db: AsyncSession, request: Request) -> str | None:
+    return await news_ingestion_watermark(db)
+
+
+async def _research_version(db: AsyncSession, request: Request) -> str | None:
+    return await research_report_watermark(db)
 
 
 def get_invest_home_service(
@@ -192,7 +226,10 @@ def get_screener_service_dep():
     return ScreenerService()
 
 
-@router.get("/home")
+@router.get(
+    "/home",
+    dependencies=[Depends(conditional_get("home"))],
+)
 async def get_home(
     user: Annotated[Any, Depends(get_authenticated_user)],
     service: Annotated[InvestHomeService, Depends(get_invest_home_service)],
@@ -321,6 +358,8 @@ async def get_invest_coverage(
             market=market,
             symbols=symbol_list,
             as_of=as_of,
+            session_factory=AsyncSessionLocal,
+            use_cache=True,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -340,7 +379,13 @@ async def get_invest_coverage_benchmark_gap(
     """
     _ = user
     try:
-        coverage = await build_invest_coverage(db, market=market, as_of=as_of)
+        coverage = await build_invest_coverage(
+            db,
+            market=market,
+            as_of=as_of,
+            session_factory=AsyncSessionLocal,
+            use_cache=True,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     return build_benchmark_gap_matrix_from_coverage(coverage, market=market)
@@ -436,7 +481,10 @@ async def get_common_preferred_disparity(
 StockDetailMarketParam = Literal["kr", "us", "crypto"]
 
 
-@router.get("/stock-detail/{market}/{symbol}")
+@router.get(
+    "/stock-detail/{market}/{symbol}",
+    dependencies=[Depends(conditional_get("stock_detail"))],
+)
 async def get_stock_detail(
     market: StockDetailMarketParam,
     symbol: str,
@@ -458,7 +506,16 @@ async def get_stock_detail(
         raise HTTPException(status_code=404, detail="symbol_not_found") from exc
 
 
-@router.get("/stock-detail/{market}/{symbol}/research-consensus")
+@router.get(
+    "/stock-detail/{market}/{symbol}/research-consensus",
+    dependencies=[
+        Depends(
+            conditional_get(
+                "stock_detail_research_consensus", watermark=_research_version
+            )
+        )
+    ],
+)
 async def get_stock_detail_research_consensus(
     market: StockDetailMarketParam,
     symbol: str,
@@ -481,7 +538,10 @@ async def get_stock_detail_research_consensus(
         raise HTTPException(status_code=404, detail="symbol_not_found") from exc
 
 
-@router.get("/stock-detail/{market}/{symbol}/recommendation")
+@router.get(
+    "/stock-detail/{market}/{symbol}/recommendation",
+    dependencies=[Depends(conditional_get("stock_detail_recommendation"))],
+)
 async def get_stock_detail_recommendation(
     market: StockDetailMarketParam,
     symbol: str,
@@ -504,7 +564,10 @@ async def get_stock_detail_recommendation(
         raise HTTPException(status_code=404, detail="symbol_not_found") from exc
 
 
-@router.get("/stock-detail/{market}/{symbol}/candles")
+@router.get(
+    "/stock-detail/{market}/{symbol}/candles",
+    dependencies=[Depends(conditional_get("stock_detail_candles"))],
+)
 async def get_stock_detail_candles(
     market: StockDetailMarketParam,
     symbol: str,
@@ -523,7 +586,12 @@ async def get_stock_detail_candles(
         raise HTTPException(status_code=400, detail=exc.code) from exc
 
 
-@router.get("/stock-detail/{market}/{symbol}/news")
+@router.get(
+    "/stock-detail/{market}/{symbol}/news",
+    dependencies=[
+        Depends(conditional_get("stock_detail_news", watermark=_news_version))
+    ],
+)
 async def get_stock_detail_news(
     market: StockDetailMarketParam,
     symbol: str,
@@ -548,7 +616,10 @@ async def get_stock_detail_news(
     )
 
 
-@router.get("/stock-detail/{market}/{symbol}/orders")
+@router.get(
+    "/stock-detail/{market}/{symbol}/orders",
+    dependencies=[Depends(conditional_get("stock_detail_orders"))],
+)
 async def get_stock_detail_orders(
     market: StockDetailMarketParam,
     symbol: str,
@@ -567,7 +638,10 @@ async def get_stock_detail_orders(
     )
 
 
-@router.get("/stock-detail/{market}/{symbol}/order-ledger")
+@router.get(
+    "/stock-detail/{market}/{symbol}/order-ledger",
+    dependencies=[Depends(conditional_get("stock_detail_order_ledger"))],
+)
 async def get_stock_detail_order_ledger(
     market: StockDetailMarketParam,
     symbol: str,
@@ -616,7 +690,10 @@ async def get_signals(
     return await build_signals(db=db, resolver=resolver, tab=tab, limit=limit)
 
 
-@router.get("/calendar")
+@router.get(
+    "/calendar",
+    dependencies=[Depends(conditional_get("calendar", watermark=_calendar_version))],
+)
 async def get_calendar(
     user: Annotated[Any, Depends(get_authenticated_user)],
     service: Annotated[InvestHomeService, Depends(get_invest_home_service)],
@@ -641,6 +718,7 @@ async def get_calendar(
         from_date=from_date,
         to_date=to_date,
         tab=tab,
+        use_cache=True,
     )
 
 
@@ -653,7 +731,10 @@ async def get_calendar_weekly_summary(
     return await build_weekly_summary(db=db, week_start=week_start)
 
 
-@router.get("/feed/news")
+@router.get(
+    "/feed/news",
+    dependencies=[Depends(conditional_get("feed_news", watermark=_news_version))],
+)
 async def get_feed_news(
     user: Annotated[Any, Depends(get_authenticated_user)],
     service: Annotated[InvestHomeService, Depends(get_invest_home_service)],
@@ -663,6 +744,7 @@ async def get_feed_news(
     cursor: str | None = Query(None),
     include_quotes: Annotated[bool, Query(alias="includeQuotes")] = False,
     topic: FeedTopic | None = Query(None),
+    q: str | None = Query(None, max_length=200),
     include_paper: Annotated[bool, Query(alias="includePaper")] = False,
     paper_sources: Annotated[str | None, Query(alias="paperSources")] = None,
 ) -> FeedNewsResponse:
@@ -682,10 +764,16 @@ async def get_feed_news(
         cursor=cursor,
         include_quotes=include_quotes,
         topic=topic,
+        q=q,
     )
 
 
-@router.get("/feed/research")
+@router.get(
+    "/feed/research",
+    dependencies=[
+        Depends(conditional_get("feed_research", watermark=_research_version))
+    ],
+)
 async def get_feed_research(
     user: Annotated[Any, Depends(get_authenticated_user)],
     service: Annotated[InvestHomeService, Depends(get_invest_home_service)],
@@ -742,7 +830,12 @@ async def get_screener_presets_endpoint(
     return build_screener_presets(market=market)
 
 
-@router.get("/screener/results")
+@router.get(
+    "/screener/results",
+    dependencies=[
+        Depends(conditional_get("screener_results", watermark=_screener_version))
+    ],
+)
 async def get_screener_results_endpoint(
     user: Annotated[Any, Depends(get_authenticated_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -791,7 +884,20 @@ async def screener_snapshots_coverage(
     }
 
 
-@router.get("/momentum/events", response_model=MomentumEventsResponse)
+@router.get(
+    "/momentum/events",
+    response_model=MomentumEventsResponse,
+    dependencies=[
+        Depends(
+            conditional_get(
+                "momentum_events",
+                watermark=_momentum_version,
+                pure=True,
+                user_scoped=False,
+            )
+        )
+    ],
+)
 async def get_momentum_events(
     db: Annotated[AsyncSession, Depends(get_db)],
     market: Literal["kr", "us", "crypto"] = Query("kr"),
@@ -824,7 +930,20 @@ async def get_momentum_events(
     )
 
 
-@router.get("/momentum/candidates", response_model=MomentumCandidatesResponse)
+@router.get(
+    "/momentum/candidates",
+    response_model=MomentumCandidatesResponse,
+    dependencies=[
+        Depends(
+            conditional_get(
+                "momentum_candidates",
+                watermark=_momentum_version,
+                pure=True,
+                user_scoped=False,
+            )
+        )
+    ],
+)
 async def get_momentum_candidates(
     db: Annotated[AsyncSession, Depends(get_db)],
     market: Literal["kr", "us", "crypto"] = Query("kr"),
@@ -851,7 +970,20 @@ async def get_momentum_candidates(
     )
 
 
-@router.get("/momentum/themes", response_model=ThemeEventsResponse)
+@router.get(
+    "/momentum/themes",
+    response_model=ThemeEventsResponse,
+    dependencies=[
+        Depends(
+            conditional_get(
+                "momentum_themes",
+                watermark=_momentum_version,
+                pure=True,
+                user_scoped=False,
+            )
+        )
+    ],
+)
 async def get_momentum_themes(
     db: Annotated[AsyncSession, Depends(get_db)],
     market: Literal["kr", "us", "crypto"] = Query("kr"),
@@ -884,7 +1016,17 @@ async def get_momentum_themes(
     )
 
 
-@router.get("/momentum/coverage", response_model=MomentumCoverageResponse)
+@router.get(
+    "/momentum/coverage",
+    response_model=MomentumCoverageResponse,
+    dependencies=[
+        Depends(
+            conditional_get(
+                "momentum_coverage", watermark=_momentum_version, user_scoped=False
+            )
+        )
+    ],
+)
 async def momentum_coverage(
     db: Annotated[AsyncSession, Depends(get_db)],
     market: Literal["kr", "us", "crypto"] = Query("kr"),
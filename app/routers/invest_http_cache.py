@@ -0,0 +1,328 @@
+"""Conditional-GET / response cache layer for the read-only `/invest/api` routes.
+
+The SPA polls these endpoints; without validators every poll re-downloads the
+full JSON body. Two pieces cooperate, leaving the endpoint functions as plain
+view-model builders:
+
+* ``InvestConditionalRoute`` (the router's ``route_class``) post-processes every
+  200 JSON response: weak ETag, ``If-None-Match`` → 304, optional Redis body
+  cache write, and gzip for bodies at or above
+  ``settings.invest_api_gzip_min_bytes`` (the screener payloads are the big
+  ones).
+* ``conditional_get(scope, ...)`` is a route dependency that runs *before* the
+  builder. With ``pure=True`` the body is a function of (scope, user, params,
+  watermark) alone, so the ETag is derived from that key and a matching
+  ``If-None-Match`` is answered with 304 without building the view model.
+  Otherwise a hit in the optional Redis body cache
+  (``settings.invest_api_body_cache_enabled``) short-circuits the builder; its
+  short TTL bounds how stale the live parts of a view (holdings, quotes) can
+  get, and a new watermark changes the key outright.
+
+Watermarks come from ``app.services.invest_view_model.watermarks`` and are only
+queried when something consumes them (a pure route, or an enabled body cache).
+All ETags are weak (``W/"…"``) so one validator covers the identity and gzip
+representations. The cache is fail-open, mirroring
+``app.services.naver_finance.peer_cache``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any
+
+import redis.asyncio as redis
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import get_db
+from app.routers.dependencies import get_authenticated_user
+from app.services.ohlcv_cache_common import create_redis_client
+
+logger = logging.getLogger(__name__)
+
+Watermark = Callable[[AsyncSession, Request], Awaitable[str | None]]
+
+_KEY_PREFIX = "invest_api:body:v1:"
+_CACHE_CONTROL = "private, no-cache"
+_REDIS_CLIENT: redis.Redis | None = None
+
+
+async def _get_redis_client() -> redis.Redis | None:
+    global _REDIS_CLIENT
+    if not settings.invest_api_body_cache_enabled:
+        return None
+    if _REDIS_CLIENT is not None:
+        return _REDIS_CLIENT
+    try:
+        _REDIS_CLIENT = await create_redis_client()
+    except Exception as exc:  # noqa: BLE001 — fail open to a live build
+        logger.debug("invest_http_cache: redis init failed: %s", exc)
+        _REDIS_CLIENT = None
+    return _REDIS_CLIENT
+
+
+async def close_invest_http_cache_redis() -> None:
+    global _REDIS_CLIENT
+    if _REDIS_CLIENT is not None:
+        try:
+            await _REDIS_CLIENT.close()
+        except Exception:  # noqa: BLE001
+            pass
+        _REDIS_CLIENT = None
+
+
+def _digest(*parts: object) -> str:
+    material = json.dumps(parts, default=str, separators=(",", ":"))
+    return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+
+def _weak_etag(token: str) -> str:
+    return f'W/"{token}"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """Weak comparison of ``etag`` against the request's ``If-None-Match``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def _validator_headers(etag: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": _CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag))
+
+
+def _body_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    *,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    merged = {**(headers or {}), **_validator_headers(etag)}
+    accepts_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    if accepts_gzip and len(body) >= settings.invest_api_gzip_min_bytes:
+        body = gzip.compress(body, compresslevel=6)
+        merged["Content-Encoding"] = "gzip"
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=merged,
+    )
+
+
+async def _cache_get(
+    redis_client: redis.Redis | None, key: str
+) -> tuple[str, bytes] | None:
+    if redis_client is None:
+        return None
+    try:
+        raw = await redis_client.get(f"{_KEY_PREFIX}{key}")
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("invest_http_cache: GET failed for %s: %s", key, exc)
+        return None
+    if not isinstance(raw, str):
+        return None
+    etag, sep, body = raw.partition("\n")
+    if not sep or not etag.startswith('W/"'):
+        return None
+    return etag, body.encode("utf-8")
+
+
+async def _cache_set(
+    redis_client: redis.Redis | None, key: str, etag: str, body: bytes
+) -> None:
+    if redis_client is None:
+        return
+    try:
+        ttl = max(1, int(settings.invest_api_body_cache_ttl_seconds))
+        value = f"{etag}\n{body.decode('utf-8')}"
+        await redis_client.set(f"{_KEY_PREFIX}{key}", value, ex=ttl)
+    except Exception as exc:  # noqa: BLE001 — best-effort
+        logger.debug("invest_http_cache: SET failed for %s: %s", key, exc)
+
+
+class _ShortCircuit(Exception):
+    """Raised by ``conditional_get`` to answer without running the endpoint."""
+
+    def __init__(self, response: Response) -> None:
+        super().__init__("invest_http_cache short-circuit")
+        self.response = response
+
+
+async def _check(
+    request: Request,
+    *,
+    scope: str,
+    user_id: int | None,
+    db: AsyncSession | None,
+    watermark: Watermark | None,
+    pure: bool,
+) -> None:
+    redis_client = await _get_redis_client()
+    if (pure or redis_client is not None) and watermark is not None and db is not None:
+        version = await watermark(db, request)
+    else:
+        version = None
+    params = sorted(request.query_params.multi_items())
+    key = _digest(scope, user_id, request.url.path, params, version)
+    key_etag = _weak_etag(key) if pure and version is not None else None
+    request.state.invest_cache_key = key
+    request.state.invest_cache_etag = key_etag
+    if key_etag is not None and if_none_match(request, key_etag):
+        raise _ShortCircuit(_not_modified(key_etag))
+
+    cached = await _cache_get(redis_client, key)
+    if cached is not None:
+        etag, body = cached
+        if if_none_match(request, etag):
+            raise _ShortCircuit(_not_modified(etag))
+        raise _ShortCircuit(_body_response(request, body, etag))
+
+
+def conditional_get(
+    scope: str,
+    *,
+    watermark: Watermark | None = None,
+    pure: bool = False,
+    user_scoped: bool = True,
+) -> Callable[..., Awaitable[None]]:
+    """Route dependency: 304 / cached body before the view model is built.
+
+    ``pure`` asserts that the response body depends only on the user (when
+    ``user_scoped``), the request path/query and ``watermark``.
+    """
+    if watermark is not None and user_scoped:
+
+        async def dependency(
+            request: Request,
+            user: Annotated[Any, Depends(get_authenticated_user)],
+            db: Annotated[AsyncSession, Depends(get_db)],
+        ) -> None:
+            await _check(
+                request,
+                scope=scope,
+                user_id=user.id,
+                db=db,
+                watermark=watermark,
+                pure=pure,
+            )
+
+    elif watermark is not None:
+
+        async def dependency(
+            request: Request,
+            db: Annotated[AsyncSession, Depends(get_db)],
+        ) -> None:
+            await _check(
+                request,
+                scope=scope,
+                user_id=None,
+                db=db,
+                watermark=watermark,
+                pure=pure,
+            )
+
+    elif user_scoped:
+
+        async def dependency(
+            request: Request,
+            user: Annotated[Any, Depends(get_authenticated_user)],
+        ) -> None:
+            await _check(
+                request,
+                scope=scope,
+                user_id=user.id,
+                db=None,
+                watermark=None,
+                pure=False,
+            )
+
+    else:
+
+        async def dependency(request: Request) -> None:
+            await _check(
+                request,
+                scope=scope,
+                user_id=None,
+                db=None,
+                watermark=None,
+                pure=False,
+            )
+
+    return dependency
+
+
+async def _finalize(request: Request, response: Response) -> Response:
+    if (
+        request.method != "GET"
+        or response.status_code != 200
+        or response.media_type != "application/json"
+        or "content-encoding" in response.headers
+        or not isinstance(getattr(response, "body", None), bytes)
+    ):
+        return response
+    body = response.body
+    etag = getattr(request.state, "invest_cache_etag", None)
+    if etag is None:
+        etag = _weak_etag(hashlib.sha256(body).hexdigest()[:32])
+    key = getattr(request.state, "invest_cache_key", None)
+    if key is not None:
+        await _cache_set(await _get_redis_client(), key, etag, body)
+    if if_none_match(request, etag):
+        return _not_modified(etag)
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name not in {"content-length", "content-type"}
+    }
+    return _body_response(
+        request, body, etag, status_code=response.status_code, headers=headers
+    )
+
+
+class InvestConditionalRoute(APIRoute):
+    """APIRoute that adds ETag/304, gzip and body caching to JSON GET routes."""
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            try:
+                response = await original_handler(request)
+            except _ShortCircuit as exc:
+                return exc.response
+            return await _finalize(request, response)
+
+        return handler
+
+
+__all__ = [
+    "InvestConditionalRoute",
+    "Watermark",
+    "close_invest_http_cache_redis",
+    "conditional_get",
+    "if_none_match",
+]
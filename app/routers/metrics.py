@@ -0,0 +1,22 @@
+# app/routers/metrics.py
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.core.config import settings
+from app.monitoring.metrics import render_latest, scrape_authorized
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request) -> Response:
+    """
+    Prometheus 스크레이프 엔드포인트.
+    AuthMiddleware 세션 인증 대신 metrics_bearer_token Bearer 토큰으로만 보호한다.
+    토큰이 없으면 스크레이프는 항상 거부된다.
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if not scrape_authorized(request.headers.get("authorization")):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
@@ -27,6 +28,11 @@ from app.services.brokers.kis.mock_scalping_exec.fill_evidence import (
 # omit fills belonging to an older order. Walk pages forward, bounded.
 _FILL_PAGE_LIMIT = 100
 _MAX_FILL_PAGES = 20
+# Most fills one read may cover, incremental or not; a full read pages at most
+# this many before refusing the feed as truncated.
+_MAX_FILL_WINDOW = _FILL_PAGE_LIMIT * _MAX_FILL_PAGES
+# Candidates reconciled at once (broker reads overlap; ledger writes serialize).
+_RECONCILE_CONCURRENCY = 4
 
 # ---------------------------------------------------------------------------
 # ROB-953 — the single (evidence -> persisted state -> reported action) mapping
@@ -203,12 +209,156 @@ def normalize_alpaca_order_for_classify(
     }
 
 
+@dataclass
+class FillActivityWatermark:
+    """Cross-run memo of the account FILL feed: every fill seen plus the newest id.
+
+    FILL activities are append-only, so a run holding a watermark walks the
+    ``desc`` feed only until it reaches ``newest_id`` and merges the new page
+    head into ``fills``. Owned by the caller, one per broker account. ``fills``
+    never exceeds ``_MAX_FILL_WINDOW``: a merge past it is refused like an
+    over-long full read, and the memo is dropped.
+    """
+
+    fills: dict[str, Any] = field(default_factory=dict)
+    newest_id: str | None = None
+
+
+def _fill_key(fill: Any) -> str:
+    fill_id = getattr(fill, "id", None)
+    return str(fill_id) if fill_id is not None else str(id(fill))
+
+
+class _FillActivityIndex:
+    """One paginated FILL activity read per reconcile run, indexed by order id.
+
+    Loaded lazily (only when some candidate needs fills) and shared by every
+    candidate of the run. A pagination failure is remembered and re-raised to
+    every caller, so each affected order still escalates to manual review.
+    """
+
+    def __init__(self, broker: Any, watermark: FillActivityWatermark | None) -> None:
+        self._broker = broker
+        self._watermark = watermark
+        self._lock = asyncio.Lock()
+        self._by_order: dict[Any, list[Any]] | None = None
+        self._error: Exception | None = None
+        self._incremental = False
+
+    async def fills_for(self, order_id: Any) -> list[Any]:
+        async with self._lock:
+            if self._by_order is None and self._error is None:
+                await self._load(full=False)
+        return self._fills_or_raise(order_id)
+
+    async def rescan_for(self, order_id: Any) -> list[Any] | None:
+        """Full re-read after an incremental load left a fill set incomplete.
+
+        ``None`` when the run's index was already a full read (nothing to gain).
+        """
+        async with self._lock:
+            if not self._incremental:
+                return None
+            await self._load(full=True)
+        return self._fills_or_raise(order_id)
+
+    def _fills_or_raise(self, order_id: Any) -> list[Any]:
+        if self._error is not None:
+            raise self._error
+        assert self._by_order is not None
+        return list(self._by_order.get(order_id, ()))
+
+    async def _load(self, *, full: bool) -> None:
+        watermark = self._watermark
+        stop_at = None if full or watermark is None else watermark.newest_id
+        try:
+            collected, newest, reached = await self._walk(stop_at)
+        except Exception as exc:
+            self._by_order, self._error = None, exc
+            return
+        self._error = None
+        self._incremental = reached
+        fills = collected
+        if watermark is not None:
+            if reached:
+                watermark.fills.update(collected)
+                fills = watermark.fills
+            else:
+                watermark.fills = collected
+            watermark.newest_id = newest or watermark.newest_id
+            if len(fills) > _MAX_FILL_WINDOW:
+                # A full read of this many fills would exceed the page cap, so
+                # the memo may not stand in for one either.
+                watermark.fills, watermark.newest_id = {}, None
+                self._incremental = False
+                self._by_order = None
+                self._error = RuntimeError("fill_pagination_limit_exceeded")
+                return
+        by_order: dict[Any, list[Any]] = {}
+        for fill in fills.values():
+            by_order.setdefault(getattr(fill, "order_id", None), []).append(fill)
+        self._by_order = by_order
+
+    async def _walk(
+        self, stop_at: str | None
+    ) -> tuple[dict[str, Any], str | None, bool]:
+        """Page the feed newest-first; stop early at the ``stop_at`` activity."""
+        collected: dict[str, Any] = {}
+        newest: str | None = None
+        page_token: str | None = None
+        for _ in range(_MAX_FILL_PAGES):
+            page = list(
+                await self._broker.list_fills(
+                    page_token=page_token,
+                    page_size=_FILL_PAGE_LIMIT,
+                    direction="desc",
+                )
+                or []
+            )
+            for fill in page:
+                key = _fill_key(fill)
+                if newest is None and getattr(fill, "id", None) is not None:
+                    newest = key
+                if stop_at is not None and key == stop_at:
+                    return collected, newest, True
+                collected.setdefault(key, fill)
+            if len(page) < _FILL_PAGE_LIMIT:
+                break
+            last_activity_id = getattr(page[-1], "id", None)
+            next_page_token = (
+                str(last_activity_id) if last_activity_id is not None else None
+            )
+            if next_page_token is None or next_page_token == page_token:
+                raise RuntimeError("fill_pagination_token_missing")
+            page_token = next_page_token
+        else:
+            # Never treat a bounded/truncated account activity feed as complete.
+            raise RuntimeError("fill_pagination_limit_exceeded")
+        return collected, newest, False
+
+
 class AlpacaPaperReconcileService:
-    """Reconcile existing non-terminal ledger rows using read-only broker evidence."""
+    """Reconcile existing non-terminal ledger rows using read-only broker evidence.
 
-    def __init__(self, ledger: Any, broker: Any) -> None:
+    Each run reads the account FILL feed at most once (see
+    ``_FillActivityIndex``); pass a ``fill_watermark`` kept across runs to
+    fetch only activities newer than the last one seen.
+    """
+
+    def __init__(
+        self,
+        ledger: Any,
+        broker: Any,
+        *,
+        fill_watermark: FillActivityWatermark | None = None,
+        concurrency: int = _RECONCILE_CONCURRENCY,
+    ) -> None:
         self._ledger = ledger
         self._broker = broker
+        self._fill_watermark = fill_watermark
+        self._concurrency = max(1, concurrency)
+        # The ledger shares one DB session, so its writes never overlap.
+        self._write_lock = asyncio.Lock()
 
     async def reconcile(
         self,
@@ -241,9 +391,18 @@ class AlpacaPaperReconcileService:
                 or getattr(row, "client_order_id", None) == client_order_id
             )
         ]
-        outcomes = [
-            await self._reconcile_one(row, dry_run=dry_run) for row in candidates
-        ]
+        fill_index = _FillActivityIndex(self._broker, self._fill_watermark)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def reconcile_bounded(row: Any) -> dict[str, Any]:
+            async with semaphore:
+                return await self._reconcile_one(
+                    row, dry_run=dry_run, fill_index=fill_index
+                )
+
+        outcomes = list(
+            await asyncio.gather(*(reconcile_bounded(row) for row in candidates))
+        )
         return {
             "success": True,
             "dry_run": dry_run,
@@ -251,43 +410,9 @@ class AlpacaPaperReconcileService:
             "count": len(outcomes),
         }
 
-    async def _load_order_fills(self, order: Any) -> list[Any]:
-        """Page every FILL activity, then keep the ones belonging to ``order``."""
-        collected: dict[str, Any] = {}
-        page_token: str | None = None
-        for _ in range(_MAX_FILL_PAGES):
-            page = list(
-                await self._broker.list_fills(
-                    page_token=page_token,
-                    page_size=_FILL_PAGE_LIMIT,
-                    direction="desc",
-                )
-                or []
-            )
-            for fill in page:
-                fill_id = getattr(fill, "id", None)
-                collected.setdefault(
-                    str(fill_id) if fill_id is not None else str(id(fill)), fill
-                )
-            if len(page) < _FILL_PAGE_LIMIT:
-                break
-            last_activity_id = getattr(page[-1], "id", None)
-            next_page_token = (
-                str(last_activity_id) if last_activity_id is not None else None
-            )
-            if next_page_token is None or next_page_token == page_token:
-                raise RuntimeError("fill_pagination_token_missing")
-            page_token = next_page_token
-        else:
-            # Never treat a bounded/truncated account activity feed as complete.
-            raise RuntimeError("fill_pagination_limit_exceeded")
-        return [
-            fill
-            for fill in collected.values()
-            if getattr(fill, "order_id", None) == order.id
-        ]
-
-    async def _reconcile_one(self, row: Any, *, dry_run: bool) -> dict[str, Any]:
+    async def _reconcile_one(
+        self, row: Any, *, dry_run: bool, fill_index: _FillActivityIndex
+    ) -> dict[str, Any]:
         result: dict[str, Any] = {
             "ledger_id": row.id,
             "client_order_id": row.client_order_id,
@@ -324,10 +449,17 @@ class AlpacaPaperReconcileService:
         fills: list[Any] = []
         if needs_fills:
             try:
-                fills = await self._load_order_fills(order)
+                fills = await fill_index.fills_for(order.id)
+                fill_set = summarize_fill_set(order, fills)
+                if not fill_set.complete:
+                    # An incremental read may predate a late-posted fill; one
+                    # full re-read settles it before escalating.
+                    rescanned = await fill_index.rescan_for(order.id)
+                    if rescanned is not None:
+                        fills = rescanned
+                        fill_set = summarize_fill_set(order, fills)
             except Exception as exc:
                 return manual_review(str(exc) or exc.__class__.__name__)
-            fill_set = summarize_fill_set(order, fills)
             if not fill_set.complete:
                 # A truncated / unreadable fill set yields a wrong average, so it
                 # is escalated rather than partially booked.
@@ -434,23 +566,26 @@ class AlpacaPaperReconcileService:
             result["action"] = transition.action(dry_run=True)
             return result
 
-        status_write = await self._ledger.record_status(
-            row.client_order_id,
-            {
-                "status": transition.broker_status,
-                "filled_qty": str(broker_qty),
-                "filled_avg_price": str(avg_price) if avg_price is not None else None,
-                "id": order.id,
-            },
-            # raw_response is persisted to a JSONB column: Decimal is not JSON
-            # serializable, so the evidence is stringified here.
-            raw_response={
-                "reconcile_order": _json_safe(
-                    normalize_alpaca_order_for_classify(order, fills)
-                )
-            },
-            return_write_result=True,
-        )
+        async with self._write_lock:
+            status_write = await self._ledger.record_status(
+                row.client_order_id,
+                {
+                    "status": transition.broker_status,
+                    "filled_qty": str(broker_qty),
+                    "filled_avg_price": str(avg_price)
+                    if avg_price is not None
+                    else None,
+                    "id": order.id,
+                },
+                # raw_response is persisted to a JSONB column: Decimal is not JSON
+                # serializable, so the evidence is stringified here.
+                raw_response={
+                    "reconcile_order": _json_safe(
+                        normalize_alpaca_order_for_classify(order, fills)
+                    )
+                },
+                return_write_result=True,
+            )
         if isinstance(status_write, StatusWriteResult):
             write_applied = status_write.applied
             confirmed = status_write.row
@@ -498,6 +633,7 @@ class AlpacaPaperReconcileService:
 
 __all__ = [
     "AlpacaPaperReconcileService",
+    "FillActivityWatermark",
     "FillSetEvidence",
     "ReconcileTransition",
     "normalize_alpaca_order_for_classify",
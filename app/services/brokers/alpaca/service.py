@@ -3,6 +3,7 @@ from typing import Any
 
 import httpx
 
+from app.monitoring.metrics import endpoint_label, observe_broker_request
 from app.services.brokers.alpaca.config import AlpacaPaperSettings
 from app.services.brokers.alpaca.endpoints import (
     FORBIDDEN_TRADING_BASE_URLS,
@@ -98,7 +99,8 @@ class AlpacaPaperBrokerService:
         ):
             await self._verify_physical_identity()
         try:
-            response = await self._transport.request(method, path, **kwargs)
+            with observe_broker_request("alpaca", endpoint_label(path)):
+                response = await self._transport.request(method, path, **kwargs)
         except httpx.HTTPError as exc:
             raise AlpacaPaperRequestError(str(exc)) from exc
 
@@ -21,6 +21,7 @@ from typing import Any, Final
 
 import httpx
 
+from app.monitoring.metrics import endpoint_label, observe_broker_request
 from app.services.brokers.binance.dto import (
     BinanceBookTicker,
     BinanceExchangeSymbolInfo,
@@ -135,7 +136,8 @@ class BinancePublicRestClient:
         - Hard-stop: raise ``BinanceRateLimited`` on 429/418.
         """
         await self._maybe_soft_throttle()
-        resp = await self._client.request(method, url, **kwargs)
+        with observe_broker_request("binance", endpoint_label(httpx.URL(url).path)):
+            resp = await self._client.request(method, url, **kwargs)
         snap = parse_rate_limit_headers(dict(resp.headers))
         emit_rate_limit_snapshot(
             snap, declared_weight_limit=self._declared_weight_limit
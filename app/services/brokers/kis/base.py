@@ -18,6 +18,7 @@ import httpx
 from app.core.async_rate_limiter import RateLimitExceededError, get_limiter
 from app.core.config import settings
 from app.core.exceptions import describe_exception
+from app.monitoring.metrics import observe_broker_request
 from app.services.brokers.kis.circuit_breaker import (
     get_kis_circuit_breaker,
     is_kis_connect_failure,
@@ -623,21 +624,22 @@ class BaseKISClient:
         #   * response seen -> KIS reachable -> CLOSED.
         phase = {"http_started": False, "response_seen": False}
         try:
-            result = await self._dispatch_rate_limited_with_headers(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json_body=json_body,
-                timeout=timeout,
-                api_name=api_name,
-                tr_id=tr_id,
-                retry_request_errors=retry_request_errors,
-                max_retries_override=max_retries_override,
-                pre_send_hook=pre_send_hook,
-                send_outcome=send_outcome,
-                _phase=phase,
-            )
+            with observe_broker_request("kis", api_name):
+                result = await self._dispatch_rate_limited_with_headers(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json_body=json_body,
+                    timeout=timeout,
+                    api_name=api_name,
+                    tr_id=tr_id,
+                    retry_request_errors=retry_request_errors,
+                    max_retries_override=max_retries_override,
+                    pre_send_hook=pre_send_hook,
+                    send_outcome=send_outcome,
+                    _phase=phase,
+                )
         except (PreSendFreshnessError, DistributedGateUnavailable):
             # Phase-aware: if a response was already seen on an earlier retry,
             # KIS reachability is proven -> reachable (CLOSED). If an earlier
@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from app.core.config import settings
+from app.monitoring.metrics import endpoint_label, observe_broker_request
 from app.services.brokers.toss.auth import TossOAuthTokenManager
 from app.services.brokers.toss.dto import (
     TossAccount,
@@ -132,10 +133,12 @@ class TossReadClient:
         async def send() -> tuple[httpx.Response, TossRateLimitHeaders]:
             if pre_send_hook is not None:
                 await pre_send_hook()
-            response = await self._client.request(
-                method, path, params=params, json=json, headers=headers
-            )
+            with observe_broker_request("toss", endpoint_label(path)):
+                response = await self._client.request(
+                    method, path, params=params, json=json, headers=headers
+                )
             rate_limit_headers = parse_rate_limit_headers(response.headers)
+            await self._rate_limiter.observe(group, rate_limit_headers)
             if self._response_observer is not None:
                 self._response_observer(group, response.status_code, rate_limit_headers)
             return response, rate_limit_headers
@@ -4,12 +4,16 @@ import asyncio
 import random
 import time
 from collections import deque
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from zoneinfo import ZoneInfo
 
+from app.monitoring.metrics import RATE_LIMITER_WAIT_SECONDS
+
 
 class TossApiGroup(StrEnum):
     AUTH = "AUTH"
@@ -38,6 +42,33 @@ _BASE_LIMITS: dict[TossApiGroup, int] = {
 }
 
 
+# A header-learned cap is trusted only this long without a fresh response.
+_LEARNED_LIMIT_TTL_SECONDS = 60.0
+
+
+class TossRequestLane(IntEnum):
+    """Dispatch priority inside one API group; lower values go first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_request_lane: ContextVar[TossRequestLane] = ContextVar(
+    "toss_request_lane", default=TossRequestLane.INTERACTIVE
+)
+
+
+@contextmanager
+def toss_request_lane(lane: TossRequestLane) -> Iterator[None]:
+    """Run the enclosed Toss calls in ``lane`` (bulk syncs use ``BULK``)."""
+
+    token = _request_lane.set(lane)
+    try:
+        yield
+    finally:
+        _request_lane.reset(token)
+
+
 @dataclass(frozen=True)
 class TossRateLimitHeaders:
     """Rate-limit metadata supplied by the Toss Open API response.
@@ -99,15 +130,44 @@ def parse_rate_limit_headers(headers: Mapping[str, str]) -> TossRateLimitHeaders
     )
 
 
+@dataclass
+class _GroupState:
+    bucket: deque[float] = field(default_factory=deque)
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+    waiting: dict[TossRequestLane, int] = field(
+        default_factory=lambda: dict.fromkeys(TossRequestLane, 0)
+    )
+    learned_limit: int | None = None
+    learned_at: float = 0.0
+    hold_until: float = 0.0
+
+
+@dataclass
+class _LaneWaits:
+    acquired: int = 0
+    throttled: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
 class TossRateLimiter:
+    """Per-group one-second windows sized from the live rate-limit headers.
+
+    ``observe`` feeds every response's :class:`TossRateLimitHeaders` back in:
+    a lower ``limit`` tightens the local ``_BASE_LIMITS`` guard while it is
+    fresh (a higher one is ignored, and the 09:00-09:10 order peak cap still
+    applies), and ``remaining == 0`` or
+    ``Retry-After`` holds the group until the advertised reset. Waiters sleep
+    on a per-group condition, so a header that frees budget, or a finished
+    admission, wakes them at once. Within a group ``INTERACTIVE`` waiters are
+    always admitted before ``BULK`` ones; groups never block each other.
+    """
+
     def __init__(self) -> None:
-        self._buckets: dict[TossApiGroup, deque[float]] = {
-            group: deque() for group in TossApiGroup
-        }
-        # Per-group locks so a throttled group never head-of-line blocks another.
-        self._locks: dict[TossApiGroup, asyncio.Lock] = {
-            group: asyncio.Lock() for group in TossApiGroup
+        self._groups: dict[TossApiGroup, _GroupState] = {
+            group: _GroupState() for group in TossApiGroup
         }
+        self._waits: dict[tuple[TossApiGroup, TossRequestLane], _LaneWaits] = {}
 
     @staticmethod
     def limit_for(group: TossApiGroup, *, now: datetime | None = None) -> int:
@@ -117,23 +177,108 @@ class TossRateLimiter:
                 return 3
         return _BASE_LIMITS[group]
 
-    async def acquire(self, group: TossApiGroup) -> None:
-        lock = self._locks[group]
-        bucket = self._buckets[group]
-        while True:
-            async with lock:
-                now = time.monotonic()
-                while bucket and now - bucket[0] >= 1.0:
-                    bucket.popleft()
-                # Re-evaluate the limit each iteration so the 6->3 peak-window
-                # transition cannot admit an extra call.
-                limit = self.limit_for(group)
-                if len(bucket) < limit:
-                    bucket.append(now)
-                    return
-                sleep_for = max(1.0 - (now - bucket[0]), 0.0)
-            # Sleep OUTSIDE the lock, then re-loop and re-check the limit.
-            await asyncio.sleep(sleep_for if sleep_for > 0.0 else 0.001)
+    def current_limit(self, group: TossApiGroup) -> int:
+        """Cap in force for ``group``: the fresh header limit, capped at the base."""
+
+        state = self._groups[group]
+        local = self.limit_for(group)
+        learned = state.learned_limit
+        if (
+            learned is None
+            or time.monotonic() - state.learned_at > _LEARNED_LIMIT_TTL_SECONDS
+        ):
+            return local
+        # The header carries no window, so it is read as per second and may
+        # only tighten the local guard, never raise it.
+        return min(learned, local)
+
+    async def observe(self, group: TossApiGroup, headers: TossRateLimitHeaders) -> None:
+        """Adopt the provider's current budget for ``group`` from a response."""
+
+        state = self._groups[group]
+        now = time.monotonic()
+        if headers.limit is not None:
+            state.learned_limit = headers.limit
+            state.learned_at = now
+        hold = headers.retry_after_seconds
+        if hold is None and headers.remaining == 0:
+            hold = headers.reset_seconds
+        if hold is not None:
+            state.hold_until = max(state.hold_until, now + hold)
+        elif headers.remaining:
+            # The provider still has budget: lift a hold set by an older
+            # response that raced this one.
+            state.hold_until = min(state.hold_until, now)
+        async with state.condition:
+            state.condition.notify_all()
+
+    async def acquire(
+        self, group: TossApiGroup, *, lane: TossRequestLane | None = None
+    ) -> None:
+        lane = _request_lane.get() if lane is None else lane
+        state = self._groups[group]
+        bucket = state.bucket
+        started = time.monotonic()
+        async with state.condition:
+            state.waiting[lane] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    while bucket and now - bucket[0] >= 1.0:
+                        bucket.popleft()
+                    # Re-evaluate the limit each iteration so the 6->3
+                    # peak-window transition cannot admit an extra call.
+                    limit = self.current_limit(group)
+                    ahead = any(
+                        state.waiting[other]
+                        for other in TossRequestLane
+                        if other < lane
+                    )
+                    if not ahead and now >= state.hold_until and len(bucket) < limit:
+                        bucket.append(now)
+                        break
+                    if ahead:
+                        sleep_for = None
+                    elif now < state.hold_until:
+                        sleep_for = state.hold_until - now
+                    else:
+                        sleep_for = max(1.0 - (now - bucket[0]), 0.001)
+                    try:
+                        await asyncio.wait_for(state.condition.wait(), sleep_for)
+                    except TimeoutError:
+                        pass
+            finally:
+                state.waiting[lane] -= 1
+                # Lower lanes re-check once a higher-lane waiter leaves.
+                state.condition.notify_all()
+        self._record_wait(group, lane, time.monotonic() - started)
+
+    def _record_wait(
+        self, group: TossApiGroup, lane: TossRequestLane, waited: float
+    ) -> None:
+        stats = self._waits.setdefault((group, lane), _LaneWaits())
+        stats.acquired += 1
+        if waited < 0.001:
+            return
+        stats.throttled += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+        RATE_LIMITER_WAIT_SECONDS.labels(f"toss|{group.value}|{lane.name}").observe(
+            waited
+        )
+
+    def lane_wait_stats(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        """Per-group, per-lane admission counts and wait times (seconds)."""
+
+        stats: dict[str, dict[str, dict[str, float | int]]] = {}
+        for (group, lane), waits in sorted(self._waits.items()):
+            stats.setdefault(group.value, {})[lane.name] = {
+                "acquired": waits.acquired,
+                "throttled": waits.throttled,
+                "total_wait_seconds": round(waits.total_wait_seconds, 6),
+                "max_wait_seconds": round(waits.max_wait_seconds, 6),
+            }
+        return stats
 
 
 _shared_rate_limiter: TossRateLimiter | None = None
@@ -15,6 +15,7 @@ import pandas as pd
 
 from app.core.async_rate_limiter import RateLimitExceededError, get_limiter
 from app.core.config import settings
+from app.monitoring.metrics import endpoint_label, observe_broker_request
 from app.services.upbit_symbol_universe_service import get_active_upbit_markets
 
 logger = logging.getLogger(__name__)
@@ -212,7 +213,8 @@ async def _request_json(
         async with httpx.AsyncClient(timeout=5) as cli:
             return await cli.get(url, params=params)
 
-    return await _retry_with_backoff(limiter, send, url=url)
+    with observe_broker_request("upbit", endpoint_label(api_path)):
+        return await _retry_with_backoff(limiter, send, url=url)
 
 
 async def fetch_my_coins() -> list[dict[str, Any]]:
@@ -907,14 +909,15 @@ async def _request_with_auth(
     is_order_mutation = (
         method.upper() == "POST" and normalized_path.endswith("/orders")
     ) or (method.upper() == "DELETE" and normalized_path.endswith("/order"))
-    return await _retry_with_backoff(
-        limiter,
-        send,
-        url=url,
-        max_retries=0 if is_order_mutation else None,
-        retry_request_errors=not is_order_mutation,
-        pre_send_hook=pre_send_hook,
-    )
+    with observe_broker_request("upbit", endpoint_label(api_path)):
+        return await _retry_with_backoff(
+            limiter,
+            send,
+            url=url,
+            max_retries=0 if is_order_mutation else None,
+            retry_request_errors=not is_order_mutation,
+            pre_send_hook=pre_send_hook,
+        )
 
 
 # Re-export order functions for backward compatibility using lazy loading to avoid circular imports.
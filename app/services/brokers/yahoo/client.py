@@ -5,16 +5,21 @@ import urllib.error
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import UTC, date, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
-import yfinance as yf
 
 from app.core.config import settings
+from app.core.lazy_module import LazyModule
 from app.core.log_sanitize import safe_log_value
 from app.core.symbol import to_yahoo_symbol
 from app.monitoring import build_yfinance_tracing_session, close_yfinance_session
 
+if TYPE_CHECKING:
+    import yfinance as yf
+else:
+    yf = LazyModule("yfinance")
+
 logger = logging.getLogger(__name__)
 
 
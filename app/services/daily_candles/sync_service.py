@@ -5,6 +5,7 @@ Composes:
 - upbit daily fetcher (crypto primary)
 - yahoo_us_fallback (US fallback only)
 - DailyCandlesRepository (DB boundary)
+- OhlcvFeaturesRepository (optional; refreshed after each symbol's upsert)
 
 Pure orchestration. The actual external-API calls live in the
 fetcher modules; the SQL lives in the repository.
@@ -28,6 +29,13 @@ from app.services.daily_candles.repository import (
     MarketKey,
 )
 from app.services.daily_candles.yahoo_us_fallback import YahooFallbackRow
+from app.services.ohlcv_features.builder import (
+    FEATURE_PERIOD,
+    FEATURE_WINDOW_BARS,
+    build_feature_snapshot,
+    closed_rows,
+)
+from app.services.ohlcv_features.repository import OhlcvFeaturesRepository
 
 logger = logging.getLogger(__name__)
 
@@ -66,8 +74,10 @@ class DailyCandleSyncService:
         toss_kr_fetcher: TossDailyFetcher | None = None,
         toss_us_fetcher: TossDailyFetcher | None = None,
         close_callbacks: list[Callable[[], object]] | None = None,
+        feature_repository: OhlcvFeaturesRepository | None = None,
     ) -> None:
         self._repository = repository
+        self._features = feature_repository
         self._kis_kr = kis_kr_fetcher
         self._kis_us = kis_us_fetcher
         self._yahoo_us = yahoo_us_fetcher
@@ -85,10 +95,63 @@ class DailyCandleSyncService:
 
     async def sync_one(self, *, target: SyncTarget, horizon_bars: int) -> SyncOneResult:
         if target.market == MarketKey.KR:
-            return await self._sync_kr(target, horizon_bars)
-        if target.market == MarketKey.US:
-            return await self._sync_us(target, horizon_bars)
-        return await self._sync_crypto(target, horizon_bars)
+            result = await self._sync_kr(target, horizon_bars)
+        elif target.market == MarketKey.US:
+            result = await self._sync_us(target, horizon_bars)
+        else:
+            result = await self._sync_crypto(target, horizon_bars)
+        await self._refresh_features(target)
+        return result
+
+    async def _refresh_features(self, target: SyncTarget) -> None:
+        """Recompute the stored indicator vector once a newer bar has closed.
+
+        Two newest rows are enough to find the last closed bar (at most one
+        can be forming); the full window is read only when it is newer than
+        the stored vector. Best effort: a failure is logged and never fails
+        the candle sync.
+        """
+        if self._features is None:
+            return
+        market = target.market.value
+        try:
+            latest = closed_rows(
+                await self._repository.fetch_recent(
+                    market=target.market,
+                    symbol=target.symbol,
+                    partition=target.partition,
+                    count=2,
+                ),
+                market=market,
+            )
+            if not latest:
+                return
+            stored = await self._features.get_bar_time(
+                market=market, symbol=target.symbol, period=FEATURE_PERIOD
+            )
+            if stored is not None and stored >= latest[-1].time_utc:
+                return
+            rows = await self._repository.fetch_recent(
+                market=target.market,
+                symbol=target.symbol,
+                partition=target.partition,
+                count=FEATURE_WINDOW_BARS + 1,
+            )
+            payload = build_feature_snapshot(
+                market=market, symbol=target.symbol, rows=rows
+            )
+            if payload is None:
+                return
+            await self._features.upsert(payload)
+            await self._commit_or_rollback()
+        except Exception as exc:
+            await self._repository.session.rollback()
+            logger.warning(
+                "OHLCV feature refresh failed market=%s symbol=%s: %s",
+                market,
+                target.symbol,
+                exc,
+            )
 
     async def _sync_kr(self, target: SyncTarget, horizon_bars: int) -> SyncOneResult:
         fallback_used = False
@@ -368,4 +431,5 @@ async def _build_default_service() -> DailyCandleSyncService:
         toss_kr_fetcher=_toss if settings.toss_api_enabled else None,
         toss_us_fetcher=_toss if settings.toss_api_enabled else None,
         close_callbacks=[session.close, kis.close],
+        feature_repository=OhlcvFeaturesRepository(session),
     )
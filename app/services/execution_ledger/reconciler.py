@@ -17,7 +17,10 @@ from app.schemas.execution_ledger import (
     ReconcileRunRecord,
 )
 from app.services.execution_ledger.normalizers import to_execution_ledger_upsert
-from app.services.execution_ledger.repository import ExecutionLedgerRepository
+from app.services.execution_ledger.repository import (
+    ExecutionLedgerRepository,
+    UpsertStatus,
+)
 from app.services.filled_orders_service import fetch_filled_orders
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,29 @@ def _resolve_run_window(
     return window_start, window_end
 
 
+def _count_classified(
+    diff: ReconcileDiff, fill: ExecutionLedgerUpsert, status: UpsertStatus
+) -> None:
+    sample = ExecutionLedgerRead(
+        id=None, **fill.model_dump(exclude={"raw_payload_json"})
+    )
+    if status == "inserted":
+        diff.would_insert += 1
+        diff.add_insert_sample(sample)
+    elif status == "updated":
+        diff.would_update += 1
+        diff.add_update_sample(sample)
+    else:
+        diff.unchanged += 1
+
+
+def _count_committed(diff: ReconcileDiff, status: UpsertStatus) -> None:
+    if status == "inserted":
+        diff.committed_insert += 1
+    elif status == "updated":
+        diff.committed_update += 1
+
+
 class ExecutionLedgerReconciler:
     def __init__(
         self,
@@ -70,11 +96,28 @@ class ExecutionLedgerReconciler:
         end_at: datetime | None = None,
         max_pages: int = 100,
         dry_run: bool = True,
+        batch_size: int | None = None,
+        resume_from_watermark: bool = False,
     ) -> ReconcileDiff:
+        """Reconcile one broker's fills over a window.
+
+        ``batch_size`` switches to the set-based path: each page of that many
+        fills is classified with one lookup and its new or changed fills are
+        written with one multi-row upsert, with the same per-fill accounting
+        as the one-fill-at-a-time loop. ``resume_from_watermark`` starts the
+        window (when ``start_at`` is not given) at the end of the broker's
+        latest successful committed run.
+        """
         if not dry_run and not settings.EXECUTION_LEDGER_COMMIT_ENABLED:
             raise ExecutionLedgerCommitDisabledError(
                 "EXECUTION_LEDGER_COMMIT_ENABLED is false; commit mode is disabled"
             )
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if resume_from_watermark and start_at is None:
+            watermark = (await self.repo.latest_run_per_broker()).get(broker)
+            if watermark is not None:
+                start_at = watermark.window_end
         run_id = uuid.uuid4()
         window_start, window_end = _resolve_run_window(
             window_hours=window_hours,
@@ -92,25 +135,17 @@ class ExecutionLedgerReconciler:
                 max_pages=max_pages,
                 source_run_id=run_id,
             )
-            for fill in fills:
-                status = await self.repo.classify_fill(fill)
-                sample = ExecutionLedgerRead(
-                    id=None, **fill.model_dump(exclude={"raw_payload_json"})
+            if batch_size is not None:
+                await self._apply_batches(
+                    fills, diff, batch_size=batch_size, dry_run=dry_run
                 )
-                if status == "inserted":
-                    diff.would_insert += 1
-                    diff.add_insert_sample(sample)
-                elif status == "updated":
-                    diff.would_update += 1
-                    diff.add_update_sample(sample)
-                else:
-                    diff.unchanged += 1
-                if not dry_run and status != "unchanged":
-                    committed_status, _row_id = await self.repo.upsert_fill(fill)
-                    if committed_status == "inserted":
-                        diff.committed_insert += 1
-                    elif committed_status == "updated":
-                        diff.committed_update += 1
+            else:
+                for fill in fills:
+                    status = await self.repo.classify_fill(fill)
+                    _count_classified(diff, fill, status)
+                    if not dry_run and status != "unchanged":
+                        committed_status, _row_id = await self.repo.upsert_fill(fill)
+                        _count_committed(diff, committed_status)
         except Exception as exc:
             error_summary = f"{type(exc).__name__}: {exc}"
             raise
@@ -134,6 +169,32 @@ class ExecutionLedgerReconciler:
             )
         return diff
 
+    async def _apply_batches(
+        self,
+        fills: list[ExecutionLedgerUpsert],
+        diff: ReconcileDiff,
+        *,
+        batch_size: int,
+        dry_run: bool,
+    ) -> None:
+        for offset in range(0, len(fills), batch_size):
+            page = fills[offset : offset + batch_size]
+            statuses = await self.repo.classify_fills(page, apply=not dry_run)
+            for fill, status in zip(page, statuses, strict=True):
+                _count_classified(diff, fill, status)
+            if dry_run:
+                continue
+            changed = [
+                fill
+                for fill, status in zip(page, statuses, strict=True)
+                if status != "unchanged"
+            ]
+            if changed:
+                await self.repo.upsert_fills(changed)
+            for status in statuses:
+                if status != "unchanged":
+                    _count_committed(diff, status)
+
     async def _fetch_normalized(
         self,
         broker: Broker,
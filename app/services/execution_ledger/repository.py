@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any, Literal
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, func, select, tuple_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +15,9 @@ from app.models.execution_ledger import ExecutionLedger, ExecutionLedgerReconcil
 from app.schemas.execution_ledger import ExecutionLedgerUpsert, ReconcileRunRecord
 
 UpsertStatus = Literal["inserted", "updated", "unchanged"]
+FillKey = tuple[str, str, str, str, int]
+
+KEY_COLUMNS = ("broker", "account_mode", "venue", "broker_order_id", "fill_seq")
 
 COMPARE_COLUMNS = (
     "account_mode",
@@ -55,7 +59,20 @@ def _values_equal(current: Any, expected: Any) -> bool:
     return current == expected
 
 
-def _values_differ(row: ExecutionLedger, fill: ExecutionLedgerUpsert) -> bool:
+def fill_key(fill: ExecutionLedgerUpsert) -> FillKey:
+    """The broker idempotency key (``uq_execution_ledger_fill``) of a fill."""
+    return (
+        fill.broker,
+        fill.account_mode,
+        fill.venue,
+        fill.broker_order_id,
+        fill.fill_seq,
+    )
+
+
+def _values_differ(
+    row: ExecutionLedger | ExecutionLedgerUpsert, fill: ExecutionLedgerUpsert
+) -> bool:
     for column in COMPARE_COLUMNS:
         expected = getattr(fill, column)
         current = getattr(row, column)
@@ -64,6 +81,20 @@ def _values_differ(row: ExecutionLedger, fill: ExecutionLedgerUpsert) -> bool:
     return False
 
 
+def _upsert_statement(payloads: list[dict]) -> Any:
+    stmt = insert(ExecutionLedger).values(payloads)
+    update_payload = {
+        key: getattr(stmt.excluded, key)
+        for key in payloads[0]
+        if key not in KEY_COLUMNS
+    }
+    update_payload["updated_at"] = datetime.now(UTC)
+    return stmt.on_conflict_do_update(
+        constraint="uq_execution_ledger_fill",
+        set_=update_payload,
+    )
+
+
 class ExecutionLedgerRepository:
     """The only write surface for review.execution_ledger."""
 
@@ -137,23 +168,80 @@ class ExecutionLedgerRepository:
             )
             return "unchanged", int(existing.id) if existing else 0
 
-        payload = _model_payload(fill)
-        stmt = insert(ExecutionLedger).values(**payload)
-        update_payload = {
-            key: getattr(stmt.excluded, key)
-            for key in payload
-            if key
-            not in {"broker", "account_mode", "venue", "broker_order_id", "fill_seq"}
-        }
-        update_payload["updated_at"] = datetime.now(UTC)
-        stmt = stmt.on_conflict_do_update(
-            constraint="uq_execution_ledger_fill",
-            set_=update_payload,
-        ).returning(ExecutionLedger.id)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(
+            _upsert_statement([_model_payload(fill)]).returning(ExecutionLedger.id)
+        )
         row_id = int(result.scalar_one())
         return status, row_id
 
+    async def get_by_keys(
+        self, keys: Iterable[FillKey]
+    ) -> dict[FillKey, ExecutionLedger]:
+        """Existing ledger rows for many idempotency keys in one query."""
+        wanted = list(dict.fromkeys(keys))
+        if not wanted:
+            return {}
+        result = await self.db.execute(
+            select(ExecutionLedger).where(
+                tuple_(
+                    *(getattr(ExecutionLedger, column) for column in KEY_COLUMNS)
+                ).in_(wanted)
+            )
+        )
+        return {
+            tuple(getattr(row, column) for column in KEY_COLUMNS): row  # type: ignore[misc]
+            for row in result.scalars().all()
+        }
+
+    async def classify_fills(
+        self,
+        fills: Sequence[ExecutionLedgerUpsert],
+        *,
+        apply: bool = False,
+    ) -> list[UpsertStatus]:
+        """``classify_fill`` for a whole page against one set-based lookup.
+
+        With ``apply`` each fill is classified as if every earlier inserted or
+        updated fill of the page had already been upserted, which is what a
+        per-fill classify-then-upsert loop observes when a page repeats a key.
+        """
+        current: dict[FillKey, ExecutionLedger | ExecutionLedgerUpsert] = dict(
+            await self.get_by_keys(fill_key(fill) for fill in fills)
+        )
+        statuses: list[UpsertStatus] = []
+        for fill in fills:
+            key = fill_key(fill)
+            existing = current.get(key)
+            if existing is None:
+                status: UpsertStatus = "inserted"
+            elif _values_differ(existing, fill):
+                status = "updated"
+            else:
+                status = "unchanged"
+            statuses.append(status)
+            if apply and status != "unchanged":
+                current[key] = fill
+        return statuses
+
+    async def upsert_fills(
+        self, fills: Sequence[ExecutionLedgerUpsert]
+    ) -> dict[FillKey, int]:
+        """Insert or update many fills with one multi-row statement.
+
+        A key repeated in ``fills`` is written once with its last fill, the
+        final state a per-fill upsert loop would leave. Returns row ids by key.
+        """
+        latest = {fill_key(fill): fill for fill in fills}
+        if not latest:
+            return {}
+        key_columns = [getattr(ExecutionLedger, column) for column in KEY_COLUMNS]
+        result = await self.db.execute(
+            _upsert_statement(
+                [_model_payload(fill) for fill in latest.values()]
+            ).returning(*key_columns, ExecutionLedger.id)
+        )
+        return {tuple(row[:-1]): int(row[-1]) for row in result.all()}  # type: ignore[misc]
+
     def record_run(self, run: ReconcileRunRecord) -> None:
         self.db.add(ExecutionLedgerReconcileRun(**run.model_dump()))
 
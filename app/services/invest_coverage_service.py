@@ -2,14 +2,26 @@
 
 The service only inspects local database/read-model tables. It intentionally does
 not call broker/provider clients, start collectors, or infer buy/sell logic.
+
+With a ``session_factory`` every section query runs concurrently on its own
+pooled session under one per-request budget; a section that misses the budget
+is reported as an ``error`` surface instead of failing the rollup. With
+``use_cache`` complete rollups are kept in memory for
+``_ROLLUP_CACHE_TTL_SECONDS`` and dropped as soon as the ingestion watermark
+(newest ingestion run / snapshot / holding / order change) moves.
 """
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.invest_screener_snapshot import InvestScreenerSnapshot
 from app.models.investor_flow_snapshot import InvestorFlowSnapshot
@@ -56,6 +68,104 @@ SUPPORTED_STATES: list[CoverageState] = [
     "provider_unwired",
 ]
 
+_SECTION_CONCURRENCY = 4
+_COVERAGE_BUDGET_SECONDS = 10.0
+_ROLLUP_CACHE_TTL_SECONDS = 60.0
+_ROLLUP_CACHE_MAX_ENTRIES = 32
+_BUDGET_WARNING = "coverage query exceeded the request budget"
+
+_SectionQuery = Callable[[AsyncSession], Awaitable[list[Any]]]
+_RollupKey = tuple[str, tuple[str, ...], dt.date]
+
+_rollup_cache: OrderedDict[
+    _RollupKey, tuple[tuple[Any, ...], float, InvestCoverageResponse]
+] = OrderedDict()
+
+
+def clear_coverage_cache() -> None:
+    _rollup_cache.clear()
+
+
+async def _ingestion_watermark(db: AsyncSession) -> tuple[Any, ...]:
+    """Newest ingestion state in one round trip (PK / indexed maxima)."""
+    maxima = [
+        sa.func.max(NewsIngestionRun.id),
+        sa.func.max(ResearchReportIngestionRun.id),
+        sa.func.max(MarketEventIngestionPartition.updated_at),
+        sa.func.max(InvestScreenerSnapshot.id),
+        sa.func.max(InvestorFlowSnapshot.id),
+        sa.func.max(ManualHolding.updated_at),
+        sa.func.max(PendingOrder.updated_at),
+    ]
+    stmt = sa.select(*(sa.select(value).scalar_subquery() for value in maxima))
+    return tuple((await db.execute(stmt)).one())
+
+
+def _cached_rollup(
+    key: _RollupKey, watermark: tuple[Any, ...]
+) -> InvestCoverageResponse | None:
+    entry = _rollup_cache.get(key)
+    if entry is None:
+        return None
+    cached_watermark, stored_at, response = entry
+    if (
+        cached_watermark != watermark
+        or time.monotonic() - stored_at > _ROLLUP_CACHE_TTL_SECONDS
+    ):
+        del _rollup_cache[key]
+        return None
+    _rollup_cache.move_to_end(key)
+    return response.model_copy(deep=True)
+
+
+def _store_rollup(
+    key: _RollupKey, watermark: tuple[Any, ...], response: InvestCoverageResponse
+) -> None:
+    _rollup_cache[key] = (
+        watermark,
+        time.monotonic(),
+        response.model_copy(deep=True),
+    )
+    _rollup_cache.move_to_end(key)
+    while len(_rollup_cache) > _ROLLUP_CACHE_MAX_ENTRIES:
+        _rollup_cache.popitem(last=False)
+
+
+async def _run_sections(
+    db: AsyncSession,
+    sections: list[tuple[str, _SectionQuery]],
+    *,
+    session_factory: async_sessionmaker[AsyncSession] | None,
+    budget_seconds: float,
+) -> list[list[Any] | None]:
+    """Run section queries; ``None`` marks a section that missed the budget."""
+    if session_factory is None:
+        return [await query(db) for _, query in sections]
+
+    semaphore = asyncio.Semaphore(_SECTION_CONCURRENCY)
+    deadline = asyncio.get_running_loop().time() + budget_seconds
+
+    async def run(query: _SectionQuery) -> list[Any] | None:
+        try:
+            async with asyncio.timeout_at(deadline), semaphore:
+                async with session_factory() as section_db:
+                    return await query(section_db)
+        except TimeoutError:
+            return None
+
+    return list(await asyncio.gather(*(run(query) for _, query in sections)))
+
+
+def _budget_exceeded_surface(section: str, market: str) -> InvestCoverageSurface:
+    return InvestCoverageSurface(
+        surface=section,
+        label=section.replace("_", " ").capitalize(),
+        state="error",
+        market=market,
+        sourceOfTruth="auto_trader_db",
+        warnings=[_BUDGET_WARNING],
+    )
+
 
 async def build_invest_coverage(
     db: AsyncSession,
@@ -63,6 +173,9 @@ async def build_invest_coverage(
     market: CoverageMarket = "kr",
     symbols: list[str] | None = None,
     as_of: dt.date | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+    budget_seconds: float = _COVERAGE_BUDGET_SECONDS,
+    use_cache: bool = False,
 ) -> InvestCoverageResponse:
     market_norm = market.lower()
     if market_norm not in {"kr", "us", "crypto", "all"}:
@@ -76,21 +189,68 @@ async def build_invest_coverage(
     )
     now = dt.datetime.now(dt.UTC)
 
-    surfaces: list[InvestCoverageSurface] = []
-    surfaces.extend(await _symbol_universe_surfaces(db, market_norm))
-    surfaces.extend(await _screener_surfaces(db, market_norm, trading_day))
-    surfaces.extend(await _news_surfaces(db, market_norm, now, symbols=symbol_list))
-    surfaces.extend(await _calendar_surfaces(db, market_norm, trading_day, now))
-    surfaces.extend(await _research_report_surfaces(db, market_norm, now))
-    surfaces.extend(
-        await _investor_flow_surfaces(db, market_norm, trading_day, symbols=symbol_list)
+    cache_key: _RollupKey = (market_norm, tuple(symbol_list), trading_day)
+    watermark: tuple[Any, ...] = ()
+    if use_cache:
+        watermark = await _ingestion_watermark(db)
+        cached = _cached_rollup(cache_key, watermark)
+        if cached is not None:
+            return cached
+
+    sections: list[tuple[str, _SectionQuery]] = [
+        ("symbol_universe", lambda s: _symbol_universe_surfaces(s, market_norm)),
+        (
+            "screener_snapshots",
+            lambda s: _screener_surfaces(s, market_norm, trading_day),
+        ),
+        (
+            "news_feed",
+            lambda s: _news_surfaces(s, market_norm, now, symbols=symbol_list),
+        ),
+        (
+            "calendar_events",
+            lambda s: _calendar_surfaces(s, market_norm, trading_day, now),
+        ),
+        (
+            "research_reports",
+            lambda s: _research_report_surfaces(s, market_norm, now),
+        ),
+        (
+            "investor_flow",
+            lambda s: _investor_flow_surfaces(
+                s, market_norm, trading_day, symbols=symbol_list
+            ),
+        ),
+        ("holdings", lambda s: _holdings_surfaces(s, market_norm, now)),
+        ("pending_orders", lambda s: _pending_order_surfaces(s, market_norm, now)),
+        ("orderbook_nxt_capability", lambda s: _orderbook_nxt_surfaces(s, market_norm)),
+        ("ohlcv", lambda s: _ohlcv_surfaces(s, market_norm, trading_day)),
+        ("quotes", lambda s: _quote_surfaces(s, market_norm, now)),
+        (
+            "valuation_fundamentals",
+            lambda s: _valuation_surfaces(s, market_norm, trading_day),
+        ),
+        (
+            "symbols",
+            lambda s: _symbol_rows(s, market_norm, symbol_list, trading_day),
+        ),
+    ]
+    results = await _run_sections(
+        db,
+        sections,
+        session_factory=session_factory,
+        budget_seconds=budget_seconds,
     )
-    surfaces.extend(await _holdings_surfaces(db, market_norm, now))
-    surfaces.extend(await _pending_order_surfaces(db, market_norm, now))
-    surfaces.extend(await _orderbook_nxt_surfaces(db, market_norm))
-    surfaces.extend(await _ohlcv_surfaces(db, market_norm, trading_day))
-    surfaces.extend(await _quote_surfaces(db, market_norm, now))
-    surfaces.extend(await _valuation_surfaces(db, market_norm, trading_day))
+    complete = all(result is not None for result in results)
+    *surface_results, symbol_result = results
+
+    surfaces: list[InvestCoverageSurface] = []
+    for (section, _), result in zip(sections, surface_results, strict=False):
+        surfaces.extend(
+            result
+            if result is not None
+            else [_budget_exceeded_surface(section, market_norm)]
+        )
     surfaces.extend(_provider_unwired_surfaces(market_norm))
     for surface in surfaces:
         surface.actionability = _actionability_for_surface(
@@ -100,7 +260,7 @@ async def build_invest_coverage(
             source_of_truth=surface.sourceOfTruth,
         )
 
-    symbol_rows = await _symbol_rows(db, market_norm, symbol_list, trading_day)
+    symbol_rows: list[InvestCoverageSymbol] = symbol_result or []
     gaps = [
         f"{surface.surface}: {', '.join(surface.warnings)}"
         for surface in surfaces
@@ -108,8 +268,10 @@ async def build_invest_coverage(
         in {"missing", "partial", "stale", "provider_unwired", "unsupported", "error"}
         and surface.warnings
     ]
+    if symbol_result is None:
+        gaps.append(f"symbols: {_BUDGET_WARNING}")
 
-    return InvestCoverageResponse(
+    response = InvestCoverageResponse(
         market=market_norm,  # type: ignore[arg-type]
         asOf=now,
         tradingDate=trading_day,
@@ -123,6 +285,9 @@ async def build_invest_coverage(
             "Naver appears only as source-candidate or reference; discussion-signal and stock-detail PoCs remain fixture-backed under the aggregate-only contract.",
         ],
     )
+    if use_cache and complete:
+        _store_rollup(cache_key, watermark, response)
+    return response
 
 
 def _normalize_symbols(symbols: list[str]) -> list[str]:
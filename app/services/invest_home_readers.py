@@ -29,13 +29,11 @@ from app.services.brokers.kis.account import (
 )
 from app.services.brokers.kis.base import BaseKISClient
 from app.services.brokers.kis.base import settings as kis_base_settings
-from app.services.brokers.upbit.client import (
-    fetch_multiple_current_prices,
-    fetch_my_coins,
-)
+from app.services.brokers.upbit.client import fetch_my_coins
 from app.services.exchange_rate_service import get_usd_krw_rate
 from app.services.invest_home_service import _SourceFetchResult
 from app.services.invest_quote_service import InvestQuoteService
+from app.services.last_price_resolver import resolve_last_prices
 from app.services.manual_holdings_service import ManualHoldingsService
 from app.services.toss_portfolio_service import fetch_toss_portfolio_snapshot
 from app.services.toss_sellable_cache import get_shared_sellable_cache
@@ -317,24 +315,8 @@ class UpbitHomeReader:
 
     async def _fetch_current_prices(self, market_codes: list[str]) -> dict[str, float]:
         """Fetch Upbit prices without letting one delisted code blank the whole batch."""
-
-        try:
-            prices = await fetch_multiple_current_prices(market_codes)
-        except Exception:
-            prices = {}
-
-        missing_codes = [code for code in market_codes if code not in prices]
-        if not missing_codes:
-            return prices
-
-        for code in missing_codes:
-            try:
-                single = await fetch_multiple_current_prices([code])
-            except Exception:
-                continue
-            if code in single:
-                prices[code] = single[code]
-        return prices
+        resolution = await resolve_last_prices("CRYPTO", market_codes)
+        return resolution.prices
 
     async def fetch(self, *, user_id: int) -> _SourceFetchResult:
         try:
@@ -5,6 +5,7 @@ from typing import Literal
 from zoneinfo import ZoneInfo
 
 from app.services.market_events.freshness_service import STALE_AFTER_HOURS
+from app.services.market_events.session_index import session_index
 
 DataState = Literal["fresh", "partial", "stale", "missing", "fallback"]
 
@@ -58,7 +59,7 @@ def classify_kr_session_slot(now: dt.datetime) -> KRSessionSlot:
     ====================  ==========================================
 
     Weekends and KR holidays are out of scope here; callers should gate
-    actionable use on ``exchange_calendars.get_calendar("XKRX").is_session``.
+    actionable use on ``session_index("XKRX").is_session``.
     Naive ``now`` is treated as UTC and converted to KST.
     """
     if now.tzinfo is None:
@@ -139,9 +140,8 @@ def kr_session_label_for_partition(
     return None
 
 
-# ROB-281: US session-aware helpers using exchange-calendars (XNYS).
-# These are imported lazily inside the functions to avoid pulling exchange_calendars
-# + pandas into every importer of this module; the cost is non-trivial at startup.
+# ROB-281: US session-aware helpers using the precomputed XNYS session index
+# (built from exchange-calendars once and cached on disk; no pandas per call).
 
 _ET = ZoneInfo("America/New_York")
 _US_POST_CLOSE_THRESHOLD = (17, 20)  # hour, minute in America/New_York
@@ -160,31 +160,23 @@ def expected_us_baseline_date(now: dt.datetime | None = None) -> dt.date:
     are treated identically — 17:20 ET is post-close on any session date, so
     no half-day-specific branch is needed.
 
-    Uses :mod:`exchange_calendars` (XNYS) for holiday and half-day awareness,
-    matching the project convention established in ``us_candles_sync_service``.
+    Uses the XNYS session index for holiday and half-day awareness.
     Naive ``now`` is treated as UTC and converted to ET.
     """
-    import exchange_calendars as xcals
-    import pandas as pd
-
     moment = now if now is not None else dt.datetime.now(dt.UTC)
     if moment.tzinfo is None:
         moment = moment.replace(tzinfo=dt.UTC)
     now_et = moment.astimezone(_ET)
     today_et = now_et.date()
-    cal = xcals.get_calendar("XNYS")
-    today_ts = pd.Timestamp(today_et)
-    is_today_session = bool(cal.is_session(today_ts))
+    index = session_index("XNYS")
     hm = (now_et.hour, now_et.minute)
-    if is_today_session and hm >= _US_POST_CLOSE_THRESHOLD:
+    if index.is_session(today_et) and hm >= _US_POST_CLOSE_THRESHOLD:
         return today_et
-    # Most recent session strictly before today. A 10-day lookback covers
-    # the worst-case US holiday gap (e.g., Thanksgiving Wed → following Mon).
-    start_ts = pd.Timestamp(today_et - dt.timedelta(days=10))
-    sessions = cal.sessions_in_range(start_ts, today_ts)
-    prior_sessions = [s.date() for s in sessions if s.date() < today_et]
-    if prior_sessions:
-        return prior_sessions[-1]
+    # Most recent session strictly before today. The worst-case US holiday gap
+    # (e.g., Thanksgiving Wed → following Mon) is far inside 10 days.
+    prior = index.previous_session(today_et)
+    if prior is not None and (today_et - prior).days <= 10:
+        return prior
     # Pathological fallback (should be unreachable in practice).
     prior = today_et - dt.timedelta(days=1)
     while prior.weekday() >= 5:
@@ -197,26 +189,20 @@ def last_completed_us_session_close(now: dt.datetime) -> dt.datetime | None:
 
     Returns ``None`` only in pathological cases where no session can be found
     in the 10-day lookback window. Half-day closes (13:00 ET) are surfaced
-    correctly because :mod:`exchange_calendars` returns the actual close time
-    per session.
+    correctly because the session index stores the actual close time per
+    session.
     """
-    import exchange_calendars as xcals
-    import pandas as pd
-
     if now.tzinfo is None:
         now = now.replace(tzinfo=dt.UTC)
-    cal = xcals.get_calendar("XNYS")
+    index = session_index("XNYS")
     today_et_date = now.astimezone(_ET).date()
-    start_ts = pd.Timestamp(today_et_date - dt.timedelta(days=10))
-    end_ts = pd.Timestamp(today_et_date)
-    sessions = cal.sessions_in_range(start_ts, end_ts)
-    for session in reversed(list(sessions)):
-        close = cal.session_close(session)
-        close_dt = close.to_pydatetime()
-        if close_dt.tzinfo is None:
-            close_dt = close_dt.replace(tzinfo=dt.UTC)
-        if close_dt <= now:
-            return close_dt
+    sessions = index.sessions_between(
+        today_et_date - dt.timedelta(days=10), today_et_date
+    )
+    for session in reversed(sessions):
+        bounds = index.bounds(session)
+        if bounds is not None and bounds[1] <= now:
+            return bounds[1]
     return None
 
 
@@ -24,9 +24,11 @@ from app.mcp_server.tooling.market_data_indicators import (
     _calculate_bollinger,
     _fetch_ohlcv_for_indicators,
 )
+from app.mcp_server.tooling.market_data_levels import support_resistance_batch
 from app.models.invest_screener_snapshot import InvestScreenerSnapshot
 from app.models.kr_symbol_universe import KRSymbolUniverse
 from app.services.invest_screener_snapshots.builder import (
+    DerivedMetrics,
     _coerce_snapshot_date,
     derive_metrics,
 )
@@ -249,15 +251,25 @@ def _nearest_support(
     return price, kind, strength, distance.quantize(Decimal("0.0001"))
 
 
-async def build_support_proximity_snapshot_for_candidate(
-    candidate: SupportProximityCandidate,
-    *,
-    now: dt.datetime,
-    min_turnover: Decimal = DEFAULT_MIN_TURNOVER_KRW,
-    clock: Callable[[], dt.datetime] = _utcnow,
-) -> SnapshotUpsert | None:
-    """Build one atomic price/support snapshot from a single completed frame."""
+@dataclass(frozen=True)
+class _PreparedCandidate:
+    """One candidate's completed frame and the metrics derived from it."""
+
+    candidate: SupportProximityCandidate
+    frame: pd.DataFrame
+    snapshot_date: dt.date
+    metrics: DerivedMetrics
+    closes: tuple[Decimal, ...]
+    daily_volume: int | None
+    daily_turnover: Decimal | None
+
+    def needs_support(self, min_turnover: Decimal) -> bool:
+        return self.daily_turnover is not None and self.daily_turnover >= min_turnover
 
+
+async def _prepare_candidate(
+    candidate: SupportProximityCandidate, *, now: dt.datetime
+) -> _PreparedCandidate | None:
     try:
         frame = await _fetch_ohlcv_for_indicators(
             candidate.symbol, "equity_kr", count=_OHLCV_LOOKBACK
@@ -300,16 +312,81 @@ async def build_support_proximity_snapshot_for_candidate(
         if daily_volume is not None
         else None
     )
+    return _PreparedCandidate(
+        candidate=candidate,
+        frame=frame,
+        snapshot_date=snapshot_date,
+        metrics=metrics,
+        closes=tuple(closes),
+        daily_volume=daily_volume,
+        daily_turnover=daily_turnover,
+    )
+
 
+def _snapshot_payload(
+    prepared: _PreparedCandidate,
+    supports: list[dict[str, Any]] | None,
+    *,
+    computed_at: dt.datetime,
+) -> SnapshotUpsert:
     support_price: Decimal | None = None
     support_kind: str | None = None
     support_strength: str | None = None
     distance: Decimal | None = None
+    if supports is not None:
+        nearest = _nearest_support(
+            supports, current_price=prepared.metrics.latest_close
+        )
+        if nearest is not None:
+            support_price, support_kind, support_strength, distance = nearest
+
+    metrics = prepared.metrics
+    candidate = prepared.candidate
+    return SnapshotUpsert(
+        market="kr",
+        symbol=candidate.symbol,
+        snapshot_date=prepared.snapshot_date,
+        latest_close=metrics.latest_close,
+        prev_close=metrics.prev_close,
+        change_amount=metrics.change_amount,
+        change_rate=metrics.change_rate,
+        consecutive_up_days=metrics.consecutive_up_days,
+        week_change_rate=metrics.week_change_rate,
+        closes_window=[float(value) for value in prepared.closes[-_OHLCV_LOOKBACK:]],
+        daily_volume=prepared.daily_volume,
+        daily_turnover=prepared.daily_turnover,
+        market_cap=candidate.market_cap.value,
+        market_cap_source=candidate.market_cap.source,
+        market_cap_snapshot_date=candidate.market_cap.snapshot_date,
+        support_price=support_price,
+        support_kind=support_kind,
+        support_strength=support_strength,
+        dist_to_support_pct=distance,
+        # Record completion, not fan-out start. Freshness metadata must not
+        # claim a calculation finished before its provider work actually did.
+        support_computed_at=computed_at,
+        source="kis",
+    )
+
 
+async def build_support_proximity_snapshot_for_candidate(
+    candidate: SupportProximityCandidate,
+    *,
+    now: dt.datetime,
+    min_turnover: Decimal = DEFAULT_MIN_TURNOVER_KRW,
+    clock: Callable[[], dt.datetime] = _utcnow,
+) -> SnapshotUpsert | None:
+    """Build one atomic price/support snapshot from a single completed frame."""
+
+    prepared = await _prepare_candidate(candidate, now=now)
+    if prepared is None:
+        return None
+
+    supports: list[dict[str, Any]] | None = None
     # The same completed frame supplies both current_price and every support
     # input.  Passing preloaded_df is the look-ahead boundary: this call cannot
     # fetch a newer candle behind the builder's back.
-    if daily_turnover is not None and daily_turnover >= min_turnover:
+    if prepared.needs_support(min_turnover):
         from app.mcp_server.tooling.fundamentals._support_resistance import (
             get_support_resistance_impl,
         )
@@ -318,7 +395,7 @@ async def build_support_proximity_snapshot_for_candidate(
             support_result = await get_support_resistance_impl(
                 candidate.symbol,
                 market="kr",
-                preloaded_df=frame,
+                preloaded_df=prepared.frame,
             )
         except Exception as exc:  # noqa: BLE001 - bounded per-symbol fail-soft build
             logger.warning(
@@ -332,38 +409,9 @@ async def build_support_proximity_snapshot_for_candidate(
                 support_result.get("message") or "unknown error",
             )
             return None
-        nearest = _nearest_support(
-            list(support_result.get("supports") or []),
-            current_price=metrics.latest_close,
-        )
-        if nearest is not None:
-            support_price, support_kind, support_strength, distance = nearest
+        supports = list(support_result.get("supports") or [])
 
-    return SnapshotUpsert(
-        market="kr",
-        symbol=candidate.symbol,
-        snapshot_date=snapshot_date,
-        latest_close=metrics.latest_close,
-        prev_close=metrics.prev_close,
-        change_amount=metrics.change_amount,
-        change_rate=metrics.change_rate,
-        consecutive_up_days=metrics.consecutive_up_days,
-        week_change_rate=metrics.week_change_rate,
-        closes_window=[float(value) for value in closes[-_OHLCV_LOOKBACK:]],
-        daily_volume=daily_volume,
-        daily_turnover=daily_turnover,
-        market_cap=candidate.market_cap.value,
-        market_cap_source=candidate.market_cap.source,
-        market_cap_snapshot_date=candidate.market_cap.snapshot_date,
-        support_price=support_price,
-        support_kind=support_kind,
-        support_strength=support_strength,
-        dist_to_support_pct=distance,
-        # Record completion, not fan-out start. Freshness metadata must not
-        # claim a calculation finished before its provider work actually did.
-        support_computed_at=clock(),
-        source="kis",
-    )
+    return _snapshot_payload(prepared, supports, computed_at=clock())
 
 
 async def build_support_proximity_snapshots(
@@ -374,6 +422,7 @@ async def build_support_proximity_snapshots(
     min_market_cap: Decimal = DEFAULT_MIN_MARKET_CAP_KRW,
     min_turnover: Decimal = DEFAULT_MIN_TURNOVER_KRW,
     now: dt.datetime | None = None,
+    clock: Callable[[], dt.datetime] = _utcnow,
 ) -> SupportProximityBuildBatch:
     """Build a bounded batch without writing it."""
 
@@ -390,17 +439,41 @@ async def build_support_proximity_snapshots(
     )
     semaphore = asyncio.Semaphore(concurrency)
 
-    async def _one(candidate: SupportProximityCandidate) -> SnapshotUpsert | None:
+    async def _one(candidate: SupportProximityCandidate) -> _PreparedCandidate | None:
         async with semaphore:
-            return await build_support_proximity_snapshot_for_candidate(
-                candidate,
-                now=moment,
-                min_turnover=min_turnover,
-            )
+            return await _prepare_candidate(candidate, now=moment)
 
-    rows = await asyncio.gather(*(_one(candidate) for candidate in candidates))
+    prepared_rows = [
+        row
+        for row in await asyncio.gather(*(_one(candidate) for candidate in candidates))
+        if row is not None
+    ]
+    # Only the OHLCV fetches fan out; levels for the whole pool are computed in
+    # one batch pass over the same completed frames.
+    levels = support_resistance_batch(
+        {
+            row.candidate.symbol: row.frame
+            for row in prepared_rows
+            if row.needs_support(min_turnover)
+        }
+    )
+
+    payloads: list[SnapshotUpsert] = []
+    for row in prepared_rows:
+        supports: list[dict[str, Any]] | None = None
+        if row.candidate.symbol in levels:
+            result = levels[row.candidate.symbol]
+            if isinstance(result, Exception):
+                logger.warning(
+                    "support snapshot calculation failed %s: %s",
+                    row.candidate.symbol,
+                    result,
+                )
+                continue
+            supports = result[0]
+        payloads.append(_snapshot_payload(row, supports, computed_at=clock()))
     return SupportProximityBuildBatch(
         source_partition_date=source_partition_date,
         candidates=tuple(candidates),
-        payloads=tuple(row for row in rows if row is not None),
+        payloads=tuple(payloads),
     )
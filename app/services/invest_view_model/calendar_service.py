@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
-from typing import cast
+from typing import Any, cast
 from zoneinfo import ZoneInfo
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schemas.calendar_freshness import CalendarDayState
 from app.schemas.invest_calendar import (
     Badge,
     CalendarCluster,
@@ -26,6 +31,7 @@ from app.schemas.invest_calendar import (
     ImpactTag,
 )
 from app.services.invest_view_model.relation_resolver import RelationResolver
+from app.services.invest_view_model.watermarks import market_events_watermark
 from app.services.market_events.freshness_service import MarketEventsFreshnessService
 from app.services.market_events.query_service import MarketEventsQueryService
 
@@ -34,6 +40,12 @@ DAY_HIGHLIGHT_LIMIT = 5
 CLUSTER_TOP_EVENT_LIMIT = 5
 KST = ZoneInfo("Asia/Seoul")
 
+# Day bases and range meta are dropped as soon as the market_events ingestion
+# watermark moves; the TTL bounds drift of the time-based "stale" day state.
+_CALENDAR_CACHE_TTL_SECONDS = 300.0
+_DAY_CACHE_MAX_ENTRIES = 512
+_META_CACHE_MAX_ENTRIES = 32
+
 _EVENT_TYPE_ORDER: dict[EventType, int] = {
     "economic": 0,
     "earnings": 1,
@@ -374,6 +386,211 @@ def _dedupe_calendar_events(
     return deduped
 
 
+def _base_event(raw: object, *, fallback_date: date) -> tuple[date, CalendarEvent]:
+    """Convert one ``MarketEventResponse`` into a user-independent event.
+
+    ``relation``/``badges`` are left at their defaults; they depend on the
+    requesting user and are applied by :func:`_with_relation`.
+    """
+    market = _normalize_market(getattr(raw, "market", None))
+    # MarketEventResponse uses 'category', not 'event_type'
+    etype = _normalize_event_type(getattr(raw, "category", None))
+    symbol = getattr(raw, "symbol", None)
+    related: list[CalendarRelatedSymbol] = []
+    if symbol and market in ("kr", "us", "crypto"):
+        # MarketEventResponse has 'company_name', not 'symbol_display_name'
+        display_name = str(getattr(raw, "company_name", None) or symbol)
+        related.append(
+            CalendarRelatedSymbol(
+                symbol=str(symbol),
+                market=market,  # type: ignore[arg-type]
+                displayName=display_name,
+            )
+        )
+
+    # MarketEventResponse has 'source_event_id' (no bare 'event_id')
+    event_id = str(
+        getattr(raw, "source_event_id", None) or getattr(raw, "id", None) or ""
+    )
+
+    # actual/forecast/previous live in values[], not at top level
+    raw_values = getattr(raw, "values", None) or []
+    first_val = raw_values[0] if raw_values else None
+    actual = _format_calendar_value(getattr(first_val, "actual", None))
+    forecast = _format_calendar_value(getattr(first_val, "forecast", None))
+    previous = _format_calendar_value(getattr(first_val, "previous", None))
+
+    # MarketEventResponse has 'release_time_utc', not 'event_time_local'
+    event_time = getattr(raw, "release_time_utc", None)
+    ev_date = getattr(raw, "event_date", None) or (
+        event_time.date() if event_time else fallback_date
+    )
+
+    title = _event_title(raw, market=market, etype=etype)
+    source = str(getattr(raw, "source", "") or "")
+    currency = getattr(raw, "currency", None)
+    country = getattr(raw, "country", None)
+    ev = CalendarEvent(
+        eventId=event_id,
+        title=title,
+        market=market,
+        eventType=etype,
+        eventTimeLocal=_format_kst_time(event_time),
+        source=source,
+        country=country,
+        currency=currency,
+        importance=getattr(raw, "importance", None),
+        impactTags=_impact_tags_for_macro(
+            title=title,
+            source=source,
+            currency=currency,
+            country=country,
+        )
+        if etype == "economic"
+        else [],
+        actual=actual,
+        forecast=forecast,
+        previous=previous,
+        relatedSymbols=related,
+        relation="none",
+        badges=[],
+    )
+    return ev_date, ev
+
+
+def _with_relation(event: CalendarEvent, resolver: RelationResolver) -> CalendarEvent:
+    if not event.relatedSymbols:
+        return event
+    related = event.relatedSymbols[0]
+    relation = resolver.relation(related.market, related.symbol)
+    if relation == "none":
+        return event
+    badges: list[Badge] = []
+    if relation in ("held", "both"):
+        badges.append("holdings")
+    if relation in ("watchlist", "both"):
+        badges.append("watchlist")
+    return event.model_copy(update={"relation": relation, "badges": badges})
+
+
+@dataclass(frozen=True)
+class _DayBase:
+    """User-independent part of one calendar day (events deduped, unranked)."""
+
+    events: tuple[CalendarEvent, ...]
+    data_state: CalendarDayState
+
+
+_day_cache: OrderedDict[date, tuple[str, float, _DayBase]] = OrderedDict()
+_meta_cache: OrderedDict[tuple[date, date], tuple[str, float, CalendarMeta]] = (
+    OrderedDict()
+)
+
+
+def clear_calendar_cache() -> None:
+    _day_cache.clear()
+    _meta_cache.clear()
+
+
+def _build_day_bases(
+    raw_events: Iterable[object],
+    per_day_states: dict[date, CalendarDayState],
+    *,
+    from_date: date,
+    to_date: date,
+) -> dict[date, _DayBase]:
+    by_day: dict[date, list[CalendarEvent]] = {}
+    for raw in raw_events:
+        ev_date, ev = _base_event(raw, fallback_date=from_date)
+        by_day.setdefault(ev_date, []).append(ev)
+    return {
+        d: _DayBase(
+            events=tuple(_dedupe_calendar_events(by_day.get(d, []), d)),
+            data_state=per_day_states.get(d, "missing"),
+        )
+        for d in _date_range(from_date, to_date)
+    }
+
+
+def _assemble_day(
+    d: date, base: _DayBase, *, tab: CalendarTab, resolver: RelationResolver
+) -> CalendarDay:
+    events = _sort_calendar_events(
+        [
+            _with_priority(_with_relation(ev, resolver), target_date=d)
+            for ev in base.events
+            if tab == "all" or ev.eventType == tab
+        ]
+    )
+    summary = _build_day_summary(events)
+    clusters: list[CalendarCluster] = []
+    if len(events) > CLUSTER_THRESHOLD:
+        grouped: dict[tuple[EventType, CalendarMarket], list[CalendarEvent]] = {}
+        for ev in events:
+            grouped.setdefault((ev.eventType, ev.market), []).append(ev)
+        kept: list[CalendarEvent] = []
+        for (etype, market), group in sorted(
+            grouped.items(),
+            key=lambda item: (
+                _EVENT_TYPE_ORDER.get(item[0][0], 99),
+                _MARKET_ORDER.get(item[0][1], 99),
+            ),
+        ):
+            group = _sort_calendar_events(group)
+            if len(group) > CLUSTER_TOP_EVENT_LIMIT:
+                clusters.append(
+                    CalendarCluster(
+                        clusterId=f"{d.isoformat()}:{etype}:{market}",
+                        label=f"{etype} {market}".strip(),
+                        eventType=etype,
+                        market=market,
+                        eventCount=len(group),
+                        topEvents=group[:CLUSTER_TOP_EVENT_LIMIT],
+                    )
+                )
+            else:
+                kept.extend(group)
+        events = kept
+    return CalendarDay(
+        date=d,
+        events=events,
+        clusters=clusters,
+        dataState=base.data_state,
+        summary=summary,
+    )
+
+
+def _cache_get(
+    cache: OrderedDict[Any, tuple[str, float, Any]], key: Any, watermark: str
+) -> Any | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    cached_watermark, stored_at, value = entry
+    if (
+        cached_watermark != watermark
+        or time.monotonic() - stored_at > _CALENDAR_CACHE_TTL_SECONDS
+    ):
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return value
+
+
+def _cache_put(
+    cache: OrderedDict[Any, tuple[str, float, Any]],
+    key: Any,
+    watermark: str,
+    value: Any,
+    *,
+    max_entries: int,
+) -> None:
+    cache[key] = (watermark, time.monotonic(), value)
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
 async def build_calendar(
     *,
     db: AsyncSession,
@@ -381,150 +598,78 @@ async def build_calendar(
     from_date: date,
     to_date: date,
     tab: CalendarTab,
+    use_cache: bool = False,
 ) -> CalendarResponse:
+    """Assemble the /invest calendar for ``[from_date, to_date]``.
+
+    With ``use_cache`` the user-independent day bases and the range meta are
+    reused while the ``market_events`` ingestion watermark is unchanged (and
+    for at most ``_CALENDAR_CACHE_TTL_SECONDS``); only the days not cached
+    are queried, as one span. Relations, ranking and clustering are always
+    applied per request.
+    """
     svc = MarketEventsQueryService(db)
     freshness_svc = MarketEventsFreshnessService(db)
 
-    range_resp = await svc.list_for_range(from_date, to_date)
-    per_day_states = await freshness_svc.get_per_day_states(from_date, to_date)
-    coverage_matrix = await freshness_svc.get_coverage_matrix(from_date, to_date)
-
-    by_day: dict[date, list[CalendarEvent]] = {}
-    # range_resp.events is a list[MarketEventResponse]
-    for raw in getattr(range_resp, "events", []):
-        market = _normalize_market(getattr(raw, "market", None))
-        # MarketEventResponse uses 'category', not 'event_type'
-        etype = _normalize_event_type(getattr(raw, "category", None))
-        if tab != "all" and etype != tab:
-            continue
-        symbol = getattr(raw, "symbol", None)
-        related: list[CalendarRelatedSymbol] = []
-        relation = "none"
-        if symbol and market in ("kr", "us", "crypto"):
-            # MarketEventResponse has 'company_name', not 'symbol_display_name'
-            display_name = str(getattr(raw, "company_name", None) or symbol)
-            related.append(
-                CalendarRelatedSymbol(
-                    symbol=str(symbol),
-                    market=market,  # type: ignore[arg-type]
-                    displayName=display_name,
-                )
-            )
-            relation = resolver.relation(market, symbol)
-
-        badges: list[Badge] = []
-        if relation in ("held", "both"):
-            badges.append("holdings")
-        if relation in ("watchlist", "both"):
-            badges.append("watchlist")
-
-        # MarketEventResponse has 'source_event_id' (no bare 'event_id')
-        event_id = str(
-            getattr(raw, "source_event_id", None) or getattr(raw, "id", None) or ""
-        )
-
-        # actual/forecast/previous live in values[], not at top level
-        raw_values = getattr(raw, "values", None) or []
-        first_val = raw_values[0] if raw_values else None
-        actual = _format_calendar_value(getattr(first_val, "actual", None))
-        forecast = _format_calendar_value(getattr(first_val, "forecast", None))
-        previous = _format_calendar_value(getattr(first_val, "previous", None))
-
-        # MarketEventResponse has 'release_time_utc', not 'event_time_local'
-        event_time = getattr(raw, "release_time_utc", None)
-        ev_date = getattr(raw, "event_date", None) or (
-            event_time.date() if event_time else from_date
-        )
-
-        title = _event_title(raw, market=market, etype=etype)
-        source = str(getattr(raw, "source", "") or "")
-        currency = getattr(raw, "currency", None)
-        country = getattr(raw, "country", None)
-        ev = CalendarEvent(
-            eventId=event_id,
-            title=title,
-            market=market,
-            eventType=etype,
-            eventTimeLocal=_format_kst_time(event_time),
-            source=source,
-            country=country,
-            currency=currency,
-            importance=getattr(raw, "importance", None),
-            impactTags=_impact_tags_for_macro(
-                title=title,
-                source=source,
-                currency=currency,
-                country=country,
-            )
-            if etype == "economic"
-            else [],
-            actual=actual,
-            forecast=forecast,
-            previous=previous,
-            relatedSymbols=related,
-            relation=relation,  # type: ignore[arg-type]
-            badges=badges,
+    watermark = await market_events_watermark(db) if use_cache else None
+    requested_days = list(_date_range(from_date, to_date))
+    bases: dict[date, _DayBase] = {}
+    meta: CalendarMeta | None = None
+    if watermark is not None:
+        for d in requested_days:
+            cached = _cache_get(_day_cache, d, watermark)
+            if cached is not None:
+                bases[d] = cached
+        meta = _cache_get(_meta_cache, (from_date, to_date), watermark)
+
+    missing_days = [d for d in requested_days if d not in bases]
+    if missing_days:
+        span_from, span_to = missing_days[0], missing_days[-1]
+        range_resp = await svc.list_for_range(span_from, span_to)
+        per_day_states = await freshness_svc.get_per_day_states(span_from, span_to)
+        # range_resp.events is a list[MarketEventResponse]
+        fetched = _build_day_bases(
+            getattr(range_resp, "events", []),
+            per_day_states,
+            from_date=span_from,
+            to_date=span_to,
         )
-        by_day.setdefault(ev_date, []).append(ev)
+        for d in missing_days:
+            bases[d] = fetched[d]
+            if watermark is not None:
+                _cache_put(
+                    _day_cache,
+                    d,
+                    watermark,
+                    fetched[d],
+                    max_entries=_DAY_CACHE_MAX_ENTRIES,
+                )
 
-    days: list[CalendarDay] = []
-    for d in _date_range(from_date, to_date):
-        events = _dedupe_calendar_events(by_day.get(d, []), d)
-        events = _sort_calendar_events(
-            [_with_priority(ev, target_date=d) for ev in events]
+    if meta is None:
+        coverage_matrix = await freshness_svc.get_coverage_matrix(from_date, to_date)
+        meta = CalendarMeta(
+            sourceFreshness=list(coverage_matrix.sources),
+            coverage=coverage_matrix.coverage,
         )
-        summary = _build_day_summary(events)
-        clusters: list[CalendarCluster] = []
-        if len(events) > CLUSTER_THRESHOLD:
-            grouped: dict[tuple[EventType, CalendarMarket], list[CalendarEvent]] = {}
-            for ev in events:
-                grouped.setdefault((ev.eventType, ev.market), []).append(ev)
-            kept: list[CalendarEvent] = []
-            for (etype, market), group in sorted(
-                grouped.items(),
-                key=lambda item: (
-                    _EVENT_TYPE_ORDER.get(item[0][0], 99),
-                    _MARKET_ORDER.get(item[0][1], 99),
-                ),
-            ):
-                group = _sort_calendar_events(group)
-                if len(group) > CLUSTER_TOP_EVENT_LIMIT:
-                    clusters.append(
-                        CalendarCluster(
-                            clusterId=f"{d.isoformat()}:{etype}:{market}",
-                            label=f"{etype} {market}".strip(),
-                            eventType=etype,
-                            market=market,
-                            eventCount=len(group),
-                            topEvents=group[:CLUSTER_TOP_EVENT_LIMIT],
-                        )
-                    )
-                else:
-                    kept.extend(group)
-            events = kept
-        day_state = per_day_states.get(d, "missing")
-        days.append(
-            CalendarDay(
-                date=d,
-                events=events,
-                clusters=clusters,
-                dataState=day_state,
-                summary=summary,
+        if watermark is not None:
+            _cache_put(
+                _meta_cache,
+                (from_date, to_date),
+                watermark,
+                meta,
+                max_entries=_META_CACHE_MAX_ENTRIES,
             )
-        )
-
-    meta = CalendarMeta(
-        sourceFreshness=list(coverage_matrix.sources),
-        coverage=coverage_matrix.coverage,
-    )
 
     return CalendarResponse(
         tab=tab,
         fromDate=from_date,
         toDate=to_date,
         asOf=datetime.now(UTC),
-        days=days,
-        meta=meta,
+        days=[
+            _assemble_day(d, bases[d], tab=tab, resolver=resolver)
+            for d in requested_days
+        ],
+        meta=meta.model_copy(deep=True),
     )
 
 
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import base64
 import json
+import re
 from datetime import UTC, datetime
 from typing import cast
 
-from sqlalchemy import desc, select
+from sqlalchemy import and_, desc, exists, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.news import NewsAnalysisResult, NewsArticle, NewsArticleRelatedSymbol
@@ -42,6 +43,7 @@ from app.services.news_entity_matcher import (
     match_symbols_for_article,
 )
 from app.services.news_issue_clustering_service import build_market_issues
+from app.services.news_search_index import get_news_search_index
 
 _TVSCREENER_FEED_SOURCE_PREFIX = "http_tvscreener_news_"
 _SNIPPET_MAX_CHARS = 240
@@ -421,6 +423,48 @@ async def _enrich_related_symbols_with_quotes(
     return warnings
 
 
+def _older_query_match(
+    q: str,
+    *,
+    before: datetime,
+    market_filter: str | None,
+    symbol_filter: tuple[str, NewsMarket] | None,
+):
+    """SQL match for ``q`` over articles published before the index window.
+
+    Every whitespace-separated term must occur (case-insensitively) in the
+    title, summary or stock name -- the DB-side approximation of the index's
+    all-tokens match.
+    """
+    clauses = [
+        or_(
+            NewsArticle.article_published_at < before,
+            NewsArticle.article_published_at.is_(None),
+        )
+    ]
+    for term in q.split():
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", term) + "%"
+        clauses.append(
+            or_(
+                NewsArticle.title.ilike(pattern, escape="\\"),
+                NewsArticle.summary.ilike(pattern, escape="\\"),
+                NewsArticle.stock_name.ilike(pattern, escape="\\"),
+            )
+        )
+    if market_filter:
+        clauses.append(NewsArticle.market == market_filter)
+    if symbol_filter is not None:
+        filter_symbol, filter_market = symbol_filter
+        clauses.append(
+            exists().where(
+                NewsArticleRelatedSymbol.article_id == NewsArticle.id,
+                NewsArticleRelatedSymbol.symbol == filter_symbol,
+                NewsArticleRelatedSymbol.market == filter_market,
+            )
+        )
+    return and_(*clauses)
+
+
 async def build_feed_news(
     *,
     db: AsyncSession,
@@ -431,6 +475,7 @@ async def build_feed_news(
     include_quotes: bool = False,
     symbol_filter: tuple[str, NewsMarket] | None = None,
     topic: FeedTopic | None = None,
+    q: str | None = None,
 ) -> FeedNewsResponse:
     market_filter: str | None = None
     if symbol_filter is not None:
@@ -455,19 +500,45 @@ async def build_feed_news(
     stmt = select(NewsArticle).order_by(
         NewsArticle.article_published_at.desc().nulls_last(), desc(NewsArticle.id)
     )
-    if market_filter:
-        stmt = stmt.where(NewsArticle.market == market_filter)
-    if symbol_filter is not None:
-        filter_symbol, filter_market = symbol_filter
-        stmt = stmt.join(
-            NewsArticleRelatedSymbol,
-            NewsArticleRelatedSymbol.article_id == NewsArticle.id,
-        ).where(
-            NewsArticleRelatedSymbol.symbol == filter_symbol,
-            NewsArticleRelatedSymbol.market == filter_market,
-        )
-
     cursor_dt, cursor_id = _decode_cursor(cursor)
+    if q and q.strip():
+        # The search index applies the query, market/symbol filters and the
+        # keyset cursor in feed order; only the page's rows are loaded.
+        index = await get_news_search_index(db)
+        page = index.search(
+            q,
+            market=market_filter,
+            symbol=symbol_filter,
+            before=(cursor_dt, cursor_id) if cursor_dt and cursor_id else None,
+            order="recent",
+            limit=limit + 1,
+        )
+        matched = NewsArticle.id.in_(page.ids)
+        if len(page.ids) <= limit and index.covers_since is not None:
+            # The index only holds its retention window; once its hits run
+            # out, continue the page with older articles matched in the DB.
+            matched = or_(
+                matched,
+                _older_query_match(
+                    q,
+                    before=index.covers_since,
+                    market_filter=market_filter,
+                    symbol_filter=symbol_filter,
+                ),
+            )
+        stmt = stmt.where(matched)
+    else:
+        if market_filter:
+            stmt = stmt.where(NewsArticle.market == market_filter)
+        if symbol_filter is not None:
+            filter_symbol, filter_market = symbol_filter
+            stmt = stmt.join(
+                NewsArticleRelatedSymbol,
+                NewsArticleRelatedSymbol.article_id == NewsArticle.id,
+            ).where(
+                NewsArticleRelatedSymbol.symbol == filter_symbol,
+                NewsArticleRelatedSymbol.market == filter_market,
+            )
     if cursor_dt and cursor_id:
         stmt = stmt.where(
             (NewsArticle.article_published_at < cursor_dt)
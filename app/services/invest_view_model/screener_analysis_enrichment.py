@@ -155,14 +155,14 @@ _SECTOR_FETCH_CONCURRENCY = 4
 async def _fetch_kr_sector(code: str) -> tuple[str | None, str | None]:
     """Naver 종목 메인 페이지에서 (업종번호, 한글 업종명)을 추출."""
     from app.services.naver_finance.valuation import (
-        _fetch_html,
+        _fetch_document,
         _parse_industry_info,
     )
 
-    soup = await _fetch_html(
+    document = await _fetch_document(
         "https://finance.naver.com/item/main.naver", params={"code": code}
     )
-    info = _parse_industry_info(soup)
+    info = _parse_industry_info(document)
     return info.get("sector_no"), info.get("sector")
 
 
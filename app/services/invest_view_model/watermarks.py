@@ -0,0 +1,114 @@
+"""Cheap version keys for the /invest/api read models.
+
+Each function returns an opaque string that changes whenever the persisted
+inputs of a view change (a snapshot partition is recomputed, an ingestion run
+lands). One aggregate query per call — no rows are materialized — so a
+conditional GET can be answered before the view model is built.
+
+``None`` means "no watermark available" (empty table, unsupported session in
+tests); callers must then fall back to hashing the built body.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.invest_momentum_event_snapshot import (
+    InvestMomentumEventSnapshot,
+    InvestThemeEventSnapshot,
+)
+from app.models.invest_screener_snapshot import InvestScreenerSnapshot
+from app.models.market_events import MarketEventIngestionPartition
+from app.models.news import NewsIngestionRun
+from app.models.research_reports import ResearchReportIngestionRun
+
+logger = logging.getLogger(__name__)
+
+
+def _format(row: Any) -> str | None:
+    if row is None:
+        return None
+    values = tuple(row)
+    if all(value is None for value in values):
+        return None
+    return "|".join(
+        value.isoformat() if hasattr(value, "isoformat") else str(value)
+        for value in values
+    )
+
+
+async def _aggregate(db: AsyncSession, stmt: Any, label: str) -> str | None:
+    # Inside a savepoint: a failed query rolls back to it instead of leaving
+    # the request's transaction aborted for the view model built after it.
+    try:
+        async with db.begin_nested():
+            result = await db.execute(stmt)
+            return _format(result.one_or_none())
+    except Exception as exc:  # noqa: BLE001 — fail open to body hashing
+        logger.debug("invest watermark %s unavailable: %s", label, exc)
+        return None
+
+
+async def screener_snapshot_watermark(db: AsyncSession, *, market: str) -> str | None:
+    """Latest partition + recompute time of ``invest_screener_snapshots``."""
+    stmt = select(
+        func.max(InvestScreenerSnapshot.snapshot_date),
+        func.max(InvestScreenerSnapshot.computed_at),
+        func.count(),
+    ).where(InvestScreenerSnapshot.market == market)
+    return await _aggregate(db, stmt, "screener")
+
+
+async def momentum_snapshot_watermark(db: AsyncSession, *, market: str) -> str | None:
+    """Newest Naver momentum/theme snapshot write (inserts and upserts)."""
+    event = InvestMomentumEventSnapshot
+    theme = InvestThemeEventSnapshot
+    stmt = select(
+        select(func.max(event.id)).where(event.market == market).scalar_subquery(),
+        select(func.max(event.updated_at))
+        .where(event.market == market)
+        .scalar_subquery(),
+        select(func.max(theme.id)).scalar_subquery(),
+        select(func.max(theme.updated_at)).scalar_subquery(),
+    )
+    return await _aggregate(db, stmt, "momentum")
+
+
+async def market_events_watermark(db: AsyncSession) -> str | None:
+    """Last touched ``market_event_ingestion_partitions`` row (any source)."""
+    stmt = select(
+        func.max(MarketEventIngestionPartition.updated_at),
+        func.count(),
+    )
+    return await _aggregate(db, stmt, "market_events")
+
+
+async def news_ingestion_watermark(db: AsyncSession) -> str | None:
+    """Newest finished news ingestion run."""
+    stmt = select(
+        func.max(NewsIngestionRun.id),
+        func.max(NewsIngestionRun.finished_at),
+    )
+    return await _aggregate(db, stmt, "news")
+
+
+async def research_report_watermark(db: AsyncSession) -> str | None:
+    """Newest research-report ingestion run."""
+    stmt = select(
+        func.max(ResearchReportIngestionRun.id),
+        func.max(ResearchReportIngestionRun.received_at),
+    )
+    return await _aggregate(db, stmt, "research_reports")
+
+
+__all__ = [
+    "market_events_watermark",
+    "momentum_snapshot_watermark",
+    "news_ingestion_watermark",
+    "research_report_watermark",
+    "screener_snapshot_watermark",
+]
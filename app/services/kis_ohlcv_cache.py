@@ -12,6 +12,7 @@ import redis.asyncio as redis
 from app.core.config import settings
 from app.core.log_sanitize import safe_log_value
 from app.core.timezone import KST, now_kst
+from app.monitoring.metrics import record_ohlcv_cache
 from app.services.ohlcv_cache_common import (
     _acquire_lock,
     _enforce_retention_limit,
@@ -418,8 +419,10 @@ async def get_candles(
         if len(cached) >= requested_count and _is_cache_fresh(
             normalized_period, cached
         ):
+            record_ohlcv_cache("kis_ohlcv_cache", "hit")
             return cached.tail(requested_count).reset_index(drop=True)
 
+        record_ohlcv_cache("kis_ohlcv_cache", "miss")
         lock_token = await acquire_lock_with_retry(
             redis_client,
             lock_key,
@@ -447,6 +450,7 @@ async def get_candles(
             )
 
         raw_frame = _empty_dataframe(normalized_period)
+        record_ohlcv_cache("kis_ohlcv_cache", "backfill")
         try:
             raw_frame = _canonicalize_frame(
                 normalized_period, await raw_fetcher(requested_count)
@@ -481,6 +485,7 @@ async def get_candles(
     except Exception as exc:
         global _FALLBACK_COUNT
         _FALLBACK_COUNT += 1
+        record_ohlcv_cache("kis_ohlcv_cache", "fallback")
         logger.warning(
             "kis_ohlcv_cache fallback symbol=%s period=%s fallback_count=%d error=%s",
             safe_log_value(normalized_symbol),
@@ -3,11 +3,9 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
-from functools import lru_cache
 from typing import Literal, cast
 from zoneinfo import ZoneInfo
 
-import exchange_calendars as xcals
 import pandas as pd
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,6 +25,7 @@ from app.services.candles_sync_common import (
 )
 from app.services.manual_holdings_service import ManualHoldingsService
 from app.services.market_data.toss_ohlcv import fetch_kr_intraday_toss_frame
+from app.services.market_events.session_index import session_index
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +77,6 @@ _CURSOR_SQL = build_cursor_sql(_TABLE_CFG)
 _UPSERT_SQL = build_upsert_sql(_TABLE_CFG)
 
 
-@lru_cache(maxsize=1)
-def _get_xkrx_calendar():
-    return xcals.get_calendar("XKRX")
-
-
 def _normalize_symbol(value: object) -> str | None:
     text_value = str(value or "").strip().upper()
     if not text_value:
@@ -141,8 +135,7 @@ def _build_venue_plan(
 
 
 def _is_session_day_kst(target_day: date) -> bool:
-    calendar = _get_xkrx_calendar()
-    return bool(calendar.is_session(pd.Timestamp(target_day)))
+    return session_index("XKRX").is_session(target_day)
 
 
 def _should_process_venue(
@@ -191,12 +184,10 @@ def _recent_session_days(
     *,
     include_today: bool,
 ) -> list[date]:
-    calendar = _get_xkrx_calendar()
     lookback_days = max(90, sessions * 8)
-    start = pd.Timestamp(now_kst.date() - timedelta(days=lookback_days))
-    end = pd.Timestamp(now_kst.date())
-    session_index = calendar.sessions_in_range(start, end)
-    days = [pd.Timestamp(value).date() for value in session_index]
+    days = session_index("XKRX").sessions_between(
+        now_kst.date() - timedelta(days=lookback_days), now_kst.date()
+    )
     if not include_today and days and days[-1] == now_kst.date():
         days = days[:-1]
     if not days:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import datetime
+from operator import attrgetter
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
 from app.services.kr_intraday._types import (
@@ -116,11 +118,114 @@ def _empty_intraday_frame() -> pd.DataFrame:
     return pd.DataFrame(columns=_INTRADAY_FRAME_COLUMNS)
 
 
-def _dedupe_normalized_venues(values: list[object]) -> list[str]:
-    venues: list[str] = []
-    for value in values:
-        venues.extend(_normalize_venues(value))
-    return list(dict.fromkeys(_normalize_venues(venues)))
+# Venue sets as bitmasks, so merging the venues of many rows is a bitwise OR.
+_VENUE_BITS: dict[str, int] = {"KRX": 1, "NTX": 2}
+_VENUES_BY_MASK: tuple[tuple[str, ...], ...] = ((), ("KRX",), ("NTX",), ("KRX", "NTX"))
+
+_MINUTE_ROW_FIELDS = (
+    "minute_time",
+    "venue",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "value",
+)
+
+
+def _venue_masks(values: pd.Series) -> np.ndarray:
+    """Per-row venue bitmask of ``_normalize_venues`` over ``values``."""
+    masks = np.zeros(len(values), dtype=np.int64)
+    exploded = values.reset_index(drop=True).explode()
+    bits = exploded.astype(str).str.strip().str.upper().map(_VENUE_BITS)
+    present = bits.notna().to_numpy()
+    np.bitwise_or.at(
+        masks,
+        exploded.index.to_numpy()[present],
+        bits.to_numpy()[present].astype(np.int64),
+    )
+    return masks
+
+
+def _venues_from_masks(masks: np.ndarray) -> list[list[str]]:
+    return [list(_VENUES_BY_MASK[mask]) for mask in masks.tolist()]
+
+
+def _sessions_for_bucket_starts(values: pd.Series) -> np.ndarray:
+    """``_session_for_bucket_start`` over a datetime series (``None`` if closed)."""
+    clock = (values - values.dt.normalize()).to_numpy()
+    sessions = np.full(len(values), None, dtype=object)
+    for session, start, end, end_inclusive in (
+        ("PRE_MARKET", datetime.timedelta(hours=8), datetime.timedelta(hours=9), False),
+        (
+            "REGULAR",
+            datetime.timedelta(hours=9),
+            datetime.timedelta(hours=15, minutes=30),
+            False,
+        ),
+        (
+            "AFTER_MARKET",
+            datetime.timedelta(hours=15, minutes=30),
+            datetime.timedelta(hours=20),
+            True,
+        ),
+    ):
+        upper = clock <= end if end_inclusive else clock < end
+        sessions[(clock >= start) & upper] = session
+    return sessions
+
+
+def _segment_bounds(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Start/end offsets of the runs of equal values in sorted ``keys``."""
+    if keys.size == 0:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return starts, np.r_[starts[1:], keys.size]
+
+
+def _float_values(frame: pd.DataFrame, column: str) -> np.ndarray:
+    return frame[column].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _segment_sums(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    # NaN-skipping like ``Series.sum``.
+    return np.add.reduceat(np.where(np.isnan(values), 0.0, values), starts)
+
+
+def _intraday_frame(
+    datetimes: pd.Series,
+    *,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    value: np.ndarray,
+    venue_masks: np.ndarray,
+) -> pd.DataFrame:
+    """Intraday frame of the rows whose start falls in a session."""
+    sessions = _sessions_for_bucket_starts(datetimes)
+    keep = np.not_equal(sessions, None)
+    if not keep.any():
+        return _empty_intraday_frame()
+    starts = datetimes[keep].dt.to_pydatetime().tolist()
+    return pd.DataFrame(
+        {
+            "datetime": starts,
+            "date": [start.date() for start in starts],
+            "time": [start.time() for start in starts],
+            "open": open_[keep],
+            "high": high[keep],
+            "low": low[keep],
+            "close": close[keep],
+            "volume": volume[keep],
+            "value": value[keep],
+            "session": sessions[keep],
+            "venues": _venues_from_masks(venue_masks[keep]),
+        },
+        columns=_INTRADAY_FRAME_COLUMNS,
+    )
 
 
 def _prepare_bucket_aggregation_frame(df: pd.DataFrame) -> pd.DataFrame:
@@ -141,43 +246,27 @@ def _prepare_bucket_aggregation_frame(df: pd.DataFrame) -> pd.DataFrame:
 
     if "value" not in out.columns:
         out["value"] = 0.0
-    if "venues" not in out.columns:
-        if "venue" in out.columns:
-            out["venues"] = out["venue"].apply(_normalize_venues)
-        else:
-            out["venues"] = [[] for _ in range(len(out))]
+    if "venues" in out.columns:
+        out["venue_mask"] = _venue_masks(out["venues"])
+    elif "venue" in out.columns:
+        out["venue_mask"] = _venue_masks(out["venue"])
     else:
-        out["venues"] = out["venues"].apply(_normalize_venues)
+        out["venue_mask"] = 0
     return out
 
 
-def _build_bucket_frame_row(
-    bucket_dt: datetime.datetime, group: pd.DataFrame
-) -> dict[str, object] | None:
-    session = _session_for_bucket_start(bucket_dt)
-    if session is None:
-        return None
-
-    return {
-        "datetime": bucket_dt,
-        "date": bucket_dt.date(),
-        "time": bucket_dt.time(),
-        "open": float(group["open"].iloc[0]),
-        "high": float(group["high"].max()),
-        "low": float(group["low"].min()),
-        "close": float(group["close"].iloc[-1]),
-        "volume": float(group["volume"].sum()),
-        "value": float(group["value"].sum()),
-        "session": session,
-        "venues": _dedupe_normalized_venues(group["venues"].tolist()),
-    }
-
-
 def _aggregate_minutes_to_buckets(
     df: pd.DataFrame,
     *,
     bucket_minutes: int,
 ) -> pd.DataFrame:
+    """Roll minute rows up into ``bucket_minutes`` candles.
+
+    Rows are stably sorted by bucket, so each bucket keeps its rows' input
+    order: open/close come from its first/last row, high/low/volume/value
+    skip NaN as pandas reductions do, and venues are the union of the rows'.
+    Buckets starting outside a session are dropped.
+    """
     if df.empty:
         return _empty_intraday_frame()
 
@@ -185,63 +274,64 @@ def _aggregate_minutes_to_buckets(
     if out.empty:
         return _empty_intraday_frame()
 
-    bucket_label = f"{bucket_minutes}min"
-    out["bucket"] = out["datetime"].dt.floor(bucket_label)
-
-    rows: list[dict[str, object]] = []
-    for bucket_value, group in out.groupby("bucket", sort=True):
-        try:
-            bucket_dt = pd.Timestamp(cast(Any, bucket_value)).to_pydatetime()
-        except Exception:
-            continue
-        row = _build_bucket_frame_row(bucket_dt, group)
-        if row is not None:
-            rows.append(row)
-
-    if not rows:
-        return _empty_intraday_frame()
-
-    return pd.DataFrame(rows, columns=_INTRADAY_FRAME_COLUMNS)
+    buckets = out["datetime"].dt.floor(f"{bucket_minutes}min")
+    keys = pd.DatetimeIndex(buckets).asi8
+    order = np.argsort(keys, kind="stable")
+    starts, ends = _segment_bounds(keys[order])
+
+    def ordered(column: str) -> np.ndarray:
+        return _float_values(out, column)[order]
+
+    return _intraday_frame(
+        buckets.iloc[order[starts]].reset_index(drop=True),
+        open_=ordered("open")[starts],
+        high=np.fmax.reduceat(ordered("high"), starts),
+        low=np.fmin.reduceat(ordered("low"), starts),
+        close=ordered("close")[ends - 1],
+        volume=_segment_sums(ordered("volume"), starts),
+        value=_segment_sums(ordered("value"), starts),
+        venue_masks=np.bitwise_or.reduceat(
+            out["venue_mask"].to_numpy(dtype=np.int64)[order], starts
+        ),
+    )
 
 
 def _merge_minute_rows(rows: list[_MinuteRow]) -> pd.DataFrame:
+    """One row per minute from per-venue minute rows.
+
+    A later row for the same (minute, venue) replaces an earlier one. Prices
+    come from KRX when it traded that minute, else NTX; volume and value are
+    summed across venues.
+    """
     if not rows:
         return _empty_intraday_frame()
 
-    minutes_by_time: dict[datetime.datetime, dict[VenueType, _MinuteRow]] = {}
-    for row in rows:
-        minutes_by_time.setdefault(row.minute_time, {})[row.venue] = row
-
-    merged_rows: list[dict[str, object]] = []
-    for minute_time in sorted(minutes_by_time):
-        venue_rows = minutes_by_time[minute_time]
-        source = venue_rows.get("KRX") or venue_rows.get("NTX")
-        if source is None:
-            continue
-        session = _session_for_bucket_start(minute_time)
-        if session is None:
-            continue
-
-        merged_rows.append(
-            {
-                "datetime": minute_time,
-                "date": minute_time.date(),
-                "time": minute_time.time(),
-                "open": float(source.open),
-                "high": float(source.high),
-                "low": float(source.low),
-                "close": float(source.close),
-                "volume": float(sum(item.volume for item in venue_rows.values())),
-                "value": float(sum(item.value for item in venue_rows.values())),
-                "session": session,
-                "venues": _normalize_venues(list(venue_rows.keys())),
-            }
+    minutes = (
+        pd.DataFrame(
+            list(map(attrgetter(*_MINUTE_ROW_FIELDS), rows)),
+            columns=list(_MINUTE_ROW_FIELDS),
         )
-
-    if not merged_rows:
-        return _empty_intraday_frame()
-
-    return pd.DataFrame(merged_rows, columns=_INTRADAY_FRAME_COLUMNS)
+        .drop_duplicates(["minute_time", "venue"], keep="last")
+        .sort_values(["minute_time", "venue"], kind="stable")
+        .reset_index(drop=True)
+    )
+    starts, _ = _segment_bounds(pd.DatetimeIndex(minutes["minute_time"]).asi8)
+
+    def first(column: str) -> np.ndarray:
+        return _float_values(minutes, column)[starts]
+
+    return _intraday_frame(
+        minutes["minute_time"].iloc[starts].reset_index(drop=True),
+        open_=first("open"),
+        high=first("high"),
+        low=first("low"),
+        close=first("close"),
+        volume=np.add.reduceat(_float_values(minutes, "volume"), starts),
+        value=np.add.reduceat(_float_values(minutes, "value"), starts),
+        venue_masks=np.bitwise_or.reduceat(
+            minutes["venue"].map(_VENUE_BITS).to_numpy(dtype=np.int64), starts
+        ),
+    )
 
 
 def _resolve_intraday_end_bounds(
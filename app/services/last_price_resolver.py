@@ -0,0 +1,347 @@
+"""Shared last-price resolution for portfolio views.
+
+The portfolio overview, manual-position enrichment, the merged portfolio and
+the /invest Upbit panel resolve missing current prices here rather than each
+fanning out to the brokers on its own:
+
+* resolved quotes are kept in a process-local snapshot keyed by
+  ``(market, symbol)`` for ``settings.last_price_snapshot_ttl_seconds``, so
+  views rendered together share one upstream read per symbol;
+* a symbol that is already being fetched is awaited instead of fetched again
+  (request coalescing, as in the Upbit ticker cache);
+* Upbit symbols are read in multi-symbol batches, and a failed batch is split
+  in halves until the failing symbols are isolated. KIS and Yahoo have no
+  multi-symbol quote call, so their per-symbol reads run under a
+  per-provider concurrency bound;
+* US symbols are checked against the active universe with one bulk lookup
+  on the caller's session before any Yahoo read; the lookup is not part of
+  the shared fetch, so no caller's session is used by another caller.
+
+Read-only: no DB writes, no orders.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.brokers.upbit.client as upbit_service
+import app.services.brokers.yahoo.client as yahoo_service
+from app.core.config import settings
+from app.core.normalizers import to_float as _to_float
+from app.services.us_symbol_universe_service import (
+    USSymbolUniverseLookupError,
+    get_us_exchanges_by_symbols,
+)
+
+logger = logging.getLogger(__name__)
+
+PriceMarket = Literal["KR", "US", "CRYPTO"]
+QuoteKey = tuple[str, str]
+
+_UPBIT_PRICE_BATCH_SIZE = 50
+_SNAPSHOT_MAX_ENTRIES = 4096
+
+
+class PriceUnavailableError(ValueError):
+    """The provider answered without a usable (positive) price."""
+
+
+@dataclass
+class PriceResolution:
+    """Prices by symbol, and the reason for every symbol left unpriced."""
+
+    prices: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+PriceFetcher = Callable[[list[str]], Awaitable[PriceResolution]]
+
+_snapshot: dict[QuoteKey, tuple[float, float]] = {}
+_inflight: dict[QuoteKey, asyncio.Task[PriceResolution]] = {}
+_semaphores: dict[str, asyncio.Semaphore] = {}
+_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+
+def clear_price_snapshot() -> None:
+    _snapshot.clear()
+
+
+def _provider_semaphore(provider: str, limit: int) -> asyncio.Semaphore:
+    global _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore_loop is not loop:
+        _semaphores.clear()
+        _semaphore_loop = loop
+    semaphore = _semaphores.get(provider)
+    if semaphore is None:
+        semaphore = _semaphores[provider] = asyncio.Semaphore(max(limit, 1))
+    return semaphore
+
+
+def _frame_close(frame: Any) -> float:
+    if frame is None or frame.empty:
+        raise PriceUnavailableError("empty response")
+    price = _to_float(frame.iloc[-1].get("close"), default=0.0)
+    if price <= 0:
+        raise PriceUnavailableError("non-positive close price")
+    return price
+
+
+async def _per_symbol(
+    symbols: list[str],
+    fetch_one: Callable[[str], Awaitable[float]],
+) -> PriceResolution:
+    resolution = PriceResolution()
+    results = await asyncio.gather(
+        *(fetch_one(symbol) for symbol in symbols), return_exceptions=True
+    )
+    for symbol, result in zip(symbols, results, strict=True):
+        if isinstance(result, Exception):
+            resolution.errors[symbol] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            resolution.prices[symbol] = result
+    return resolution
+
+
+async def _fetch_kis_prices(kis_client: Any, symbols: list[str]) -> PriceResolution:
+    semaphore = _provider_semaphore("kis", settings.last_price_kis_concurrency)
+
+    async def fetch_one(symbol: str) -> float:
+        async with semaphore:
+            frame = await kis_client.inquire_price(symbol)
+        return _frame_close(frame)
+
+    return await _per_symbol(symbols, fetch_one)
+
+
+async def _us_universe_errors(
+    symbols: list[str], db: AsyncSession | None
+) -> dict[str, Exception]:
+    exchanges = await get_us_exchanges_by_symbols(symbols, db=db)
+    return {
+        symbol: USSymbolUniverseLookupError(
+            f"US symbol '{symbol}' is not active in us_symbol_universe"
+        )
+        for symbol in symbols
+        if symbol not in exchanges
+    }
+
+
+async def _fetch_us_prices(symbols: list[str]) -> PriceResolution:
+    semaphore = _provider_semaphore("yahoo", settings.last_price_yahoo_concurrency)
+
+    async def fetch_one(symbol: str) -> float:
+        async with semaphore:
+            frame = await yahoo_service.fetch_price(symbol)
+        return _frame_close(frame)
+
+    return await _per_symbol(symbols, fetch_one)
+
+
+def _upbit_price_map(prices: dict[str, Any]) -> dict[str, float]:
+    normalized: dict[str, float] = {}
+    for symbol, price in prices.items():
+        code = str(symbol).strip().upper()
+        if code and price is not None:
+            normalized[code] = float(price)
+    return normalized
+
+
+async def _fetch_upbit_split(symbols: list[str], resolution: PriceResolution) -> None:
+    if len(symbols) == 1:
+        await _fetch_upbit_batch(symbols, resolution)
+        return
+    middle = len(symbols) // 2
+    await asyncio.gather(
+        _fetch_upbit_batch(symbols[:middle], resolution),
+        _fetch_upbit_batch(symbols[middle:], resolution),
+    )
+
+
+async def _fetch_upbit_batch(symbols: list[str], resolution: PriceResolution) -> None:
+    try:
+        prices = _upbit_price_map(
+            await upbit_service.fetch_multiple_current_prices(symbols)
+        )
+    except Exception as exc:
+        if len(symbols) == 1:
+            resolution.errors[symbols[0]] = exc
+            return
+        logger.warning(
+            "Failed Upbit price batch (size=%d), splitting: %s", len(symbols), exc
+        )
+        await _fetch_upbit_split(symbols, resolution)
+        return
+
+    missing = [symbol for symbol in symbols if symbol not in prices]
+    for symbol in symbols:
+        if symbol in prices:
+            resolution.prices[symbol] = prices[symbol]
+    if not missing:
+        return
+    if len(symbols) == 1:
+        resolution.errors[symbols[0]] = PriceUnavailableError("empty response")
+        return
+    # A batch may silently drop symbols; look the dropped ones up again.
+    await _fetch_upbit_split(missing, resolution)
+
+
+async def _fetch_upbit_prices(symbols: list[str]) -> PriceResolution:
+    resolution = PriceResolution()
+    await asyncio.gather(
+        *(
+            _fetch_upbit_batch(
+                symbols[index : index + _UPBIT_PRICE_BATCH_SIZE], resolution
+            )
+            for index in range(0, len(symbols), _UPBIT_PRICE_BATCH_SIZE)
+        )
+    )
+    return resolution
+
+
+async def _fetch_and_snapshot(
+    market: str, symbols: list[str], fetch: PriceFetcher
+) -> PriceResolution:
+    try:
+        resolution = await fetch(symbols)
+        ttl = settings.last_price_snapshot_ttl_seconds
+        if ttl > 0 and resolution.prices:
+            expires_at = time.monotonic() + ttl
+            if len(_snapshot) + len(resolution.prices) > _SNAPSHOT_MAX_ENTRIES:
+                now = time.monotonic()
+                for key in [k for k, (_, exp) in _snapshot.items() if exp <= now]:
+                    del _snapshot[key]
+            for symbol, price in resolution.prices.items():
+                _snapshot[(market, symbol)] = (price, expires_at)
+        return resolution
+    finally:
+        current_task = asyncio.current_task()
+        for symbol in symbols:
+            if _inflight.get((market, symbol)) is current_task:
+                _inflight.pop((market, symbol), None)
+
+
+async def _resolve(
+    market: PriceMarket,
+    symbols: Iterable[str],
+    fetch: PriceFetcher,
+    *,
+    reject: Callable[[list[str]], Awaitable[dict[str, Exception]]] | None = None,
+) -> PriceResolution:
+    """Snapshot hits, else shared fetches; ``reject`` screens symbols first.
+
+    ``reject`` runs in the caller's context (it may use the caller's DB
+    session), never inside a shared fetch task.
+    """
+    resolution = PriceResolution()
+    now = time.monotonic()
+    tasks_by_symbol: dict[str, asyncio.Task[PriceResolution]] = {}
+    to_fetch: list[str] = []
+    for symbol in dict.fromkeys(symbols):
+        key = (market, symbol)
+        cached = _snapshot.get(key)
+        if cached is not None and cached[1] > now:
+            resolution.prices[symbol] = cached[0]
+            continue
+        task = _inflight.get(key)
+        if task is None:
+            to_fetch.append(symbol)
+        else:
+            tasks_by_symbol[symbol] = task
+
+    if to_fetch and reject is not None:
+        rejected = await reject(to_fetch)
+        resolution.errors.update(rejected)
+        to_fetch = [symbol for symbol in to_fetch if symbol not in rejected]
+        # Fetches may have started while ``reject`` was awaited.
+        for symbol in list(to_fetch):
+            task = _inflight.get((market, symbol))
+            if task is not None:
+                tasks_by_symbol[symbol] = task
+                to_fetch.remove(symbol)
+
+    if to_fetch:
+        task = asyncio.create_task(_fetch_and_snapshot(market, to_fetch, fetch))
+        for symbol in to_fetch:
+            _inflight[(market, symbol)] = task
+            tasks_by_symbol[symbol] = task
+
+    tasks = list(dict.fromkeys(tasks_by_symbol.values()))
+    # Shielded so a cancelled caller does not cancel the fetch other callers
+    # are waiting on.
+    results = dict(
+        zip(
+            tasks,
+            await asyncio.gather(
+                *(asyncio.shield(task) for task in tasks), return_exceptions=True
+            ),
+            strict=True,
+        )
+    )
+    for symbol, task in tasks_by_symbol.items():
+        result = results[task]
+        if isinstance(result, Exception):
+            resolution.errors[symbol] = result
+        elif isinstance(result, BaseException):
+            raise result
+        elif symbol in result.prices:
+            resolution.prices[symbol] = result.prices[symbol]
+        else:
+            resolution.errors[symbol] = result.errors.get(
+                symbol, PriceUnavailableError("empty response")
+            )
+    return resolution
+
+
+async def resolve_last_prices(
+    market: PriceMarket,
+    symbols: Iterable[str],
+    *,
+    kis_client: Any | None = None,
+    db: AsyncSession | None = None,
+) -> PriceResolution:
+    """Latest prices for ``symbols`` of one market.
+
+    KR symbols are read through ``kis_client`` (required for KR). US symbols
+    must be active in the universe (checked through ``db`` when given); the
+    others get a :class:`USSymbolUniverseLookupError`. Every symbol ends up
+    either in ``prices`` or in ``errors``.
+    """
+    if market == "KR":
+        if kis_client is None:
+            raise ValueError("kis_client is required for KR prices")
+        return await _resolve(
+            market, symbols, lambda batch: _fetch_kis_prices(kis_client, batch)
+        )
+    if market == "US":
+        return await _resolve(
+            market,
+            symbols,
+            _fetch_us_prices,
+            reject=lambda batch: _us_universe_errors(batch, db),
+        )
+    if market == "CRYPTO":
+        return await _resolve(
+            market,
+            (code for symbol in symbols if (code := str(symbol or "").strip().upper())),
+            _fetch_upbit_prices,
+        )
+    raise ValueError(f"Unsupported market: {market}")
+
+
+__all__ = [
+    "PriceMarket",
+    "PriceResolution",
+    "PriceUnavailableError",
+    "clear_price_snapshot",
+    "resolve_last_prices",
+]
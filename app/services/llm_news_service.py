@@ -37,6 +37,10 @@ from app.services.news_payload_normalizer import (
     _normalize_related_symbol_symbol,
     _related_symbol_values_from_ingestor_payload,
 )
+from app.services.news_search_index import (
+    INDEX_RETENTION_HOURS,
+    get_news_search_index,
+)
 
 _CORE_FEED_SOURCES_BY_MARKET: dict[str, tuple[str, ...]] = {
     "us": (
@@ -216,6 +220,39 @@ async def get_news_articles(
     return articles, total
 
 
+async def search_news_articles(
+    q: str,
+    *,
+    market: str | None = None,
+    hours: int | None = None,
+    limit: int = 10,
+    offset: int = 0,
+) -> tuple[list[NewsArticle], int]:
+    """Full-text search over recent articles, best match first.
+
+    Matching, ranking, the market/time filters and paging run in the news
+    search index; only the page's rows are loaded. The window is capped at
+    the index retention. Returns (list_of_articles, total_count).
+    """
+    window = min(hours or INDEX_RETENTION_HOURS, INDEX_RETENTION_HOURS)
+    async with AsyncSessionLocal() as db:
+        index = await get_news_search_index(db)
+        page = index.search(
+            q,
+            market=market,
+            since=now_kst_naive() - timedelta(hours=window),
+            limit=limit,
+            offset=offset,
+        )
+        if not page.ids:
+            return [], page.total
+        result = await db.execute(
+            select(NewsArticle).where(NewsArticle.id.in_(page.ids))
+        )
+        by_id = {article.id: article for article in result.scalars().all()}
+    return [by_id[i] for i in page.ids if i in by_id], page.total
+
+
 async def get_news_analysis(article_id: int) -> NewsAnalysisResult | None:
     async with AsyncSessionLocal() as db:
         result = await db.execute(
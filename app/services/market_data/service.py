@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import numpy as np
 import pandas as pd
 
 from app.core.async_rate_limiter import RateLimitExceededError
@@ -89,6 +90,49 @@ def _normalize_period(period: str, market: str) -> str:
     return validate_ohlcv_period(period, market, error_type=ValidationError)
 
 
+def _candle_timestamps(frame: pd.DataFrame) -> list[dt.datetime]:
+    column = "datetime" if "datetime" in frame.columns else "date"
+    if column in frame.columns and pd.api.types.is_datetime64_any_dtype(
+        frame[column].dtype
+    ):
+        return list(frame[column].dt.to_pydatetime())
+
+    # Object columns: a missing (``None``) datetime falls back to the date.
+    datetimes = (
+        frame["datetime"].tolist()
+        if "datetime" in frame.columns
+        else [None] * len(frame)
+    )
+    dates = frame["date"].tolist() if "date" in frame.columns else None
+    timestamps: list[dt.datetime] = []
+    for index, timestamp_raw in enumerate(datetimes):
+        if timestamp_raw is None:
+            date_raw = dates[index] if dates is not None else None
+            if date_raw is None:
+                raise ValidationError("candle row must include datetime or date")
+            timestamp_raw = date_raw
+        timestamps.append(pd.Timestamp(timestamp_raw).to_pydatetime())
+    return timestamps
+
+
+def _candle_floats(frame: pd.DataFrame, column: str) -> list[float]:
+    if column not in frame.columns:
+        return [0.0] * len(frame)
+    values = frame[column]
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf":
+        return values.to_numpy(dtype=float).tolist()
+    return [float(value or 0.0) for value in values.tolist()]
+
+
+def _candle_values(frame: pd.DataFrame) -> list[float | None]:
+    if "value" not in frame.columns:
+        return [None] * len(frame)
+    values = frame["value"]
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf":
+        return values.to_numpy(dtype=float).tolist()
+    return [float(value) if value is not None else None for value in values.tolist()]
+
+
 def _to_candle_rows(
     frame: pd.DataFrame,
     *,
@@ -97,35 +141,39 @@ def _to_candle_rows(
     source: str,
     period: str,
 ) -> list[Candle]:
+    """``Candle`` models for ``frame``, converted column by column.
+
+    Missing or ``None`` prices and volume become ``0.0``; a missing or
+    ``None`` value stays ``None``.
+    """
     if frame.empty:
         return []
 
-    rows: list[Candle] = []
-    for _, row in frame.iterrows():
-        timestamp_raw = row.get("datetime")
-        if timestamp_raw is None:
-            date_raw = row.get("date")
-            if date_raw is None:
-                raise ValidationError("candle row must include datetime or date")
-            timestamp_raw = pd.Timestamp(date_raw)
-        timestamp = pd.Timestamp(timestamp_raw).to_pydatetime()
-        value_raw = row.get("value")
-        rows.append(
-            Candle(
-                symbol=symbol,
-                market=market,
-                source=source,
-                period=period,
-                timestamp=timestamp,
-                open=float(row.get("open") or 0.0),
-                high=float(row.get("high") or 0.0),
-                low=float(row.get("low") or 0.0),
-                close=float(row.get("close") or 0.0),
-                volume=float(row.get("volume") or 0.0),
-                value=(float(value_raw) if value_raw is not None else None),
-            )
+    return [
+        Candle(
+            symbol=symbol,
+            market=market,
+            source=source,
+            period=period,
+            timestamp=timestamp,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            value=value,
+        )
+        for timestamp, open_, high, low, close, volume, value in zip(
+            _candle_timestamps(frame),
+            _candle_floats(frame, "open"),
+            _candle_floats(frame, "high"),
+            _candle_floats(frame, "low"),
+            _candle_floats(frame, "close"),
+            _candle_floats(frame, "volume"),
+            _candle_values(frame),
+            strict=True,
         )
-    return rows
+    ]
 
 
 def _map_error(exc: Exception) -> Exception:
@@ -1,27 +1,32 @@
 """Fail-closed XNYS / XKRX session+holiday calendar (ROB-371).
 
-Wraps :mod:`exchange_calendars` (already a project dependency, used by
-``invest_screener_snapshot_tasks`` and ``invest_screener_snapshots.freshness``).
-``exchange_calendars`` is imported lazily so importing this module stays cheap;
-the library memoizes ``get_calendar`` so repeated calls are amortized.
+Backed by the precomputed :mod:`app.services.market_events.session_index`
+(sorted session arrays built once from :mod:`exchange_calendars` and cached on
+disk), so lookups are bisects over ints — no calendar construction or pandas
+``Timestamp`` per call.
 
 Fail-closed contract (ROB-367 §5 / ROB-371): any date the calendar cannot
-positively classify as open — out of its precomputed range, or any
-``ValueError``/``KeyError`` from the library or pandas (``OutOfBoundsDatetime``
-is a ``ValueError``) — is treated as **not a trading session**. Lookahead-safe
-labeling must never leak across a session it could not confirm is open.
+positively classify as open — outside the index's covered range, or any error
+loading or querying it — is treated as **not a trading session**.
+Lookahead-safe labeling must never leak across a session it could not confirm
+is open.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import Literal
 
+from app.services.market_events.session_index import (
+    SessionIndex,
+    SessionStatus,
+    session_index,
+)
+
 logger = logging.getLogger(__name__)
 
 Market = Literal["us", "kr"]
-SessionStatus = Literal["open", "closed", "unknown"]
 
 _CALENDAR_NAME: dict[str, str] = {"us": "XNYS", "kr": "XKRX"}
 
@@ -33,11 +38,9 @@ _CALENDAR_NAME: dict[str, str] = {"us": "XNYS", "kr": "XKRX"}
 _SESSION_SEARCH_DAYS = 32
 
 
-def _calendar(market: Market):
-    import exchange_calendars as xcals
-
+def _calendar(market: Market) -> SessionIndex:
     try:
-        return xcals.get_calendar(_CALENDAR_NAME[market])
+        return session_index(_CALENDAR_NAME[market])  # type: ignore[arg-type]
     except KeyError as exc:  # unknown market key -> programmer error, surface it
         raise ValueError(f"unsupported market {market!r}") from exc
 
@@ -50,11 +53,8 @@ def trading_session_status(market: Market, day: date) -> SessionStatus:
     classify the date instead of silently treating an infrastructure error as a
     holiday.
     """
-    import pandas as pd
-
     try:
-        cal = _calendar(market)
-        return "open" if bool(cal.is_session(pd.Timestamp(day))) else "closed"
+        return _calendar(market).status(day)
     except (ValueError, KeyError):
         return "unknown"
     except Exception:  # noqa: BLE001 - expose uncertainty without claiming open/closed
@@ -87,18 +87,11 @@ def regular_session_bounds(
     Returns ``None`` when ``day`` is not a confirmed trading session (weekend /
     holiday / out of the calendar's range) or any calendar/library error occurs
     (fail-closed, same contract as :func:`is_trading_session`). Early-close
-    half-days are honored — the bounds come straight from the library, which
-    models them (e.g. the day after US Thanksgiving closes at 13:00 ET).
+    half-days are honored — the index stores the library's per-session close
+    (e.g. the day after US Thanksgiving closes at 13:00 ET).
     """
-    import pandas as pd
-
     try:
-        cal = _calendar(market)
-        session = pd.Timestamp(day)
-        if not cal.is_session(session):
-            return None
-        open_ts = cal.session_open(session)
-        close_ts = cal.session_close(session)
+        return _calendar(market).bounds(day)
     except (ValueError, KeyError):
         return None
     except Exception:  # noqa: BLE001 - fail-closed on any calendar/library error
@@ -110,8 +103,6 @@ def regular_session_bounds(
             exc_info=True,
         )
         return None
-    # ``session_open``/``session_close`` return tz-aware UTC pandas Timestamps.
-    return open_ts.to_pydatetime(), close_ts.to_pydatetime()
 
 
 def next_trading_session(market: Market, day: date) -> date | None:
@@ -119,20 +110,34 @@ def next_trading_session(market: Market, day: date) -> date | None:
 
     Returns ``None`` if none can be confirmed (fail-closed / out of range).
     """
-    for offset in range(1, _SESSION_SEARCH_DAYS + 1):
-        candidate = day + timedelta(days=offset)
-        if is_trading_session(market, candidate):
-            return candidate
-    return None
+    candidate = _bounded_neighbour(market, day, forward=True)
+    if candidate is None or (candidate - day).days > _SESSION_SEARCH_DAYS:
+        return None
+    return candidate
 
 
 def previous_trading_session(market: Market, day: date) -> date | None:
     """Last trading session strictly before ``day`` within a bounded horizon."""
-    for offset in range(1, _SESSION_SEARCH_DAYS + 1):
-        candidate = day - timedelta(days=offset)
-        if is_trading_session(market, candidate):
-            return candidate
-    return None
+    candidate = _bounded_neighbour(market, day, forward=False)
+    if candidate is None or (day - candidate).days > _SESSION_SEARCH_DAYS:
+        return None
+    return candidate
+
+
+def _bounded_neighbour(market: Market, day: date, *, forward: bool) -> date | None:
+    """Adjacent session from the index; ``None`` when ``day`` is uncovered."""
+    try:
+        index = _calendar(market)
+        return index.next_session(day) if forward else index.previous_session(day)
+    except Exception:  # noqa: BLE001 - fail-closed on any calendar/library error
+        logger.warning(
+            "session_calendar: unexpected error finding the session next to %s %s; "
+            "treating as none (fail-closed)",
+            market,
+            day,
+            exc_info=True,
+        )
+        return None
 
 
 def trading_sessions_in_range(market: Market, start: date, end: date) -> list[date]:
@@ -141,13 +146,10 @@ def trading_sessions_in_range(market: Market, start: date, end: date) -> list[da
     Empty when ``end < start`` or the range is out of the calendar's bounds
     (fail-closed).
     """
-    import pandas as pd
-
     if end < start:
         return []
     try:
-        cal = _calendar(market)
-        sessions = cal.sessions_in_range(pd.Timestamp(start), pd.Timestamp(end))
+        return _calendar(market).sessions_between(start, end)
     except (ValueError, KeyError):
         return []
     except Exception:  # noqa: BLE001 - fail-closed on any calendar/library error
@@ -160,4 +162,3 @@ def trading_sessions_in_range(market: Market, start: date, end: date) -> list[da
             exc_info=True,
         )
         return []
-    return [ts.date() for ts in sessions]
@@ -0,0 +1,359 @@
+"""Precomputed XKRX / XNYS / NXT session index (pandas-free lookups).
+
+Building an :mod:`exchange_calendars` calendar costs seconds per process
+(XKRX alone is ~4s) and every query goes through pandas ``Timestamp``s. This
+module flattens each calendar once into sorted integer arrays —
+
+* ``days``   — session dates as ``date.toordinal()``,
+* ``opens``  — session open as epoch minutes (UTC),
+* ``closes`` — session close as epoch minutes (UTC),
+
+and answers is-session / next / previous / session-of-timestamp /
+sessions-between with :mod:`bisect`. The arrays are persisted as a small JSON
+artifact under ``settings.session_index_artifact_dir`` keyed by the installed
+``exchange_calendars`` version, so only the first process after an upgrade (or
+after the artifact ages past ``_ARTIFACT_MAX_AGE_DAYS``, which keeps the
+forward horizon rolling) pays the calendar build. The directory is created
+owner-only and ignored when other users can write to it; an artifact whose
+payload does not validate is rebuilt rather than trusted.
+
+``NXT`` (Nextrade) has no exchange_calendars entry: it trades on XKRX session
+days, and its index spans the venue envelope 08:00–20:00 KST (pre-market
+through after-market), matching the ``NTX`` window used by the KR candle sync.
+
+Coverage is the calendar's ``[first_session, last_session]``. Anything outside
+it is ``unknown`` — never ``closed`` — so the fail-closed contract of
+:mod:`app.services.market_events.session_calendar` is preserved.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import stat
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from functools import lru_cache
+from importlib import metadata
+from itertools import pairwise
+from pathlib import Path
+from typing import Any, Literal
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Exchange = Literal["XKRX", "XNYS", "NXT"]
+SessionStatus = Literal["open", "closed", "unknown"]
+
+_ARTIFACT_FORMAT = 1
+_ARTIFACT_MAX_AGE_DAYS = 30
+_SOURCE_CALENDARS: tuple[str, ...] = ("XKRX", "XNYS")
+
+_KST = ZoneInfo("Asia/Seoul")
+_NXT_OPEN_KST = time(8, 0)
+_NXT_CLOSE_KST = time(20, 0)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _epoch_minute(moment: datetime) -> int:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return int(moment.timestamp()) // 60
+
+
+def _from_epoch_minute(minute: int) -> datetime:
+    return datetime.fromtimestamp(minute * 60, tz=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionIndex:
+    """Sorted session arrays for one exchange; all lookups are O(log n)."""
+
+    exchange: str
+    first_day: date
+    last_day: date
+    days: array
+    opens: array
+    closes: array
+
+    def covers(self, day: date) -> bool:
+        return self.first_day <= day <= self.last_day
+
+    def _position(self, day: date) -> int | None:
+        ordinal = day.toordinal()
+        pos = bisect_left(self.days, ordinal)
+        if pos < len(self.days) and self.days[pos] == ordinal:
+            return pos
+        return None
+
+    def status(self, day: date) -> SessionStatus:
+        if not self.covers(day):
+            return "unknown"
+        return "open" if self._position(day) is not None else "closed"
+
+    def is_session(self, day: date) -> bool:
+        """Fail-closed: ``False`` for closed days and for uncovered days."""
+        return self.status(day) == "open"
+
+    def next_session(self, day: date) -> date | None:
+        """First session strictly after ``day``; ``None`` when not provable."""
+        if not self.covers(day):
+            return None
+        pos = bisect_right(self.days, day.toordinal())
+        if pos >= len(self.days):
+            return None
+        return date.fromordinal(self.days[pos])
+
+    def previous_session(self, day: date) -> date | None:
+        """Last session strictly before ``day``; ``None`` when not provable."""
+        if not self.covers(day):
+            return None
+        pos = bisect_left(self.days, day.toordinal())
+        if pos == 0:
+            return None
+        return date.fromordinal(self.days[pos - 1])
+
+    def bounds(self, day: date) -> tuple[datetime, datetime] | None:
+        """UTC ``(open, close)`` of the session on ``day`` (early closes kept)."""
+        pos = self._position(day) if self.covers(day) else None
+        if pos is None:
+            return None
+        return (
+            _from_epoch_minute(self.opens[pos]),
+            _from_epoch_minute(self.closes[pos]),
+        )
+
+    def session_of(self, moment: datetime) -> date | None:
+        """Session whose ``[open, close)`` contains ``moment`` (minute floor).
+
+        Naive ``moment`` is treated as UTC. ``None`` outside trading minutes,
+        including anywhere outside the covered range.
+        """
+        minute = _epoch_minute(moment)
+        pos = bisect_right(self.opens, minute) - 1
+        if pos >= 0 and minute < self.closes[pos]:
+            return date.fromordinal(self.days[pos])
+        return None
+
+    def is_open_at(self, moment: datetime) -> bool:
+        return self.session_of(moment) is not None
+
+    def sessions_between(self, start: date, end: date) -> list[date]:
+        """Sessions in the inclusive ``[start, end]`` range.
+
+        Raises ``ValueError`` when either bound is outside the covered range,
+        like ``exchange_calendars.sessions_in_range`` did, so callers cannot
+        mistake an uncovered span for a run of holidays.
+        """
+        if end < start:
+            return []
+        if not (self.covers(start) and self.covers(end)):
+            raise ValueError(
+                f"{self.exchange} session index covers "
+                f"{self.first_day}..{self.last_day}, not {start}..{end}"
+            )
+        lo = bisect_left(self.days, start.toordinal())
+        hi = bisect_right(self.days, end.toordinal())
+        return [date.fromordinal(value) for value in self.days[lo:hi]]
+
+
+def _calendars_version() -> str:
+    return metadata.version("exchange_calendars")
+
+
+def _artifact_dir() -> Path:
+    if settings.session_index_artifact_dir:
+        return Path(settings.session_index_artifact_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "auto_trader" / "session_index"
+
+
+def _artifact_path(version: str) -> Path:
+    return _artifact_dir() / f"sessions-v{_ARTIFACT_FORMAT}-xcals{version}.json"
+
+
+def _private_dir(directory: Path, *, create: bool) -> bool:
+    """Whether ``directory`` is ours alone (created 0700 when ``create``)."""
+    try:
+        if create:
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = directory.stat()
+    except OSError:
+        return False
+    private = (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+    if not private:
+        logger.warning("session_index: ignoring shared artifact dir %s", directory)
+    return private
+
+
+def _build_payload(version: str, today: date) -> dict[str, Any]:
+    import exchange_calendars as xcals
+
+    calendars: dict[str, Any] = {}
+    for name in _SOURCE_CALENDARS:
+        cal = xcals.get_calendar(name)
+        schedule = cal.schedule
+        # Neither calendar models a lunch break; the index keeps [open, close).
+        calendars[name] = {
+            "first": cal.first_session.date().toordinal(),
+            "last": cal.last_session.date().toordinal(),
+            "days": [
+                _EPOCH_ORDINAL + int(ns // 86_400_000_000_000)
+                for ns in schedule.index.values.astype("int64")
+            ],
+            "opens": [
+                int(ns // 60_000_000_000)
+                for ns in schedule["open"].values.astype("int64")
+            ],
+            "closes": [
+                int(ns // 60_000_000_000)
+                for ns in schedule["close"].values.astype("int64")
+            ],
+        }
+    return {
+        "format": _ARTIFACT_FORMAT,
+        "exchange_calendars": version,
+        "built_on": today.isoformat(),
+        "calendars": calendars,
+    }
+
+
+def _int_list(value: Any) -> bool:
+    return isinstance(value, list) and all(type(item) is int for item in value)
+
+
+def _valid_calendar(entry: Any) -> bool:
+    if not isinstance(entry, dict):
+        return False
+    first, last = entry.get("first"), entry.get("last")
+    days, opens, closes = entry.get("days"), entry.get("opens"), entry.get("closes")
+    if not (
+        type(first) is int
+        and type(last) is int
+        and 0 < first <= last <= date.max.toordinal()
+        and _int_list(days)
+        and _int_list(opens)
+        and _int_list(closes)
+        and len(days) == len(opens) == len(closes)
+    ):
+        return False
+    return (
+        all(first <= day <= last for day in days)
+        and all(a < b for a, b in pairwise(days))
+        and all(a < b for a, b in pairwise(opens))
+        and all(o < c for o, c in zip(opens, closes, strict=True))
+    )
+
+
+def _read_artifact(path: Path, version: str, today: date) -> dict[str, Any] | None:
+    if not _private_dir(path.parent, create=False):
+        return None
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get("calendars"), dict):
+        return None
+    try:
+        built_on = date.fromisoformat(payload["built_on"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    calendars = payload["calendars"]
+    valid = (
+        payload.get("format") == _ARTIFACT_FORMAT
+        and payload.get("exchange_calendars") == version
+        and 0 <= (today - built_on).days <= _ARTIFACT_MAX_AGE_DAYS
+        and all(_valid_calendar(calendars.get(name)) for name in _SOURCE_CALENDARS)
+    )
+    return payload if valid else None
+
+
+def _write_artifact(path: Path, payload: dict[str, Any]) -> None:
+    if not _private_dir(path.parent, create=True):
+        return
+    try:
+        fd, temp_name = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+        )
+        with os.fdopen(fd, "w") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(temp_name, path)
+    except OSError:
+        logger.warning("session_index: could not persist %s", path, exc_info=True)
+
+
+def _index_from(name: str, entry: dict[str, Any]) -> SessionIndex:
+    return SessionIndex(
+        exchange=name,
+        first_day=date.fromordinal(entry["first"]),
+        last_day=date.fromordinal(entry["last"]),
+        days=array("q", entry["days"]),
+        opens=array("q", entry["opens"]),
+        closes=array("q", entry["closes"]),
+    )
+
+
+def _nxt_index(xkrx: SessionIndex) -> SessionIndex:
+    opens = array("q")
+    closes = array("q")
+    for ordinal in xkrx.days:
+        day = date.fromordinal(ordinal)
+        opens.append(_epoch_minute(datetime.combine(day, _NXT_OPEN_KST, _KST)))
+        closes.append(_epoch_minute(datetime.combine(day, _NXT_CLOSE_KST, _KST)))
+    return SessionIndex(
+        exchange="NXT",
+        first_day=xkrx.first_day,
+        last_day=xkrx.last_day,
+        days=xkrx.days,
+        opens=opens,
+        closes=closes,
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_indexes() -> dict[str, SessionIndex]:
+    version = _calendars_version()
+    today = datetime.now(UTC).date()
+    path = _artifact_path(version)
+    payload = _read_artifact(path, version, today)
+    if payload is None:
+        payload = _build_payload(version, today)
+        _write_artifact(path, payload)
+    indexes = {
+        name: _index_from(name, payload["calendars"][name])
+        for name in _SOURCE_CALENDARS
+    }
+    indexes["NXT"] = _nxt_index(indexes["XKRX"])
+    return indexes
+
+
+def session_index(exchange: Exchange) -> SessionIndex:
+    """Process-wide :class:`SessionIndex` for ``exchange``."""
+    try:
+        return _load_indexes()[exchange]
+    except KeyError as exc:
+        raise ValueError(f"unsupported exchange {exchange!r}") from exc
+
+
+def clear_cache() -> None:
+    """Drop the in-process indexes (the on-disk artifact is kept)."""
+    _load_indexes.cache_clear()
+
+
+__all__ = [
+    "Exchange",
+    "SessionIndex",
+    "SessionStatus",
+    "clear_cache",
+    "session_index",
+]
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.manual_holdings import MarketType
 from app.services.brokers.kis.client import KISClient
 from app.services.exchange_rate_service import get_usd_krw_rate
+from app.services.last_price_resolver import resolve_last_prices
 from app.services.manual_holdings_service import ManualHoldingsService
 
 logger = logging.getLogger(__name__)
@@ -283,17 +284,22 @@ class MergedPortfolioService:
         if not tickers_without_price:
             return
 
+        if market_type == MarketType.KR:
+            resolution = await resolve_last_prices(
+                "KR", tickers_without_price, kis_client=kis_client
+            )
+            for ticker, price in resolution.prices.items():
+                merged[ticker].current_price = price
+            for ticker, exc in resolution.errors.items():
+                logger.warning("Failed to fetch price for %s: %s", ticker, exc)
+            return
+
         for ticker in tickers_without_price:
             try:
-                if market_type == MarketType.KR:
-                    df = await kis_client.inquire_price(ticker)
-                    if not df.empty:
-                        merged[ticker].current_price = float(df.iloc[0]["close"])
-                else:
-                    # 해외주식 현재가 조회
-                    df = await kis_client.inquire_overseas_price(ticker)
-                    if not df.empty:
-                        merged[ticker].current_price = float(df.iloc[0]["close"])
+                # 해외주식 현재가 조회
+                df = await kis_client.inquire_overseas_price(ticker)
+                if not df.empty:
+                    merged[ticker].current_price = float(df.iloc[0]["close"])
             except Exception as exc:
                 logger.warning("Failed to fetch price for %s: %s", ticker, exc)
 
@@ -66,6 +66,12 @@ from app.services.naver_finance.parser import (
 from app.services.naver_finance.parser import (
     _extract_current_price_from_main_soup as _extract_current_price_from_main_soup,
 )
+from app.services.naver_finance.parser import (
+    _fetch_document as _fetch_document,
+)
+from app.services.naver_finance.parser import (
+    _fetch_document_with_client as _fetch_document_with_client,
+)
 from app.services.naver_finance.parser import (
     _fetch_html as _fetch_html,
 )
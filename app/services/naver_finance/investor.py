@@ -8,7 +8,7 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from app.core.number_utils import parse_korean_number as _parse_korean_number
 from app.services.analyst_normalizer import (
@@ -21,17 +21,31 @@ from app.services.naver_finance.news import _parse_news_soup
 from app.services.naver_finance.parser import (
     NAVER_FINANCE_BASE,
     NAVER_FINANCE_ITEM,
+    Page,
+    _as_document,
     _extract_current_price_from_main_soup,
-    _fetch_html,
-    _fetch_html_with_client,
+    _fetch_document,
+    _fetch_document_with_client,
+    _first,
+    _has_class,
     _parse_naver_date,
+    _text,
 )
 from app.services.naver_finance.valuation import _parse_valuation_from_soups
 
+_REPORT_INFO = etree.XPath(f"//div[{_has_class('view_info_1')}]")
+_REPORT_TARGET = etree.XPath(f".//em[{_has_class('money')}]//strong")
+_REPORT_RATING = etree.XPath(f".//em[{_has_class('coment')}]")
+_OPINION_TABLE = etree.XPath(f"//table[{_has_class('type_1')}]")
+_TREND_TABLES = etree.XPath(f"//table[{_has_class('type2')}]")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath(".//td")
+_LINK = etree.XPath(".//a")
 
-def _parse_report_detail_soup(soup: BeautifulSoup) -> dict[str, Any] | None:
-    info_div = soup.select_one("div.view_info_1")
-    if not info_div:
+
+def _parse_report_detail_soup(soup: Page) -> dict[str, Any] | None:
+    info_div = _first(_REPORT_INFO, _as_document(soup))
+    if info_div is None:
         # ROB-814: the parse anchor itself is missing — a page-shape anomaly
         # (anti-bot interstitial, deleted-post notice, Naver selector rot),
         # NOT a report with a legitimately-absent target. Return None so the
@@ -45,40 +59,38 @@ def _parse_report_detail_soup(soup: BeautifulSoup) -> dict[str, Any] | None:
         "rating": None,
     }
 
-    target_elem = info_div.select_one("em.money strong")
-    if target_elem:
-        result["target_price"] = _parse_korean_number(target_elem.get_text(strip=True))
+    target_elem = _first(_REPORT_TARGET, info_div)
+    if target_elem is not None:
+        result["target_price"] = _parse_korean_number(_text(target_elem))
 
-    rating_elem = info_div.select_one("em.coment")
-    if rating_elem:
-        result["rating"] = rating_elem.get_text(strip=True)
+    rating_elem = _first(_REPORT_RATING, info_div)
+    if rating_elem is not None:
+        result["rating"] = _text(rating_elem)
 
     return result
 
 
 def _collect_opinion_report_infos(
-    company_list_soup: BeautifulSoup,
+    company_list_soup: Page,
     limit: int,
 ) -> list[dict[str, Any]]:
-    table = company_list_soup.select_one("table.type_1")
-    if not table:
+    table = _first(_OPINION_TABLE, _as_document(company_list_soup))
+    if table is None:
         return []
 
     report_infos: list[dict[str, Any]] = []
     seen_nids: set[str] = set()
-    rows = table.select("tbody tr, tr")
-    for row in rows:
-        cells = row.select("td")
+    for row in _ROWS(table):
+        cells = _CELLS(row)
         if len(cells) < 5:
             continue
 
         try:
-            title_elem = cells[1].select_one("a")
-            if not title_elem:
+            title_elem = _first(_LINK, cells[1])
+            if title_elem is None:
                 continue
 
-            href = title_elem.get("href") or ""
-            href_str = href if isinstance(href, str) else ""
+            href_str = title_elem.get("href") or ""
             nid_match = re.search(r"nid=(\d+)", href_str)
             if not nid_match:
                 continue
@@ -91,10 +103,10 @@ def _collect_opinion_report_infos(
             report_infos.append(
                 {
                     "nid": nid,
-                    "stock_name": cells[0].get_text(strip=True),
-                    "title": title_elem.get_text(strip=True),
-                    "firm": cells[2].get_text(strip=True),
-                    "date": _parse_naver_date(cells[4].get_text(strip=True)),
+                    "stock_name": _text(cells[0]),
+                    "title": _text(title_elem),
+                    "firm": _text(cells[2]),
+                    "date": _parse_naver_date(_text(cells[4])),
                     "url": (
                         href_str
                         if href_str.startswith("http")
@@ -112,7 +124,7 @@ def _collect_opinion_report_infos(
 
 async def _build_investment_opinions_from_company_list_soup(
     code: str,
-    company_list_soup: BeautifulSoup,
+    company_list_soup: Page,
     limit: int,
     *,
     current_price: int | None,
@@ -194,21 +206,7 @@ def _parse_holding_rate(text: str | None) -> float | None:
         return None
 
 
-async def fetch_investor_trends(code: str, days: int = 20) -> dict[str, Any]:
-    """Fetch foreign/institutional investor trading trends.
-
-    URL: finance.naver.com/item/frgn.naver?code={code}
-
-    Args:
-        code: 6-digit Korean stock code
-        days: Number of days of data to fetch
-
-    Returns:
-        Daily investor flow data (foreign, institutional, individual net trades)
-    """
-    url = f"{NAVER_FINANCE_ITEM}/frgn.naver"
-    soup = await _fetch_html(url, params={"code": code})
-
+def _parse_investor_trends_soup(soup: Page, code: str, days: int) -> dict[str, Any]:
     trends: dict[str, Any] = {
         "symbol": code,
         "days": days,
@@ -218,29 +216,26 @@ async def fetch_investor_trends(code: str, days: int = 20) -> dict[str, Any]:
     # There are multiple table.type2 on the page
     # The one with actual investor data has rows with 7+ cells
     # Columns: 날짜, 종가, 전일비, 등락률, 거래량, 기관, 외국인
-    tables = soup.select("table.type2")
     target_table = None
 
-    for table in tables:
+    for table in _TREND_TABLES(_as_document(soup)):
         # Find the table that has data rows with 7 cells
-        rows = table.select("tr")
-        for row in rows:
-            cells = row.select("td")
+        for row in _ROWS(table):
+            cells = _CELLS(row)
             if len(cells) >= 7:
                 # Check if first cell looks like a date
-                first_cell = cells[0].get_text(strip=True)
+                first_cell = _text(cells[0])
                 if first_cell and first_cell[0].isdigit():
                     target_table = table
                     break
-        if target_table:
+        if target_table is not None:
             break
 
-    if not target_table:
+    if target_table is None:
         return trends
 
-    rows = target_table.select("tr")
-    for row in rows:
-        cells = row.select("td")
+    for row in _ROWS(target_table):
+        cells = _CELLS(row)
         # ROB-448: the 외국인 column is a 2-level header → the data row actually has 9
         # cells (the old "7 cells" comment was stale). Columns:
         #   날짜(0), 종가(1), 전일비(2), 등락률(3), 거래량(4), 기관 순매수(5),
@@ -249,34 +244,28 @@ async def fetch_investor_trends(code: str, days: int = 20) -> dict[str, Any]:
             continue
 
         try:
-            date_text = cells[0].get_text(strip=True)
+            date_text = _text(cells[0])
             if not date_text or not date_text[0].isdigit():
                 continue
 
             # Parse 전일비 which includes direction text (상승/하락)
-            change_text = cells[2].get_text(strip=True)
+            change_text = _text(cells[2])
 
             data_point = {
                 "date": _parse_naver_date(date_text),
-                "close": _parse_korean_number(cells[1].get_text(strip=True)),
+                "close": _parse_korean_number(_text(cells[1])),
                 "change": _parse_korean_number(change_text),
-                "change_pct": _parse_korean_number(cells[3].get_text(strip=True)),
-                "volume": _parse_korean_number(cells[4].get_text(strip=True)),
-                "institutional_net": _parse_korean_number(
-                    cells[5].get_text(strip=True)
-                ),
-                "foreign_net": _parse_korean_number(cells[6].get_text(strip=True)),
+                "change_pct": _parse_korean_number(_text(cells[3])),
+                "volume": _parse_korean_number(_text(cells[4])),
+                "institutional_net": _parse_korean_number(_text(cells[5])),
+                "foreign_net": _parse_korean_number(_text(cells[6])),
                 # ROB-448: foreign holding shares (count) + rate (%, 0..100). Guarded so
                 # a legacy 7-cell layout degrades to None instead of IndexError.
                 "foreign_holding_shares": (
-                    _parse_korean_number(cells[7].get_text(strip=True))
-                    if len(cells) >= 9
-                    else None
+                    _parse_korean_number(_text(cells[7])) if len(cells) >= 9 else None
                 ),
                 "foreign_holding_rate": (
-                    _parse_holding_rate(cells[8].get_text(strip=True))
-                    if len(cells) >= 9
-                    else None
+                    _parse_holding_rate(_text(cells[8])) if len(cells) >= 9 else None
                 ),
             }
 
@@ -290,11 +279,28 @@ async def fetch_investor_trends(code: str, days: int = 20) -> dict[str, Any]:
     return trends
 
 
+async def fetch_investor_trends(code: str, days: int = 20) -> dict[str, Any]:
+    """Fetch foreign/institutional investor trading trends.
+
+    URL: finance.naver.com/item/frgn.naver?code={code}
+
+    Args:
+        code: 6-digit Korean stock code
+        days: Number of days of data to fetch
+
+    Returns:
+        Daily investor flow data (foreign, institutional, individual net trades)
+    """
+    url = f"{NAVER_FINANCE_ITEM}/frgn.naver"
+    document = await _fetch_document(url, params={"code": code})
+    return _parse_investor_trends_soup(document, code, days)
+
+
 async def _fetch_report_detail(nid: str) -> dict[str, Any] | None:
     try:
         url = f"{NAVER_FINANCE_BASE}/research/company_read.naver"
-        soup = await _fetch_html(url, params={"nid": nid})
-        return _parse_report_detail_soup(soup)
+        document = await _fetch_document(url, params={"nid": nid})
+        return _parse_report_detail_soup(document)
     except Exception:
         return None
 
@@ -304,8 +310,8 @@ async def _fetch_report_detail_with_client(
 ) -> dict[str, Any] | None:
     try:
         url = f"{NAVER_FINANCE_BASE}/research/company_read.naver"
-        soup = await _fetch_html_with_client(client, url, params={"nid": nid})
-        return _parse_report_detail_soup(soup)
+        document = await _fetch_document_with_client(client, url, params={"nid": nid})
+        return _parse_report_detail_soup(document)
     except Exception:
         return None
 
@@ -321,8 +327,8 @@ async def _fetch_current_price(code: str) -> int | None:
     """
     try:
         url = f"{NAVER_FINANCE_ITEM}/main.naver"
-        soup = await _fetch_html(url, params={"code": code})
-        return _extract_current_price_from_main_soup(soup)
+        document = await _fetch_document(url, params={"code": code})
+        return _extract_current_price_from_main_soup(document)
     except Exception:
         return None
 
@@ -357,13 +363,13 @@ async def fetch_investment_opinions(
           rows_undated/newest_opinion_date/window_months)
     """
     url = f"{NAVER_FINANCE_BASE}/research/company_list.naver"
-    company_list_soup = await _fetch_html(
+    company_list_document = await _fetch_document(
         url, params={"searchType": "itemCode", "itemCode": code}
     )
     current_price = await _fetch_current_price(code)
     return await _build_investment_opinions_from_company_list_soup(
         code,
-        company_list_soup,
+        company_list_document,
         limit,
         current_price=current_price,
         detail_fetcher=_fetch_report_detail,
@@ -385,31 +391,23 @@ async def _fetch_kr_snapshot(
         news_url = f"{NAVER_FINANCE_ITEM}/news_news.naver"
         company_list_url = f"{NAVER_FINANCE_BASE}/research/company_list.naver"
         page_results = await asyncio.gather(
-            _fetch_html_with_client(client, main_url, params={"code": code}),
-            _fetch_html_with_client(client, sise_url, params={"code": code}),
-            _fetch_html_with_client(
+            _fetch_document_with_client(client, main_url, params={"code": code}),
+            _fetch_document_with_client(client, sise_url, params={"code": code}),
+            _fetch_document_with_client(
                 client,
                 news_url,
                 params={"code": code, "page": "", "clusterId": ""},
             ),
-            _fetch_html_with_client(
+            _fetch_document_with_client(
                 client,
                 company_list_url,
                 params={"searchType": "itemCode", "itemCode": code},
             ),
             return_exceptions=True,
         )
-        main_soup = (
-            page_results[0] if isinstance(page_results[0], BeautifulSoup) else None
-        )
-        sise_soup = (
-            page_results[1] if isinstance(page_results[1], BeautifulSoup) else None
-        )
-        news_soup = (
-            page_results[2] if isinstance(page_results[2], BeautifulSoup) else None
-        )
-        company_list_soup = (
-            page_results[3] if isinstance(page_results[3], BeautifulSoup) else None
+        main_page, sise_page, news_page, company_list_page = (
+            None if isinstance(result, BaseException) else result
+            for result in page_results
         )
 
         snapshot: dict[str, Any] = {
@@ -418,25 +416,25 @@ async def _fetch_kr_snapshot(
             "opinions": None,
         }
 
-        if main_soup is not None and sise_soup is not None:
+        if main_page is not None and sise_page is not None:
             snapshot["valuation"] = _parse_valuation_from_soups(
-                code, main_soup, sise_soup
+                code, main_page, sise_page
             )
 
-        if news_soup is not None:
-            snapshot["news"] = _parse_news_soup(news_soup, news_limit)
+        if news_page is not None:
+            snapshot["news"] = _parse_news_soup(news_page, news_limit)
 
-        if company_list_soup is not None:
+        if company_list_page is not None:
             current_price = (
-                _extract_current_price_from_main_soup(main_soup)
-                if main_soup is not None
+                _extract_current_price_from_main_soup(main_page)
+                if main_page is not None
                 else None
             )
             snapshot[
                 "opinions"
             ] = await _build_investment_opinions_from_company_list_soup(
                 code,
-                company_list_soup,
+                company_list_page,
                 opinion_limit,
                 current_price=current_price,
                 detail_fetcher=lambda nid: _fetch_report_detail_with_client(
@@ -4,42 +4,52 @@ from __future__ import annotations
 
 from typing import Any
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from app.services.naver_finance.parser import (
     NAVER_FINANCE_BASE,
     NAVER_FINANCE_ITEM,
-    _fetch_html,
+    Page,
+    _as_document,
+    _fetch_document,
+    _first,
+    _has_class,
     _parse_naver_date,
+    _text,
 )
 
+_NEWS_TABLE = etree.XPath(f"//table[{_has_class('type5')}]")
+_ROWS = etree.XPath(".//tr")
+_TITLE_LINK = etree.XPath(f".//td[{_has_class('title')}]//a")
+_SOURCE = etree.XPath(f".//td[{_has_class('info')}]")
+_DATE = etree.XPath(f".//td[{_has_class('date')}]")
 
-def _parse_news_soup(soup: BeautifulSoup, limit: int) -> list[dict[str, Any]]:
+
+def _parse_news_soup(soup: Page, limit: int) -> list[dict[str, Any]]:
     news_items: list[dict[str, Any]] = []
-    table = soup.select_one("table.type5")
-    if not table:
+    table = _first(_NEWS_TABLE, _as_document(soup))
+    if table is None:
         return news_items
 
-    for row in table.select("tr"):
-        title_elem = row.select_one("td.title a")
-        if not title_elem:
+    for row in _ROWS(table):
+        title_elem = _first(_TITLE_LINK, row)
+        if title_elem is None:
             continue
 
-        source_elem = row.select_one("td.info")
-        date_elem = row.select_one("td.date")
-        href = title_elem.get("href") or ""
-        href_str = href if isinstance(href, str) else ""
+        source_elem = _first(_SOURCE, row)
+        date_elem = _first(_DATE, row)
+        href_str = title_elem.get("href") or ""
         full_url = (
             href_str if href_str.startswith("http") else NAVER_FINANCE_BASE + href_str
         )
         news_items.append(
             {
-                "title": title_elem.get_text(strip=True),
+                "title": _text(title_elem),
                 "url": full_url,
-                "source": source_elem.get_text(strip=True) if source_elem else "",
+                "source": _text(source_elem) if source_elem is not None else "",
                 "datetime": (
-                    _parse_naver_date(date_elem.get_text(strip=True))
-                    if date_elem
+                    _parse_naver_date(_text(date_elem))
+                    if date_elem is not None
                     else None
                 ),
             }
@@ -64,5 +74,7 @@ async def fetch_news(code: str, limit: int = 20) -> list[dict[str, Any]]:
         List of news items with title, source, datetime, url
     """
     url = f"{NAVER_FINANCE_ITEM}/news_news.naver"
-    soup = await _fetch_html(url, params={"code": code, "page": "", "clusterId": ""})
-    return _parse_news_soup(soup, limit)
+    document = await _fetch_document(
+        url, params={"code": code, "page": "", "clusterId": ""}
+    )
+    return _parse_news_soup(document, limit)
@@ -0,0 +1,95 @@
+"""Process-local conditional-request cache for rarely changing Naver pages.
+
+Sector member lists, research-report bodies and company-overview pages change
+on the order of days, yet every snapshot job re-downloads them. For the paths
+in ``_REVALIDATED_PATHS`` the last 200 body is kept together with its
+``ETag``/``Last-Modified`` validators; the next fetch sends
+``If-None-Match``/``If-Modified-Since`` and a 304 reuses the stored body.
+Responses without validators are not stored, so pages Naver renders
+dynamically simply behave as before. Gated by
+``settings.naver_page_revalidate_enabled`` and bounded (LRU) by
+``settings.naver_page_cache_max_entries``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+_REVALIDATED_PATHS = frozenset(
+    {
+        "/sise/sise_group_detail.naver",
+        "/research/company_read.naver",
+        "/item/coinfo.naver",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PageEntry:
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+
+
+_ENTRIES: OrderedDict[str, PageEntry] = OrderedDict()
+
+
+def page_key(url: str, params: dict[str, Any] | None) -> str | None:
+    """Cache key for ``url``+``params``, or None when the page is not cached."""
+    if not settings.naver_page_revalidate_enabled:
+        return None
+    if urlsplit(url).path not in _REVALIDATED_PATHS:
+        return None
+    query = urlencode(sorted((params or {}).items()))
+    return f"{url}?{query}"
+
+
+def get(key: str | None) -> PageEntry | None:
+    if key is None:
+        return None
+    entry = _ENTRIES.get(key)
+    if entry is not None:
+        _ENTRIES.move_to_end(key)
+    return entry
+
+
+def validators(entry: PageEntry | None) -> dict[str, str]:
+    """Conditional-request headers for a stored entry."""
+    if entry is None:
+        return {}
+    headers: dict[str, str] = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def store(key: str | None, response: httpx.Response) -> None:
+    if key is None or response.status_code != 200:
+        return
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if not etag and not last_modified:
+        _ENTRIES.pop(key, None)
+        return
+    _ENTRIES[key] = PageEntry(
+        content=response.content, etag=etag, last_modified=last_modified
+    )
+    _ENTRIES.move_to_end(key)
+    while len(_ENTRIES) > max(1, settings.naver_page_cache_max_entries):
+        _ENTRIES.popitem(last=False)
+
+
+def clear() -> None:
+    _ENTRIES.clear()
+
+
+__all__ = ["PageEntry", "clear", "get", "page_key", "store", "validators"]
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import date
 from typing import Any
 
 import httpx
+import lxml.html
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from app.core.number_utils import parse_korean_number as _parse_korean_number
+from app.services.naver_finance import page_cache
+
+# Parsed page: every extractor accepts either the lxml document produced by
+# ``_fetch_document`` (hot path) or a BeautifulSoup tree (legacy callers/tests).
+Page = BeautifulSoup | lxml.html.HtmlElement
 
 # Base URLs for Naver Finance
 NAVER_FINANCE_BASE = "https://finance.naver.com"
@@ -77,10 +85,105 @@ def _parse_naver_date(date_str: str | None) -> str | None:
     return date_str
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS ``.name`` class selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _text(element: Any) -> str:
+    """``BeautifulSoup.get_text(strip=True)`` for an lxml element."""
+    return "".join(part.strip() for part in element.xpath(".//text()"))
+
+
+def _first(xpath: etree.XPath, node: Any) -> Any | None:
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _decode_html_content(content: bytes) -> str:
+    try:
+        return content.decode("euc-kr")
+    except UnicodeDecodeError:
+        return content.decode("utf-8", errors="replace")
+
+
+def _parse_document(content: bytes | str) -> lxml.html.HtmlElement:
+    """Parse a Naver page into an lxml document (CPU-bound; run off-loop)."""
+    text = _decode_html_content(content) if isinstance(content, bytes) else content
+    try:
+        return lxml.html.document_fromstring(text)
+    except etree.ParserError:
+        # Empty body — mirror BeautifulSoup, which yields an empty tree.
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def _as_document(page: Page) -> lxml.html.HtmlElement:
+    if isinstance(page, BeautifulSoup):
+        return _parse_document(str(page))
+    return page
+
+
+def _parse_soup(content: bytes) -> BeautifulSoup:
+    return BeautifulSoup(_decode_html_content(content), "lxml")
+
+
+async def _get_page_content(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any] | None = None,
+    *,
+    headers: dict[str, str] | None = DEFAULT_HEADERS,
+    raise_for_status: bool = True,
+) -> bytes:
+    """GET a page body, revalidating rarely changing pages via ``page_cache``."""
+    key = page_cache.page_key(url, params)
+    entry = page_cache.get(key)
+    request_headers = {**(headers or {}), **page_cache.validators(entry)}
+    if request_headers:
+        response = await client.get(url, params=params, headers=request_headers)
+    else:
+        response = await client.get(url, params=params)
+    if entry is not None and response.status_code == 304:
+        return entry.content
+    if raise_for_status:
+        response.raise_for_status()
+    page_cache.store(key, response)
+    return response.content
+
+
+async def _fetch_document(
+    url: str, params: dict[str, Any] | None = None
+) -> lxml.html.HtmlElement:
+    """Fetch a Naver Finance page and parse it off the event loop.
+
+    Handles encoding detection (EUC-KR vs UTF-8) for Naver Finance pages.
+
+    Args:
+        url: URL to fetch
+        params: Query parameters
+
+    Returns:
+        lxml document for the compiled XPath extractors
+    """
+    async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+        return await _fetch_document_with_client(client, url, params=params)
+
+
+async def _fetch_document_with_client(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any] | None = None,
+) -> lxml.html.HtmlElement:
+    content = await _get_page_content(client, url, params)
+    return await asyncio.to_thread(_parse_document, content)
+
+
 async def _fetch_html(url: str, params: dict[str, Any] | None = None) -> BeautifulSoup:
     """Fetch HTML and return BeautifulSoup object.
 
     Handles encoding detection (EUC-KR vs UTF-8) for Naver Finance pages.
+    Prefer ``_fetch_document`` for new extractors; the soup is still built in
+    a worker thread so it never blocks the event loop.
 
     Args:
         url: URL to fetch
@@ -93,33 +196,32 @@ async def _fetch_html(url: str, params: dict[str, Any] | None = None) -> Beautif
         return await _fetch_html_with_client(client, url, params=params)
 
 
-def _decode_html_content(content: bytes) -> str:
-    try:
-        return content.decode("euc-kr")
-    except UnicodeDecodeError:
-        return content.decode("utf-8", errors="replace")
-
-
 async def _fetch_html_with_client(
     client: httpx.AsyncClient,
     url: str,
     params: dict[str, Any] | None = None,
 ) -> BeautifulSoup:
-    response = await client.get(url, params=params, headers=DEFAULT_HEADERS)
-    response.raise_for_status()
-    return BeautifulSoup(_decode_html_content(response.content), "lxml")
+    content = await _get_page_content(client, url, params)
+    return await asyncio.to_thread(_parse_soup, content)
+
+
+_PRICE_BLIND = etree.XPath(
+    f"//p[{_has_class('no_today')}]//em//span[{_has_class('blind')}]"
+)
+_PRICE_NO_TODAY = etree.XPath(f"//p[{_has_class('no_today')}]")
 
 
-def _extract_current_price_from_main_soup(main_soup: BeautifulSoup) -> int | None:
-    price_elem = main_soup.select_one("p.no_today em span.blind")
-    if price_elem:
-        price = _parse_korean_number(price_elem.get_text(strip=True))
+def _extract_current_price_from_main_soup(main_soup: Page) -> int | None:
+    document = _as_document(main_soup)
+    price_elem = _first(_PRICE_BLIND, document)
+    if price_elem is not None:
+        price = _parse_korean_number(_text(price_elem))
         if price:
             return int(price)
 
-    no_today = main_soup.select_one("p.no_today")
-    if no_today:
-        price = _parse_korean_number(no_today.get_text(strip=True))
+    no_today = _first(_PRICE_NO_TODAY, document)
+    if no_today is not None:
+        price = _parse_korean_number(_text(no_today))
         if price:
             return int(price)
 
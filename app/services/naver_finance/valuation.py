@@ -8,7 +8,8 @@ import re
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from app.core.config import settings
 from app.core.number_utils import parse_korean_number as _parse_korean_number
@@ -17,9 +18,15 @@ from app.services.naver_finance.parser import (
     DEFAULT_HEADERS,
     NAVER_FINANCE_BASE,
     NAVER_FINANCE_ITEM,
-    _decode_html_content,
+    Page,
+    _as_document,
     _extract_current_price_from_main_soup,
-    _fetch_html,
+    _fetch_document,
+    _first,
+    _get_page_content,
+    _has_class,
+    _parse_document,
+    _text,
 )
 
 NAVER_MOBILE_API = "https://m.stock.naver.com/api/stock"
@@ -27,11 +34,28 @@ NAVER_MOBILE_API = "https://m.stock.naver.com/api/stock"
 logger = logging.getLogger(__name__)
 
 
+_COMPANY_NAME = etree.XPath(f"//div[{_has_class('wrap_company')}]//h2//a")
+_PER = etree.XPath("//em[@id='_per']")
+_PBR = etree.XPath("//em[@id='_pbr']")
+_DVR = etree.XPath("//em[@id='_dvr']")
+_ROWS = etree.XPath("//tr")
+_ROW_TH = etree.XPath(".//th")
+_ROW_TD = etree.XPath(".//td")
+_ROW_CELLS = etree.XPath(".//*[self::th or self::td]")
+_CODE_INFO = etree.XPath(f"//div[{_has_class('code')}]")
+_UPJONG_LINK = etree.XPath("//a[contains(@href, 'type=upjong')]")
+_LEGACY_SECTOR = etree.XPath(f"//div[{_has_class('tab_con1')}]//em//a")
+_SECTOR_TABLE = etree.XPath(f"//table[{_has_class('type_5')}]")
+_CODE_LINKS = etree.XPath(".//a[contains(@href, 'code=')]")
+_TITLE = etree.XPath("//title")
+
+
 def _parse_valuation_from_soups(
     code: str,
-    main_soup: BeautifulSoup,
-    sise_soup: BeautifulSoup,
+    main_soup: Page,
+    sise_soup: Page,
 ) -> dict[str, Any]:
+    main_document = _as_document(main_soup)
     valuation: dict[str, Any] = {
         "symbol": code,
         "name": None,
@@ -45,61 +69,21 @@ def _parse_valuation_from_soups(
         "low_52w": None,
         "current_position_52w": None,
     }
+    valuation.update(_parse_basic_info(main_document))
+    valuation.update(_parse_financial_metrics(main_document))
 
-    name_elem = main_soup.select_one("div.wrap_company h2 a")
-    if name_elem:
-        valuation["name"] = name_elem.get_text(strip=True)
-
-    valuation["current_price"] = _extract_current_price_from_main_soup(main_soup)
-
-    per_elem = main_soup.select_one("em#_per")
-    if per_elem:
-        per_val = _parse_korean_number(per_elem.get_text(strip=True))
-        if per_val is not None and per_val != 0:
-            valuation["per"] = per_val
-
-    pbr_elem = main_soup.select_one("em#_pbr")
-    if pbr_elem:
-        pbr_val = _parse_korean_number(pbr_elem.get_text(strip=True))
-        if pbr_val is not None and pbr_val != 0:
-            valuation["pbr"] = pbr_val
-
-    dvr_elem = main_soup.select_one("em#_dvr")
-    if dvr_elem:
-        dvr_val = _parse_korean_number(dvr_elem.get_text(strip=True))
-        if dvr_val is not None:
-            valuation["dividend_yield"] = dvr_val / 100
-
-    for row in main_soup.select("tr"):
-        th = row.select_one("th")
-        if not th:
-            continue
-        th_text = th.get_text(strip=True)
-        if not th_text.startswith("ROE"):
-            continue
-        tds = row.select("td")
-        if not tds:
-            continue
-        roe_val = _parse_korean_number(tds[0].get_text(strip=True))
-        if roe_val is None:
-            continue
-        if "ROE(%)" in th_text:
-            valuation["roe"] = roe_val
-        elif "지배" in th_text:
-            valuation["roe_controlling"] = roe_val
-
-    for row in sise_soup.select("tr"):
-        cells = row.select("th, td")
+    for row in _ROWS(_as_document(sise_soup)):
+        cells = _ROW_CELLS(row)
         for i, cell in enumerate(cells):
-            label = cell.get_text(strip=True)
+            label = _text(cell)
             if "52주 최고" in label or "52주최고" in label:
                 if i + 1 < len(cells):
-                    high_val = _parse_korean_number(cells[i + 1].get_text(strip=True))
+                    high_val = _parse_korean_number(_text(cells[i + 1]))
                     if high_val:
                         valuation["high_52w"] = int(high_val)
             elif "52주 최저" in label or "52주최저" in label:
                 if i + 1 < len(cells):
-                    low_val = _parse_korean_number(cells[i + 1].get_text(strip=True))
+                    low_val = _parse_korean_number(_text(cells[i + 1]))
                     if low_val:
                         valuation["low_52w"] = int(low_val)
 
@@ -117,18 +101,20 @@ def _parse_valuation_from_soups(
     return valuation
 
 
-def _parse_basic_info(main_soup: BeautifulSoup) -> dict[str, Any]:
-    """Extract company name and current price from the main page soup."""
+def _parse_basic_info(main_soup: Page) -> dict[str, Any]:
+    """Extract company name and current price from the main page."""
+    document = _as_document(main_soup)
     info: dict[str, Any] = {"name": None, "current_price": None}
-    name_elem = main_soup.select_one("div.wrap_company h2 a")
-    if name_elem:
-        info["name"] = name_elem.get_text(strip=True)
-    info["current_price"] = _extract_current_price_from_main_soup(main_soup)
+    name_elem = _first(_COMPANY_NAME, document)
+    if name_elem is not None:
+        info["name"] = _text(name_elem)
+    info["current_price"] = _extract_current_price_from_main_soup(document)
     return info
 
 
-def _parse_financial_metrics(main_soup: BeautifulSoup) -> dict[str, Any]:
-    """Extract PER, PBR, ROE, and dividend yield from the main page soup."""
+def _parse_financial_metrics(main_soup: Page) -> dict[str, Any]:
+    """Extract PER, PBR, ROE, and dividend yield from the main page."""
+    document = _as_document(main_soup)
     metrics: dict[str, Any] = {
         "per": None,
         "pbr": None,
@@ -137,35 +123,35 @@ def _parse_financial_metrics(main_soup: BeautifulSoup) -> dict[str, Any]:
         "dividend_yield": None,
     }
 
-    per_elem = main_soup.select_one("em#_per")
-    if per_elem:
-        per_val = _parse_korean_number(per_elem.get_text(strip=True))
+    per_elem = _first(_PER, document)
+    if per_elem is not None:
+        per_val = _parse_korean_number(_text(per_elem))
         if per_val is not None and per_val != 0:
             metrics["per"] = per_val
 
-    pbr_elem = main_soup.select_one("em#_pbr")
-    if pbr_elem:
-        pbr_val = _parse_korean_number(pbr_elem.get_text(strip=True))
+    pbr_elem = _first(_PBR, document)
+    if pbr_elem is not None:
+        pbr_val = _parse_korean_number(_text(pbr_elem))
         if pbr_val is not None and pbr_val != 0:
             metrics["pbr"] = pbr_val
 
-    dvr_elem = main_soup.select_one("em#_dvr")
-    if dvr_elem:
-        dvr_val = _parse_korean_number(dvr_elem.get_text(strip=True))
+    dvr_elem = _first(_DVR, document)
+    if dvr_elem is not None:
+        dvr_val = _parse_korean_number(_text(dvr_elem))
         if dvr_val is not None:
             metrics["dividend_yield"] = dvr_val / 100
 
-    for row in main_soup.select("tr"):
-        th = row.select_one("th")
-        if not th:
+    for row in _ROWS(document):
+        th = _first(_ROW_TH, row)
+        if th is None:
             continue
-        th_text = th.get_text(strip=True)
+        th_text = _text(th)
         if not th_text.startswith("ROE"):
             continue
-        tds = row.select("td")
+        tds = _ROW_TD(row)
         if not tds:
             continue
-        roe_val = _parse_korean_number(tds[0].get_text(strip=True))
+        roe_val = _parse_korean_number(_text(tds[0]))
         if roe_val is None:
             continue
         if "ROE(%)" in th_text:
@@ -176,36 +162,37 @@ def _parse_financial_metrics(main_soup: BeautifulSoup) -> dict[str, Any]:
     return metrics
 
 
-def _parse_industry_info(soup: BeautifulSoup) -> dict[str, Any]:
-    """Extract exchange type and sector from the main page soup.
+def _parse_industry_info(soup: Page) -> dict[str, Any]:
+    """Extract exchange type and sector from the main page.
 
     ROB-512: 한글 업종은 동종업종비교 헤더의 upjong 링크에서 추출한다 —
     링크 href의 ``no=`` 쿼리값이 Naver 업종번호(안정 식별자)다. 과거 셀렉터
     ``div.tab_con1 em a``는 현행 페이지에서 매칭되지 않아(2026-06-11 라이브
     확인, 전 종목 None) legacy fallback으로만 유지한다.
     """
+    document = _as_document(soup)
     info: dict[str, Any] = {"exchange": None, "sector": None, "sector_no": None}
 
-    code_info = soup.select_one("div.code")
-    if code_info:
-        code_text = code_info.get_text(strip=True)
+    code_info = _first(_CODE_INFO, document)
+    if code_info is not None:
+        code_text = _text(code_info)
         if "코스피" in code_text:
             info["exchange"] = "KOSPI"
         elif "코스닥" in code_text:
             info["exchange"] = "KOSDAQ"
 
-    sector_elem = soup.select_one('a[href*="type=upjong"]')
+    sector_elem = _first(_UPJONG_LINK, document)
     if sector_elem is not None:
-        info["sector"] = sector_elem.get_text(strip=True) or None
+        info["sector"] = _text(sector_elem) or None
         match = re.search(r"[?&]no=(\d+)", sector_elem.get("href") or "")
         if match:
             info["sector_no"] = match.group(1)
         return info
 
     # legacy fallback (구 페이지 구조 / 기존 fixture 호환)
-    legacy_elem = soup.select_one("div.tab_con1 em a")
+    legacy_elem = _first(_LEGACY_SECTOR, document)
     if legacy_elem is not None:
-        info["sector"] = legacy_elem.get_text(strip=True) or None
+        info["sector"] = _text(legacy_elem) or None
     return info
 
 
@@ -249,11 +236,11 @@ async def fetch_valuation(code: str) -> dict[str, Any]:
     """
     main_url = f"{NAVER_FINANCE_ITEM}/main.naver"
     sise_url = f"{NAVER_FINANCE_ITEM}/sise.naver"
-    main_soup, sise_soup = await asyncio.gather(
-        _fetch_html(main_url, params={"code": code}),
-        _fetch_html(sise_url, params={"code": code}),
+    main_document, sise_document = await asyncio.gather(
+        _fetch_document(main_url, params={"code": code}),
+        _fetch_document(sise_url, params={"code": code}),
     )
-    valuation = _parse_valuation_from_soups(code, main_soup, sise_soup)
+    valuation = _parse_valuation_from_soups(code, main_document, sise_document)
 
     # ROB-448: overlay EPS/BPS/market_cap from the Naver mobile integration endpoint
     # (already parsed by _parse_total_infos, just not surfaced on the HTML path).
@@ -491,34 +478,38 @@ async def fetch_sector_peers(
 async def _fetch_sector_soup(
     sector_code: str,
     client: httpx.AsyncClient,
-) -> BeautifulSoup | None:
+) -> lxml.html.HtmlElement | None:
     url = f"{NAVER_FINANCE_BASE}/sise/sise_group_detail.naver"
     try:
-        r = await client.get(url, params={"type": "upjong", "no": sector_code})
-        return BeautifulSoup(_decode_html_content(r.content), "lxml")
+        content = await _get_page_content(
+            client,
+            url,
+            {"type": "upjong", "no": sector_code},
+            headers=None,
+            raise_for_status=False,
+        )
+        return await asyncio.to_thread(_parse_document, content)
     except Exception:
         return None
 
 
-def _parse_sector_stock_codes(soup: BeautifulSoup) -> list[str]:
-    table = soup.select_one("table.type_5")
-    if not table:
+def _parse_sector_stock_codes(soup: Page) -> list[str]:
+    table = _first(_SECTOR_TABLE, _as_document(soup))
+    if table is None:
         return []
 
     codes: list[str] = []
-    for a in table.select("a[href*='code=']"):
-        href = a.get("href")
-        href_str = href if isinstance(href, str) else ""
-        m = re.search(r"code=(\w{6})", href_str)
+    for a in _CODE_LINKS(table):
+        m = re.search(r"code=(\w{6})", a.get("href") or "")
         if m:
             codes.append(m.group(1))
     return codes
 
 
-def _parse_sector_name(soup: BeautifulSoup) -> str | None:
-    title_elem = soup.select_one("title")
-    if title_elem:
-        raw = title_elem.get_text(strip=True)
+def _parse_sector_name(soup: Page) -> str | None:
+    title_elem = _first(_TITLE, _as_document(soup))
+    if title_elem is not None:
+        raw = _text(title_elem)
         # "전기장비 : Npay 증권" -> "전기장비"
         return raw.split(":")[0].strip() if ":" in raw else raw
     return None
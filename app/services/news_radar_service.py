@@ -25,6 +25,7 @@ from app.schemas.news_radar import (
 from app.services.llm_news_service import (
     get_news_articles,
     get_news_readiness,
+    search_news_articles,
 )
 from app.services.market_news_briefing_formatter import (
     format_market_news_briefing,
@@ -64,15 +65,6 @@ def _field(article: Any, name: str) -> Any:
     return getattr(article, name, None)
 
 
-def _matches_query(article: Any, q: str | None) -> bool:
-    if not q:
-        return True
-    needle = q.lower()
-    title = str(_field(article, "title") or "").lower()
-    summary = str(_field(article, "summary") or "").lower()
-    return needle in title or needle in summary
-
-
 def _briefing_score_lookup(
     articles: list[Any], market: str
 ) -> dict[int, tuple[int, bool]]:
@@ -295,15 +287,24 @@ async def build_news_radar(
     market_filter: str | None = None if market == "all" else market
 
     fetch_limit = min(max(limit * 5, limit), _MAX_INTERNAL_FETCH_LIMIT)
-    articles, _total = await get_news_articles(
-        market=market_filter,
-        hours=hours,
-        limit=fetch_limit,
-        offset=0,
-    )
+    if q and q.strip():
+        # The search index applies the query, market and window and ranks the
+        # matches, so only matching rows are loaded and scored.
+        filtered_articles, _total = await search_news_articles(
+            q,
+            market=market_filter,
+            hours=hours,
+            limit=fetch_limit,
+        )
+    else:
+        filtered_articles, _total = await get_news_articles(
+            market=market_filter,
+            hours=hours,
+            limit=fetch_limit,
+            offset=0,
+        )
     readiness = await _get_readiness_for_radar(market_filter)
 
-    filtered_articles = [a for a in articles if _matches_query(a, q)]
     scores = _briefing_score_lookup(filtered_articles, market_filter or "all")
 
     items: list[NewsRadarItem] = []
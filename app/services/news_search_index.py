@@ -0,0 +1,408 @@
+"""In-process full-text search index over stored news articles.
+
+Read-only over ``news_articles`` / ``news_article_related_symbols``. No DB
+writes. No broker calls.
+
+Documents carry an article's title, summary and matched entities (related
+symbols with their display names and matched terms, the article's own stock
+symbol/name, and its keywords). Text is tokenized Korean-aware: Hangul (and
+other CJK) runs become overlapping character bigrams, so "삼성전자" matches
+"삼성" and "전자" without a morphological analyzer, while Latin/digit runs are
+whole words. A query matches when every one of its tokens occurs in the
+document, and hits are ranked with BM25 over field-weighted term frequencies
+(title > entities > summary).
+
+Market, published-at and related-symbol filters and paging all run inside the
+index, so callers load only the page of article rows they return. The shared
+index keeps ``INDEX_RETENTION_HOURS`` of articles (``covers_since`` is the
+oldest publish time it holds; older ranges must be read from the DB). It is
+refreshed at most every ``_REFRESH_INTERVAL_SECONDS`` by re-reading the ids
+above ``max_id - _RESCAN_ID_MARGIN`` -- so rows committed out of id order by
+concurrent ingests are still picked up -- and rebuilt from scratch every
+``_REBUILD_INTERVAL_SECONDS`` so updated articles and late related-symbol rows
+are re-indexed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Literal
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.timezone import now_kst_naive
+from app.models.news import NewsArticle, NewsArticleRelatedSymbol
+
+INDEX_RETENTION_HOURS = 168
+_REFRESH_INTERVAL_SECONDS = 30.0
+_REBUILD_INTERVAL_SECONDS = 900.0
+_RESCAN_ID_MARGIN = 2000
+_LOAD_BATCH_SIZE = 2000
+
+_TITLE_WEIGHT = 3.0
+_ENTITY_WEIGHT = 2.0
+_SUMMARY_WEIGHT = 1.0
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# Hangul syllables/jamo and CJK ideographs/kana are n-grammed; everything else
+# alphanumeric is a word.
+_CJK_CLASS = "ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힣"
+_TOKEN_RE = re.compile(rf"([{_CJK_CLASS}]+)|([^\W_{_CJK_CLASS}]+)")
+
+SearchOrder = Literal["relevance", "recent"]
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Index tokens for ``text``: CJK character bigrams plus whole words."""
+    if not text:
+        return []
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    tokens: list[str] = []
+    for cjk, word in _TOKEN_RE.findall(normalized):
+        if word:
+            tokens.append(word)
+        elif len(cjk) == 1:
+            tokens.append(cjk)
+        else:
+            tokens.extend(cjk[i : i + 2] for i in range(len(cjk) - 1))
+    return tokens
+
+
+@dataclass(frozen=True, slots=True)
+class NewsSearchDocument:
+    id: int
+    market: str | None
+    published_at: datetime | None
+    title: str
+    summary: str | None = None
+    entities: tuple[str, ...] = ()
+    symbols: frozenset[tuple[str, str]] = frozenset()
+
+
+@dataclass(frozen=True)
+class NewsSearchPage:
+    """Article ids of one page in result order, and the total match count."""
+
+    ids: list[int]
+    total: int
+
+
+def _recency_key(document: NewsSearchDocument) -> tuple[bool, datetime, int]:
+    # Newest first with NULL published_at last, then id descending — the
+    # order of the feed/radar SQL queries.
+    published = document.published_at
+    return (published is not None, published or datetime.min, document.id)
+
+
+@dataclass
+class NewsSearchIndex:
+    """Inverted index of :class:`NewsSearchDocument` with BM25 ranking."""
+
+    _documents: dict[int, NewsSearchDocument] = field(default_factory=dict)
+    _postings: dict[str, dict[int, float]] = field(default_factory=dict)
+    _lengths: dict[int, float] = field(default_factory=dict)
+    _total_length: float = 0.0
+    max_id: int = 0
+    covers_since: datetime | None = None
+    refreshed_at: float | None = None
+    rebuilt_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, document: NewsSearchDocument) -> None:
+        if document.id in self._documents:
+            self.remove(document.id)
+        weights: Counter[str] = Counter()
+        for text, weight in (
+            (document.title, _TITLE_WEIGHT),
+            (document.summary, _SUMMARY_WEIGHT),
+            *((entity, _ENTITY_WEIGHT) for entity in document.entities),
+        ):
+            for token in tokenize(text):
+                weights[token] += weight
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[document.id] = weight
+        length = float(sum(weights.values()))
+        self._documents[document.id] = document
+        self._lengths[document.id] = length
+        self._total_length += length
+        self.max_id = max(self.max_id, document.id)
+
+    def add_many(self, documents: Iterable[NewsSearchDocument]) -> None:
+        for document in documents:
+            self.add(document)
+
+    def remove(self, document_id: int) -> None:
+        document = self._documents.pop(document_id, None)
+        if document is None:
+            return
+        self._total_length -= self._lengths.pop(document_id)
+        for token in set(
+            tokenize(document.title)
+            + tokenize(document.summary)
+            + [t for entity in document.entities for t in tokenize(entity)]
+        ):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(document_id, None)
+            if not postings:
+                del self._postings[token]
+
+    def evict_before(self, cutoff: datetime) -> int:
+        """Drop documents published before ``cutoff`` (or never published)."""
+        stale = [
+            document.id
+            for document in self._documents.values()
+            if document.published_at is None or document.published_at < cutoff
+        ]
+        for document_id in stale:
+            self.remove(document_id)
+        return len(stale)
+
+    def search(
+        self,
+        q: str,
+        *,
+        market: str | None = None,
+        since: datetime | None = None,
+        symbol: tuple[str, str] | None = None,
+        before: tuple[datetime, int] | None = None,
+        order: SearchOrder = "relevance",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> NewsSearchPage:
+        """Page of ids matching every token of ``q`` under the given filters.
+
+        ``order="recent"`` sorts newest first and honours ``before`` — a
+        ``(published_at, id)`` keyset cursor as used by the news feed.
+        ``symbol`` is a ``(symbol, market)`` related-symbol pair.
+        """
+        terms = list(dict.fromkeys(tokenize(q)))
+        if not terms or not self._documents:
+            return NewsSearchPage(ids=[], total=0)
+        postings = [self._postings.get(term) for term in terms]
+        if any(not posting for posting in postings):
+            return NewsSearchPage(ids=[], total=0)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return NewsSearchPage(ids=[], total=0)
+
+        matches = [
+            document
+            for document in map(self._documents.__getitem__, candidates)
+            if (market is None or document.market == market)
+            and (
+                since is None
+                or (
+                    document.published_at is not None and document.published_at >= since
+                )
+            )
+            and (symbol is None or symbol in document.symbols)
+            and (before is None or _is_before(document, before))
+        ]
+        if order == "recent":
+            matches.sort(key=_recency_key, reverse=True)
+        else:
+            scores = self._bm25(terms, matches)
+            matches.sort(
+                key=lambda document: (scores[document.id], *_recency_key(document)),
+                reverse=True,
+            )
+        page = matches[offset : offset + limit]
+        return NewsSearchPage(
+            ids=[document.id for document in page], total=len(matches)
+        )
+
+    def _bm25(
+        self, terms: list[str], matches: list[NewsSearchDocument]
+    ) -> dict[int, float]:
+        count = len(self._documents)
+        average_length = self._total_length / count if count else 0.0
+        scores: dict[int, float] = {}
+        for term in terms:
+            posting = self._postings[term]
+            idf = math.log(1.0 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for document in matches:
+                frequency = posting[document.id]
+                norm = (
+                    1.0
+                    - _BM25_B
+                    + _BM25_B
+                    * (
+                        self._lengths[document.id] / average_length
+                        if average_length
+                        else 0.0
+                    )
+                )
+                scores[document.id] = scores.get(document.id, 0.0) + idf * (
+                    frequency * (_BM25_K1 + 1.0) / (frequency + _BM25_K1 * norm)
+                )
+        return scores
+
+
+def _is_before(document: NewsSearchDocument, cursor: tuple[datetime, int]) -> bool:
+    cursor_at, cursor_id = cursor
+    published = document.published_at
+    if published is None:
+        return False
+    return published < cursor_at or (published == cursor_at and document.id < cursor_id)
+
+
+async def load_news_search_documents(
+    db: AsyncSession,
+    *,
+    after_id: int,
+    since: datetime,
+) -> list[NewsSearchDocument]:
+    """Search documents for articles with ``id > after_id`` published since ``since``."""
+    documents: list[NewsSearchDocument] = []
+    while True:
+        rows = (
+            await db.execute(
+                select(
+                    NewsArticle.id,
+                    NewsArticle.market,
+                    NewsArticle.article_published_at,
+                    NewsArticle.title,
+                    NewsArticle.summary,
+                    NewsArticle.stock_symbol,
+                    NewsArticle.stock_name,
+                    NewsArticle.keywords,
+                )
+                .where(
+                    NewsArticle.id > after_id,
+                    NewsArticle.article_published_at >= since,
+                )
+                .order_by(NewsArticle.id)
+                .limit(_LOAD_BATCH_SIZE)
+            )
+        ).all()
+        if not rows:
+            return documents
+
+        relations: dict[int, list[tuple[str, str, str | None, str | None]]] = {}
+        relation_rows = await db.execute(
+            select(
+                NewsArticleRelatedSymbol.article_id,
+                NewsArticleRelatedSymbol.symbol,
+                NewsArticleRelatedSymbol.market,
+                NewsArticleRelatedSymbol.display_name,
+                NewsArticleRelatedSymbol.matched_term,
+            ).where(NewsArticleRelatedSymbol.article_id.in_([row.id for row in rows]))
+        )
+        for article_id, symbol, market, display_name, matched_term in relation_rows:
+            relations.setdefault(article_id, []).append(
+                (symbol, market, display_name, matched_term)
+            )
+
+        for row in rows:
+            related = relations.get(row.id, [])
+            entities = [
+                text
+                for text in (
+                    row.stock_symbol,
+                    row.stock_name,
+                    *(str(keyword) for keyword in row.keywords or ()),
+                    *(
+                        part
+                        for symbol, _, name, term in related
+                        for part in (symbol, name, term)
+                    ),
+                )
+                if text
+            ]
+            documents.append(
+                NewsSearchDocument(
+                    id=row.id,
+                    market=(row.market or "").lower() or None,
+                    published_at=row.article_published_at,
+                    title=row.title or "",
+                    summary=row.summary,
+                    entities=tuple(dict.fromkeys(entities)),
+                    symbols=frozenset(
+                        (symbol, market.lower()) for symbol, market, _, _ in related
+                    ),
+                )
+            )
+        after_id = rows[-1].id
+
+
+_index = NewsSearchIndex()
+_lock: asyncio.Lock | None = None
+_lock_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_lock() -> asyncio.Lock:
+    global _lock, _lock_loop
+    loop = asyncio.get_running_loop()
+    if _lock is None or _lock_loop is not loop:
+        _lock = asyncio.Lock()
+        _lock_loop = loop
+    return _lock
+
+
+def reset_news_search_index() -> None:
+    global _index
+    _index = NewsSearchIndex()
+
+
+async def get_news_search_index(db: AsyncSession) -> NewsSearchIndex:
+    """The shared index, refreshed (or rebuilt) from stored articles when due."""
+    global _index
+    async with _get_lock():
+        now = time.monotonic()
+        if (
+            _index.refreshed_at is not None
+            and now - _index.refreshed_at < _REFRESH_INTERVAL_SECONDS
+        ):
+            return _index
+        cutoff = now_kst_naive() - timedelta(hours=INDEX_RETENTION_HOURS)
+        if (
+            _index.rebuilt_at is None
+            or now - _index.rebuilt_at >= _REBUILD_INTERVAL_SECONDS
+        ):
+            fresh = NewsSearchIndex()
+            fresh.add_many(
+                await load_news_search_documents(db, after_id=0, since=cutoff)
+            )
+            fresh.rebuilt_at = now
+            _index = fresh
+        else:
+            _index.add_many(
+                await load_news_search_documents(
+                    db,
+                    after_id=max(0, _index.max_id - _RESCAN_ID_MARGIN),
+                    since=cutoff,
+                )
+            )
+            _index.evict_before(cutoff)
+        _index.covers_since = cutoff
+        _index.refreshed_at = now
+        return _index
+
+
+__all__ = [
+    "INDEX_RETENTION_HOURS",
+    "NewsSearchDocument",
+    "NewsSearchIndex",
+    "NewsSearchPage",
+    "get_news_search_index",
+    "load_news_search_documents",
+    "reset_news_search_index",
+    "tokenize",
+]
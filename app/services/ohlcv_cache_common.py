@@ -5,17 +5,26 @@ Upbit, Yahoo, KIS 캐시 모듈이 공유하는 순수 함수 모음.
 각 서비스 모듈에서 `from app.services.ohlcv_cache_common import ...` 로 사용.
 """
 
+from __future__ import annotations
+
 import json
 import logging
 import uuid
 from collections.abc import Awaitable, Callable
 from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import redis.asyncio as redis
 
 from app.core.config import settings
+from app.core.lazy_module import LazyModule
 from app.core.log_sanitize import safe_log_value
+from app.monitoring.metrics import record_ohlcv_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = LazyModule("pandas")
 
 logger = logging.getLogger(__name__)
 
@@ -622,8 +631,10 @@ async def get_closed_candles_flow(
             len(cached),
             requested_count,
         )
+        record_ohlcv_cache(log_prefix, "hit")
         return cached.tail(requested_count).reset_index(drop=True)
 
+    record_ohlcv_cache(log_prefix, "miss")
     logger.info(
         "%s miss symbol=%s period=%s cached=%d requested=%d",
         log_prefix,
@@ -649,6 +660,7 @@ async def get_closed_candles_flow(
             return refreshed.tail(requested_count).reset_index(drop=True)
         return None
 
+    record_ohlcv_cache(log_prefix, "backfill")
     try:
         await backfill_loop(
             redis_client=redis_client,
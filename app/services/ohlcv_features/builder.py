@@ -0,0 +1,102 @@
+"""Pure feature-vector builder for the OHLCV feature store.
+
+Turns a window of daily candle rows into one indicator vector computed from
+*closed* bars only, with the same indicator functions the MCP tools use, so a
+stored vector is interchangeable with a live ``_compute_indicators`` result.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from decimal import Decimal
+
+from app.mcp_server.tooling.market_data_indicators import (
+    IndicatorType,
+    _compute_indicators,
+)
+from app.services.daily_candles.read_service import (
+    last_final_session_kr,
+    last_final_session_us,
+    rows_to_frame,
+)
+from app.services.daily_candles.repository import DailyCandleRow
+from app.services.ohlcv_features.repository import FeatureSnapshotUpsert
+
+FEATURE_PERIOD = "day"
+#: Enough history for the longest default window (SMA/EMA 200) plus warm-up.
+FEATURE_WINDOW_BARS = 250
+FEATURE_INDICATORS: tuple[IndicatorType, ...] = (
+    "sma",
+    "ema",
+    "rsi",
+    "macd",
+    "bollinger",
+    "atr",
+    "adx",
+    "stoch_rsi",
+)
+
+
+def bar_date(row: DailyCandleRow) -> dt.date:
+    ts = row.time_utc
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=dt.UTC)
+    return ts.astimezone(dt.UTC).date()
+
+
+def last_closed_bar_date(
+    market: str, *, now: dt.datetime | None = None
+) -> dt.date | None:
+    """Date of the newest daily bar that can no longer change.
+
+    KR/US follow the daily-candle read path (XKRX 15:35 KST cutoff, XNYS
+    close). Upbit daily bars roll at 00:00 UTC, so the newest closed crypto
+    bar is always yesterday (UTC). ``None`` when the calendar cannot tell.
+    """
+    if market == "kr":
+        return last_final_session_kr(now)
+    if market == "us":
+        return last_final_session_us(now)
+    if market == "crypto":
+        current = now or dt.datetime.now(dt.UTC)
+        if current.tzinfo is None:
+            current = current.replace(tzinfo=dt.UTC)
+        return current.astimezone(dt.UTC).date() - dt.timedelta(days=1)
+    raise ValueError(f"unsupported market: {market}")
+
+
+def closed_rows(
+    rows: Sequence[DailyCandleRow], *, market: str, now: dt.datetime | None = None
+) -> list[DailyCandleRow]:
+    """Ascending rows up to and including the last closed bar."""
+    cutoff = last_closed_bar_date(market, now=now)
+    if cutoff is None:
+        return []
+    return sorted(
+        (row for row in rows if bar_date(row) <= cutoff), key=lambda r: r.time_utc
+    )
+
+
+def build_feature_snapshot(
+    *,
+    market: str,
+    symbol: str,
+    rows: Sequence[DailyCandleRow],
+    now: dt.datetime | None = None,
+) -> FeatureSnapshotUpsert | None:
+    """Indicator vector as of the last closed bar; ``None`` without one."""
+    window = closed_rows(rows, market=market, now=now)[-FEATURE_WINDOW_BARS:]
+    if not window:
+        return None
+    features = _compute_indicators(rows_to_frame(window), list(FEATURE_INDICATORS))
+    latest = window[-1]
+    return FeatureSnapshotUpsert(
+        market=market,
+        symbol=symbol,
+        period=FEATURE_PERIOD,
+        bar_time=latest.time_utc,
+        bars_used=len(window),
+        close=Decimal(str(latest.close)),
+        features=features,
+    )
@@ -0,0 +1,67 @@
+"""Bulk read of stored feature vectors with freshness metadata.
+
+Callers read many symbols in one query and fall back to live computation for
+any symbol that is absent or not ``fresh``. A vector is fresh only when it was
+computed from the market's latest closed bar; calendar failures classify as
+``stale`` so callers recompute instead of trusting an unverifiable row.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.ohlcv_features.builder import FEATURE_PERIOD, last_closed_bar_date
+from app.services.ohlcv_features.repository import OhlcvFeaturesRepository
+
+FeatureState = Literal["fresh", "stale", "missing"]
+
+
+@dataclass(frozen=True, slots=True)
+class StoredFeatures:
+    symbol: str
+    bar_date: dt.date
+    close: float
+    features: dict[str, Any]
+    computed_at: dt.datetime
+    state: FeatureState
+
+
+def feature_state(
+    bar_date: dt.date | None, expected_bar_date: dt.date | None
+) -> FeatureState:
+    if bar_date is None:
+        return "missing"
+    if expected_bar_date is None:
+        return "stale"
+    return "fresh" if bar_date >= expected_bar_date else "stale"
+
+
+async def load_features(
+    session: AsyncSession,
+    *,
+    market: str,
+    symbols: Iterable[str],
+    now: dt.datetime | None = None,
+) -> dict[str, StoredFeatures]:
+    """Stored vectors keyed by symbol; symbols without a row are omitted."""
+    snapshots = await OhlcvFeaturesRepository(session).get_many(
+        market=market, symbols=symbols, period=FEATURE_PERIOD
+    )
+    expected = last_closed_bar_date(market, now=now)
+    out: dict[str, StoredFeatures] = {}
+    for snapshot in snapshots:
+        stored_bar_date = snapshot.bar_time.astimezone(dt.UTC).date()
+        out[snapshot.symbol] = StoredFeatures(
+            symbol=snapshot.symbol,
+            bar_date=stored_bar_date,
+            close=float(snapshot.close),
+            features=dict(snapshot.features or {}),
+            computed_at=snapshot.computed_at,
+            state=feature_state(stored_bar_date, expected),
+        )
+    return out
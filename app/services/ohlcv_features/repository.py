@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ohlcv_feature_snapshot import OhlcvFeatureSnapshot
+
+
+class FeatureSnapshotUpsert(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    market: str
+    symbol: str
+    period: str
+    bar_time: dt.datetime
+    bars_used: int
+    close: Decimal
+    features: dict[str, Any]
+
+
+class OhlcvFeaturesRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def upsert(self, payload: FeatureSnapshotUpsert) -> None:
+        """Insert or replace the vector; an older ``bar_time`` never wins."""
+        values = payload.model_dump()
+        stmt = insert(OhlcvFeatureSnapshot).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_ohlcv_feature_snapshots_market_symbol_period",
+            set_={
+                **{
+                    k: stmt.excluded[k]
+                    for k in values
+                    if k not in {"market", "symbol", "period"}
+                },
+                "updated_at": func.now(),
+                "computed_at": func.now(),
+            },
+            where=OhlcvFeatureSnapshot.bar_time <= stmt.excluded.bar_time,
+        )
+        await self._session.execute(stmt)
+
+    async def get_bar_time(
+        self, *, market: str, symbol: str, period: str
+    ) -> dt.datetime | None:
+        result = await self._session.execute(
+            select(OhlcvFeatureSnapshot.bar_time).where(
+                OhlcvFeatureSnapshot.market == market,
+                OhlcvFeatureSnapshot.symbol == symbol,
+                OhlcvFeatureSnapshot.period == period,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_many(
+        self, *, market: str, symbols: Iterable[str], period: str
+    ) -> list[OhlcvFeatureSnapshot]:
+        """All stored vectors for ``symbols`` in one query."""
+        symbols_list = sorted(set(symbols))
+        if not symbols_list:
+            return []
+        result = await self._session.execute(
+            select(OhlcvFeatureSnapshot).where(
+                OhlcvFeatureSnapshot.market == market,
+                OhlcvFeatureSnapshot.period == period,
+                OhlcvFeatureSnapshot.symbol.in_(symbols_list),
+            )
+        )
+        return list(result.scalars().all())
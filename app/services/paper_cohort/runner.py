@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Protocol
@@ -304,16 +305,22 @@ class PaperCohortRunner:
         expected_state = (
             "paper_active" if invocation.mode is RunMode.PAPER_ACTIVE else "shadow_soak"
         )
-        for assignment in assignments:
-            latest = await self._session.scalar(
+        validation_ids = sorted({item.validation_id for item in assignments})
+        # One DISTINCT ON read returns the newest transition per validation.
+        latest_rows = (
+            await self._session.scalars(
                 select(PaperValidationStateTransition)
-                .where(
-                    PaperValidationStateTransition.validation_id
-                    == assignment.validation_id
+                .where(PaperValidationStateTransition.validation_id.in_(validation_ids))
+                .order_by(
+                    PaperValidationStateTransition.validation_id,
+                    PaperValidationStateTransition.sequence.desc(),
                 )
-                .order_by(PaperValidationStateTransition.sequence.desc())
-                .limit(1)
+                .distinct(PaperValidationStateTransition.validation_id)
             )
+        ).all()
+        latest_by_validation = {row.validation_id: row for row in latest_rows}
+        for assignment in assignments:
+            latest = latest_by_validation.get(assignment.validation_id)
             exact = latest is not None and all(
                 (
                     latest.new_state == expected_state,
@@ -400,6 +407,33 @@ class PaperCohortRunner:
         ):
             raise PaperCohortError("venue_quote_provider_error")
 
+    async def _prefetch_quotes(
+        self, venues: Sequence[str], symbols: Sequence[str]
+    ) -> dict[tuple[str, str], VenueQuote]:
+        """Fetch each distinct ``(venue, symbol)`` quote once per invocation.
+
+        Only symbols that carry a signal are asked for. Providers with
+        ``get_quotes`` are asked once per venue, all venues in flight together;
+        a symbol missing from a batch is left out so the intent loop reads it
+        with ``get_quote`` exactly as before. Plain providers are read lazily
+        by that loop, since test and embedding doubles may share the session.
+        """
+        get_quotes = getattr(self._quote_provider, "get_quotes", None)
+        if get_quotes is None or not symbols:
+            return {}
+        venues = tuple(dict.fromkeys(venues))
+        symbols = tuple(dict.fromkeys(symbols))
+        batches = await asyncio.gather(
+            *(get_quotes(venue, symbols) for venue in venues)
+        )
+        quotes: dict[tuple[str, str], VenueQuote] = {}
+        for venue, batch in zip(venues, batches, strict=True):
+            for symbol in symbols:
+                quote = batch.get(symbol)
+                if quote is not None:
+                    quotes[(venue, symbol)] = quote
+        return quotes
+
     async def _load_prepared(
         self, invocation: CohortRunInvocation
     ) -> (
@@ -571,13 +605,20 @@ class PaperCohortRunner:
                 signals.append((decision_id, signal, assignment))
         await self._session.flush()
 
+        # Quotes are read only after the signals are durable, and each distinct
+        # (venue, symbol) is fetched once rather than once per assignment.
+        quotes = await self._prefetch_quotes(
+            cohort.venues, [signal.symbol for _, signal, _ in signals]
+        )
         active: list[
             tuple[PaperCohortVenueIntent, CanonicalTargetSignal, dict[str, object]]
         ] = []
         for decision_id, signal, assignment in signals:
             symbol_index = cohort.symbols.index(signal.symbol)
             for venue_index, venue in enumerate(cohort.venues):
-                quote = await self._quote_provider.get_quote(venue, signal.symbol)
+                quote = quotes.get((venue, signal.symbol))
+                if quote is None:
+                    quote = await self._quote_provider.get_quote(venue, signal.symbol)
                 self._validate_venue_quote(
                     quote,
                     observed_at=self._clock(),
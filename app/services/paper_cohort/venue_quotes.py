@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
@@ -63,34 +65,58 @@ class AlpacaCryptoQuoteClient:
         )
 
     async def quote(self, symbol: str) -> VenueQuote:
+        return (await self.quotes((symbol,)))[symbol]
+
+    async def quotes(self, symbols: Sequence[str]) -> dict[str, VenueQuote]:
+        """Latest quotes for ``symbols`` from one multi-symbol data request.
+
+        Asset sizing rules are still per symbol and are fetched concurrently.
+        """
         try:
             quote_response = await self._data.get(
-                "/v1beta3/crypto/us/latest/quotes", params={"symbols": symbol}
+                "/v1beta3/crypto/us/latest/quotes",
+                params={"symbols": ",".join(symbols)},
             )
-            asset_response = await self._assets.get(
-                f"/v2/assets/{symbol.replace('/', '')}"
+            asset_responses = await asyncio.gather(
+                *(
+                    self._assets.get(f"/v2/assets/{symbol.replace('/', '')}")
+                    for symbol in symbols
+                )
             )
             quote_response.raise_for_status()
-            asset_response.raise_for_status()
-            quote_payload = quote_response.json()["quotes"][symbol]
-            asset_payload = asset_response.json()
-            min_qty = _positive(asset_payload["min_order_size"])
-            ask_price = _positive(quote_payload["ap"])
-            return VenueQuote(
-                venue="alpaca",
-                symbol=symbol,
-                bid_price=_positive(quote_payload["bp"]),
-                ask_price=ask_price,
-                bid_qty=_positive(quote_payload["bs"]),
-                ask_qty=_positive(quote_payload["as"]),
-                fetched_at=_timestamp(quote_payload["t"]),
-                qty_increment=_positive(asset_payload["min_trade_increment"]),
-                min_qty=min_qty,
-                min_notional=min_qty * ask_price,
-            )
+            for asset_response in asset_responses:
+                asset_response.raise_for_status()
+            quote_payloads = quote_response.json()["quotes"]
+            return {
+                symbol: self._venue_quote(
+                    symbol, quote_payloads[symbol], asset_response.json()
+                )
+                for symbol, asset_response in zip(symbols, asset_responses, strict=True)
+            }
         except (KeyError, TypeError, httpx.HTTPError) as exc:
             raise PaperCohortError("venue_quote_provider_error") from exc
 
+    @staticmethod
+    def _venue_quote(
+        symbol: str,
+        quote_payload: dict[str, object],
+        asset_payload: dict[str, object],
+    ) -> VenueQuote:
+        min_qty = _positive(asset_payload["min_order_size"])
+        ask_price = _positive(quote_payload["ap"])
+        return VenueQuote(
+            venue="alpaca",
+            symbol=symbol,
+            bid_price=_positive(quote_payload["bp"]),
+            ask_price=ask_price,
+            bid_qty=_positive(quote_payload["bs"]),
+            ask_qty=_positive(quote_payload["as"]),
+            fetched_at=_timestamp(quote_payload["t"]),
+            qty_increment=_positive(asset_payload["min_trade_increment"]),
+            min_qty=min_qty,
+            min_notional=min_qty * ask_price,
+        )
+
     async def aclose(self) -> None:
         if self._owns_data_client:
             await self._data.aclose()
@@ -108,16 +134,39 @@ class ProductionVenueQuoteProvider:
         self._alpaca = alpaca
 
     async def get_quote(self, venue: str, symbol: str) -> VenueQuote:
+        return (await self.get_quotes(venue, (symbol,)))[symbol]
+
+    async def get_quotes(
+        self, venue: str, symbols: Sequence[str]
+    ) -> dict[str, VenueQuote]:
+        """Quotes for every canonical ``symbols`` entry on one venue.
+
+        Alpaca answers all symbols from a single data request; Binance book
+        tickers are requested concurrently. Keys are the canonical symbols.
+        """
         if venue == "alpaca":
             try:
-                execution_symbol = map_binance_public_spot_to_alpaca_paper(
-                    symbol
-                ).execution_symbol
+                execution_symbols = {
+                    symbol: map_binance_public_spot_to_alpaca_paper(
+                        symbol
+                    ).execution_symbol
+                    for symbol in symbols
+                }
             except ValueError as exc:
                 raise PaperCohortError("unsupported_capability") from exc
-            return await self._alpaca.quote(execution_symbol)
+            quotes = await self._alpaca.quotes(tuple(execution_symbols.values()))
+            return {
+                symbol: quotes[execution_symbol]
+                for symbol, execution_symbol in execution_symbols.items()
+            }
         if venue != "binance":
             raise PaperCohortError("unsupported_capability")
+        tickers = await asyncio.gather(
+            *(self._binance_quote(symbol) for symbol in symbols)
+        )
+        return dict(zip(symbols, tickers, strict=True))
+
+    async def _binance_quote(self, symbol: str) -> VenueQuote:
         try:
             ticker = await self._binance.book_ticker(symbol)
             return VenueQuote(
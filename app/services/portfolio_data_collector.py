@@ -261,7 +261,7 @@ class PortfolioDataCollector:
             )
 
         # Price fill for Upbit components is handled by PortfolioOverviewService
-        # (_fetch_upbit_prices_resilient / _fill_missing_crypto_prices).
+        # (_fill_missing_crypto_prices, through last_price_resolver).
         return components
 
     # ------------------------------------------------------------------
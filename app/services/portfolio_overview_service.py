@@ -7,21 +7,20 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-import app.services.brokers.upbit.client as upbit_service
-import app.services.brokers.yahoo.client as yahoo_service
 from app.core.normalizers import to_float as _to_float
 from app.core.symbol import to_db_symbol
 from app.mcp_server.tooling.portfolio_helpers import min_order_krw
 from app.models.manual_holdings import MarketType
 from app.services.brokers.kis.client import KISClient
 from app.services.exchange_rate_service import get_usd_krw_rate
+from app.services.last_price_resolver import (
+    PriceUnavailableError,
+    resolve_last_prices,
+)
 from app.services.manual_holdings_service import ManualHoldingsService
 from app.services.portfolio_data_collector import PortfolioDataCollector
 from app.services.upbit_symbol_universe_service import get_active_upbit_markets
-from app.services.us_symbol_universe_service import (
-    USSymbolUniverseLookupError,
-    get_us_exchange_by_symbol,
-)
+from app.services.us_symbol_universe_service import USSymbolUniverseLookupError
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +29,6 @@ _MARKET_KR = "KR"
 _MARKET_US = "US"
 _MARKET_CRYPTO = "CRYPTO"
 _MARKET_ORDER = {_MARKET_KR: 0, _MARKET_US: 1, _MARKET_CRYPTO: 2}
-_UPBIT_PRICE_BATCH_SIZE = 50
 
 
 def _kis_percent_to_decimal(value: Any) -> float | None:
@@ -360,22 +358,16 @@ class PortfolioOverviewService:
         if not kr_symbols:
             return []
 
-        async def fetch_and_apply(symbol: str):
-            try:
-                frame = await kis_client.inquire_price(symbol)
-                if frame.empty:
-                    return
-                price = _to_float(frame.iloc[-1].get("close"), default=0.0)
-                if price <= 0:
-                    return
-                self._apply_price(
-                    components, _MARKET_KR, symbol, price, usd_krw=usd_krw
-                )
-            except Exception as exc:
-                logger.warning("Failed to fetch KIS KR price for %s: %s", symbol, exc)
-                warnings.append(f"KIS KR price fetch failed for {symbol}: {exc}")
-
-        await asyncio.gather(*(fetch_and_apply(s) for s in kr_symbols))
+        resolution = await resolve_last_prices(
+            _MARKET_KR, kr_symbols, kis_client=kis_client
+        )
+        for symbol, price in resolution.prices.items():
+            self._apply_price(components, _MARKET_KR, symbol, price, usd_krw=usd_krw)
+        for symbol, exc in resolution.errors.items():
+            if isinstance(exc, PriceUnavailableError):
+                continue
+            logger.warning("Failed to fetch KIS KR price for %s: %s", symbol, exc)
+            warnings.append(f"KIS KR price fetch failed for {symbol}: {exc}")
         return warnings
 
     async def _fill_missing_us_prices(
@@ -384,7 +376,6 @@ class PortfolioOverviewService:
         *,
         usd_krw: float | None = None,
     ) -> list[str]:
-        warnings: list[str] = []
         us_symbol_targets: dict[str, set[str]] = {}
         for item in components:
             if item["market_type"] != _MARKET_US or item["current_price"] is not None:
@@ -401,41 +392,27 @@ class PortfolioOverviewService:
         if not us_symbols:
             return []
 
-        valid_us_symbols: list[str] = []
-        for normalized_symbol in us_symbols:
-            try:
-                await get_us_exchange_by_symbol(normalized_symbol, db=self.db)
-                valid_us_symbols.append(normalized_symbol)
-            except USSymbolUniverseLookupError as exc:
-                raw_symbols = sorted(
-                    us_symbol_targets.get(normalized_symbol, {normalized_symbol})
-                )
+        resolution = await resolve_last_prices(_MARKET_US, us_symbols, db=self.db)
+        for symbol in us_symbols:
+            exc = resolution.errors.get(symbol)
+            if isinstance(exc, USSymbolUniverseLookupError):
                 logger.info(
                     "Skipping invalid US symbol before price fetch symbols=%s normalized=%s reason=%s",
-                    ",".join(raw_symbols),
-                    normalized_symbol,
+                    ",".join(sorted(us_symbol_targets[symbol])),
+                    symbol,
                     exc,
                 )
+            elif isinstance(exc, PriceUnavailableError):
+                raise ValueError(f"US price fetch failed for {symbol}: {exc}") from exc
+            elif exc is not None:
+                raise exc
 
-        async def fetch_and_apply(symbol: str):
-            frame = await yahoo_service.fetch_price(symbol)
-            if frame.empty:
-                raise ValueError(f"US price fetch failed for {symbol}: empty response")
-
-            price = _to_float(frame.iloc[-1].get("close"), default=0.0)
-            if price <= 0:
-                raise ValueError(
-                    f"US price fetch failed for {symbol}: non-positive close price"
-                )
-
-            for target_symbol in us_symbol_targets.get(symbol, {symbol}):
+        for symbol, price in resolution.prices.items():
+            for target_symbol in us_symbol_targets[symbol]:
                 self._apply_price(
                     components, _MARKET_US, target_symbol, price, usd_krw=usd_krw
                 )
-
-        # Yahoo price fetches are also parallelized here
-        await asyncio.gather(*(fetch_and_apply(s) for s in valid_us_symbols))
-        return warnings
+        return []
 
     async def _fill_missing_crypto_prices(
         self,
@@ -462,154 +439,15 @@ class PortfolioOverviewService:
         if not crypto_symbols:
             return []
 
-        price_map = await self._fetch_upbit_prices_resilient(
-            crypto_symbols,
-            warnings,
-            stage="crypto",
-            active_upbit_markets=active_upbit_set,
-            enforce_upbit_universe=enforce_upbit_universe,
-        )
-        for symbol, price in price_map.items():
-            if price is None:
-                continue
+        resolution = await resolve_last_prices(_MARKET_CRYPTO, crypto_symbols)
+        for symbol, price in resolution.prices.items():
             self._apply_price(
-                components, _MARKET_CRYPTO, symbol, float(price), usd_krw=usd_krw
+                components, _MARKET_CRYPTO, symbol, price, usd_krw=usd_krw
             )
+        for symbol, exc in resolution.errors.items():
+            warnings.append(f"Upbit price fetch failed (crypto) for {symbol}: {exc}")
         return warnings
 
-    async def _fetch_upbit_prices_resilient(
-        self,
-        symbols: list[str],
-        warnings: list[str],
-        stage: str,
-        active_upbit_markets: set[str] | None = None,
-        enforce_upbit_universe: bool = True,
-    ) -> dict[str, float]:
-        unique_symbols: list[str] = []
-        seen: set[str] = set()
-        for symbol in symbols:
-            normalized = str(symbol or "").strip().upper()
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            unique_symbols.append(normalized)
-
-        if not unique_symbols:
-            return {}
-
-        recovered_prices: dict[str, float] = {}
-        symbols_to_recover = list(unique_symbols)
-
-        try:
-            initial_prices = await upbit_service.fetch_multiple_current_prices(
-                unique_symbols
-            )
-        except Exception as exc:
-            logger.warning(
-                "Failed initial Upbit price batch fetch (%s): %s",
-                stage,
-                exc,
-            )
-        else:
-            for symbol, price in initial_prices.items():
-                if price is None:
-                    continue
-                normalized = str(symbol).strip().upper()
-                if not normalized:
-                    continue
-                recovered_prices[normalized] = float(price)
-
-            symbols_to_recover = [
-                symbol for symbol in unique_symbols if symbol not in recovered_prices
-            ]
-            if not symbols_to_recover:
-                return recovered_prices
-
-        filtered_symbols: list[str] = []
-        if enforce_upbit_universe:
-            tradable_set = active_upbit_markets
-            if tradable_set is None:
-                tradable_set = await get_active_upbit_markets(quote_currency=None)
-            tradable_set = {
-                str(market).strip().upper()
-                for market in tradable_set
-                if str(market).strip()
-            }
-
-            for symbol in symbols_to_recover:
-                if symbol in tradable_set:
-                    filtered_symbols.append(symbol)
-                else:
-                    logger.info(
-                        "Skipping non-tradable Upbit symbol (%s): %s",
-                        stage,
-                        symbol,
-                    )
-        else:
-            filtered_symbols = list(symbols_to_recover)
-
-        if not filtered_symbols:
-            return recovered_prices
-        failed_symbols: list[str] = []
-
-        for index in range(0, len(filtered_symbols), _UPBIT_PRICE_BATCH_SIZE):
-            batch = filtered_symbols[index : index + _UPBIT_PRICE_BATCH_SIZE]
-            if not batch:
-                continue
-            try:
-                batch_prices = await upbit_service.fetch_multiple_current_prices(batch)
-                normalized_batch_prices: dict[str, float] = {}
-                for symbol, price in batch_prices.items():
-                    if price is None:
-                        continue
-                    normalized = str(symbol).strip().upper()
-                    if not normalized:
-                        continue
-                    normalized_batch_prices[normalized] = float(price)
-                    recovered_prices[normalized] = float(price)
-
-                missing_symbols = [
-                    symbol for symbol in batch if symbol not in normalized_batch_prices
-                ]
-                failed_symbols.extend(missing_symbols)
-            except Exception as exc:
-                logger.warning(
-                    "Failed Upbit price batch retry (%s, size=%d): %s",
-                    stage,
-                    len(batch),
-                    exc,
-                )
-                failed_symbols.extend(batch)
-
-        failed_symbols = list(dict.fromkeys(failed_symbols))
-        for symbol in failed_symbols:
-            try:
-                single_prices = await upbit_service.fetch_multiple_current_prices(
-                    [symbol]
-                )
-            except Exception as exc:
-                warnings.append(
-                    f"Upbit price fetch failed ({stage}) for {symbol}: {exc}"
-                )
-                continue
-
-            single_price: float | None = None
-            for fetched_symbol, fetched_price in single_prices.items():
-                normalized = str(fetched_symbol).strip().upper()
-                if normalized != symbol or fetched_price is None:
-                    continue
-                single_price = float(fetched_price)
-                break
-
-            if single_price is None:
-                warnings.append(
-                    f"Upbit price fetch failed ({stage}) for {symbol}: empty response"
-                )
-                continue
-            recovered_prices[symbol] = single_price
-
-        return recovered_prices
-
     def _apply_price(
         self,
         components: list[dict[str, Any]],
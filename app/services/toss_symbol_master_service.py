@@ -10,6 +10,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.kr_symbol_universe import KRSymbolUniverse
 from app.models.us_symbol_universe import USSymbolUniverse
 from app.services.brokers.toss.dto import TossPrice, TossStockInfo
+from app.services.brokers.toss.rate_limiter import (
+    TossRequestLane,
+    toss_request_lane,
+)
 from app.services.market_valuation_snapshots.repository import (
     MarketValuationSnapshotsRepository,
     MarketValuationSnapshotUpsert,
@@ -226,12 +230,13 @@ async def sync_toss_symbol_master(
 
     batches = _chunks(symbols)
     for batch in batches:
-        stock_rows = {row.symbol: row for row in await client.stocks(batch)}
-        price_rows = (
-            {row.symbol: row for row in await client.prices(batch)}
-            if request.include_market_cap
-            else {}
-        )
+        with toss_request_lane(TossRequestLane.BULK):
+            stock_rows = {row.symbol: row for row in await client.stocks(batch)}
+            price_rows = (
+                {row.symbol: row for row in await client.prices(batch)}
+                if request.include_market_cap
+                else {}
+            )
         all_stocks.update(stock_rows)
         all_prices.update(price_rows)
         for symbol, stock in stock_rows.items():
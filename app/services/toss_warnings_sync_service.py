@@ -10,6 +10,10 @@ from app.models.kr_stock_warnings import KRStockWarning
 from app.models.manual_holdings import BrokerAccount, ManualHolding, MarketType
 from app.services.brokers.toss.client import TossReadClient
 from app.services.brokers.toss.dto import TossWarningInfo
+from app.services.brokers.toss.rate_limiter import (
+    TossRequestLane,
+    toss_request_lane,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -161,8 +165,9 @@ async def sync_toss_warnings(
 
     for symbol in symbols:
         try:
-            # 1. Fetch warnings from Toss client
-            warnings = await client.warnings(symbol)
+            # 1. Fetch warnings from Toss client (behind interactive calls)
+            with toss_request_lane(TossRequestLane.BULK):
+                warnings = await client.warnings(symbol)
             fetched_at = datetime.now(UTC)
             warning_rows = [
                 _warning_row(
@@ -15,6 +15,7 @@ import logging
 import math
 import uuid
 from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -908,24 +909,214 @@ async def _read_window_candles(
     if resolved is None:
         return None
     market, partition = resolved
+    rows = await _fetch_padded_window(
+        db,
+        market=market,
+        symbol=symbol,
+        partition=partition,
+        start_date=start_date,
+        review_date=review_date,
+    )
+    return [r for r in rows if start_date <= _row_date(r) <= review_date]
 
-    # Pad the UTC window by 2 days each side to absorb tz/session boundary skew,
-    # then filter by the candle's calendar date for a clean inclusive window.
+
+async def _fetch_padded_window(
+    db: AsyncSession,
+    *,
+    market: MarketKey,
+    symbol: str,
+    partition: str,
+    start_date: date,
+    review_date: date,
+) -> list[DailyCandleRow]:
+    # Pad the UTC window by 2 days each side to absorb tz/session boundary skew;
+    # callers filter by the candle's calendar date for a clean inclusive window.
     start_dt = datetime.combine(
         start_date - timedelta(days=2), dt.time(0, 0), tzinfo=dt.UTC
     )
     end_dt = datetime.combine(
         review_date + timedelta(days=2), dt.time(23, 59, 59), tzinfo=dt.UTC
     )
-    repo = DailyCandlesRepository(session=db)
-    rows = await repo.fetch_range(
+    return await DailyCandlesRepository(session=db).fetch_range(
         market=market,
         symbol=symbol,
         partition=partition,
         start=start_dt,
         end=end_dt,
     )
-    return [r for r in rows if start_date <= _row_date(r) <= review_date]
+
+
+class _CandleWindows:
+    """Daily-candle window source for resolution.
+
+    This default reads each forecast's window on demand through
+    ``_read_window_candles`` and backfills per call — the single-forecast path.
+    """
+
+    def __init__(self, db: AsyncSession, *, backfill_missing: bool) -> None:
+        self._db = db
+        self.backfill_missing = backfill_missing
+
+    async def read(
+        self,
+        *,
+        symbol: str,
+        instrument_type: str,
+        start_date: date,
+        review_date: date,
+    ) -> list[DailyCandleRow] | None:
+        return await _read_window_candles(
+            self._db,
+            symbol=symbol,
+            instrument_type=instrument_type,
+            start_date=start_date,
+            review_date=review_date,
+        )
+
+    async def backfill(self, *, symbol: str, instrument_type: str) -> int | None:
+        """Fetch+persist ``symbol``; ``None`` when it has no candle partition."""
+        resolved = await _resolve_candle_partition(
+            self._db, symbol=symbol, instrument_type=instrument_type
+        )
+        if resolved is None:
+            return None
+        market, partition = resolved
+        return await _backfill_daily_candles(
+            symbol=symbol, market=market, partition=partition
+        )
+
+
+_WindowKey = tuple[str, str]  # (symbol, instrument_type)
+
+
+class _PreloadedCandleWindows(_CandleWindows):
+    """Batch window source: one partition lookup, one range read and at most
+    one backfill per symbol, with every forecast's window sliced in memory.
+
+    Windows registered via :meth:`want` are merged into a single span per
+    symbol and read by :meth:`load`; a read outside the registered span falls
+    back to the per-call query.
+    """
+
+    def __init__(self, db: AsyncSession, *, backfill_missing: bool) -> None:
+        super().__init__(db, backfill_missing=backfill_missing)
+        self._partitions: dict[_WindowKey, tuple[MarketKey, str] | None] = {}
+        self._spans: dict[_WindowKey, tuple[date, date]] = {}
+        self._rows: dict[_WindowKey, list[DailyCandleRow] | None] = {}
+        self._backfilled: dict[_WindowKey, int | None] = {}
+
+    def want(
+        self,
+        *,
+        symbol: str,
+        instrument_type: str,
+        start_date: date,
+        review_date: date,
+    ) -> None:
+        key = (symbol, instrument_type)
+        span = self._spans.get(key)
+        if span is not None:
+            start_date = min(start_date, span[0])
+            review_date = max(review_date, span[1])
+        self._spans[key] = (start_date, review_date)
+
+    async def load(self) -> None:
+        for key in self._spans:
+            await self._load(key)
+
+    async def _partition(self, key: _WindowKey) -> tuple[MarketKey, str] | None:
+        if key not in self._partitions:
+            symbol, instrument_type = key
+            self._partitions[key] = await _resolve_candle_partition(
+                self._db, symbol=symbol, instrument_type=instrument_type
+            )
+        return self._partitions[key]
+
+    async def _load(self, key: _WindowKey) -> None:
+        resolved = await self._partition(key)
+        if resolved is None:
+            self._rows[key] = None
+            return
+        market, partition = resolved
+        start_date, review_date = self._spans[key]
+        self._rows[key] = await _fetch_padded_window(
+            self._db,
+            market=market,
+            symbol=key[0],
+            partition=partition,
+            start_date=start_date,
+            review_date=review_date,
+        )
+
+    async def read(
+        self,
+        *,
+        symbol: str,
+        instrument_type: str,
+        start_date: date,
+        review_date: date,
+    ) -> list[DailyCandleRow] | None:
+        key = (symbol, instrument_type)
+        span = self._spans.get(key)
+        if (
+            key not in self._rows
+            or span is None
+            or not (span[0] <= start_date and review_date <= span[1])
+        ):
+            return await super().read(
+                symbol=symbol,
+                instrument_type=instrument_type,
+                start_date=start_date,
+                review_date=review_date,
+            )
+        rows = self._rows[key]
+        if rows is None:
+            return None
+        return [r for r in rows if start_date <= _row_date(r) <= review_date]
+
+    async def backfill(self, *, symbol: str, instrument_type: str) -> int | None:
+        key = (symbol, instrument_type)
+        if key in self._backfilled:
+            return self._backfilled[key]
+        resolved = await self._partition(key)
+        rows: int | None = None
+        if resolved is not None:
+            market, partition = resolved
+            rows = await _backfill_daily_candles(
+                symbol=symbol, market=market, partition=partition
+            )
+            # Batch upserts may report rowcount=0 after a successful write, so
+            # the merged span is always re-read once after the attempt.
+            if key in self._spans:
+                await self._load(key)
+        self._backfilled[key] = rows
+        return rows
+
+
+def _instrument_value(row: TradeForecast) -> str:
+    return (
+        row.instrument_type.value
+        if hasattr(row.instrument_type, "value")
+        else str(row.instrument_type)
+    )
+
+
+def _candle_window(row: TradeForecast) -> tuple[date, date] | None:
+    """Inclusive candle window an auto-resolvable forecast is scored on."""
+    target = row.forecast_target
+    kind = target.get("kind") if isinstance(target, dict) else None
+    instrument = _instrument_value(row)
+    if kind == "price_target" and instrument in _AUTO_RESOLVABLE_INSTRUMENTS:
+        start_date = row.forecast_start_date or _kst_date(row.created_at)
+        if start_date is None:
+            return None
+        return start_date, row.review_date
+    if kind == _TERMINAL_CLOSE_KIND and instrument in _TERMINAL_CLOSE_INSTRUMENTS:
+        return (
+            row.review_date - timedelta(days=_TERMINAL_CLOSE_STALE_LOOKBACK_DAYS),
+            row.review_date,
+        )
+    return None
 
 
 def _terminal_close_session_failure(
@@ -1061,6 +1252,35 @@ async def resolve_forecast(
     row = await repo.get_by_forecast_id(_coerce_forecast_id(forecast_id))
     if row is None:
         raise ForecastValidationError(f"forecast not found: {forecast_id}")
+    return await _resolve_row(
+        db,
+        row,
+        persist=persist,
+        manual_outcome=manual_outcome,
+        manual_observed_value=manual_observed_value,
+        manual_evidence=manual_evidence,
+        resolved_now=now or now_kst(),
+        windows=_CandleWindows(db, backfill_missing=backfill_missing),
+    )
+
+
+async def _resolve_row(
+    db: AsyncSession,
+    row: TradeForecast,
+    *,
+    persist: bool,
+    resolved_now: datetime,
+    windows: _CandleWindows,
+    manual_outcome: bool | None = None,
+    manual_observed_value: float | None = None,
+    manual_evidence: Any | None = None,
+    reload: bool = True,
+) -> dict[str, Any]:
+    """Score one loaded forecast row.
+
+    ``reload=False`` (the batch engine) skips the per-row flush/refresh; the
+    caller flushes once and re-serializes the changed rows.
+    """
     if row.status != "open":
         return {
             "status": "already_closed",
@@ -1068,14 +1288,9 @@ async def resolve_forecast(
             "forecast": serialize_forecast(row),
         }
 
-    resolved_now = now or now_kst()
     target = row.forecast_target
     kind = target.get("kind") if isinstance(target, dict) else None
-    instrument = (
-        row.instrument_type.value
-        if hasattr(row.instrument_type, "value")
-        else str(row.instrument_type)
-    )
+    instrument = _instrument_value(row)
 
     contract_failure = _target_contract_failure(
         row,
@@ -1105,8 +1320,9 @@ async def resolve_forecast(
         }
         row.resolved_at = resolved_now
         row.status = _CLOSED_NO_CLAIM_STATUS
-        await db.flush()
-        await db.refresh(row)
+        if reload:
+            await db.flush()
+            await db.refresh(row)
         return {
             "status": _CLOSED_NO_CLAIM_STATUS,
             "changed": True,
@@ -1146,8 +1362,7 @@ async def resolve_forecast(
                 "forecast": serialize_forecast(row),
             }
         start_date = row.forecast_start_date or _kst_date(row.created_at)
-        candles = await _read_window_candles(
-            db,
+        candles = await windows.read(
             symbol=row.symbol,
             instrument_type=instrument,
             start_date=start_date,
@@ -1157,23 +1372,15 @@ async def resolve_forecast(
         # the DB yet. Lazily fetch+persist once via the shared sync service, then
         # re-read. Never raises — backfill returns 0 on failure and the existing
         # unresolved_no_data branch still runs below.
-        if not candles and backfill_missing:
-            resolved = await _resolve_candle_partition(
-                db, symbol=row.symbol, instrument_type=instrument
-            )
-            if resolved is not None:
-                market, partition = resolved
-                rows = await _backfill_daily_candles(
-                    symbol=row.symbol, market=market, partition=partition
+        if not candles and windows.backfill_missing:
+            rows = await windows.backfill(symbol=row.symbol, instrument_type=instrument)
+            if rows:
+                candles = await windows.read(
+                    symbol=row.symbol,
+                    instrument_type=instrument,
+                    start_date=start_date,
+                    review_date=row.review_date,
                 )
-                if rows:
-                    candles = await _read_window_candles(
-                        db,
-                        symbol=row.symbol,
-                        instrument_type=instrument,
-                        start_date=start_date,
-                        review_date=row.review_date,
-                    )
         if not candles:
             return {
                 "status": "unresolved_no_data",
@@ -1229,26 +1436,20 @@ async def resolve_forecast(
         terminal_window_start = row.review_date - timedelta(
             days=_TERMINAL_CLOSE_STALE_LOOKBACK_DAYS
         )
-        candles = await _read_window_candles(
-            db,
+        candles = await windows.read(
             symbol=row.symbol,
             instrument_type=instrument,
             start_date=terminal_window_start,
             review_date=row.review_date,
         )
-        if not candles and backfill_missing:
-            resolved = await _resolve_candle_partition(
-                db, symbol=row.symbol, instrument_type=instrument
+        if not candles and windows.backfill_missing:
+            backfilled = await windows.backfill(
+                symbol=row.symbol, instrument_type=instrument
             )
-            if resolved is not None:
-                market, partition = resolved
-                await _backfill_daily_candles(
-                    symbol=row.symbol, market=market, partition=partition
-                )
+            if backfilled is not None:
                 # Daily-candle batch upserts may report rowcount=0 even after a
                 # successful write, so always re-read once after the attempt.
-                candles = await _read_window_candles(
-                    db,
+                candles = await windows.read(
                     symbol=row.symbol,
                     instrument_type=instrument,
                     start_date=terminal_window_start,
@@ -1327,10 +1528,11 @@ async def resolve_forecast(
     row.resolution_detail = detail
     row.resolved_at = resolved_now
     row.status = "closed"
-    await db.flush()
-    # Reload server-computed columns (updated_at onupdate) within the async
-    # context so serialize_forecast doesn't trigger a lazy sync refresh.
-    await db.refresh(row)
+    if reload:
+        await db.flush()
+        # Reload server-computed columns (updated_at onupdate) within the async
+        # context so serialize_forecast doesn't trigger a lazy sync refresh.
+        await db.refresh(row)
     return {
         "status": "resolved",
         "changed": True,
@@ -1339,6 +1541,72 @@ async def resolve_forecast(
     }
 
 
+@dataclass(frozen=True, slots=True)
+class DueForecastResolution:
+    quarantined: list[TradeForecast]
+    due: list[TradeForecast]
+    results: list[tuple[TradeForecast, dict[str, Any]]]
+
+
+async def resolve_due_forecasts(
+    db: AsyncSession,
+    *,
+    persist: bool,
+    now: datetime | None = None,
+    limit: int = 50,
+    backfill_missing: bool = True,
+) -> DueForecastResolution:
+    """Resolve the due queue (quarantined rows first) in one pass.
+
+    Same per-row semantics as :func:`resolve_forecast`, but candle access is
+    batched: forecasts are grouped by instrument, the union of their windows
+    is read once per symbol, a missing symbol is backfilled at most once, and
+    every row is scored in memory. With ``persist`` the changed rows are
+    flushed together and reloaded in one query; the caller commits, so the
+    whole batch lands in a single transaction.
+    """
+    quarantined = await list_due_quarantined_forecasts(db, now=now, limit=limit)
+    due = await list_due_forecasts(db, now=now, limit=limit)
+    resolved_now = now or now_kst()
+
+    windows = _PreloadedCandleWindows(db, backfill_missing=backfill_missing)
+    for row in due:
+        window = _candle_window(row)
+        if window is not None:
+            windows.want(
+                symbol=row.symbol,
+                instrument_type=_instrument_value(row),
+                start_date=window[0],
+                review_date=window[1],
+            )
+    await windows.load()
+
+    results: list[tuple[TradeForecast, dict[str, Any]]] = []
+    for row in [*quarantined, *due]:
+        result = await _resolve_row(
+            db,
+            row,
+            persist=persist,
+            resolved_now=resolved_now,
+            windows=windows,
+            reload=False,
+        )
+        results.append((row, result))
+
+    changed = [row for row, result in results if result.get("changed")]
+    if changed:
+        await db.flush()
+        await db.execute(
+            select(TradeForecast)
+            .where(TradeForecast.id.in_([row.id for row in changed]))
+            .execution_options(populate_existing=True)
+        )
+        for row, result in results:
+            if result.get("changed"):
+                result["forecast"] = serialize_forecast(row)
+    return DueForecastResolution(quarantined=quarantined, due=due, results=results)
+
+
 def _group_key(r: TradeForecast, group_by: str) -> str:
     if group_by == "day":
         d = _kst_date(r.created_at)
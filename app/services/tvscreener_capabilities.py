@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import Any
 
 
 class TvScreenerCapabilityState(StrEnum):
@@ -81,11 +83,27 @@ _CRYPTO_CAPABILITY_ALIASES: dict[str, tuple[str, ...]] = {
 _CAPABILITY_CACHE_MISS = object()
 
 
+CapabilityMatrix = dict[str, tuple[TvScreenerCapabilityState, float]]
+
+
 class _TvScreenerCapabilityRegistry:
     def __init__(self) -> None:
         self._field_cache: dict[tuple[str, str], object | None] = {}
-        self._status_cache: dict[tuple[str, str, str], TvScreenerCapabilityState] = {}
+        self._discovered_fields: dict[str, list[tuple[str, Any]]] = {}
+        self._status_cache: dict[
+            tuple[str, str, str], tuple[TvScreenerCapabilityState, float]
+        ] = {}
         self._probe_locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+        self._loaded_matrices: set[tuple[str, str]] = set()
+        self._refresh_tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+    def get_discovered_fields(self, cache_key: str) -> list[tuple[str, Any]] | None:
+        return self._discovered_fields.get(cache_key)
+
+    def set_discovered_fields(
+        self, cache_key: str, fields: list[tuple[str, Any]]
+    ) -> None:
+        self._discovered_fields[cache_key] = fields
 
     def get_field(self, screener: str, capability_name: str) -> object:
         return self._field_cache.get(
@@ -107,7 +125,17 @@ class _TvScreenerCapabilityRegistry:
         market: str,
         capability_name: str,
     ) -> TvScreenerCapabilityState | None:
-        return self._status_cache.get((screener, market, capability_name))
+        entry = self._status_cache.get((screener, market, capability_name))
+        return None if entry is None else entry[0]
+
+    def get_checked_at(
+        self,
+        screener: str,
+        market: str,
+        capability_name: str,
+    ) -> float | None:
+        entry = self._status_cache.get((screener, market, capability_name))
+        return None if entry is None else entry[1]
 
     def set_status(
         self,
@@ -115,8 +143,56 @@ class _TvScreenerCapabilityRegistry:
         market: str,
         capability_name: str,
         status: TvScreenerCapabilityState,
+        *,
+        checked_at: float | None = None,
     ) -> None:
-        self._status_cache[(screener, market, capability_name)] = status
+        self._status_cache[(screener, market, capability_name)] = (
+            status,
+            time.time() if checked_at is None else checked_at,
+        )
+
+    def matrix(self, screener: str, market: str) -> CapabilityMatrix:
+        return {
+            capability_name: entry
+            for (entry_screener, entry_market, capability_name), entry in (
+                self._status_cache.items()
+            )
+            if entry_screener == screener and entry_market == market
+        }
+
+    def merge_matrix(
+        self, screener: str, market: str, matrix: CapabilityMatrix
+    ) -> None:
+        """Adopt persisted entries that are newer than the in-process ones."""
+        for capability_name, (status, checked_at) in matrix.items():
+            current = self.get_checked_at(screener, market, capability_name)
+            if current is None or current < checked_at:
+                self.set_status(
+                    screener, market, capability_name, status, checked_at=checked_at
+                )
+
+    def is_matrix_loaded(self, screener: str, market: str) -> bool:
+        return (screener, market) in self._loaded_matrices
+
+    def mark_matrix_loaded(self, screener: str, market: str) -> None:
+        self._loaded_matrices.add((screener, market))
+
+    def get_refresh_task(self, screener: str, market: str) -> asyncio.Task[None] | None:
+        task = self._refresh_tasks.get((screener, market))
+        return None if task is None or task.done() else task
+
+    def set_refresh_task(
+        self, screener: str, market: str, task: asyncio.Task[None]
+    ) -> None:
+        key = (screener, market)
+        self._refresh_tasks[key] = task
+        task.add_done_callback(
+            lambda done: (
+                self._refresh_tasks.pop(key, None)
+                if self._refresh_tasks.get(key) is done
+                else None
+            )
+        )
 
     def get_probe_lock(
         self,
@@ -0,0 +1,134 @@
+"""Fail-open Redis persistence for the TvScreener capability matrix.
+
+Probed capability statuses are stored per (screener class, market, tvscreener
+version), each entry with the epoch time it was checked, so a new process or
+MCP worker starts from the last known matrix instead of re-probing every
+capability. Keys outlive ``settings.tvscreener_capability_ttl_seconds`` so
+stale entries can still be served while they are re-probed. Any Redis outage
+or malformed payload degrades to an empty matrix and never raises. Gated by
+settings.tvscreener_capability_cache_enabled (forced off in tests/conftest.py).
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+from importlib import metadata
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.ohlcv_cache_common import create_redis_client
+from app.services.tvscreener_capabilities import (
+    CapabilityMatrix,
+    TvScreenerCapabilityState,
+)
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "tvscreener:capabilities:v1:"
+# Stale entries stay readable for this many TTLs before Redis drops the key.
+_RETENTION_TTL_MULTIPLIER = 7
+_REDIS_CLIENT: redis.Redis | None = None
+
+
+@functools.cache
+def tvscreener_version() -> str:
+    try:
+        return metadata.version("tvscreener")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _key(screener_class: str, market: str) -> str:
+    return f"{_KEY_PREFIX}{screener_class}:{market}:{tvscreener_version()}"
+
+
+async def _get_redis_client() -> redis.Redis | None:
+    global _REDIS_CLIENT
+    if not settings.tvscreener_capability_cache_enabled:
+        return None
+    if _REDIS_CLIENT is not None:
+        return _REDIS_CLIENT
+    try:
+        _REDIS_CLIENT = await create_redis_client()
+    except Exception as exc:  # noqa: BLE001 — fail open to live probes
+        logger.debug("tvscreener capability store: redis init failed: %s", exc)
+        _REDIS_CLIENT = None
+    return _REDIS_CLIENT
+
+
+async def close_capability_store_redis() -> None:
+    global _REDIS_CLIENT
+    if _REDIS_CLIENT is not None:
+        try:
+            await _REDIS_CLIENT.close()
+        except Exception:  # noqa: BLE001
+            pass
+        _REDIS_CLIENT = None
+
+
+def _parse_matrix(raw: object) -> CapabilityMatrix:
+    if not isinstance(raw, str):
+        return {}
+    try:
+        payload = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    statuses = payload.get("statuses") if isinstance(payload, dict) else None
+    if not isinstance(statuses, dict):
+        return {}
+    matrix: CapabilityMatrix = {}
+    for capability_name, entry in statuses.items():
+        try:
+            matrix[str(capability_name)] = (
+                TvScreenerCapabilityState(entry["status"]),
+                float(entry["checked_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return matrix
+
+
+async def load_capability_matrix(screener_class: str, market: str) -> CapabilityMatrix:
+    redis_client = await _get_redis_client()
+    if redis_client is None:
+        return {}
+    key = _key(screener_class, market)
+    try:
+        raw = await redis_client.get(key)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("tvscreener capability store: GET failed for %s: %s", key, exc)
+        return {}
+    return _parse_matrix(raw)
+
+
+async def save_capability_matrix(
+    screener_class: str, market: str, matrix: CapabilityMatrix
+) -> None:
+    redis_client = await _get_redis_client()
+    if redis_client is None or not matrix:
+        return
+    key = _key(screener_class, market)
+    payload = {
+        "statuses": {
+            capability_name: {"status": status.value, "checked_at": checked_at}
+            for capability_name, (status, checked_at) in matrix.items()
+        }
+    }
+    try:
+        ttl = max(1, int(settings.tvscreener_capability_ttl_seconds))
+        await redis_client.set(
+            key, json.dumps(payload), ex=ttl * _RETENTION_TTL_MULTIPLIER
+        )
+    except Exception as exc:  # noqa: BLE001 — best-effort
+        logger.debug("tvscreener capability store: SET failed for %s: %s", key, exc)
+
+
+__all__ = [
+    "close_capability_store_redis",
+    "load_capability_matrix",
+    "save_capability_matrix",
+    "tvscreener_version",
+]
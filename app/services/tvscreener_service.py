@@ -10,11 +10,14 @@ import asyncio
 import importlib
 import logging
 import re
+import time
 from collections.abc import Callable, Iterable
 from typing import Any
 
 import pandas as pd
 
+from app.core.config import settings
+from app.services import tvscreener_capability_store
 from app.services.tvscreener_capabilities import (
     _CAPABILITY_CACHE_MISS as _CAPABILITY_CACHE_MISS,
 )
@@ -49,6 +52,9 @@ from app.services.tvscreener_retry import (
 
 logger = logging.getLogger(__name__)
 
+_probe_semaphore: asyncio.Semaphore | None = None
+_probe_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
 _COLUMN_NAME_MAP = {
     "symbol": "symbol",
     "name": "name",
@@ -79,6 +85,18 @@ def _import_tvscreener() -> Any:
     return importlib.import_module("tvscreener")
 
 
+def _get_probe_semaphore() -> asyncio.Semaphore:
+    """Process-wide bound on concurrent live capability probes."""
+    global _probe_semaphore, _probe_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _probe_semaphore is None or _probe_semaphore_loop is not loop:
+        _probe_semaphore = asyncio.Semaphore(
+            max(1, settings.tvscreener_capability_probe_concurrency)
+        )
+        _probe_semaphore_loop = loop
+    return _probe_semaphore
+
+
 def _normalize_column_name(column_name: Any) -> str:
     text = str(column_name or "").strip()
     if not text:
@@ -195,7 +213,6 @@ class TvScreenerService:
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.timeout = timeout
-        self._field_cache: dict[str, list[tuple[str, Any]]] = {}
         self._capability_registry = capability_registry or _shared_capability_registry
         logger.info(
             "TvScreenerService initialized with max_retries=%d, base_delay=%.1fs, timeout=%.1fs",
@@ -225,9 +242,10 @@ class TvScreenerService:
         cache_key = f"{screener_class.__name__}:{field_enum.__name__}"
 
         # Return cached results if available
-        if cache_key in self._field_cache:
+        cached_fields = self._capability_registry.get_discovered_fields(cache_key)
+        if cached_fields is not None:
             logger.debug("Returning cached field discovery for %s", cache_key)
-            return self._field_cache[cache_key]
+            return cached_fields
 
         logger.info(
             "Discovering available fields for %s with %s",
@@ -261,7 +279,7 @@ class TvScreenerService:
 
         try:
             available_fields = await asyncio.to_thread(_discover)
-            self._field_cache[cache_key] = available_fields
+            self._capability_registry.set_discovered_fields(cache_key, available_fields)
 
             logger.info(
                 "Discovered %d fields for %s: %s",
@@ -331,19 +349,58 @@ class TvScreenerService:
 
         return resolved_fields
 
+    @staticmethod
+    def _is_capability_stale(checked_at: float | None) -> bool:
+        return (
+            checked_at is None
+            or time.time() - checked_at >= settings.tvscreener_capability_ttl_seconds
+        )
+
+    async def _load_persisted_stock_matrix(
+        self, screener_class: type, market: str
+    ) -> None:
+        if self._capability_registry.is_matrix_loaded("stock", market):
+            return
+        matrix = await tvscreener_capability_store.load_capability_matrix(
+            screener_class.__name__, market
+        )
+        self._capability_registry.merge_matrix("stock", market, matrix)
+        self._capability_registry.mark_matrix_loaded("stock", market)
+
+    async def _persist_stock_matrix(self, screener_class: type, market: str) -> None:
+        await tvscreener_capability_store.save_capability_matrix(
+            screener_class.__name__,
+            market,
+            self._capability_registry.matrix("stock", market),
+        )
+
     async def _probe_stock_capability(
         self,
         *,
         market: str,
         capability_name: str,
         field: object,
+        refresh: bool = False,
     ) -> TvScreenerCapabilityState:
+        """Probe one capability, or return its cached status.
+
+        ``refresh`` re-probes a cached status once it is past the TTL.
+        """
         normalized_market = self._normalize_stock_market(market)
-        cached_status = self._capability_registry.get_status(
-            "stock",
-            normalized_market,
-            capability_name,
-        )
+
+        def cached() -> TvScreenerCapabilityState | None:
+            status = self._capability_registry.get_status(
+                "stock", normalized_market, capability_name
+            )
+            if status is not None and refresh:
+                checked_at = self._capability_registry.get_checked_at(
+                    "stock", normalized_market, capability_name
+                )
+                if self._is_capability_stale(checked_at):
+                    return None
+            return status
+
+        cached_status = cached()
         if cached_status is not None:
             return cached_status
 
@@ -354,11 +411,7 @@ class TvScreenerService:
         )
 
         async with probe_lock:
-            cached_status = self._capability_registry.get_status(
-                "stock",
-                normalized_market,
-                capability_name,
-            )
+            cached_status = cached()
             if cached_status is not None:
                 return cached_status
 
@@ -384,13 +437,14 @@ class TvScreenerService:
                 return TvScreenerCapabilityState.UNKNOWN
 
             try:
-                probe_result = await self.query_stock_screener(
-                    columns=probe_columns,
-                    where_clause=None,
-                    country=probe_country,
-                    markets=probe_markets,
-                    limit=_STOCK_CAPABILITY_PROBE_LIMIT,
-                )
+                async with _get_probe_semaphore():
+                    probe_result = await self.query_stock_screener(
+                        columns=probe_columns,
+                        where_clause=None,
+                        country=probe_country,
+                        markets=probe_markets,
+                        limit=_STOCK_CAPABILITY_PROBE_LIMIT,
+                    )
             except TvScreenerMalformedRequestError:
                 status = TvScreenerCapabilityState.UNSUPPORTED
             except (
@@ -398,7 +452,9 @@ class TvScreenerService:
                 TvScreenerRateLimitError,
                 TvScreenerTimeoutError,
             ):
-                return TvScreenerCapabilityState.UNKNOWN
+                return self._capability_registry.get_status(
+                    "stock", normalized_market, capability_name
+                ) or (TvScreenerCapabilityState.UNKNOWN)
             else:
                 status = _evaluate_stock_probe_result(
                     capability_name=capability_name,
@@ -414,12 +470,62 @@ class TvScreenerService:
             )
             return status
 
+    async def _refresh_stock_capabilities(
+        self,
+        *,
+        screener_class: type,
+        market: str,
+        capability_fields: dict[str, object],
+    ) -> None:
+        try:
+            await asyncio.gather(
+                *(
+                    self._probe_stock_capability(
+                        market=market,
+                        capability_name=capability_name,
+                        field=field,
+                        refresh=True,
+                    )
+                    for capability_name, field in capability_fields.items()
+                )
+            )
+            await self._persist_stock_matrix(screener_class, market)
+        except Exception as exc:  # noqa: BLE001 — stale statuses stay in use
+            logger.warning(
+                "TvScreener capability refresh failed for %s: %s", market, exc
+            )
+
+    def _schedule_stock_capability_refresh(
+        self,
+        *,
+        screener_class: type,
+        market: str,
+        capability_fields: dict[str, object],
+    ) -> None:
+        if self._capability_registry.get_refresh_task("stock", market) is not None:
+            return
+        task = asyncio.create_task(
+            self._refresh_stock_capabilities(
+                screener_class=screener_class,
+                market=market,
+                capability_fields=capability_fields,
+            )
+        )
+        self._capability_registry.set_refresh_task("stock", market, task)
+
     async def get_stock_capabilities(
         self,
         *,
         market: str,
         capability_names: Iterable[str],
     ) -> TvScreenerCapabilitySnapshot:
+        """Capability statuses for ``market``, starting from the cached matrix.
+
+        Capabilities never checked are probed concurrently (bounded by
+        ``settings.tvscreener_capability_probe_concurrency``). Cached statuses
+        past ``settings.tvscreener_capability_ttl_seconds`` are returned as-is
+        and re-probed in the background.
+        """
         requested_capabilities = {
             str(capability_name).strip()
             for capability_name in capability_names
@@ -454,9 +560,14 @@ class TvScreenerService:
             capability_aliases=_STOCK_CAPABILITY_ALIASES,
             capability_names=requested_capabilities,
         )
+        await self._load_persisted_stock_matrix(
+            tvscreener.StockScreener, normalized_market
+        )
 
         capability_fields: dict[str, object | None] = {}
         capability_statuses: dict[str, TvScreenerCapabilityState] = {}
+        to_probe: dict[str, object] = {}
+        stale: dict[str, object] = {}
 
         for capability_name in requested_capabilities:
             resolved_field = resolved_fields.get(capability_name)
@@ -479,14 +590,39 @@ class TvScreenerService:
                 normalized_market,
                 capability_name,
             )
-            if cached_status is not None:
-                capability_statuses[capability_name] = cached_status
+            if cached_status is None:
+                to_probe[capability_name] = resolved_field
                 continue
 
-            capability_statuses[capability_name] = await self._probe_stock_capability(
+            capability_statuses[capability_name] = cached_status
+            if self._is_capability_stale(
+                self._capability_registry.get_checked_at(
+                    "stock", normalized_market, capability_name
+                )
+            ):
+                stale[capability_name] = resolved_field
+
+        if to_probe:
+            probed = await asyncio.gather(
+                *(
+                    self._probe_stock_capability(
+                        market=normalized_market,
+                        capability_name=capability_name,
+                        field=field,
+                    )
+                    for capability_name, field in to_probe.items()
+                )
+            )
+            capability_statuses.update(zip(to_probe, probed, strict=True))
+            await self._persist_stock_matrix(
+                tvscreener.StockScreener, normalized_market
+            )
+
+        if stale:
+            self._schedule_stock_capability_refresh(
+                screener_class=tvscreener.StockScreener,
                 market=normalized_market,
-                capability_name=capability_name,
-                field=resolved_field,
+                capability_fields=stale,
             )
 
         return TvScreenerCapabilitySnapshot(
@@ -1,6 +1,13 @@
 """Upbit Orderbook Service
 
 Fetches real-time orderbook data from Upbit API.
+
+``fetch_multiple_orderbooks`` is the raw batched fetcher: markets are
+normalized with one universe lookup, and chunks are sent concurrently through
+the shared Upbit ``GET /v1/orderbook`` rate limiter, which backs off and
+retries on 429. ``fetch_orderbook`` reads through the shared read-model
+orderbook cache, so callers asking for the same market within its TTL share
+one upstream request.
 """
 
 import asyncio
@@ -8,34 +15,38 @@ import logging
 from typing import Any
 
 import httpx
-from httpx import HTTPStatusError
 
+from app.core.async_rate_limiter import RateLimitExceededError
 from app.core.log_sanitize import safe_log_value
-from app.services.upbit_symbol_universe_service import get_upbit_market_by_coin
+from app.services.brokers.upbit.client import UPBIT_REST, _request_json
+from app.services.upbit_symbol_universe_service import get_upbit_markets_by_coins
 
 logger = logging.getLogger(__name__)
 
-UPBIT_REST = "https://api.upbit.com/v1"
 UPBIT_ORDERBOOK_URL = f"{UPBIT_REST}/orderbook"
-ORDERBOOK_TIMEOUT_SECONDS = 5
 # 업비트 orderbook 조회를 한 번에 너무 크게 보내면 429가 자주 발생하므로 청크 단위로 분할
 MAX_MARKETS_PER_REQUEST = 30
-INTER_CHUNK_DELAY_SECONDS = 0.12
 
 
 def _chunked(values: list[str], size: int) -> list[list[str]]:
     return [values[i : i + size] for i in range(0, len(values), size)]
 
 
-async def _normalize_market_code(market: str) -> str | None:
-    market_code = market.strip().upper()
-    if not market_code:
-        return None
-
-    if market_code.startswith("KRW-"):
-        return market_code
+async def _normalize_market_codes(markets: list[str]) -> list[str]:
+    """KRW market codes for ``markets`` (codes or coins), deduplicated in order."""
+    codes = [str(market or "").strip().upper() for market in markets]
+    coins = [code for code in codes if code and not code.startswith("KRW-")]
+    markets_by_coin = await get_upbit_markets_by_coins(coins) if coins else {}
 
-    return await get_upbit_market_by_coin(market_code)
+    normalized_markets: list[str] = []
+    for market, code in zip(markets, codes, strict=True):
+        normalized = code if code.startswith("KRW-") else markets_by_coin.get(code)
+        if not normalized:
+            logger.warning("지원하지 않는 마켓 코드: %s", safe_log_value(market))
+            continue
+        if normalized not in normalized_markets:
+            normalized_markets.append(normalized)
+    return normalized_markets
 
 
 def _build_orderbook_result(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
@@ -58,6 +69,9 @@ async def fetch_orderbook(market: str = "KRW-BTC") -> dict[str, Any]:
     """
     호가(오더북) 정보를 가져옵니다.
 
+    공유 read-model 오더북 캐시를 거치므로 TTL 안의 반복 조회와 동시 조회는
+    한 번의 업비트 요청을 함께 사용합니다.
+
     Args:
         market: 마켓 코드 (예: "KRW-BTC", "KRW-ETH")
 
@@ -70,48 +84,60 @@ async def fetch_orderbook(market: str = "KRW-BTC") -> dict[str, Any]:
           - ask_size: 매도 잔량
           - bid_size: 매수 잔량
     """
-    normalized_market = await _normalize_market_code(market)
-    if not normalized_market:
-        logger.warning("지원하지 않는 마켓 코드: %s", safe_log_value(market))
+    normalized_markets = await _normalize_market_codes([market])
+    if not normalized_markets:
+        return {}
+
+    from app.services.upbit_public_read_model import get_default_read_model
+
+    read_model = await get_default_read_model()
+    books = await read_model.fetch_orderbooks(normalized_markets)
+    book = books.get(normalized_markets[0])
+    if not book:
+        logger.warning(
+            "마켓 %s에 대한 호가 데이터가 없습니다.",
+            safe_log_value(normalized_markets[0]),
+        )
         return {}
+    return book
+
 
+async def _fetch_orderbook_chunk(chunk: list[str]) -> dict[str, dict[str, Any]]:
+    markets_query = ",".join(chunk)
     try:
-        async with httpx.AsyncClient(timeout=ORDERBOOK_TIMEOUT_SECONDS) as client:
-            response = await client.get(
-                f"{UPBIT_ORDERBOOK_URL}?markets={normalized_market}"
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if not data or len(data) == 0:
-                logger.warning(
-                    "마켓 %s에 대한 호가 데이터가 없습니다.",
-                    safe_log_value(normalized_market),
-                )
-                return {}
-
-            return _build_orderbook_result(data).get(normalized_market, {})
-    except httpx.HTTPStatusError as e:
-        logger.error(
-            "Upbit API 호출 실패 (%s): %s",
-            safe_log_value(normalized_market),
-            e.response.status_code,
+        rows = await _request_json(
+            UPBIT_ORDERBOOK_URL, params={"markets": markets_query}
+        )
+    except RateLimitExceededError:
+        logger.warning(
+            "Upbit orderbook rate limit 재시도 소진 (batch=%s)", markets_query
         )
         raise
-    except httpx.RequestError as e:
-        logger.error("요청 에러 (%s): %s", safe_log_value(normalized_market), e)
-        raise
-    except Exception as e:
+    except httpx.HTTPStatusError as exc:
         logger.error(
-            "호가 데이터 가져오기 실패 (%s): %s", safe_log_value(normalized_market), e
+            "Upbit API 호출 실패 (batch=%s): %s",
+            markets_query,
+            exc.response.status_code,
         )
         raise
+    except httpx.RequestError as exc:
+        logger.error("Upbit orderbook 요청 에러 (batch=%s): %s", markets_query, exc)
+        raise
+
+    if not isinstance(rows, list):
+        logger.warning("Upbit orderbook 응답 형식 이상 (batch=%s)", markets_query)
+        raise ValueError("unexpected Upbit orderbook response shape")
+    return _build_orderbook_result(rows)
 
 
 async def fetch_multiple_orderbooks(markets: list[str]) -> dict[str, dict[str, Any]]:
     """
     여러 마켓의 호가 정보를 가져옵니다.
 
+    청크는 동시에 보내며, 간격과 429 백오프는 공유 rate limiter가 맡습니다.
+    실패한 청크(재시도 소진 포함)만 결과에서 빠지고, 모든 청크가 실패하면
+    첫 오류를 그대로 올립니다.
+
     Args:
         markets: 마켓 코드 리스트 (예: ["KRW-BTC", "KRW-ETH"])
 
@@ -125,58 +151,26 @@ async def fetch_multiple_orderbooks(markets: list[str]) -> dict[str, dict[str, A
     if not markets:
         return {}
 
-    normalized_markets: list[str] = []
-    seen: set[str] = set()
-    for market in markets:
-        normalized = await _normalize_market_code(market)
-        if not normalized:
-            logger.warning("지원하지 않는 마켓 코드: %s", market)
-            continue
-        if normalized not in seen:
-            seen.add(normalized)
-            normalized_markets.append(normalized)
-
+    normalized_markets = await _normalize_market_codes(markets)
     if not normalized_markets:
         return {}
 
+    chunk_results = await asyncio.gather(
+        *(
+            _fetch_orderbook_chunk(chunk)
+            for chunk in _chunked(normalized_markets, MAX_MARKETS_PER_REQUEST)
+        ),
+        return_exceptions=True,
+    )
     results: dict[str, dict[str, Any]] = {}
-    async with httpx.AsyncClient(timeout=ORDERBOOK_TIMEOUT_SECONDS) as client:
-        market_chunks = _chunked(normalized_markets, MAX_MARKETS_PER_REQUEST)
-        for index, chunk in enumerate(market_chunks):
-            markets_query = ",".join(chunk)
-            try:
-                response = await client.get(
-                    f"{UPBIT_ORDERBOOK_URL}?markets={markets_query}"
-                )
-                response.raise_for_status()
-            except HTTPStatusError as exc:
-                status = exc.response.status_code
-                if status == 429:
-                    logger.warning(
-                        "Upbit orderbook rate limit 도달: %s개 중 %s개 조회 후 중단",
-                        len(normalized_markets),
-                        len(results),
-                    )
-                    break
-                logger.error(
-                    "Upbit API 호출 실패 (batch=%s): %s", markets_query, status
-                )
-                continue
-            except httpx.RequestError as exc:
-                logger.error(
-                    "Upbit orderbook 요청 에러 (batch=%s): %s", markets_query, exc
-                )
-                continue
-
-            rows = response.json()
-            if not isinstance(rows, list):
-                logger.warning(
-                    "Upbit orderbook 응답 형식 이상 (batch=%s)", markets_query
-                )
-                continue
-
-            results.update(_build_orderbook_result(rows))
-            if index < len(market_chunks) - 1:
-                await asyncio.sleep(INTER_CHUNK_DELAY_SECONDS)
-
+    errors: list[Exception] = []
+    for chunk_result in chunk_results:
+        if isinstance(chunk_result, Exception):
+            errors.append(chunk_result)
+        elif isinstance(chunk_result, BaseException):
+            raise chunk_result
+        else:
+            results.update(chunk_result)
+    if errors and len(errors) == len(chunk_results):
+        raise errors[0]
     return results
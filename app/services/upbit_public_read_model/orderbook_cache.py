@@ -1,7 +1,11 @@
-"""Redis-cached Upbit orderbook fetcher with derived spread metadata."""
+"""Redis-cached Upbit orderbook fetcher with derived spread metadata.
+
+Concurrent cache misses for the same market share one upstream fetch.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from datetime import datetime
@@ -52,6 +56,7 @@ class OrderbookCache:
     def __init__(self, *, redis, fetcher: OrderbookFetcher) -> None:
         self._redis = redis
         self._fetcher = fetcher
+        self._inflight: dict[str, asyncio.Task[dict[str, dict[str, Any]]]] = {}
 
     async def get(self, markets: list[str]) -> UpbitOrderbookBlock:
         markets = [str(m).upper() for m in markets if str(m or "").strip()]
@@ -62,27 +67,15 @@ class OrderbookCache:
                 )
             )
         now = _now_utc()
-        cached_by_market = {m: await read_json(self._redis, _key(m)) for m in markets}
-        fresh = {
-            m: c["orderbook"]
-            for m, c in cached_by_market.items()
-            if c and (now - c["cachedAt"]).total_seconds() <= ORDERBOOK_TTL_SECONDS
-        }
+        cached_by_market = await self._read_cached(markets)
+        fresh = self._fresh_books(cached_by_market, now)
         missing = [m for m in markets if m not in fresh]
         books = dict(fresh)
         reason = None
         state = "fresh"
         if missing:
             try:
-                fetched = await self._fetcher(missing)
-                fetched = {str(k).upper(): v for k, v in fetched.items()}
-                for market, book in fetched.items():
-                    await write_json(
-                        self._redis,
-                        _key(market),
-                        {"orderbook": book, "fetchedAt": now, "cachedAt": now},
-                        ex=ORDERBOOK_STALE_TOLERANCE_SECONDS,
-                    )
+                fetched = await self._fetch_shared(missing, now)
                 books.update(fetched)
                 unfetched = [m for m in missing if m not in fetched]
                 if unfetched:
@@ -110,6 +103,92 @@ class OrderbookCache:
             error_reason=reason,
         )
 
+    async def fetch(self, markets: list[str]) -> dict[str, dict[str, Any]]:
+        """Raw books for ``markets``: fresh cache entries, else one shared fetch.
+
+        Unlike :meth:`get`, fetch errors propagate and no stale book is served.
+        """
+        markets = [str(m).upper() for m in markets if str(m or "").strip()]
+        if not markets:
+            return {}
+        now = _now_utc()
+        books = self._fresh_books(await self._read_cached(markets), now)
+        missing = [m for m in markets if m not in books]
+        if missing:
+            books.update(await self._fetch_shared(missing, now))
+        return books
+
+    async def _read_cached(
+        self, markets: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        cached = await asyncio.gather(
+            *(read_json(self._redis, _key(m)) for m in markets)
+        )
+        return dict(zip(markets, cached, strict=True))
+
+    @staticmethod
+    def _fresh_books(
+        cached_by_market: dict[str, dict[str, Any] | None], now: datetime
+    ) -> dict[str, dict[str, Any]]:
+        return {
+            m: c["orderbook"]
+            for m, c in cached_by_market.items()
+            if c and (now - c["cachedAt"]).total_seconds() <= ORDERBOOK_TTL_SECONDS
+        }
+
+    async def _fetch_shared(
+        self, markets: list[str], now: datetime
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch ``markets``, joining fetches already in flight for any of them."""
+        to_fetch = [m for m in markets if m not in self._inflight]
+        if to_fetch:
+            task = asyncio.create_task(self._fetch_and_store(to_fetch, now))
+            for market in to_fetch:
+                self._inflight[market] = task
+        tasks = list(dict.fromkeys(self._inflight[m] for m in markets))
+        # Shielded so a cancelled caller does not cancel the fetch other
+        # callers are waiting on.
+        results = await asyncio.gather(
+            *(asyncio.shield(task) for task in tasks), return_exceptions=True
+        )
+        fetched: dict[str, dict[str, Any]] = {}
+        errors: list[Exception] = []
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                fetched.update(result)
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        requested = set(markets)
+        return {m: book for m, book in fetched.items() if m in requested}
+
+    async def _fetch_and_store(
+        self, markets: list[str], now: datetime
+    ) -> dict[str, dict[str, Any]]:
+        try:
+            fetched = await self._fetcher(markets)
+            fetched = {str(k).upper(): v for k, v in fetched.items()}
+            await asyncio.gather(
+                *(
+                    write_json(
+                        self._redis,
+                        _key(market),
+                        {"orderbook": book, "fetchedAt": now, "cachedAt": now},
+                        ex=ORDERBOOK_STALE_TOLERANCE_SECONDS,
+                    )
+                    for market, book in fetched.items()
+                )
+            )
+            return fetched
+        finally:
+            current_task = asyncio.current_task()
+            for market in markets:
+                if self._inflight.get(market) is current_task:
+                    del self._inflight[market]
+
     @staticmethod
     def _stale_books(
         cached_by_market: dict[str, dict[str, Any] | None],
@@ -44,6 +44,11 @@ class UpbitPublicReadModel:
     async def get_orderbooks(self, markets: Iterable[str]):
         return await self._orderbook.get(list(markets))
 
+    async def fetch_orderbooks(
+        self, markets: Iterable[str]
+    ) -> dict[str, dict[str, Any]]:
+        return await self._orderbook.fetch(list(markets))
+
     async def get_recent_trades(self, market: str, count: int = 50):
         return await self._trades.get(market, count)
 
@@ -435,6 +435,58 @@ async def get_upbit_market_display_names(
         return await _get_upbit_market_display_names_impl(session, markets)
 
 
+async def _get_upbit_markets_by_coins_impl(
+    db: AsyncSession,
+    currencies: list[str],
+    quote_currency: str,
+) -> dict[str, str]:
+    normalized_currencies = [
+        normalized
+        for normalized in {_normalize_symbol(currency) for currency in currencies}
+        if normalized
+    ]
+    if not normalized_currencies:
+        return {}
+
+    normalized_quote_currency = _normalize_quote_currency(quote_currency)
+    stmt = (
+        select(UpbitSymbolUniverse.base_currency, UpbitSymbolUniverse.market)
+        .where(
+            UpbitSymbolUniverse.base_currency.in_(normalized_currencies),
+            UpbitSymbolUniverse.quote_currency == normalized_quote_currency,
+            UpbitSymbolUniverse.is_active.is_(True),
+        )
+        .order_by(UpbitSymbolUniverse.market.asc())
+    )
+    markets: dict[str, str] = {}
+    for base_currency, market in (await db.execute(stmt)).all():
+        markets.setdefault(base_currency, market)
+    if not markets and not await has_any_rows(db, UpbitSymbolUniverse.market):
+        raise UpbitSymbolUniverseEmptyError(
+            f"upbit_symbol_universe is empty. {sync_hint(_UPBIT_UNIVERSE_SYNC_COMMAND)}"
+        )
+    return markets
+
+
+async def get_upbit_markets_by_coins(
+    currencies: list[str],
+    quote_currency: str = "KRW",
+    db: AsyncSession | None = None,
+) -> dict[str, str]:
+    """Active market per coin in one query, keyed by normalized coin.
+
+    Coins without an active market for ``quote_currency`` are left out, where
+    :func:`get_upbit_market_by_coin` would raise for them.
+    """
+    if db is not None:
+        return await _get_upbit_markets_by_coins_impl(db, currencies, quote_currency)
+
+    async with _internal_session() as session:
+        return await _get_upbit_markets_by_coins_impl(
+            session, currencies, quote_currency
+        )
+
+
 async def get_upbit_coin_by_market(
     market: str,
     db: AsyncSession | None = None,
@@ -639,6 +691,7 @@ __all__ = [
     "get_upbit_korean_name_by_market",
     "get_upbit_market_display_names",
     "get_upbit_market_by_coin",
+    "get_upbit_markets_by_coins",
     "get_upbit_warning_markets",
     "get_upbit_symbol_by_name",
     "search_upbit_symbols",
@@ -264,6 +264,46 @@ async def get_us_exchange_by_symbol(
         return row.exchange
 
 
+async def get_us_exchanges_by_symbols(
+    symbols: list[str],
+    db: AsyncSession | None = None,
+) -> dict[str, str]:
+    """Return ``{input_symbol: exchange}`` for active US symbols in one query.
+
+    The bulk form of :func:`get_us_exchange_by_symbol`. Symbols that are
+    unregistered or inactive (or any symbol, when the universe is empty) are
+    omitted rather than raising.
+    """
+    canon_to_original: dict[str, str] = {}
+    for raw in symbols:
+        if not raw:
+            continue
+        canon = to_db_symbol(_normalize_symbol(raw))
+        if canon:
+            canon_to_original.setdefault(canon, raw)
+    if not canon_to_original:
+        return {}
+
+    async def _run(session: AsyncSession) -> dict[str, str]:
+        stmt = select(USSymbolUniverse.symbol, USSymbolUniverse.exchange).where(
+            USSymbolUniverse.symbol.in_(list(canon_to_original)),
+            USSymbolUniverse.is_active.is_(True),
+        )
+        result = await session.execute(stmt)
+        exchanges: dict[str, str] = {}
+        for canon_symbol, exchange in result.all():
+            original = canon_to_original.get(canon_symbol)
+            if original is not None:
+                exchanges[original] = exchange
+        return exchanges
+
+    if db is not None:
+        return await _run(db)
+
+    async with AsyncSessionLocal() as session:  # pyright: ignore[reportGeneralTypeIssues]
+        return await _run(session)
+
+
 async def get_us_common_stock_flags(
     symbols: list[str],
     db: AsyncSession | None = None,
@@ -482,6 +522,7 @@ __all__ = [
     "USSymbolNameAmbiguousError",
     "build_us_symbol_universe_snapshot",
     "get_us_exchange_by_symbol",
+    "get_us_exchanges_by_symbols",
     "get_us_symbol_by_name",
     "search_us_symbols",
     "sync_us_symbol_universe",
@@ -1,8 +1,8 @@
 """Append-only artifact persistence with staging and atomic publication.
 
 All completed data files are first materialized in ``.staging``.  Their
-Parquet metadata and SHA-256 are verified from the exact in-memory byte stream
-that is written to the ``.partial`` file, then the staging file is atomically
+Parquet metadata and SHA-256 are verified from the exact byte stream that is
+written to the ``.partial`` file, then the staging file is atomically
 renamed into its final location.  Final artifact names are UUID based, so no
 publication operation overwrites an earlier file.
 
@@ -14,6 +14,7 @@ opens, stats, globs, or otherwise reads a completed holdout file.
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import os
 import uuid
@@ -59,6 +60,107 @@ class StagedFile:
         }
 
 
+class _HashingSink(io.RawIOBase):
+    """Write-through file wrapper that hashes exactly the bytes it forwards."""
+
+    def __init__(self, handle: io.BufferedWriter) -> None:
+        super().__init__()
+        self._handle = handle
+        self.digest = hashlib.sha256()
+        self.byte_size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, payload: bytes) -> int:  # type: ignore[override]
+        view = memoryview(payload)
+        self._handle.write(view)
+        self.digest.update(view)
+        self.byte_size += len(view)
+        return len(view)
+
+    def tell(self) -> int:
+        return self.byte_size
+
+
+class StagedParquetStream:
+    """A staging ``.partial`` Parquet file appended one row group at a time.
+
+    The SHA-256 is taken from the byte stream as it is written, so closing the
+    stream yields the same evidence ``stage_parquet`` derives from its
+    in-memory buffer without ever reading the file back.  The footer returned
+    by the writer is validated (row count, column count, policy label) before
+    a ``StagedFile`` is handed out; a stream that is abandoned, or fails that
+    validation, leaves its partial in staging as evidence.
+    """
+
+    def __init__(
+        self,
+        partial: Path,
+        final_relative_path: str,
+        *,
+        schema: pa.Schema,
+        is_holdout: bool,
+        venue: str,
+    ) -> None:
+        self._partial = partial
+        self._final_relative_path = final_relative_path
+        self._is_holdout = is_holdout
+        self._venue = venue
+        self._schema = label_table_for_venue(schema.empty_table(), venue).schema
+        self._handle = partial.open("xb")
+        self._sink = _HashingSink(self._handle)
+        self._writer = pq.ParquetWriter(
+            self._sink,
+            self._schema,
+            compression="zstd",
+            use_dictionary=True,
+            write_statistics=True,
+        )
+        self.row_count = 0
+
+    def write(self, table: pa.Table) -> None:
+        """Append ``table`` as one row group."""
+        if table.num_rows == 0:
+            return
+        self._writer.write_table(table.replace_schema_metadata(self._schema.metadata))
+        self.row_count += table.num_rows
+
+    def close(self) -> StagedFile:
+        self._writer.close()
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.close()
+        metadata = self._writer.writer.metadata
+        if metadata is None or metadata.num_rows != self.row_count:
+            raise ValueError("staged Parquet metadata row-count mismatch")
+        if len(metadata.schema.names) != len(self._schema.names):
+            raise ValueError("staged Parquet schema-column mismatch")
+        policy_from_parquet_metadata(
+            metadata.schema.to_arrow_schema().metadata,
+            expected_venue=self._venue,
+        )
+        return StagedFile(
+            staging_path=str(self._partial),
+            final_relative_path=self._final_relative_path,
+            record=FileRecord(
+                relative_path=self._final_relative_path,
+                sha256=self._sink.digest.hexdigest(),
+                byte_size=self._sink.byte_size,
+                row_count=self.row_count,
+                kind="parquet",
+                is_holdout=self._is_holdout,
+            ),
+        )
+
+    def abandon(self) -> None:
+        """Stop writing; the untouched partial stays in staging."""
+        try:
+            self._writer.close()
+        finally:
+            self._handle.close()
+
+
 def _timestamp_token() -> str:
     return datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
 
@@ -195,6 +297,23 @@ class ArtifactStore:
             is_holdout=is_holdout,
         )
 
+    def open_parquet_stream(
+        self,
+        final_relative_path: str,
+        *,
+        schema: pa.Schema,
+        is_holdout: bool,
+        venue: str,
+    ) -> StagedParquetStream:
+        """Start a row-group-at-a-time staging file for ``final_relative_path``."""
+        return StagedParquetStream(
+            self.staging / f"{self._token()}.bin.partial",
+            final_relative_path,
+            schema=schema,
+            is_holdout=is_holdout,
+            venue=venue,
+        )
+
     def publish(self, staged: StagedFile) -> FileRecord:
         """Atomically publish a staged file without replacing any destination.
 
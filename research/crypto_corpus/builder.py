@@ -7,13 +7,14 @@ It only calls the explicitly listed unsigned public market-data endpoints.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import math
 import os
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -21,7 +22,7 @@ from urllib.parse import urlencode
 
 import pyarrow as pa
 
-from .artifacts import ArtifactStore, FileRecord, StagedFile
+from .artifacts import ArtifactStore, FileRecord, StagedFile, StagedParquetStream
 from .constants import (
     ARTIFACT_ROOT,
     AUTH,
@@ -32,6 +33,7 @@ from .constants import (
     BINANCE_PAGE_SIZE,
     CORPUS_ID,
     CUTOFF_END,
+    FETCH_WORKERS_PER_VENUE,
     HOLDOUT_ACCESS_LOG,
     HOLDOUT_START,
     HOUR_WINDOW_START,
@@ -95,10 +97,17 @@ class Bar:
 
 @dataclass
 class FetchResult:
-    bars: list[Bar]
+    """One task's outcome.
+
+    Fetchers stream validated pages into ``stream`` as they arrive; ``bars``
+    is only used by callers that already hold a finished list of bars.
+    """
+
+    bars: list[Bar] = field(default_factory=list)
     error: str | None = None
     rate_limited: bool = False
     budget_exhausted: bool = False
+    stream: _TaskStream | None = None
 
 
 BAR_SCHEMA = pa.schema(
@@ -255,27 +264,33 @@ def _normalize_binance(record: list[Any], frequency: str, expected_symbol: str)
     )
 
 
-def _bar_to_row(bar: Bar) -> dict[str, Any]:
-    return {
-        "venue": bar.venue,
-        "symbol": bar.symbol,
-        "frequency": bar.frequency,
-        "bucket_timezone": "UTC",
-        "open_time_utc": _utc_from_ms(bar.open_ms),
-        "close_time_utc": _utc_from_ms(bar.close_exclusive_ms),
-        "open": bar.open_price,
-        "high": bar.high_price,
-        "low": bar.low_price,
-        "close": bar.close_price,
-        "base_volume": bar.base_volume,
-        "quote_volume": bar.quote_volume,
-        "trade_count": bar.trade_count,
-        "source_candle_date_time_utc": bar.source_candle_date_time_utc,
-        "source_candle_date_time_kst": bar.source_candle_date_time_kst,
-        "source_open_time_ms": bar.source_open_time_ms,
-        "source_close_time_ms": bar.source_close_time_ms,
-        "source_timestamp_ms": bar.source_timestamp_ms,
-    }
+def _bars_to_table(bars: list[Bar]) -> pa.Table:
+    """Build one page's Arrow table column-wise (no per-row dicts/datetimes)."""
+    return pa.Table.from_arrays(
+        [
+            pa.array([bar.venue for bar in bars], pa.string()),
+            pa.array([bar.symbol for bar in bars], pa.string()),
+            pa.array([bar.frequency for bar in bars], pa.string()),
+            pa.array(["UTC"] * len(bars), pa.string()),
+            pa.array([bar.open_ms for bar in bars], pa.timestamp("ms", tz="UTC")),
+            pa.array(
+                [bar.close_exclusive_ms for bar in bars], pa.timestamp("ms", tz="UTC")
+            ),
+            pa.array([bar.open_price for bar in bars], pa.float64()),
+            pa.array([bar.high_price for bar in bars], pa.float64()),
+            pa.array([bar.low_price for bar in bars], pa.float64()),
+            pa.array([bar.close_price for bar in bars], pa.float64()),
+            pa.array([bar.base_volume for bar in bars], pa.float64()),
+            pa.array([bar.quote_volume for bar in bars], pa.float64()),
+            pa.array([bar.trade_count for bar in bars], pa.int64()),
+            pa.array([bar.source_candle_date_time_utc for bar in bars], pa.string()),
+            pa.array([bar.source_candle_date_time_kst for bar in bars], pa.string()),
+            pa.array([bar.source_open_time_ms for bar in bars], pa.int64()),
+            pa.array([bar.source_close_time_ms for bar in bars], pa.int64()),
+            pa.array([bar.source_timestamp_ms for bar in bars], pa.int64()),
+        ],
+        schema=BAR_SCHEMA,
+    )
 
 
 def _task_window(venue: str, frequency: str) -> tuple[datetime, datetime, int]:
@@ -368,6 +383,104 @@ def _response_error(response: ApiResponse) -> str:
     return f"{detail}; response_sha256={body_hash}"
 
 
+class _TaskStream:
+    """Validate one task's pages and stream them into staged Parquet files.
+
+    Each (split, year) group becomes one staged file, as before.  Ascending
+    venues append every page as a row group the moment it arrives.  Upbit
+    pages arrive newest-first, so a group's pages are held as Arrow tables
+    only until an older group shows up and are then written oldest-first;
+    stored rows therefore keep their ascending ``open_time_utc`` order.
+    The invariants ``_finalize_fetch`` used to check over the whole task
+    (unique open time, exact interval, no unfinished bar) are checked per
+    page against every open time seen so far.
+    """
+
+    def __init__(
+        self, store: ArtifactStore, venue: str, symbol: str, frequency: str
+    ) -> None:
+        self.store = store
+        self.venue = venue
+        self.symbol = symbol
+        self.frequency = frequency
+        _, end, self.interval_ms = _task_window(venue, frequency)
+        self._end_ms = _milliseconds(end)
+        self._holdout_start_ms = _milliseconds(HOLDOUT_START)
+        self._descending = venue == "upbit_krw"
+        self._open_ms: set[int] = set()
+        self._pending: dict[tuple[bool, int], list[pa.Table]] = defaultdict(list)
+        self._files: dict[tuple[bool, int], StagedParquetStream] = {}
+
+    @property
+    def open_times(self) -> list[int]:
+        return sorted(self._open_ms)
+
+    @property
+    def row_count(self) -> int:
+        return len(self._open_ms)
+
+    def _group(self, open_ms: int) -> tuple[bool, int]:
+        return open_ms >= self._holdout_start_ms, _utc_from_ms(open_ms).year
+
+    def _file(self, group: tuple[bool, int]) -> StagedParquetStream:
+        staged = self._files.get(group)
+        if staged is None:
+            is_holdout, year = group
+            base = "holdout" if is_holdout else "dataset"
+            filename = f"{self.symbol}__{self.frequency}__{self.store._token()}.parquet"
+            staged = self.store.open_parquet_stream(
+                f"{base}/venue={self.venue}/year={year}/{filename}",
+                schema=BAR_SCHEMA,
+                is_holdout=is_holdout,
+                venue=self.venue,
+            )
+            self._files[group] = staged
+        return staged
+
+    def _flush(self, newer_than: tuple[bool, int] | None = None) -> None:
+        for group in sorted(self._pending):
+            if newer_than is not None and group <= newer_than:
+                continue
+            for table in self._pending.pop(group):
+                self._file(group).write(table)
+
+    def append(self, bars: list[Bar]) -> str | None:
+        """Write one page of in-window bars; return an invariant error, if any."""
+        for bar in bars:
+            if bar.open_ms in self._open_ms:
+                return f"duplicate_source_row:{self.symbol}@{bar.open_ms}"
+            self._open_ms.add(bar.open_ms)
+            if bar.close_exclusive_ms - bar.open_ms != self.interval_ms:
+                return f"interval_invariant_failed:{self.symbol}@{bar.open_ms}"
+            if bar.close_exclusive_ms > self._end_ms:
+                return f"unfinished_bar_rejected:{self.symbol}@{bar.open_ms}"
+        if not bars:
+            return None
+        groups: dict[tuple[bool, int], list[Bar]] = defaultdict(list)
+        for bar in sorted(bars, key=lambda item: item.open_ms):
+            groups[self._group(bar.open_ms)].append(bar)
+        for group, members in groups.items():
+            table = _bars_to_table(members)
+            if self._descending:
+                self._pending[group].insert(0, table)
+            else:
+                self._file(group).write(table)
+        if self._descending:
+            self._flush(newer_than=min(groups))
+        return None
+
+    def close(self) -> list[StagedFile]:
+        """Finish every file; staged records are ordered by (split, year)."""
+        self._flush()
+        return [self._files[group].close() for group in sorted(self._files)]
+
+    def abandon(self) -> None:
+        """Drop the task's output; written partials stay in staging."""
+        self._pending.clear()
+        for staged in self._files.values():
+            staged.abandon()
+
+
 class CorpusBuilder:
     """Build one immutable, restartable public corpus at the literal root."""
 
@@ -378,6 +491,7 @@ class CorpusBuilder:
         client: PublicApiClient | None = None,
         now: Callable[[], datetime] | None = None,
         monotonic: Callable[[], float] | None = None,
+        workers_per_venue: int = FETCH_WORKERS_PER_VENUE,
     ) -> None:
         self.store = store or ArtifactStore(ARTIFACT_ROOT)
         self.client = client or PublicApiClient(self.store)
@@ -388,6 +502,7 @@ class CorpusBuilder:
         self._completed = 0
         self._total_tasks = 0
         self._last_checkpoint = "none"
+        self.workers_per_venue = max(1, workers_per_venue)
         self.store.ensure_append_only_log("errors.jsonl")
 
     def _append_progress(self, stage: str, *, force: bool = False) -> None:
@@ -614,15 +729,40 @@ class CorpusBuilder:
         started_at = _parse_utc_timestamp(str(self._preflight_payload["started_at"]))
         return (self.now() - started_at).total_seconds() <= MAX_WALL_CLOCK_SECONDS
 
-    def _fetch_upbit(self, symbol: str, frequency: str) -> FetchResult:
-        start, end, interval_ms = _task_window("upbit_krw", frequency)
+    async def _get_page(self, venue: str, url: str) -> ApiResponse:
+        """Run one paced, budget-reserving public GET off the event loop."""
+        return await asyncio.to_thread(self.client.get_json, venue, url)
+
+    @staticmethod
+    def _stream_page(stream: _TaskStream, bars: list[Bar]) -> FetchResult | None:
+        """Append a page; on failure drop the task's rows like a bad finalize."""
+        try:
+            error = stream.append(bars)
+        except (OSError, ValueError) as exc:
+            error = f"artifact_write_failed:{exc}"
+        if error is None:
+            return None
+        stream.abandon()
+        return FetchResult(error=error)
+
+    async def _fetch_upbit(
+        self,
+        symbol: str,
+        frequency: str,
+        stopped: Callable[[], bool] = lambda: False,
+    ) -> FetchResult | None:
+        """Page one Upbit task newest-first; ``None`` when the run stopped."""
+        start, end, _interval_ms = _task_window("upbit_krw", frequency)
+        stream = _TaskStream(self.store, "upbit_krw", symbol, frequency)
         cursor = end
-        rows: list[Bar] = []
         previous_cursor: datetime | None = None
         endpoint = UPBIT_DAYS_URL if frequency == "1d" else UPBIT_HOURS_URL
         while True:
+            if stopped():
+                stream.abandon()
+                return None
             if not self._check_wall_clock():
-                return FetchResult(rows, error="max_wall_clock_exceeded")
+                return FetchResult(error="max_wall_clock_exceeded", stream=stream)
             query = urlencode(
                 {
                     "market": symbol,
@@ -631,20 +771,24 @@ class CorpusBuilder:
                 }
             )
             try:
-                response = self.client.get_json("upbit_krw", f"{endpoint}?{query}")
+                response = await self._get_page("upbit_krw", f"{endpoint}?{query}")
             except RequestBudgetExceeded:
                 return FetchResult(
-                    rows, error="request_budget_exhausted", budget_exhausted=True
+                    error="request_budget_exhausted",
+                    budget_exhausted=True,
+                    stream=stream,
                 )
             self._append_progress("FETCH_UPBIT")
             if not response.ok:
                 return FetchResult(
-                    rows,
                     error=_response_error(response),
                     rate_limited=response.rate_limited,
+                    stream=stream,
                 )
             if not isinstance(response.payload, list):
-                return FetchResult(rows, error="upbit_candles_non_list_payload")
+                return FetchResult(
+                    error="upbit_candles_non_list_payload", stream=stream
+                )
             if not response.payload:
                 break
             try:
@@ -653,25 +797,40 @@ class CorpusBuilder:
                     for item in response.payload
                 ]
             except (KeyError, TypeError, ValueError, SourceDataError) as exc:
-                return FetchResult([], error=f"upbit_normalization_failed:{exc}")
-            rows.extend(bar for bar in page if start <= _utc_from_ms(bar.open_ms) < end)
+                stream.abandon()
+                return FetchResult(error=f"upbit_normalization_failed:{exc}")
+            failed = self._stream_page(
+                stream,
+                [bar for bar in page if start <= _utc_from_ms(bar.open_ms) < end],
+            )
+            if failed is not None:
+                return failed
             oldest = min(_utc_from_ms(bar.open_ms) for bar in page)
             if oldest <= start or len(page) < UPBIT_PAGE_SIZE:
                 break
             if previous_cursor is not None and oldest >= previous_cursor:
-                return FetchResult(rows, error="upbit_pagination_nonprogress")
+                return FetchResult(error="upbit_pagination_nonprogress", stream=stream)
             previous_cursor = cursor
             cursor = oldest
-        return self._finalize_fetch(rows, symbol, frequency, start, end, interval_ms)
+        return FetchResult(stream=stream)
 
-    def _fetch_binance(self, symbol: str, frequency: str) -> FetchResult:
+    async def _fetch_binance(
+        self,
+        symbol: str,
+        frequency: str,
+        stopped: Callable[[], bool] = lambda: False,
+    ) -> FetchResult | None:
+        """Page one Binance task oldest-first; ``None`` when the run stopped."""
         start, end, interval_ms = _task_window("binance_usdt_spot", frequency)
+        stream = _TaskStream(self.store, "binance_usdt_spot", symbol, frequency)
         cursor_ms = _milliseconds(start)
         end_ms = _milliseconds(end)
-        rows: list[Bar] = []
         while cursor_ms < end_ms:
+            if stopped():
+                stream.abandon()
+                return None
             if not self._check_wall_clock():
-                return FetchResult(rows, error="max_wall_clock_exceeded")
+                return FetchResult(error="max_wall_clock_exceeded", stream=stream)
             query = urlencode(
                 {
                     "symbol": symbol,
@@ -682,22 +841,26 @@ class CorpusBuilder:
                 }
             )
             try:
-                response = self.client.get_json(
+                response = await self._get_page(
                     "binance_usdt_spot", f"{BINANCE_KLINES_URL}?{query}"
                 )
             except RequestBudgetExceeded:
                 return FetchResult(
-                    rows, error="request_budget_exhausted", budget_exhausted=True
+                    error="request_budget_exhausted",
+                    budget_exhausted=True,
+                    stream=stream,
                 )
             self._append_progress("FETCH_BINANCE")
             if not response.ok:
                 return FetchResult(
-                    rows,
                     error=_response_error(response),
                     rate_limited=response.rate_limited,
+                    stream=stream,
                 )
             if not isinstance(response.payload, list):
-                return FetchResult(rows, error="binance_klines_non_list_payload")
+                return FetchResult(
+                    error="binance_klines_non_list_payload", stream=stream
+                )
             if not response.payload:
                 break
             try:
@@ -706,46 +869,23 @@ class CorpusBuilder:
                     for item in response.payload
                 ]
             except (IndexError, TypeError, ValueError, SourceDataError) as exc:
-                return FetchResult([], error=f"binance_normalization_failed:{exc}")
-            rows.extend(
-                bar
-                for bar in page
-                if _milliseconds(start) <= bar.open_ms < _milliseconds(end)
+                stream.abandon()
+                return FetchResult(error=f"binance_normalization_failed:{exc}")
+            failed = self._stream_page(
+                stream,
+                [bar for bar in page if _milliseconds(start) <= bar.open_ms < end_ms],
             )
+            if failed is not None:
+                return failed
             next_cursor = max(bar.open_ms for bar in page) + interval_ms
             if next_cursor <= cursor_ms:
-                return FetchResult(rows, error="binance_pagination_nonprogress")
+                return FetchResult(
+                    error="binance_pagination_nonprogress", stream=stream
+                )
             cursor_ms = next_cursor
             if len(page) < BINANCE_PAGE_SIZE:
                 break
-        return self._finalize_fetch(rows, symbol, frequency, start, end, interval_ms)
-
-    @staticmethod
-    def _finalize_fetch(
-        rows: list[Bar],
-        symbol: str,
-        frequency: str,
-        start: datetime,
-        end: datetime,
-        interval_ms: int,
-    ) -> FetchResult:
-        seen: set[int] = set()
-        for row in rows:
-            if row.open_ms in seen:
-                return FetchResult(
-                    [], error=f"duplicate_source_row:{symbol}@{row.open_ms}"
-                )
-            seen.add(row.open_ms)
-            if row.close_exclusive_ms - row.open_ms != interval_ms:
-                return FetchResult(
-                    [], error=f"interval_invariant_failed:{symbol}@{row.open_ms}"
-                )
-            if row.close_exclusive_ms > _milliseconds(end):
-                return FetchResult(
-                    [], error=f"unfinished_bar_rejected:{symbol}@{row.open_ms}"
-                )
-        rows.sort(key=lambda row: row.open_ms)
-        return FetchResult(rows)
+        return FetchResult(stream=stream)
 
     @staticmethod
     def _gap_ranges(
@@ -753,7 +893,7 @@ class CorpusBuilder:
         venue: str,
         symbol: str,
         frequency: str,
-        rows: list[Bar],
+        open_times: list[int],
         task_error: str | None,
     ) -> list[dict[str, Any]]:
         """Explicitly enumerate every missing source range; never fill one."""
@@ -772,20 +912,19 @@ class CorpusBuilder:
                     "reason": task_error,
                 }
             ]
-        sorted_rows = sorted(rows, key=lambda row: row.open_ms)
         gaps: list[dict[str, Any]] = []
         expected = start_ms
         first_observed = True
-        for row in sorted_rows:
-            if row.open_ms > expected:
+        for open_ms in sorted(open_times):
+            if open_ms > expected:
                 gaps.append(
                     {
                         "venue": venue,
                         "symbol": symbol,
                         "frequency": frequency,
                         "start_utc": utc_iso(_utc_from_ms(expected)),
-                        "end_utc": utc_iso(_utc_from_ms(row.open_ms)),
-                        "missing_bars": (row.open_ms - expected) // interval_ms,
+                        "end_utc": utc_iso(_utc_from_ms(open_ms)),
+                        "missing_bars": (open_ms - expected) // interval_ms,
                         "reason": (
                             "prelisting_or_unavailable_before_first_observed"
                             if first_observed
@@ -793,7 +932,7 @@ class CorpusBuilder:
                         ),
                     }
                 )
-            expected = max(expected, row.open_ms + interval_ms)
+            expected = max(expected, open_ms + interval_ms)
             first_observed = False
         if expected < end_ms:
             gaps.append(
@@ -806,22 +945,13 @@ class CorpusBuilder:
                     "missing_bars": (end_ms - expected) // interval_ms,
                     "reason": (
                         "source_empty"
-                        if not sorted_rows
+                        if not open_times
                         else "source_missing_after_last_observed"
                     ),
                 }
             )
         return gaps
 
-    @staticmethod
-    def _row_groups(rows: list[Bar]) -> dict[tuple[bool, int], list[Bar]]:
-        groups: dict[tuple[bool, int], list[Bar]] = defaultdict(list)
-        holdout_start_ms = _milliseconds(HOLDOUT_START)
-        for row in rows:
-            is_holdout = row.open_ms >= holdout_start_ms
-            groups[(is_holdout, _utc_from_ms(row.open_ms).year)].append(row)
-        return groups
-
     @staticmethod
     def _record_from_dict(payload: dict[str, Any]) -> FileRecord:
         return FileRecord(
@@ -851,31 +981,6 @@ class CorpusBuilder:
                 f"{known_bytes + candidate_bytes}>{MAX_ARTIFACT_BYTES}"
             )
 
-    def _stage_task_files(
-        self,
-        venue: str,
-        symbol: str,
-        frequency: str,
-        rows: list[Bar],
-    ) -> list[StagedFile]:
-        staged: list[StagedFile] = []
-        for (is_holdout, year), group in sorted(self._row_groups(rows).items()):
-            base = "holdout" if is_holdout else "dataset"
-            filename = f"{symbol}__{frequency}__{self.store._token()}.parquet"
-            relative = f"{base}/venue={venue}/year={year}/{filename}"
-            table = pa.Table.from_pylist(
-                [_bar_to_row(row) for row in group], schema=BAR_SCHEMA
-            )
-            staged.append(
-                self.store.stage_parquet(
-                    table,
-                    relative,
-                    is_holdout=is_holdout,
-                    venue=venue,
-                )
-            )
-        return staged
-
     def _receipt_payloads(self) -> list[dict[str, Any]]:
         return self.store.load_json_records(self.store.receipts)
 
@@ -915,28 +1020,40 @@ class CorpusBuilder:
     ) -> FileRecord:
         """Stage, record, atomically publish, then receipt one task result."""
         task_key = self._task_key(venue, symbol, frequency)
+        stream = result.stream
+        if stream is None:
+            stream = _TaskStream(self.store, venue, symbol, frequency)
+            if result.bars:
+                failed = self._stream_page(stream, result.bars)
+                if failed is not None:
+                    result = FetchResult(
+                        error=failed.error,
+                        rate_limited=result.rate_limited,
+                        budget_exhausted=result.budget_exhausted,
+                    )
+                    stream = _TaskStream(self.store, venue, symbol, frequency)
         gaps = self._gap_ranges(
             venue=venue,
             symbol=symbol,
             frequency=frequency,
-            rows=result.bars,
+            open_times=stream.open_times,
             task_error=result.error,
         )
         staged: list[StagedFile] = []
-        if result.bars:
+        if stream.row_count:
             try:
-                staged = self._stage_task_files(venue, symbol, frequency, result.bars)
+                staged = stream.close()
                 self._ensure_artifact_budget(staged)
             except (OSError, ValueError, SourceDataError) as exc:
                 # No partial result is promoted if its artifact cannot meet the
                 # cap/format contract.  The untouched staging partial remains
                 # as evidence; we never delete it.
-                result = FetchResult([], error=f"artifact_write_failed:{exc}")
+                result = FetchResult(error=f"artifact_write_failed:{exc}")
                 gaps = self._gap_ranges(
                     venue=venue,
                     symbol=symbol,
                     frequency=frequency,
-                    rows=[],
+                    open_times=[],
                     task_error=result.error,
                 )
                 staged = []
@@ -1458,6 +1575,65 @@ class CorpusBuilder:
         self._append_progress(f"TERMINAL_{terminal_verdict}", force=True)
         return manifest_record
 
+    async def _collect(
+        self, universe: dict[str, list[str]], completed: set[str]
+    ) -> str | None:
+        """Fetch and persist every open task; return the terminal reason, if any.
+
+        Each venue gets ``workers_per_venue`` workers draining its task queue
+        in the original symbol/frequency order.  The client still spaces the
+        *dispatch* of consecutive requests to a venue by that venue's minimum
+        interval and reserves every request against the shared cap, so the
+        workers only overlap network latency; they never raise the request
+        rate.  The first rate-limit, budget or wall-clock stop wins: every
+        worker stops before its next request, and a task it had in flight is
+        abandoned without a receipt so a resumed build fetches it again.
+        Receipts are written one at a time (inflight → publish → receipt), so
+        the artifact budget check always sees every earlier task.
+        """
+        stops: list[str] = []
+        persist_lock = asyncio.Lock()
+
+        async def worker(venue: str, queue: deque[tuple[str, str]]) -> None:
+            while queue and not stops:
+                symbol, frequency = queue.popleft()
+                if not self._check_wall_clock():
+                    stops.append("max_wall_clock_exceeded")
+                    return
+                fetch = (
+                    self._fetch_upbit if venue == "upbit_krw" else self._fetch_binance
+                )
+                result = await fetch(symbol, frequency, lambda: bool(stops))
+                if result is None:
+                    return
+                async with persist_lock:
+                    await asyncio.to_thread(
+                        self._persist_task,
+                        venue=venue,
+                        symbol=symbol,
+                        frequency=frequency,
+                        result=result,
+                    )
+                    completed.add(self._task_key(venue, symbol, frequency))
+                    self._completed = len(completed)
+                    self._append_progress("TASK_CHECKPOINT", force=True)
+                if result.rate_limited:
+                    stops.append("rate_limit_or_block_signal")
+                elif result.budget_exhausted:
+                    stops.append("request_budget_exhausted")
+
+        async with asyncio.TaskGroup() as group:
+            for venue in VENUES:
+                queue = deque(
+                    (symbol, frequency)
+                    for symbol in universe[venue]
+                    for frequency in ("1d", "1h")
+                    if self._task_key(venue, symbol, frequency) not in completed
+                )
+                for _ in range(self.workers_per_venue):
+                    group.create_task(worker(venue, queue))
+        return stops[0] if stops else None
+
     def run(self, *, preflight_only: bool = False) -> FileRecord | None:
         """Execute the gate and, only if it passes, the corpus collection."""
         preflight = self.preflight()
@@ -1491,50 +1667,8 @@ class CorpusBuilder:
         if probe_stop:
             terminal_reason = "delisted_probe_rate_limit_or_request_budget"
 
-        for venue in VENUES:
-            if terminal_reason:
-                break
-            for symbol in universe[venue]:
-                if terminal_reason:
-                    break
-                for frequency in ("1d", "1h"):
-                    key = self._task_key(venue, symbol, frequency)
-                    if key in completed:
-                        continue
-                    if not self._check_wall_clock():
-                        terminal_reason = "max_wall_clock_exceeded"
-                        break
-                    result = (
-                        self._fetch_upbit(symbol, frequency)
-                        if venue == "upbit_krw"
-                        else self._fetch_binance(symbol, frequency)
-                    )
-                    # A failed page can arrive after valid pages.  Validate the
-                    # retained rows before publishing even that partial result.
-                    if result.bars:
-                        start, end, interval_ms = _task_window(venue, frequency)
-                        clean = self._finalize_fetch(
-                            result.bars, symbol, frequency, start, end, interval_ms
-                        )
-                        if clean.error:
-                            result = clean
-                        else:
-                            result.bars = clean.bars
-                    self._persist_task(
-                        venue=venue,
-                        symbol=symbol,
-                        frequency=frequency,
-                        result=result,
-                    )
-                    completed.add(key)
-                    self._completed = len(completed)
-                    self._append_progress("TASK_CHECKPOINT", force=True)
-                    if result.rate_limited:
-                        terminal_reason = "rate_limit_or_block_signal"
-                        break
-                    if result.budget_exhausted:
-                        terminal_reason = "request_budget_exhausted"
-                        break
+        if not terminal_reason:
+            terminal_reason = asyncio.run(self._collect(universe, completed))
 
         receipts = self._receipt_payloads()
         has_gaps = any(receipt.get("gaps") for receipt in receipts)
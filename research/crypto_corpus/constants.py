@@ -28,6 +28,10 @@ MAX_WALL_CLOCK_SECONDS = 12 * 60 * 60
 MAX_ARTIFACT_BYTES = 15 * 1024 * 1024 * 1024
 UPBIT_MIN_REQUEST_INTERVAL_SECONDS = 0.3
 BINANCE_MIN_REQUEST_INTERVAL_SECONDS = 0.25
+# Concurrent fetch workers per venue.  Dispatch stays spaced by the minimum
+# intervals above, so this overlaps response latency without raising the
+# request rate.
+FETCH_WORKERS_PER_VENUE = 2
 
 CUTOFF_END = datetime(2026, 8, 1, tzinfo=UTC)  # exclusive
 HOLDOUT_START = datetime(2025, 1, 1, tzinfo=UTC)
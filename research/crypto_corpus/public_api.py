@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -15,6 +16,7 @@ from .constants import (
     BINANCE_MIN_REQUEST_INTERVAL_SECONDS,
     MAX_REQUESTS,
     UPBIT_MIN_REQUEST_INTERVAL_SECONDS,
+    VENUES,
 )
 
 
@@ -54,11 +56,16 @@ def _default_open(request: Request, timeout_seconds: float) -> tuple[int, bytes]
 
 
 class PublicApiClient:
-    """A sequential, append-logged public-data client.
+    """A paced, append-logged public-data client.
 
     It intentionally has no credential input, no environment lookup, and no
     retry path.  A rate-limit or block signal is surfaced to the builder so it
     can checkpoint and terminate honestly instead of increasing speed.
+
+    ``get_json`` is safe to call from several threads: request *dispatch* is
+    serialized per venue so consecutive requests to one venue are still spaced
+    by its minimum interval, while the request-cap check, the request-log
+    append and the counter increment happen atomically under one lock.
     """
 
     def __init__(
@@ -77,6 +84,8 @@ class PublicApiClient:
         self.timeout_seconds = timeout_seconds
         self._last_request_at: dict[str, float] = {}
         self._requests_actual = self._count_existing_request_log()
+        self._budget_lock = threading.Lock()
+        self._pacing_locks = {venue: threading.Lock() for venue in VENUES}
 
     @property
     def requests_actual(self) -> int:
@@ -98,24 +107,32 @@ class PublicApiClient:
         raise ValueError(f"unsupported public venue {venue!r}")
 
     def _reserve_request(self, venue: str, url: str) -> None:
-        if self._requests_actual >= MAX_REQUESTS:
-            raise RequestBudgetExceeded(
-                f"request cap {MAX_REQUESTS} reached before {venue} request"
-            )
-        previous = self._last_request_at.get(venue)
-        now = self.monotonic()
-        if previous is not None:
-            remaining = self._minimum_interval(venue) - (now - previous)
-            if remaining > 0:
-                self.sleep(remaining)
-        self._last_request_at[venue] = self.monotonic()
-        # The append happens *before* I/O.  A crash in flight can overcount by
-        # one request, which is conservative and never weakens the cap.
-        self.store.append_jsonl(
-            "control/request-log.jsonl",
-            {"venue": venue, "url": url, "request_number": self._requests_actual + 1},
-        )
-        self._requests_actual += 1
+        interval = self._minimum_interval(venue)
+        with self._pacing_locks[venue]:
+            previous = self._last_request_at.get(venue)
+            now = self.monotonic()
+            if previous is not None:
+                remaining = interval - (now - previous)
+                if remaining > 0:
+                    self.sleep(remaining)
+            with self._budget_lock:
+                if self._requests_actual >= MAX_REQUESTS:
+                    raise RequestBudgetExceeded(
+                        f"request cap {MAX_REQUESTS} reached before {venue} request"
+                    )
+                # The append happens *before* I/O.  A crash in flight can
+                # overcount by one request, which is conservative and never
+                # weakens the cap.
+                self.store.append_jsonl(
+                    "control/request-log.jsonl",
+                    {
+                        "venue": venue,
+                        "url": url,
+                        "request_number": self._requests_actual + 1,
+                    },
+                )
+                self._requests_actual += 1
+            self._last_request_at[venue] = self.monotonic()
 
     @staticmethod
     def _is_rate_limited(status: int | None, body: bytes) -> bool:
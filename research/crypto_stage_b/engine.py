@@ -8,7 +8,7 @@ pre-registered ablation through the same calendar-day execution implementation.
 from __future__ import annotations
 
 import math
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, replace
 from datetime import date, timedelta
@@ -16,7 +16,12 @@ from statistics import fmean
 from typing import Literal
 
 from .contracts import CryptoStageBRunContract
-from .signals import Arm, SignalEvaluation, evaluate_signal
+from .signals import (
+    Arm,
+    SignalEvaluation,
+    evaluate_contiguous_signal,
+    evaluate_signal,
+)
 from .source import BoundaryAccessSpy, CryptoStageBInputError, DailyBar, DailyBarSource
 
 __all__ = [
@@ -210,6 +215,10 @@ def run_execution_arm(
     observations: list[SignalEvaluation] = []
     signals_by_session: dict[date, list[SignalEvaluation]] = defaultdict(list)
     symbols = spy.symbols(contract.venue)
+    windows = {
+        symbol: _HistoryWindow(contract.candidate.required_history_days)
+        for symbol in symbols
+    }
 
     for session in _date_range(contract.exploration_start, contract.exploration_end):
         for symbol in symbols:
@@ -219,6 +228,7 @@ def run_execution_arm(
                 symbol=symbol,
                 signal_session=session,
                 arm=arm,
+                window=windows[symbol],
             )
             observations.append(observation)
             if observation.signal:
@@ -295,6 +305,39 @@ def run_execution_arm(
     )
 
 
+class _HistoryWindow:
+    """One symbol's trailing ``required_history_days`` bars, advanced daily.
+
+    The window holds point-read, key-checked bars for consecutive UTC days, so
+    venue/symbol identity and continuity hold by construction; only the count
+    of missing days is tracked as the window slides.
+    """
+
+    __slots__ = ("bars", "end", "missing")
+
+    def __init__(self, days: int) -> None:
+        self.bars: deque[DailyBar | None] = deque(maxlen=days)
+        self.end: date | None = None
+        self.missing = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.bars) == self.bars.maxlen
+
+    def push(self, session: date, bar: DailyBar | None) -> None:
+        if self.full and self.bars[0] is None:
+            self.missing -= 1
+        self.bars.append(bar)
+        if bar is None:
+            self.missing += 1
+        self.end = session
+
+    def reset(self) -> None:
+        self.bars.clear()
+        self.end = None
+        self.missing = 0
+
+
 def _evaluate_symbol_day(
     *,
     spy: BoundaryAccessSpy,
@@ -302,6 +345,7 @@ def _evaluate_symbol_day(
     symbol: str,
     signal_session: date,
     arm: Arm,
+    window: _HistoryWindow,
 ) -> SignalEvaluation:
     history_start = signal_session - timedelta(
         days=contract.candidate.required_history_days - 1
@@ -320,11 +364,25 @@ def _evaluate_symbol_day(
             stages={},
             metrics={},
         )
-    history = tuple(
-        _read_expected_bar(spy, contract.venue, symbol, session)
-        for session in _date_range(history_start, signal_session)
-    )
-    evaluated = evaluate_signal(contract.candidate, history, arm=arm)
+    previous_session = signal_session - timedelta(days=1)
+    if window.full and window.end == previous_session:
+        # Slide by one day. The audit still lists every history day as read,
+        # in the same order as a full re-read of the window would.
+        spy.replay_bar_reads(contract.venue, symbol, history_start, previous_session)
+        window.push(
+            signal_session,
+            _read_expected_bar(spy, contract.venue, symbol, signal_session),
+        )
+    else:
+        window.reset()
+        for session in _date_range(history_start, signal_session):
+            window.push(
+                session, _read_expected_bar(spy, contract.venue, symbol, session)
+            )
+    if window.missing:
+        evaluated = evaluate_signal(contract.candidate, tuple(window.bars), arm=arm)
+    else:
+        evaluated = evaluate_contiguous_signal(contract.candidate, window.bars, arm=arm)
     # A missing final bar has no identity inside the signal helper.  The
     # engine restores the requested symbol-day so exclusions remain auditable.
     return replace(
@@ -20,6 +20,7 @@ from .source import DailyBar
 __all__ = [
     "Arm",
     "SignalEvaluation",
+    "evaluate_contiguous_signal",
     "evaluate_signal",
     "nearest_rank_quantile",
 ]
@@ -98,6 +99,33 @@ def evaluate_signal(
         )
 
     bars = tuple(bar for bar in history if bar is not None)
+    return _evaluate_bars(candidate, bars, arm=arm)
+
+
+def evaluate_contiguous_signal(
+    candidate: CandidateDefinition,
+    bars: Sequence[DailyBar],
+    *,
+    arm: Arm,
+) -> SignalEvaluation:
+    """``evaluate_signal`` for a history the caller has already validated.
+
+    The caller guarantees what ``_history_problem`` checks: exactly
+    ``required_history_days`` present bars of one venue/symbol on consecutive
+    UTC days. The engine's rolling window carries that proof incrementally, so
+    the per-day re-scan is skipped; the evaluation itself is the same code.
+    """
+    if arm not in {"full", "ablation"}:
+        raise ValueError(f"unsupported signal arm: {arm!r}")
+    return _evaluate_bars(candidate, tuple(bars), arm=arm)
+
+
+def _evaluate_bars(
+    candidate: CandidateDefinition,
+    bars: tuple[DailyBar, ...],
+    *,
+    arm: Arm,
+) -> SignalEvaluation:
     if candidate.strategy_id == "CR-SPOT-ETR-01":
         return _evaluate_etr(candidate, bars, arm=arm)
     if candidate.strategy_id == "CR-SPOT-TPR-01":
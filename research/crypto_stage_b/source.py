@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
@@ -163,6 +163,26 @@ class InMemoryDailyBarSource:
         return self._events.get((venue, symbol, session))
 
 
+@dataclass(frozen=True)
+class _ReplayedBarReads:
+    """Consecutive in-boundary bar reads kept as one entry, expanded on demand."""
+
+    venue: str
+    symbol: str
+    start: date
+    days: int
+
+    def expand(self) -> Iterator[AccessRecord]:
+        for offset in range(self.days):
+            yield AccessRecord(
+                kind="bar",
+                venue=self.venue,
+                symbol=self.symbol,
+                session=self.start + timedelta(days=offset),
+                allowed=True,
+            )
+
+
 class BoundaryAccessSpy:
     """Wrap a source and fail before every read outside an explicit UTC window."""
 
@@ -178,7 +198,9 @@ class BoundaryAccessSpy:
         self._source = source
         self._start = exploration_start
         self._end = exploration_end
-        self._records: list[AccessRecord] = []
+        self._records: list[AccessRecord | _ReplayedBarReads] = []
+        self._counts = {"bar": 0, "terminal_event": 0}
+        self._outside: list[AccessRecord] = []
 
     def symbols(self, venue: str) -> tuple[str, ...]:
         return self._source.symbols(venue)
@@ -187,6 +209,27 @@ class BoundaryAccessSpy:
         self._record_or_refuse("bar", venue, symbol, session)
         return self._source.get(venue, symbol, session)
 
+    def replay_bar_reads(self, venue: str, symbol: str, start: date, end: date) -> None:
+        """Record bar reads for ``start..end`` served from bars already read here.
+
+        A caller that keeps a rolling window of bars it fetched through
+        :meth:`get` re-reads them from memory; the audit still lists one bar
+        read per day, exactly as if each had been fetched again. A range that
+        leaves the boundary is recorded day by day so the refusal happens at
+        the same first outside day as a point read would.
+        """
+        if start > end:
+            return
+        if not (self._start <= start and end <= self._end):
+            session = start
+            while session <= end:
+                self._record_or_refuse("bar", venue, symbol, session)
+                session += timedelta(days=1)
+            return
+        days = (end - start).days + 1
+        self._records.append(_ReplayedBarReads(venue, symbol, start, days))
+        self._counts["bar"] += days
+
     def terminal_event(
         self, venue: str, symbol: str, session: date
     ) -> TerminalEvent | None:
@@ -195,11 +238,17 @@ class BoundaryAccessSpy:
 
     @property
     def records(self) -> tuple[AccessRecord, ...]:
-        return tuple(self._records)
+        expanded: list[AccessRecord] = []
+        for entry in self._records:
+            if isinstance(entry, _ReplayedBarReads):
+                expanded.extend(entry.expand())
+            else:
+                expanded.append(entry)
+        return tuple(expanded)
 
     @property
     def outside_boundary_records(self) -> tuple[AccessRecord, ...]:
-        return tuple(record for record in self._records if not record.allowed)
+        return tuple(self._outside)
 
     def assert_no_outside_access(self) -> None:
         outside = self.outside_boundary_records
@@ -211,12 +260,10 @@ class BoundaryAccessSpy:
 
     def summary(self) -> dict[str, int]:
         return {
-            "reads_total": len(self._records),
-            "bar_reads": sum(record.kind == "bar" for record in self._records),
-            "terminal_event_reads": sum(
-                record.kind == "terminal_event" for record in self._records
-            ),
-            "outside_boundary_reads": len(self.outside_boundary_records),
+            "reads_total": self._counts["bar"] + self._counts["terminal_event"],
+            "bar_reads": self._counts["bar"],
+            "terminal_event_reads": self._counts["terminal_event"],
+            "outside_boundary_reads": len(self._outside),
         }
 
     def _record_or_refuse(
@@ -231,7 +278,9 @@ class BoundaryAccessSpy:
             allowed=allowed,
         )
         self._records.append(record)
+        self._counts[kind] += 1
         if not allowed:
+            self._outside.append(record)
             raise ExplorationBoundaryAccessError(
                 f"{kind} read outside exploration boundary: {session.isoformat()} "
                 f"not in {self._start.isoformat()}..{self._end.isoformat()}"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
 import pyarrow as pa
@@ -9,9 +9,13 @@ import pytest
 from research.crypto_corpus.loader import LabeledCorpus
 from research.crypto_corpus.policy import venue_policy
 from research.crypto_stage_b.source import (
+    BoundaryAccessSpy,
     CryptoStageBInputError,
+    ExplorationBoundaryAccessError,
+    InMemoryDailyBarSource,
     source_from_labeled_corpus,
 )
+from research.crypto_stage_b.tests.conftest import etr_bars
 
 
 def _corpus(
@@ -63,3 +67,27 @@ def test_labeled_corpus_adapter_refuses_outside_window_or_xsec_intent() -> None:
             exploration_start=date(2024, 1, 1),
             exploration_end=date(2024, 1, 1),
         )
+
+
+def test_replayed_bar_reads_audit_exactly_like_point_reads() -> None:
+    source = InMemoryDailyBarSource(etr_bars())
+    start = date(2024, 1, 1)
+    end = start + timedelta(days=9)
+    fetched = BoundaryAccessSpy(source, exploration_start=start, exploration_end=end)
+    replayed = BoundaryAccessSpy(source, exploration_start=start, exploration_end=end)
+    for offset in range(3):
+        fetched.get("upbit_krw", "TEST", start + timedelta(days=offset))
+        replayed.get("upbit_krw", "TEST", start + timedelta(days=offset))
+    for offset in range(1, 4):
+        fetched.get("upbit_krw", "TEST", start + timedelta(days=offset))
+    replayed.replay_bar_reads(
+        "upbit_krw", "TEST", start + timedelta(days=1), start + timedelta(days=3)
+    )
+
+    assert replayed.records == fetched.records
+    assert replayed.summary() == fetched.summary()
+
+    with pytest.raises(ExplorationBoundaryAccessError, match="outside exploration"):
+        replayed.replay_bar_reads("upbit_krw", "TEST", end, end + timedelta(days=2))
+    assert len(replayed.outside_boundary_records) == 1
+    assert replayed.records[-2].session == end
@@ -9,11 +9,11 @@ from pathlib import Path
 CONTRACT_VERSION = "intraday-harness-v2.0.0"
 _ROOT = Path(__file__).resolve().parent
 _SELF_HASH_PLACEHOLDER = "__SELF_SHA256_PLACEHOLDER__"
-_SELF_HASH_EXPECTED = "70f20c166673304a01a5e21ef1faa07b533b65e46f1ae265d0a591bdc2c8db49"
+_SELF_HASH_EXPECTED = "babfdf96378c49b88af1d099290af61e0f666103be4483fe138a108594b83dc9"
 
 # These pins deliberately cover executable enforcement, not just this text.
 _ENFORCEMENT_SHA256 = {
-    "engine.py": "e2e89fc2fd5f41bde9a473691c06743dbfd4eb56f6a5539296f5bd0ca5a342a3",
+    "engine.py": "806a34f613bd8b0ddd3a57867bec260580a7fef614017962d9f021b94430a5b7",
     "__init__.py": "0b8f73cd56a274f84fa2da3cea64dd2b4cef0bea1c22165af166a22a481b62f2",
     "contract.py": _SELF_HASH_EXPECTED,
 }
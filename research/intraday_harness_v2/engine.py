@@ -6,8 +6,9 @@ signal's close timestamp; callers cannot supply a bar or a fill price.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import StrEnum
@@ -60,22 +61,50 @@ class Bar:
 
 @dataclass(frozen=True, slots=True)
 class BarSeries:
+    """Bars indexed once: O(1) key lookup and per-symbol sorted open times."""
+
     bars: tuple[Bar, ...]
+    _by_key: Mapping[tuple[str, datetime], Bar] = field(
+        init=False, repr=False, compare=False
+    )
+    _by_symbol: Mapping[str, tuple[tuple[datetime, ...], tuple[Bar, ...]]] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        keys = [(bar.symbol, bar.open_time) for bar in self.bars]
-        if len(keys) != len(set(keys)):
-            raise ValueError("duplicate symbol/open_time bars are forbidden")
+        by_key: dict[tuple[str, datetime], Bar] = {}
+        grouped: dict[str, list[Bar]] = {}
+        for bar in self.bars:
+            key = (bar.symbol, bar.open_time)
+            if key in by_key:
+                raise ValueError("duplicate symbol/open_time bars are forbidden")
+            by_key[key] = bar
+            grouped.setdefault(bar.symbol, []).append(bar)
+        by_symbol: dict[str, tuple[tuple[datetime, ...], tuple[Bar, ...]]] = {}
+        for symbol, symbol_bars in grouped.items():
+            symbol_bars.sort(key=lambda bar: bar.open_time)
+            by_symbol[symbol] = (
+                tuple(bar.open_time for bar in symbol_bars),
+                tuple(symbol_bars),
+            )
+        object.__setattr__(self, "_by_key", by_key)
+        object.__setattr__(self, "_by_symbol", by_symbol)
 
     @classmethod
     def from_iterable(cls, bars: Iterable[Bar]) -> BarSeries:
         return cls(tuple(sorted(bars, key=lambda bar: (bar.symbol, bar.open_time))))
 
-    def _by_key(self) -> Mapping[tuple[str, datetime], Bar]:
-        return {(bar.symbol, bar.open_time): bar for bar in self.bars}
-
     def get(self, symbol: str, open_time: datetime) -> Bar | None:
-        return self._by_key().get((symbol, open_time))
+        return self._by_key.get((symbol, open_time))
+
+    def first_at_or_after(self, symbol: str, moment: datetime) -> Bar | None:
+        """Earliest ``symbol`` bar opening at or after ``moment`` (bisect)."""
+        indexed = self._by_symbol.get(symbol)
+        if indexed is None:
+            return None
+        open_times, symbol_bars = indexed
+        position = bisect_left(open_times, moment)
+        return symbol_bars[position] if position < len(symbol_bars) else None
 
 
 @dataclass(frozen=True, slots=True)
@@ -170,17 +199,11 @@ def run(
             continue
         next_bar = bars.get(signal.symbol, signal.bar_close_time)
         if next_bar is None:
-            later_bars = tuple(
-                bar
-                for bar in bars.bars
-                if bar.symbol == signal.symbol
-                and bar.open_time >= signal.bar_close_time
-            )
+            later_bar = bars.first_at_or_after(signal.symbol, signal.bar_close_time)
             reason = (
                 IncompleteReason.NEXT_BAR_SESSION_GAP
-                if later_bars
-                and min(later_bars, key=lambda bar: bar.open_time).open_time.date()
-                != signal.bar_close_time.date()
+                if later_bar is not None
+                and later_bar.open_time.date() != signal.bar_close_time.date()
                 else IncompleteReason.NEXT_BAR_MISSING
             )
             fills.append(_incomplete(signal, reason))
@@ -200,3 +200,52 @@ def test_negative_cost_model_is_rejected():
             fee_bps=-1,
             slippage_bps=0,
         )
+
+
+def test_indexed_lookups_classify_gaps_per_symbol_on_unsorted_input():
+    other = Bar(
+        "XYZ",
+        T0 + 2 * INTERVAL,
+        T0 + 3 * INTERVAL,
+        Decimal("50"),
+        Decimal("51"),
+        Decimal("49"),
+        Decimal("50"),
+    )
+    next_day = Bar(
+        "ABC",
+        datetime(2026, 1, 3, 10, 0, tzinfo=UTC),
+        datetime(2026, 1, 3, 10, 5, tzinfo=UTC),
+        Decimal("101"),
+        Decimal("103"),
+        Decimal("99"),
+        Decimal("102"),
+    )
+    # Constructed directly, not via from_iterable, so bars are not sorted.
+    bars = BarSeries((next_day, other, bar(3), bar(0)))
+
+    assert bars.get("ABC", T0) == bar(0)
+    assert bars.first_at_or_after("ABC", T0 + INTERVAL) == bar(3)
+    assert bars.first_at_or_after("ABC", T0 + 4 * INTERVAL) == next_day
+    assert bars.first_at_or_after("NONE", T0) is None
+
+    result = run(
+        [
+            signal(),
+            Signal("ABC", T0 + 4 * INTERVAL, Side.SELL, Decimal("1"), INTERVAL),
+            Signal("XYZ", T0 + 3 * INTERVAL, Side.BUY, Decimal("1"), INTERVAL),
+        ],
+        bars,
+        fee_bps=0,
+        slippage_bps=0,
+    )
+    assert [fill.incomplete_reason for fill in result.fills] == [
+        IncompleteReason.NEXT_BAR_MISSING,
+        IncompleteReason.NEXT_BAR_SESSION_GAP,
+        IncompleteReason.NEXT_BAR_MISSING,
+    ]
+
+
+def test_duplicate_bars_are_rejected():
+    with pytest.raises(ValueError, match="duplicate"):
+        BarSeries((bar(0), bar(0, open_price="100")))
@@ -5,6 +5,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 _HERE = Path(__file__).resolve().parent
 _REPO_ROOT = _HERE.parent.parent.parent  # .../auto_trader.<worktree>
 
@@ -15,3 +17,14 @@ assert _REPO_ROOT.joinpath("research_contracts").is_dir(), (
 for _p in (str(_HERE), str(_REPO_ROOT)):
     if _p not in sys.path:
         sys.path.insert(0, _p)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_verification_memo(tmp_path, monkeypatch):
+    """Keep shard verification memos per test, never in the user cache."""
+    import loader
+
+    monkeypatch.setenv(loader.VERIFY_MEMO_ENV, str(tmp_path / "verified.json"))
+    loader.clear_verification_memo()
+    yield
+    loader.clear_verification_memo()
@@ -17,6 +17,18 @@ Loader public entrypoints (complete enumeration — keep this list honest):
    date/partition-year gate on every entry ``year`` before return.
 2. ``load_shard`` — path gate (root + relative + resolved); partition-year
    gate **before** byte read; window date gate; row session_date gate after parse.
+3. ``load_shards`` — ``load_shard`` for many entries on a thread pool; every
+   entry passes through the full ``load_shard`` gate sequence.
+
+Verification memo: a shard is identified by its stat stamp (resolved path,
+size, mtime_ns, ctime_ns, inode) plus the manifest SHA-256. The first open —
+or any open after the stamp changes — hashes and parses the same in-memory
+bytes as before. Afterwards the on-disk memo (``$KR_CORPUS_VERIFY_MEMO``,
+default ``~/.cache/auto_trader/kr_corpus_verified_shards.json``) lets a new
+process skip the re-hash, and the process-local memo hands the already
+decoded, validated Arrow table to every later run of a sweep. The stamp is
+taken from the open file descriptor and re-checked after the read, so a file
+replaced mid-read is always fully re-verified.
 
 Internal helpers (not public, but always dual-gated when used):
 
@@ -30,8 +42,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal
 
@@ -62,8 +81,10 @@ __all__ = [
     "PathEscapesArtifactRootError",
     "RowCountMismatchError",
     "ShardFileMissingError",
+    "clear_verification_memo",
     "load_manifest",
     "load_shard",
+    "load_shards",
     "sha256_bytes",
 ]
 
@@ -72,8 +93,16 @@ __all__ = [
 LOADER_ENTRYPOINTS: tuple[str, ...] = (
     "load_manifest",
     "load_shard",
+    "load_shards",
 )
 
+VERIFY_MEMO_ENV = "KR_CORPUS_VERIFY_MEMO"
+_DEFAULT_VERIFY_MEMO = "~/.cache/auto_trader/kr_corpus_verified_shards.json"
+# Decoded tables kept for reuse across the runs of a sweep (LRU by nbytes).
+_TABLE_MEMO_MAX_BYTES = 1 << 30
+_LOAD_WORKERS = 8
+_VERIFY_MEMO_MAX_ENTRIES = 20_000
+
 DatasetName = Literal["ohlcv", "membership"]
 
 
@@ -133,6 +162,114 @@ def sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+_ShardStamp = tuple[str, int, int, int, int]
+
+_memo_lock = threading.Lock()
+_table_memo: OrderedDict[tuple[object, ...], pa.Table] = OrderedDict()
+_table_memo_bytes = 0
+_verified_on_disk: dict[str, str] | None = None
+_verified_dirty = False
+
+
+def _stamp(path: Path, st: os.stat_result) -> _ShardStamp:
+    return (str(path), st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+
+def _verify_memo_path() -> Path:
+    return Path(os.environ.get(VERIFY_MEMO_ENV) or _DEFAULT_VERIFY_MEMO).expanduser()
+
+
+def _verified_digests() -> dict[str, str]:
+    """Stamp -> SHA-256 pairs already verified by some process (lock held)."""
+    global _verified_on_disk
+    if _verified_on_disk is None:
+        try:
+            raw = json.loads(_verify_memo_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raw = {}
+        _verified_on_disk = (
+            {str(k): str(v) for k, v in raw.items()} if isinstance(raw, dict) else {}
+        )
+    return _verified_on_disk
+
+
+def _is_verified(stamp: _ShardStamp, file_sha256: str) -> bool:
+    with _memo_lock:
+        return _verified_digests().get(json.dumps(stamp)) == file_sha256
+
+
+def _record_verified(stamp: _ShardStamp, file_sha256: str) -> None:
+    global _verified_dirty
+    with _memo_lock:
+        digests = _verified_digests()
+        digests[json.dumps(stamp)] = file_sha256
+        while len(digests) > _VERIFY_MEMO_MAX_ENTRIES:
+            del digests[next(iter(digests))]
+        _verified_dirty = True
+
+
+def _flush_verified() -> None:
+    """Persist newly verified stamps (atomic replace; best effort)."""
+    global _verified_dirty
+    with _memo_lock:
+        if not _verified_dirty or _verified_on_disk is None:
+            return
+        _verified_dirty = False
+        path = _verify_memo_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(_verified_on_disk, fh)
+            os.replace(tmp, path)
+        except OSError:
+            # The memo is an optimization only; the next process re-hashes.
+            pass
+
+
+def _memo_get(key: tuple[object, ...]) -> pa.Table | None:
+    with _memo_lock:
+        table = _table_memo.get(key)
+        if table is not None:
+            _table_memo.move_to_end(key)
+        return table
+
+
+def _memo_put(key: tuple[object, ...], table: pa.Table) -> None:
+    global _table_memo_bytes
+    with _memo_lock:
+        if key in _table_memo or table.nbytes > _TABLE_MEMO_MAX_BYTES:
+            return
+        _table_memo[key] = table
+        _table_memo_bytes += table.nbytes
+        while _table_memo_bytes > _TABLE_MEMO_MAX_BYTES:
+            _, evicted = _table_memo.popitem(last=False)
+            _table_memo_bytes -= evicted.nbytes
+
+
+def clear_verification_memo() -> None:
+    """Drop the process-local memo (decoded tables + loaded on-disk digests)."""
+    global _table_memo_bytes, _verified_on_disk, _verified_dirty
+    with _memo_lock:
+        _table_memo.clear()
+        _table_memo_bytes = 0
+        _verified_on_disk = None
+        _verified_dirty = False
+
+
+def _read_stamped(path: Path) -> tuple[bytes, _ShardStamp]:
+    """Read all bytes and the stamp of the inode they came from."""
+    with path.open("rb") as fh:
+        before = _stamp(path, os.fstat(fh.fileno()))
+        data = fh.read()
+        after = _stamp(path, os.fstat(fh.fileno()))
+    if before != after or len(data) != before[1]:
+        raise LoaderError(f"shard {path} changed while being read — retry the load")
+    return data, before
+
+
 def _resolve_within_root(
     artifact_root: Path,
     relative_path: str,
@@ -228,7 +365,32 @@ def load_shard(
     4. parquet parse + schema + row-count
     5. row session_date holdout gate
     6. caller / default exploration window date gate
+
+    Steps 3-5 run once per shard stamp; see the module docstring for the
+    verification memo. Gates 1, 2 and 6 run on every call.
     """
+    try:
+        return _load_shard(
+            artifact_root,
+            entry,
+            allowed_window_start=allowed_window_start,
+            allowed_window_end=allowed_window_end,
+            corpus=corpus,
+            holdout_policy=holdout_policy,
+        )
+    finally:
+        _flush_verified()
+
+
+def _load_shard(
+    artifact_root: Path | str,
+    entry: ManifestEntry,
+    *,
+    allowed_window_start: date | str | None,
+    allowed_window_end: date | str | None,
+    corpus: CorpusKind,
+    holdout_policy: HoldoutPolicy,
+) -> pa.Table:
     # Date gate first — refuse holdout partition years without opening files.
     assert_partition_year_not_holdout(entry.year, policy=holdout_policy)
 
@@ -241,15 +403,48 @@ def load_shard(
     if not path.is_file():
         raise ShardFileMissingError(f"shard file missing at {path}")
 
-    # Single in-memory buffer: hash and parse the SAME bytes (no TOCTOU).
-    data = path.read_bytes()
-    actual_sha = sha256_bytes(data)
-    if actual_sha != entry.file_sha256:
-        raise ManifestShaMismatchError(
-            f"SHA-256 mismatch for {entry.relative_path!r}: "
-            f"manifest={entry.file_sha256} actual={actual_sha} — read refused"
+    memo_facts = (entry.file_sha256, entry.row_count, entry.dataset, corpus)
+    table = _memo_get((_stamp(path, path.stat()), *memo_facts, holdout_policy))
+    if table is None:
+        table, stamp = _verify_and_decode(path, entry, corpus, holdout_policy)
+        _memo_put((stamp, *memo_facts, holdout_policy), table)
+
+    # Optional caller window: still dual-gated against holdout.
+    if allowed_window_start is not None and allowed_window_end is not None:
+        assert_range_not_holdout(
+            allowed_window_start,
+            allowed_window_end,
+            policy=holdout_policy,
+        )
+    else:
+        # Default exploration window — never opens holdout by accident.
+        assert_range_not_holdout(
+            EXPLORATION_WINDOW.start,
+            EXPLORATION_WINDOW.end,
+            policy=holdout_policy,
         )
 
+    return table
+
+
+def _verify_and_decode(
+    path: Path,
+    entry: ManifestEntry,
+    corpus: CorpusKind,
+    holdout_policy: HoldoutPolicy,
+) -> tuple[pa.Table, _ShardStamp]:
+    """SHA gate (unless memoized for this exact stamp), parse, schema, rows."""
+    # Single in-memory buffer: hash and parse the SAME bytes (no TOCTOU).
+    data, stamp = _read_stamped(path)
+    if not _is_verified(stamp, entry.file_sha256):
+        actual_sha = sha256_bytes(data)
+        if actual_sha != entry.file_sha256:
+            raise ManifestShaMismatchError(
+                f"SHA-256 mismatch for {entry.relative_path!r}: "
+                f"manifest={entry.file_sha256} actual={actual_sha} — read refused"
+            )
+        _record_verified(stamp, actual_sha)
+
     table = pq.read_table(pa.BufferReader(data))
     try:
         validate_table_schema(table, entry.dataset, corpus=corpus)
@@ -268,23 +463,41 @@ def load_shard(
         corpus=corpus,
         dataset=entry.dataset,
     )
+    return table, stamp
 
-    # Optional caller window: still dual-gated against holdout.
-    if allowed_window_start is not None and allowed_window_end is not None:
-        assert_range_not_holdout(
-            allowed_window_start,
-            allowed_window_end,
-            policy=holdout_policy,
-        )
-    else:
-        # Default exploration window — never opens holdout by accident.
-        assert_range_not_holdout(
-            EXPLORATION_WINDOW.start,
-            EXPLORATION_WINDOW.end,
-            policy=holdout_policy,
-        )
 
-    return table
+def load_shards(
+    artifact_root: Path | str,
+    entries: Iterable[ManifestEntry],
+    *,
+    allowed_window_start: date | str | None = None,
+    allowed_window_end: date | str | None = None,
+    corpus: CorpusKind = CorpusKind.KR_V1,
+    holdout_policy: HoldoutPolicy = DEFAULT_HOLDOUT_POLICY,
+    max_workers: int = _LOAD_WORKERS,
+) -> list[pa.Table]:
+    """``load_shard`` every entry on a thread pool; results keep entry order.
+
+    Hashing and parquet decoding release the GIL, so shards verify in
+    parallel. The first failing entry (in manifest order) is re-raised.
+    """
+    entries = list(entries)
+    load = partial(
+        _load_shard,
+        artifact_root,
+        allowed_window_start=allowed_window_start,
+        allowed_window_end=allowed_window_end,
+        corpus=corpus,
+        holdout_policy=holdout_policy,
+    )
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(entries)))
+        ) as pool:
+            return list(pool.map(load, entries))
+    finally:
+        # One memo write for the whole manifest, not one per shard.
+        _flush_verified()
 
 
 def _assert_no_holdout_rows(
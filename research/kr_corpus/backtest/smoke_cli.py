@@ -35,7 +35,7 @@ from baseline_smoke import (  # noqa: E402
     run_liquidity_proxy_decile_topn_d5,
 )
 from fixture_builder import FIXTURE_REL_ROOT, build_synthetic_fixture  # noqa: E402
-from loader import load_manifest, load_shard  # noqa: E402
+from loader import load_manifest, load_shards  # noqa: E402
 from membership import membership_rows_from_table  # noqa: E402
 from pit import bars_from_table  # noqa: E402
 from schema_contract import SCHEMA_ORIGIN, load_contract  # noqa: E402
@@ -65,9 +65,8 @@ def run_fixture_smoke(
 
     bars = []
     membership = []
-    for entry in manifest:
-        # SHA gate exercises committed digests when rebuild=False.
-        table = load_shard(root, entry)
+    # SHA gate exercises committed digests when rebuild=False.
+    for entry, table in zip(manifest, load_shards(root, manifest), strict=True):
         if entry.dataset == "ohlcv":
             bars.extend(bars_from_table(table))
         elif entry.dataset == "membership":
@@ -266,7 +266,7 @@ def test_exploration_range_allowed():
 
 def test_loader_entrypoints_enumerated_complete():
     """Public loader surface is exactly the dual-gated set."""
-    assert LOADER_ENTRYPOINTS == ("load_manifest", "load_shard")
+    assert LOADER_ENTRYPOINTS == ("load_manifest", "load_shard", "load_shards")
 
 
 def test_load_manifest_refuses_holdout_path(tmp_path):
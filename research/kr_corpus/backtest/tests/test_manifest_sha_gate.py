@@ -13,6 +13,7 @@ from loader import (
     ShardFileMissingError,
     load_manifest,
     load_shard,
+    load_shards,
     sha256_bytes,
 )
 from schema_contract import arrow_schema_for
@@ -161,3 +162,69 @@ def test_load_manifest_round_trip(tmp_path):
     entries = load_manifest(manifest_path)
     assert len(entries) == 1
     assert entries[0].file_sha256 == digest
+
+
+def _entry(rel: str, digest: str, n: int) -> ManifestEntry:
+    return ManifestEntry(
+        relative_path=rel,
+        file_sha256=digest,
+        row_count=n,
+        dataset="ohlcv",
+        market="KOSPI",
+        year=2023,
+    )
+
+
+def test_unchanged_shard_is_verified_once_and_table_reused(tmp_path, monkeypatch):
+    import loader
+
+    rel = "ohlcv/KOSPI/2023/bars.parquet"
+    digest, n = _write_ohlcv_shard(tmp_path, rel, [_sample_row()])
+    hashed: list[int] = []
+    real_sha = loader.sha256_bytes
+    monkeypatch.setattr(
+        loader, "sha256_bytes", lambda data: hashed.append(len(data)) or real_sha(data)
+    )
+
+    first = load_shard(tmp_path, _entry(rel, digest, n))
+    second = load_shard(tmp_path, _entry(rel, digest, n))
+
+    assert second is first
+    assert len(hashed) == 1
+
+    # A fresh process trusts the on-disk memo for the same stamp: no re-hash,
+    # but the bytes are still read, parsed and validated.
+    loader.clear_verification_memo()
+    third = load_shard(tmp_path, _entry(rel, digest, n))
+    assert third.equals(first) and third is not first
+    assert len(hashed) == 1
+
+
+def test_changed_shard_is_fully_reverified(tmp_path):
+    rel = "ohlcv/KOSPI/2023/bars.parquet"
+    digest, n = _write_ohlcv_shard(tmp_path, rel, [_sample_row()])
+    load_shard(tmp_path, _entry(rel, digest, n))
+
+    _write_ohlcv_shard(tmp_path, rel, [_sample_row("2023-01-04")])
+
+    with pytest.raises(ManifestShaMismatchError):
+        load_shard(tmp_path, _entry(rel, digest, n))
+
+
+def test_load_shards_keeps_manifest_order_and_refuses_any_bad_entry(tmp_path):
+    entries = []
+    for day in ("03", "04", "05"):
+        rel = f"ohlcv/KOSPI/2023/bars-{day}.parquet"
+        digest, n = _write_ohlcv_shard(tmp_path, rel, [_sample_row(f"2023-01-{day}")])
+        entries.append(_entry(rel, digest, n))
+
+    tables = load_shards(tmp_path, entries, max_workers=3)
+
+    assert [t.column("session")[0].as_py() for t in tables] == [
+        "2023-01-03",
+        "2023-01-04",
+        "2023-01-05",
+    ]
+    bad = _entry(entries[1].relative_path, "0" * 64, 1)
+    with pytest.raises(ManifestShaMismatchError):
+        load_shards(tmp_path, [entries[0], bad, entries[2]])
@@ -0,0 +1,148 @@
+"""Per-page parse benchmark for the Naver Finance HTML scrapers.
+
+Offline and read-only: parses the captured-shape pages under
+``tests/fixtures/naver_finance/`` and reports, per page, the median time of
+
+    * before — ``BeautifulSoup(html, "lxml")`` tree build plus the CSS
+      ``select``/``get_text`` walk the soup-based extractors performed (this
+      whole block used to run on the event loop), and
+    * after  — ``lxml.html`` document build plus the compiled-XPath extractor
+      (the document build now runs in a worker thread via ``asyncio.to_thread``).
+
+Each page's extractor output is also checked to be identical whether it is fed
+the soup or the lxml document, so the numbers compare equivalent work.
+
+How to run
+----------
+    uv run python scripts/benchmark_naver_parsers.py --iterations 50
+    uv run python scripts/benchmark_naver_parsers.py --output-json /tmp/naver.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+from app.services.naver_finance.investor import (
+    _collect_opinion_report_infos,
+    _parse_investor_trends_soup,
+    _parse_report_detail_soup,
+)
+from app.services.naver_finance.news import _parse_news_soup
+from app.services.naver_finance.parser import _decode_html_content, _parse_document
+from app.services.naver_finance.valuation import (
+    _parse_industry_info,
+    _parse_sector_name,
+    _parse_sector_stock_codes,
+    _parse_valuation_from_soups,
+)
+
+FIXTURE_DIR = Path(__file__).resolve().parents[1] / "tests/fixtures/naver_finance"
+
+# Selectors walked by the pre-change soup extractors, per page.
+_LEGACY_SELECTORS: dict[str, tuple[str, ...]] = {
+    "main.html": (
+        "div.wrap_company h2 a",
+        "p.no_today em span.blind",
+        "em#_per",
+        "em#_pbr",
+        "em#_dvr",
+        "div.code",
+        'a[href*="type=upjong"]',
+        "tr th",
+        "tr td",
+    ),
+    "sise.html": ("tr th, tr td",),
+    "news_news.html": ("table.type5 tr td.title a", "td.info", "td.date"),
+    "frgn.html": ("table.type2 tr td",),
+    "company_list.html": ("table.type_1 tr td", "table.type_1 tr td a"),
+    "company_read.html": ("div.view_info_1 em.money strong", "em.coment"),
+    "sise_group_detail.html": ("table.type_5 a[href*='code=']", "title"),
+}
+
+_EXTRACTORS: dict[str, Callable[[Any], Any]] = {
+    "main.html": lambda page: (
+        _parse_valuation_from_soups("005930", page, page),
+        _parse_industry_info(page),
+    ),
+    "sise.html": lambda page: _parse_valuation_from_soups("005930", page, page),
+    "news_news.html": lambda page: _parse_news_soup(page, 20),
+    "frgn.html": lambda page: _parse_investor_trends_soup(page, "005930", 20),
+    "company_list.html": lambda page: _collect_opinion_report_infos(page, 30),
+    "company_read.html": _parse_report_detail_soup,
+    "sise_group_detail.html": lambda page: (
+        _parse_sector_stock_codes(page),
+        _parse_sector_name(page),
+    ),
+}
+
+
+def _before(content: bytes, selectors: tuple[str, ...]) -> None:
+    soup = BeautifulSoup(_decode_html_content(content), "lxml")
+    for selector in selectors:
+        for element in soup.select(selector):
+            element.get_text(strip=True)
+
+
+def _after(content: bytes, extractor: Callable[[Any], Any]) -> None:
+    extractor(_parse_document(content))
+
+
+def _median_ms(fn: Callable[[], None], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def run(iterations: int) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for name, extractor in _EXTRACTORS.items():
+        content = (FIXTURE_DIR / name).read_bytes()
+        soup = BeautifulSoup(_decode_html_content(content), "lxml")
+        if extractor(soup) != extractor(_parse_document(content)):
+            raise SystemExit(f"{name}: soup and lxml extraction differ")
+        before = _median_ms(
+            lambda c=content, n=name: _before(c, _LEGACY_SELECTORS[n]), iterations
+        )
+        after = _median_ms(lambda c=content, e=extractor: _after(c, e), iterations)
+        rows.append(
+            {
+                "page": name,
+                "bytes": len(content),
+                "before_ms": before,
+                "after_ms": after,
+                "speedup": round(before / after, 1) if after else None,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--output-json", type=Path, default=None)
+    args = parser.parse_args()
+
+    rows = run(max(1, args.iterations))
+    print(f"{'page':<24}{'bytes':>8}{'before ms':>12}{'after ms':>11}{'x':>7}")
+    for row in rows:
+        print(
+            f"{row['page']:<24}{row['bytes']:>8}{row['before_ms']:>12}"
+            f"{row['after_ms']:>11}{row['speedup']:>7}"
+        )
+    if args.output_json is not None:
+        args.output_json.write_text(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,21 @@ Output also estimates a linear cost model
 and projects W-day cold-view fanout vs a single ±k range request, which is
 the actual UX trade-off Phase 2 will pick from.
 
+Offline benchmark mode
+----------------------
+    uv run python scripts/measure_calendar_endpoint.py --offline \
+        --events-per-day 40 --seed 7 --query-latency-ms 5
+
+`--offline` needs no server and no cookie. It seeds deterministic synthetic
+market events (``--events-per-day`` per day, ``--seed``) and calls
+``build_calendar`` in-process with the query/freshness services and the
+ingestion watermark pointed at that seed. ``--query-latency-ms`` is added to
+every simulated DB call so round-trip savings are visible. Each scenario runs
+twice: ``uncached`` (every request re-queries and re-buckets every day) and
+``cached`` (``use_cache=True`` with a fixed watermark, so warm samples only
+assemble cached days). The same linear model reports the per-day marginal
+cost for both.
+
 Safety
 ------
 GET requests only. No broker/order/watch/order-intent mutation. The cookie
@@ -64,14 +79,19 @@ the `--output-json` file.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
+import random
 import statistics
 import sys
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from http.client import HTTPConnection, HTTPSConnection
+from types import SimpleNamespace
+from typing import Any
 from urllib.parse import urlencode, urlparse
 from zoneinfo import ZoneInfo
 
@@ -118,6 +138,16 @@ def _grid_range(anchor: date) -> tuple[date, date]:
     return start, end
 
 
+def _scenarios(anchor: date) -> list[Scenario]:
+    grid_start, grid_end = _grid_range(anchor)
+    return [
+        Scenario("42d_grid (current)", grid_start, grid_end),
+        Scenario("7d (±3)", anchor - timedelta(days=3), anchor + timedelta(days=3)),
+        Scenario("15d (±7)", anchor - timedelta(days=7), anchor + timedelta(days=7)),
+        Scenario("single_day", anchor, anchor),
+    ]
+
+
 def _parse_counts(body: bytes) -> tuple[int, int, int, str | None]:
     """Return (day_count, event_count, cluster_count, parse_error)."""
     try:
@@ -297,6 +327,251 @@ def _run_scenario(
     return row
 
 
+_OFFLINE_ECONOMIC_TITLES = (
+    "US CPI",
+    "US Core PPI",
+    "FOMC Interest Rate Decision",
+    "Nonfarm Payrolls",
+    "Initial Jobless Claims",
+    "Retail Sales",
+    "ISM Manufacturing PMI",
+    "한국 소비자물가",
+)
+
+
+def _date_iter(start: date, end: date) -> Iterator[date]:
+    cur = start
+    while cur <= end:
+        yield cur
+        cur += timedelta(days=1)
+
+
+def _seed_events(
+    start: date, end: date, *, events_per_day: int, seed: int
+) -> dict[date, list[SimpleNamespace]]:
+    """Deterministic synthetic ``MarketEventResponse``-shaped rows per day."""
+    rng = random.Random(seed)
+    by_day: dict[date, list[SimpleNamespace]] = {}
+    for day in _date_iter(start, end):
+        rows: list[SimpleNamespace] = []
+        for index in range(events_per_day):
+            kind = rng.choice(("us_earnings", "kr_earnings", "economic", "disclosure"))
+            value = SimpleNamespace(
+                actual=round(rng.uniform(-2, 5), 2) if rng.random() < 0.5 else None,
+                forecast=round(rng.uniform(-2, 5), 2),
+                previous=round(rng.uniform(-2, 5), 2),
+            )
+            symbol = (
+                f"SYM{rng.randrange(500):03d}"
+                if kind == "us_earnings"
+                else f"{rng.randrange(1, 999999):06d}"
+            )
+            economic = kind == "economic"
+            rows.append(
+                SimpleNamespace(
+                    source_event_id=f"{day.isoformat()}-{index}",
+                    id=f"{day.isoformat()}-{index}",
+                    market="global"
+                    if economic
+                    else ("us" if kind == "us_earnings" else "kr"),
+                    category="disclosure"
+                    if kind == "disclosure"
+                    else ("economic" if economic else "earnings"),
+                    symbol=None if economic else symbol,
+                    company_name=None if economic else f"Company {symbol}",
+                    title=rng.choice(_OFFLINE_ECONOMIC_TITLES) if economic else None,
+                    event_date=day,
+                    release_time_utc=datetime(
+                        day.year, day.month, day.day, rng.randrange(24)
+                    ),
+                    source=rng.choice(("tradingview", "forexfactory"))
+                    if economic
+                    else "seed",
+                    currency="USD" if economic else None,
+                    country="US" if economic else None,
+                    importance=rng.choice((1, 2, 3)) if economic else None,
+                    values=[value] if economic or rng.random() < 0.3 else [],
+                )
+            )
+        by_day[day] = rows
+    return by_day
+
+
+class _SeededQueryService:
+    def __init__(
+        self, events_by_day: dict[date, list[SimpleNamespace]], latency_s: float
+    ) -> None:
+        self._events_by_day = events_by_day
+        self._latency_s = latency_s
+
+    async def list_for_range(self, from_date: date, to_date: date) -> Any:
+        await asyncio.sleep(self._latency_s)
+        return SimpleNamespace(
+            events=[
+                row
+                for day in _date_iter(from_date, to_date)
+                for row in self._events_by_day.get(day, [])
+            ]
+        )
+
+
+class _SeededFreshnessService:
+    def __init__(self, latency_s: float) -> None:
+        self._latency_s = latency_s
+
+    async def get_per_day_states(self, from_date: date, to_date: date) -> Any:
+        await asyncio.sleep(self._latency_s)
+        return dict.fromkeys(_date_iter(from_date, to_date), "loaded")
+
+    async def get_coverage_matrix(self, from_date: date, to_date: date) -> Any:
+        from app.schemas.calendar_freshness import (
+            CalendarCoverage,
+            CoverageMatrixResponse,
+        )
+
+        await asyncio.sleep(self._latency_s)
+        return CoverageMatrixResponse(
+            fromDate=from_date,
+            toDate=to_date,
+            asOf=datetime.now(KST),
+            sources=[],
+            partitions=[],
+            coverage=CalendarCoverage(
+                fromDate=from_date,
+                toDate=to_date,
+                expectedPartitions=0,
+                succeededPartitions=0,
+                failedPartitions=0,
+                missingPartitions=0,
+                totalEvents=0,
+            ),
+        )
+
+
+async def _run_offline_scenarios(
+    scenarios: list[Scenario],
+    *,
+    iterations: int,
+    events_per_day: int,
+    seed: int,
+    latency_s: float,
+) -> dict[str, dict[str, ScenarioRow]]:
+    """Rows per mode (``uncached`` / ``cached``), keyed by scenario name."""
+    from unittest.mock import patch
+
+    from app.services.invest_view_model import calendar_service
+    from app.services.invest_view_model.relation_resolver import RelationResolver
+
+    start = min(sc.from_date for sc in scenarios)
+    end = max(sc.to_date for sc in scenarios)
+    events_by_day = _seed_events(start, end, events_per_day=events_per_day, seed=seed)
+    query_service = _SeededQueryService(events_by_day, latency_s)
+    freshness_service = _SeededFreshnessService(latency_s)
+
+    async def watermark(db: Any) -> str:
+        await asyncio.sleep(latency_s)
+        return f"offline-seed-{seed}"
+
+    resolver = RelationResolver(
+        held={("us", f"SYM{index:03d}") for index in range(0, 500, 25)}
+    )
+    results: dict[str, dict[str, ScenarioRow]] = {}
+    with (
+        patch.object(
+            calendar_service, "MarketEventsQueryService", lambda db: query_service
+        ),
+        patch.object(
+            calendar_service,
+            "MarketEventsFreshnessService",
+            lambda db: freshness_service,
+        ),
+        patch.object(calendar_service, "market_events_watermark", watermark),
+    ):
+        for mode, use_cache in (("uncached", False), ("cached", True)):
+            rows: dict[str, ScenarioRow] = {}
+            for sc in scenarios:
+                # Every scenario starts cold so its first sample pays the query.
+                calendar_service.clear_calendar_cache()
+                row = ScenarioRow(
+                    days=sc.days,
+                    from_date=sc.from_date.isoformat(),
+                    to_date=sc.to_date.isoformat(),
+                )
+                for _ in range(max(iterations, 1) + 1):
+                    started = time.perf_counter()
+                    resp = await calendar_service.build_calendar(
+                        db=None,  # type: ignore[arg-type]
+                        resolver=resolver,
+                        from_date=sc.from_date,
+                        to_date=sc.to_date,
+                        tab="all",
+                        use_cache=use_cache,
+                    )
+                    body = resp.model_dump_json().encode()
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    days, events, clusters, err = _parse_counts(body)
+                    row.samples.append(
+                        Sample(
+                            elapsed_ms=elapsed_ms,
+                            body_bytes=len(body),
+                            status=200,
+                            day_count=days,
+                            event_count=events,
+                            cluster_count=clusters,
+                            parse_error=err,
+                        )
+                    )
+                rows[sc.name] = row
+            results[mode] = rows
+        calendar_service.clear_calendar_cache()
+    return results
+
+
+def _main_offline(args: argparse.Namespace, scenarios: list[Scenario]) -> int:
+    print(
+        f"offline  seed={args.seed}  events_per_day={args.events_per_day}  "
+        f"query_latency_ms={args.query_latency_ms}  "
+        f"iterations={args.iterations} (+1 cold per scenario)"
+    )
+    print()
+    results = asyncio.run(
+        _run_offline_scenarios(
+            scenarios,
+            iterations=args.iterations,
+            events_per_day=args.events_per_day,
+            seed=args.seed,
+            latency_s=args.query_latency_ms / 1000,
+        )
+    )
+
+    payload: dict[str, object] = {
+        "mode": "offline",
+        "seed": args.seed,
+        "events_per_day": args.events_per_day,
+        "query_latency_ms": args.query_latency_ms,
+        "iterations": args.iterations,
+    }
+    for mode, rows in results.items():
+        summaries = {name: _summary_dict(row) for name, row in rows.items()}
+        for name, summary in summaries.items():
+            _print_scenario(f"{mode}: {name}", summary)
+        overhead = _fixed_overhead_block(rows)
+        if overhead:
+            print(
+                f"{mode}: per_day_marginal ≈ "
+                f"{overhead['per_day_marginal_ms']:.2f} ms/day, "
+                f"fixed_overhead ≈ {overhead['fixed_overhead_ms']:.2f} ms"
+            )
+            print()
+        payload[mode] = {"scenarios": summaries, "fixed_overhead_estimate": overhead}
+
+    if args.output_json:
+        with open(args.output_json, "w") as f:
+            json.dump(payload, f, indent=2)
+        print(f"Structured results dumped to {args.output_json}")
+    return 0
+
+
 def _fixed_overhead_block(
     rows: dict[str, ScenarioRow],
 ) -> dict[str, object] | None:
@@ -378,8 +653,37 @@ def main() -> int:
         default=None,
         help="optional path to dump structured results (no secrets)",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="benchmark build_calendar in-process against seeded data "
+        "(no server, no cookie)",
+    )
+    parser.add_argument(
+        "--events-per-day",
+        type=int,
+        default=40,
+        help="offline: synthetic events seeded per day",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=7, help="offline: RNG seed for synthetic events"
+    )
+    parser.add_argument(
+        "--query-latency-ms",
+        type=float,
+        default=0.0,
+        help="offline: simulated latency added to every DB call",
+    )
     args = parser.parse_args()
 
+    if args.offline:
+        anchor = (
+            date.fromisoformat(args.selected)
+            if args.selected
+            else datetime.now(KST).date()
+        )
+        return _main_offline(args, _scenarios(anchor))
+
     cookie = os.environ.get("CALENDAR_COOKIE")
     if not cookie:
         print(
@@ -396,14 +700,7 @@ def main() -> int:
     anchor = (
         date.fromisoformat(args.selected) if args.selected else datetime.now(KST).date()
     )
-    grid_start, grid_end = _grid_range(anchor)
-
-    scenarios: list[Scenario] = [
-        Scenario("42d_grid (current)", grid_start, grid_end),
-        Scenario("7d (±3)", anchor - timedelta(days=3), anchor + timedelta(days=3)),
-        Scenario("15d (±7)", anchor - timedelta(days=7), anchor + timedelta(days=7)),
-        Scenario("single_day", anchor, anchor),
-    ]
+    scenarios = _scenarios(anchor)
     repeated = Scenario(
         f"single_day_repeated x{args.repeat_single_day}", anchor, anchor
     )
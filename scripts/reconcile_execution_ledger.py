@@ -43,6 +43,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--start-date", help="UTC date YYYY-MM-DD or YYYYMMDD")
     parser.add_argument("--end-date", help="UTC date YYYY-MM-DD or YYYYMMDD")
     parser.add_argument("--max-pages", type=int, default=100)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="classify/upsert fills in set-based pages of this size",
+    )
+    parser.add_argument(
+        "--resume-from-watermark",
+        action="store_true",
+        help="without --start-date, start at the last committed run's window end",
+    )
     mode = parser.add_mutually_exclusive_group()
     mode.add_argument("--dry-run", action="store_true", default=True)
     mode.add_argument("--commit", action="store_true")
@@ -63,6 +74,8 @@ async def _main() -> int:
                 end_at=end_at,
                 max_pages=args.max_pages,
                 dry_run=dry_run,
+                batch_size=args.batch_size,
+                resume_from_watermark=args.resume_from_watermark,
             )
         except Exception:
             if dry_run:
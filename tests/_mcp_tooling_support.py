@@ -38,6 +38,7 @@ from app.mcp_server.tooling import (
     fundamentals_sources_naver,
     fundamentals_sources_yfinance,
     market_data_indicators,
+    market_data_levels,
     market_data_quotes,
     order_execution,
     order_journal,
@@ -186,6 +187,7 @@ _PATCH_MODULES = (
     fundamentals_sources_naver,
     fundamentals_sources_yfinance,
     market_data_indicators,
+    market_data_levels,
     market_data_quotes,
     order_execution,
     order_journal,
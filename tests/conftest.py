@@ -194,6 +194,10 @@ def _ensure_test_env() -> None:
     # ROB-688: same hermetic guard for the sector-peers cache — never touch a
     # real Redis from tests; cache tests inject a fake client explicitly.
     os.environ["NAVER_PEER_CACHE_ENABLED"] = "false"
+    os.environ["TVSCREENER_CAPABILITY_CACHE_ENABLED"] = "false"
+
+    # Portfolio price fills must not reuse a quote cached by another test.
+    os.environ["LAST_PRICE_SNAPSHOT_TTL_SECONDS"] = "0"
 
 
 _ensure_test_env()
@@ -0,0 +1,38 @@
+"""Tests for the deferred-import module proxy."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from app.core.lazy_module import LazyModule
+
+
+@pytest.mark.unit
+def test_lazy_module_defers_import_until_attribute_access(monkeypatch) -> None:
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    proxy = LazyModule("colorsys")
+
+    assert "colorsys" not in sys.modules
+    assert "deferred" in repr(proxy)
+
+    assert proxy.rgb_to_hsv(0.0, 0.0, 0.0) == (0.0, 0.0, 0.0)
+    assert "colorsys" in sys.modules
+    assert "loaded" in repr(proxy)
+
+
+@pytest.mark.unit
+def test_lazy_module_patches_reach_the_real_module(monkeypatch) -> None:
+    import colorsys
+
+    proxy = LazyModule("colorsys")
+    original = colorsys.rgb_to_hsv
+
+    monkeypatch.setattr(proxy, "rgb_to_hsv", lambda *args: "patched")
+    assert colorsys.rgb_to_hsv() == "patched"
+    assert proxy.rgb_to_hsv() == "patched"
+
+    monkeypatch.undo()
+    assert colorsys.rgb_to_hsv is original
+    assert proxy.rgb_to_hsv is original
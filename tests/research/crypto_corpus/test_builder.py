@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
+import pyarrow.parquet as pq
 import pytest
 
 import research.crypto_corpus.builder as builder_module
+import research.crypto_corpus.public_api as public_api_module
 from research.crypto_corpus.artifacts import ArtifactStore
 from research.crypto_corpus.builder import (
     Bar,
@@ -20,7 +25,12 @@ from research.crypto_corpus.builder import (
     calculate_request_budget,
 )
 from research.crypto_corpus.constants import MAX_REQUESTS
-from research.crypto_corpus.public_api import ApiResponse
+from research.crypto_corpus.loader import load_labeled_parquet
+from research.crypto_corpus.public_api import (
+    ApiResponse,
+    PublicApiClient,
+    RequestBudgetExceeded,
+)
 
 
 class FakePublicClient:
@@ -259,3 +269,224 @@ def test_research_package_has_no_app_db_or_environment_credential_imports():
             if isinstance(node, ast.ImportFrom):
                 assert (node.module or "").split(".")[0] not in forbidden_roots
         assert "os.environ" not in source.read_text()
+
+
+_HOUR_MS = 3_600_000
+
+
+def _ms(*args: int) -> int:
+    return int(datetime(*args, tzinfo=UTC).timestamp() * 1000)
+
+
+class FakeVenueOpener:
+    """Serves Upbit/Binance candle pages from fixed bar lists, like the APIs.
+
+    Upbit pages walk backwards from the exclusive ``to`` cursor; Binance pages
+    walk forwards from ``startTime``.  Every other URL gets an empty list.
+    """
+
+    def __init__(self, upbit_1h: list[int], binance_1h: list[int]) -> None:
+        self.upbit_1h = sorted(upbit_1h, reverse=True)
+        self.binance_1h = sorted(binance_1h)
+        self.urls: list[str] = []
+        self.rate_limited_prefix: str | None = None
+
+    def __call__(self, request, timeout_seconds: float) -> tuple[int, bytes]:
+        del timeout_seconds
+        url = request.full_url
+        self.urls.append(url)
+        if self.rate_limited_prefix and url.startswith(self.rate_limited_prefix):
+            return 429, b'{"msg":"Too many requests"}'
+        query = parse_qs(urlsplit(url).query)
+        if url.startswith(builder_module.UPBIT_HOURS_URL):
+            cursor = int(
+                datetime.fromisoformat(
+                    query["to"][0].replace("Z", "+00:00")
+                ).timestamp()
+                * 1000
+            )
+            count = int(query["count"][0])
+            page = [ms for ms in self.upbit_1h if ms < cursor][:count]
+            return 200, json.dumps([_upbit_candle(ms) for ms in page]).encode()
+        if url.startswith(builder_module.BINANCE_KLINES_URL) and query["interval"] == [
+            "1h"
+        ]:
+            start = int(query["startTime"][0])
+            limit = int(query["limit"][0])
+            page = [ms for ms in self.binance_1h if ms >= start][:limit]
+            return 200, json.dumps([_binance_kline(ms) for ms in page]).encode()
+        return 200, b"[]"
+
+
+def _upbit_candle(open_ms: int) -> dict[str, object]:
+    opened = datetime.fromtimestamp(open_ms / 1000, tz=UTC)
+    return {
+        "market": "KRW-BTC",
+        "candle_date_time_utc": opened.strftime("%Y-%m-%dT%H:%M:%S"),
+        "candle_date_time_kst": opened.strftime("%Y-%m-%dT%H:%M:%S"),
+        "opening_price": 100.0,
+        "high_price": 110.0,
+        "low_price": 90.0,
+        "trade_price": 105.0,
+        "candle_acc_trade_volume": 2.0,
+        "candle_acc_trade_price": 210.0,
+        "timestamp": open_ms + 1,
+    }
+
+
+def _binance_kline(open_ms: int) -> list[object]:
+    return [
+        open_ms,
+        "10",
+        "12",
+        "9",
+        "11",
+        "3",
+        open_ms + _HOUR_MS - 1,
+        "33",
+        7,
+        "1",
+        "11",
+        "0",
+    ]
+
+
+def _ready_builder(
+    tmp_path, monkeypatch, opener: FakeVenueOpener, **kwargs
+) -> tuple[CorpusBuilder, ArtifactStore]:
+    monkeypatch.setattr(builder_module, "PROGRESS_LOG", str(tmp_path / "progress.md"))
+    monkeypatch.setattr(builder_module, "UPBIT_PAGE_SIZE", 2)
+    monkeypatch.setattr(builder_module, "BINANCE_PAGE_SIZE", 2)
+    store = ArtifactStore(tmp_path / "artifacts")
+    if not store.load_json_records(store.preflight):
+        store.write_preflight(
+            {
+                "corpus_id": "crypto-corpus-v1",
+                "created_at": "2026-08-03T00:00:00Z",
+                "started_at": "2026-08-03T00:00:00Z",
+                "status": "READY_FOR_COLLECTION",
+                "reason": None,
+                "request_budget": calculate_request_budget(1, 1).as_dict(),
+                "inputs": [],
+                "universe": {
+                    "upbit_krw": ["KRW-BTC"],
+                    "binance_usdt_spot": ["BTCUSDT"],
+                    "binance_status_by_symbol": {"BTCUSDT": "TRADING"},
+                },
+            }
+        )
+    client = PublicApiClient(store, opener=opener, sleep=lambda _seconds: None)
+    builder = CorpusBuilder(
+        store=store,
+        client=client,
+        now=lambda: datetime(2026, 8, 3, 1, tzinfo=UTC),
+        **kwargs,
+    )
+    return builder, store
+
+
+def _receipts_by_task(store: ArtifactStore) -> dict[str, dict]:
+    return {
+        receipt["task_key"]: receipt
+        for receipt in store.load_json_records(store.receipts)
+    }
+
+
+def test_streamed_run_writes_ascending_row_groups_with_exact_checksums(
+    tmp_path, monkeypatch
+):
+    upbit_hours = [_ms(2024, 12, 31, 21) + step * _HOUR_MS for step in range(5)]
+    binance_hours = [_ms(2024, 6, 1) + step * _HOUR_MS for step in range(5)]
+    opener = FakeVenueOpener(upbit_hours, binance_hours)
+    builder, store = _ready_builder(tmp_path, monkeypatch, opener)
+
+    builder.run()
+
+    receipts = _receipts_by_task(store)
+    assert len(receipts) == 4
+    upbit = receipts["upbit_krw|KRW-BTC|1h"]
+    assert upbit["error"] is None
+    assert upbit["rows_by_split"] == {"dataset": 3, "holdout": 2}
+    assert [record["is_holdout"] for record in upbit["files"]] == [False, True]
+    dataset_record = upbit["files"][0]
+    payload = (store.root / dataset_record["relative_path"]).read_bytes()
+    assert hashlib.sha256(payload).hexdigest() == dataset_record["sha256"]
+    assert len(payload) == dataset_record["byte_size"]
+    loaded = load_labeled_parquet(store.root / dataset_record["relative_path"])
+    assert loaded.table.column("open_time_utc").to_pylist() == [
+        datetime.fromtimestamp(ms / 1000, tz=UTC) for ms in upbit_hours[:3]
+    ]
+
+    binance = receipts["binance_usdt_spot|BTCUSDT|1h"]
+    binance_file = pq.ParquetFile(store.root / binance["files"][0]["relative_path"])
+    # Pages of two bars arrive oldest-first and are appended as row groups.
+    assert binance_file.metadata.num_row_groups == 3
+    table = binance_file.read()
+    assert table.column("open_time_utc").to_pylist() == [
+        datetime.fromtimestamp(ms / 1000, tz=UTC) for ms in binance_hours
+    ]
+    assert table.column("trade_count").to_pylist() == [7] * 5
+    assert table.column("source_close_time_ms").to_pylist() == [
+        ms + _HOUR_MS - 1 for ms in binance_hours
+    ]
+    assert binance["gaps"][0]["reason"] == (
+        "prelisting_or_unavailable_before_first_observed"
+    )
+    request_log = store.root / "control/request-log.jsonl"
+    assert len(request_log.read_text().splitlines()) == builder.client.requests_actual
+
+    resumed, _ = _ready_builder(tmp_path, monkeypatch, FakeVenueOpener([], []))
+    resumed.run()
+
+    assert resumed.client.opener.urls == []  # type: ignore[attr-defined]
+    assert len(store.load_json_records(store.receipts)) == 4
+
+
+def test_rate_limit_stops_every_worker_and_leaves_later_tasks_unreceipted(
+    tmp_path, monkeypatch
+):
+    opener = FakeVenueOpener([], [])
+    opener.rate_limited_prefix = (
+        builder_module.BINANCE_KLINES_URL + "?symbol=BTCUSDT&interval=1d"
+    )
+    builder, store = _ready_builder(tmp_path, monkeypatch, opener, workers_per_venue=1)
+
+    manifest = builder.run()
+
+    receipts = _receipts_by_task(store)
+    assert receipts["binance_usdt_spot|BTCUSDT|1d"]["rate_limited"] is True
+    assert "binance_usdt_spot|BTCUSDT|1h" not in receipts
+    assert manifest is not None
+    published = json.loads((store.root / manifest.relative_path).read_text())
+    assert published["terminal_reason"] == "rate_limit_or_block_signal"
+
+
+def test_duplicate_row_across_pages_discards_the_streamed_task(tmp_path):
+    store = ArtifactStore(tmp_path / "artifacts")
+    stream = builder_module._TaskStream(store, "binance_usdt_spot", "BTCUSDT", "1h")
+    first = _normalize_binance(_binance_kline(_ms(2024, 1, 1)), "1h", "BTCUSDT")
+
+    assert stream.append([first]) is None
+    assert stream.append([first]) == f"duplicate_source_row:BTCUSDT@{first.open_ms}"
+
+
+def test_concurrent_reservations_never_exceed_the_request_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr(public_api_module, "MAX_REQUESTS", 5)
+    store = ArtifactStore(tmp_path / "artifacts")
+    client = PublicApiClient(store, sleep=lambda _seconds: None)
+
+    def reserve(index: int) -> bool:
+        venue = "upbit_krw" if index % 2 else "binance_usdt_spot"
+        try:
+            client._reserve_request(venue, f"https://example.test/{index}")
+        except RequestBudgetExceeded:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reserved = list(pool.map(reserve, range(40)))
+
+    assert sum(reserved) == 5
+    assert client.requests_actual == 5
+    log = (store.root / "control/request-log.jsonl").read_text().splitlines()
+    assert sorted(json.loads(line)["request_number"] for line in log) == [1, 2, 3, 4, 5]
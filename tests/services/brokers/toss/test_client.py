@@ -986,6 +986,9 @@ async def test_mutation_hook_runs_after_limiter_token_and_account_resolution(
         async def acquire(self, group) -> None:
             limiter_groups.append(group)
 
+        async def observe(self, group, headers) -> None:
+            pass
+
     async def handler(request: httpx.Request) -> httpx.Response:
         paths.append(request.url.path)
         if request.url.path == "/api/v1/accounts":
@@ -12,9 +12,11 @@ from app.services.brokers.toss.rate_limiter import (
     TossApiGroup,
     TossRateLimiter,
     TossRateLimitHeaders,
+    TossRequestLane,
     get_shared_rate_limiter,
     parse_rate_limit_headers,
     retry_delay_seconds,
+    toss_request_lane,
 )
 
 
@@ -113,3 +115,67 @@ async def test_throttled_group_does_not_block_other_groups() -> None:
 
     assert elapsed < 0.2, "MARKET_DATA was blocked behind the throttled ORDER group"
     order_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_header_limit_only_tightens_base_cap_while_fresh() -> None:
+    limiter = TossRateLimiter()
+
+    await limiter.observe(
+        TossApiGroup.MARKET_DATA, TossRateLimitHeaders(4, 3, 1.0, None)
+    )
+    await limiter.observe(TossApiGroup.ASSET, TossRateLimitHeaders(20, 19, 1.0, None))
+
+    assert limiter.current_limit(TossApiGroup.MARKET_DATA) == 4
+    assert limiter.current_limit(TossApiGroup.ASSET) == 5
+    assert limiter.current_limit(TossApiGroup.STOCK) == 5
+
+
+@pytest.mark.asyncio
+async def test_exhausted_remaining_holds_group_until_reset() -> None:
+    limiter = TossRateLimiter()
+    await limiter.observe(TossApiGroup.STOCK, TossRateLimitHeaders(5, 0, 0.2, None))
+
+    start = time.monotonic()
+    await limiter.acquire(TossApiGroup.STOCK)
+
+    assert time.monotonic() - start >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_remaining_budget_releases_held_waiters_immediately() -> None:
+    limiter = TossRateLimiter()
+    await limiter.observe(TossApiGroup.STOCK, TossRateLimitHeaders(5, 0, 5.0, None))
+    waiter = asyncio.create_task(limiter.acquire(TossApiGroup.STOCK))
+    await asyncio.sleep(0.02)
+    assert not waiter.done()
+
+    await limiter.observe(TossApiGroup.STOCK, TossRateLimitHeaders(5, 3, 1.0, None))
+
+    await asyncio.wait_for(waiter, 0.2)
+
+
+@pytest.mark.asyncio
+async def test_interactive_lane_is_admitted_before_queued_bulk() -> None:
+    limiter = TossRateLimiter()
+    admitted: list[str] = []
+    for _ in range(TossRateLimiter.limit_for(TossApiGroup.MARKET_INFO)):
+        await limiter.acquire(TossApiGroup.MARKET_INFO)
+
+    async def call(name: str, lane: TossRequestLane) -> None:
+        with toss_request_lane(lane):
+            await limiter.acquire(TossApiGroup.MARKET_INFO)
+        admitted.append(name)
+
+    bulk = [
+        asyncio.create_task(call(f"bulk-{index}", TossRequestLane.BULK))
+        for index in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    interactive = asyncio.create_task(call("order", TossRequestLane.INTERACTIVE))
+    await asyncio.gather(interactive, *bulk)
+
+    assert admitted[0] == "order"
+    stats = limiter.lane_wait_stats()["MARKET_INFO"]
+    assert stats["BULK"]["throttled"] == 3
+    assert stats["INTERACTIVE"]["max_wait_seconds"] > 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import uuid
 from datetime import UTC, datetime
 from decimal import Decimal
 from types import SimpleNamespace
@@ -10,8 +11,10 @@ import pytest
 from app.schemas.execution_ledger import (
     ExecutionLedgerCommitDisabledError,
     ExecutionLedgerUpsert,
+    ReconcileRunRecord,
 )
 from app.services.execution_ledger.reconciler import ExecutionLedgerReconciler
+from app.services.execution_ledger.repository import _values_differ, fill_key
 
 
 class FakeRepo:
@@ -211,3 +214,186 @@ async def test_reconciler_skips_malformed_filled_at_with_one_run_warning(
     assert diff.would_insert == 0
     warnings = [r.message for r in caplog.records if "malformed filled_at" in r.message]
     assert warnings == ["execution ledger skipped 2 malformed filled_at row(s)"]
+
+
+class BatchFakeRepo(FakeRepo):
+    """In-memory ledger exposing both the per-fill and the batch surface."""
+
+    def __init__(self, rows: dict | None = None) -> None:
+        super().__init__()
+        self.rows: dict = dict(rows or {})
+        self.batches: list[int] = []
+        self.watermark: ReconcileRunRecord | None = None
+
+    def _status(self, fill: ExecutionLedgerUpsert) -> str:
+        existing = self.rows.get(fill_key(fill))
+        if existing is None:
+            return "inserted"
+        return "updated" if _values_differ(existing, fill) else "unchanged"
+
+    async def classify_fill(self, fill: ExecutionLedgerUpsert) -> str:
+        return self._status(fill)
+
+    async def upsert_fill(self, fill: ExecutionLedgerUpsert) -> tuple[str, int]:
+        status = self._status(fill)
+        self.rows[fill_key(fill)] = fill
+        self.upserts.append(fill)
+        return status, 42
+
+    async def classify_fills(self, fills, *, apply=False):  # noqa: ANN001
+        statuses = []
+        shadow = dict(self.rows)
+        for fill in fills:
+            existing = shadow.get(fill_key(fill))
+            status = (
+                "inserted"
+                if existing is None
+                else "updated"
+                if _values_differ(existing, fill)
+                else "unchanged"
+            )
+            statuses.append(status)
+            if apply and status != "unchanged":
+                shadow[fill_key(fill)] = fill
+        return statuses
+
+    async def upsert_fills(self, fills):  # noqa: ANN001
+        self.batches.append(len(fills))
+        for fill in fills:
+            self.rows[fill_key(fill)] = fill
+            self.upserts.append(fill)
+        return {fill_key(fill): 42 for fill in fills}
+
+    async def latest_run_per_broker(self) -> dict[str, ReconcileRunRecord]:
+        return {"upbit": self.watermark} if self.watermark else {}
+
+
+def _order(order_id: str, quantity: int) -> dict:
+    return {
+        "symbol": "BTC",
+        "raw_symbol": "KRW-BTC",
+        "instrument_type": "crypto",
+        "side": "buy",
+        "price": 100,
+        "quantity": quantity,
+        "total_amount": 100 * quantity,
+        "currency": "KRW",
+        "account": "upbit",
+        "order_id": order_id,
+        "filled_at": datetime(2026, 5, 13, tzinfo=UTC).isoformat(),
+        "fill_seq": 0,
+        "venue": "upbit_krw",
+    }
+
+
+_BATCH_ORDERS = [
+    _order("ord-1", 2),
+    _order("ord-2", 1),
+    _order("ord-2", 3),  # same key again later in the page
+    _order("ord-3", 1),
+    _order("ord-4", 5),
+]
+
+
+async def _batch_fetcher(**_kwargs):  # noqa: ANN003
+    return {"orders": list(_BATCH_ORDERS)}
+
+
+async def _seeded_repo() -> BatchFakeRepo:
+    repo = BatchFakeRepo()
+    # ord-3 is already in the ledger with a different quantity.
+    fills = await ExecutionLedgerReconciler(
+        repo, fetcher=_batch_fetcher
+    )._fetch_normalized(
+        "upbit",
+        window_hours=24,
+        start_at=datetime(2026, 5, 12, tzinfo=UTC),
+        end_at=datetime(2026, 5, 14, tzinfo=UTC),
+        max_pages=1,
+        source_run_id=uuid.uuid4(),
+    )
+    for fill in fills:
+        if fill.broker_order_id == "ord-3":
+            repo.rows[fill_key(fill)] = fill.model_copy(
+                update={"filled_qty": Decimal("9")}
+            )
+    return repo
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dry_run", [True, False])
+async def test_batch_path_matches_per_fill_accounting(
+    monkeypatch: pytest.MonkeyPatch, dry_run: bool
+) -> None:
+    monkeypatch.setattr(
+        "app.services.execution_ledger.reconciler.settings",
+        SimpleNamespace(EXECUTION_LEDGER_COMMIT_ENABLED=True),
+    )
+    sequential_repo = await _seeded_repo()
+    batch_repo = await _seeded_repo()
+
+    sequential = await ExecutionLedgerReconciler(
+        sequential_repo, fetcher=_batch_fetcher
+    ).run("upbit", dry_run=dry_run)
+    batched = await ExecutionLedgerReconciler(batch_repo, fetcher=_batch_fetcher).run(
+        "upbit", dry_run=dry_run, batch_size=2
+    )
+
+    counts = (
+        "would_insert",
+        "would_update",
+        "unchanged",
+        "committed_insert",
+        "committed_update",
+    )
+    assert {name: getattr(batched, name) for name in counts} == {
+        name: getattr(sequential, name) for name in counts
+    }
+    assert {key: row.filled_qty for key, row in batch_repo.rows.items()} == {
+        key: row.filled_qty for key, row in sequential_repo.rows.items()
+    }
+    if dry_run:
+        assert batch_repo.batches == []
+        assert sequential.would_insert == 4
+    else:
+        assert batch_repo.batches == [2, 2, 1]
+        assert (sequential.committed_insert, sequential.committed_update) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_resume_from_watermark_starts_at_last_committed_window_end(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "app.services.execution_ledger.reconciler.settings",
+        SimpleNamespace(EXECUTION_LEDGER_COMMIT_ENABLED=False),
+    )
+    captured: dict[str, object] = {}
+
+    async def fetcher(**kwargs):  # noqa: ANN003
+        captured.update(kwargs)
+        return {"orders": []}
+
+    watermark = datetime(2026, 5, 10, 6, tzinfo=UTC)
+    end_at = datetime(2026, 5, 12, tzinfo=UTC)
+    repo = BatchFakeRepo()
+    repo.watermark = ReconcileRunRecord(
+        run_id=uuid.uuid4(),
+        broker="upbit",
+        dry_run=False,
+        window_start=datetime(2026, 5, 9, tzinfo=UTC),
+        window_end=watermark,
+        started_at=watermark,
+        finished_at=watermark,
+    )
+
+    await ExecutionLedgerReconciler(repo, fetcher=fetcher).run(
+        "upbit", end_at=end_at, dry_run=True, resume_from_watermark=True
+    )
+
+    assert captured["start_at"] == watermark
+    assert repo.runs[0].window_start == watermark
+    with pytest.raises(ValueError, match="batch_size"):
+        await ExecutionLedgerReconciler(repo, fetcher=fetcher).run(
+            "upbit", dry_run=True, batch_size=0
+        )
@@ -0,0 +1,159 @@
+"""Unit tests for the precomputed XKRX/XNYS/NXT session index."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, date, datetime
+
+import pytest
+
+from app.core.config import settings
+from app.services.market_events import session_index as si
+
+
+@pytest.mark.unit
+def test_index_matches_exchange_calendars():
+    import exchange_calendars as xcals
+    import pandas as pd
+
+    for name in ("XKRX", "XNYS"):
+        cal = xcals.get_calendar(name)
+        index = si.session_index(name)
+        sessions = index.sessions_between(date(2024, 1, 1), date(2026, 6, 30))
+        expected = cal.sessions_in_range("2024-01-01", "2026-06-30")
+        assert sessions == [ts.date() for ts in expected]
+        for minute in pd.date_range("2025-11-26", "2025-12-02", freq="17min", tz="UTC"):
+            assert index.is_open_at(minute.to_pydatetime()) == bool(
+                cal.is_trading_minute(minute)
+            )
+
+
+@pytest.mark.unit
+def test_lookups_across_holidays_and_early_close():
+    xnys = si.session_index("XNYS")
+
+    assert xnys.status(date(2025, 7, 4)) == "closed"
+    assert xnys.next_session(date(2025, 7, 3)) == date(2025, 7, 7)
+    assert xnys.previous_session(date(2025, 7, 7)) == date(2025, 7, 3)
+    assert xnys.bounds(date(2025, 11, 28)) == (
+        datetime(2025, 11, 28, 14, 30, tzinfo=UTC),
+        datetime(2025, 11, 28, 18, 0, tzinfo=UTC),
+    )
+    assert xnys.session_of(datetime(2025, 11, 28, 17, 59, 30, tzinfo=UTC)) == date(
+        2025, 11, 28
+    )
+    assert xnys.session_of(datetime(2025, 11, 28, 18, 0, tzinfo=UTC)) is None
+
+
+@pytest.mark.unit
+def test_nxt_spans_venue_hours_on_xkrx_days():
+    nxt = si.session_index("NXT")
+
+    # 08:00 / 19:59 KST on a Friday session; KRX New Year holiday is closed.
+    assert nxt.session_of(datetime(2026, 5, 28, 23, 0, tzinfo=UTC)) == date(2026, 5, 29)
+    assert nxt.is_open_at(datetime(2026, 5, 29, 10, 59, tzinfo=UTC))
+    assert not nxt.is_open_at(datetime(2026, 5, 29, 11, 0, tzinfo=UTC))
+    assert nxt.status(date(2025, 1, 1)) == "closed"
+
+
+@pytest.mark.unit
+def test_outside_coverage_is_unknown_not_closed():
+    xkrx = si.session_index("XKRX")
+
+    assert xkrx.status(date(2100, 1, 4)) == "unknown"
+    assert xkrx.is_session(date(2100, 1, 4)) is False
+    assert xkrx.next_session(date(2100, 1, 1)) is None
+    assert xkrx.previous_session(date(1900, 1, 1)) is None
+    assert xkrx.session_of(datetime(2100, 1, 4, 1, tzinfo=UTC)) is None
+    with pytest.raises(ValueError):
+        xkrx.sessions_between(date(2100, 1, 1), date(2100, 1, 10))
+
+
+@pytest.mark.unit
+def test_artifact_is_reused_and_rebuilt_when_stale(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "session_index_artifact_dir", str(tmp_path))
+    si.clear_cache()
+    try:
+        built = si.session_index("XNYS")
+        (artifact,) = tmp_path.glob("*.json")
+        payload = json.loads(artifact.read_text())
+        assert payload["exchange_calendars"] == si._calendars_version()
+
+        def _no_build(*_args):
+            raise AssertionError("fresh artifact must not rebuild")
+
+        monkeypatch.setattr(si, "_build_payload", _no_build)
+        si.clear_cache()
+        assert si.session_index("XNYS").days == built.days
+
+        payload["built_on"] = "2000-01-01"
+        artifact.write_text(json.dumps(payload))
+        assert (
+            si._read_artifact(artifact, payload["exchange_calendars"], date.today())
+            is None
+        )
+    finally:
+        si.clear_cache()
+
+
+@pytest.mark.unit
+def test_artifact_payload_is_validated_before_use(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "session_index_artifact_dir", str(tmp_path))
+    si.clear_cache()
+    try:
+        si.session_index("XNYS")
+    finally:
+        si.clear_cache()
+    (artifact,) = tmp_path.glob("*.json")
+    payload = json.loads(artifact.read_text())
+    version = payload["exchange_calendars"]
+    today = date.fromisoformat(payload["built_on"])
+    assert si._read_artifact(artifact, version, today) == payload
+    assert tmp_path.stat().st_mode & 0o077 == 0
+
+    tampered = [
+        {**payload, "format": "1"},
+        {**payload, "built_on": 20260101},
+        {**payload, "calendars": {"XNYS": payload["calendars"]["XNYS"]}},
+    ]
+    xkrx = payload["calendars"]["XKRX"]
+    for key, value in (
+        ("days", list(reversed(xkrx["days"]))),
+        ("opens", xkrx["opens"][:-1]),
+        ("closes", [str(minute) for minute in xkrx["closes"]]),
+        ("first", xkrx["last"] + 1),
+    ):
+        tampered.append(
+            {
+                **payload,
+                "calendars": {**payload["calendars"], "XKRX": {**xkrx, key: value}},
+            }
+        )
+    for bad in (*tampered, ["not", "a", "payload"]):
+        artifact.write_text(json.dumps(bad))
+        assert si._read_artifact(artifact, version, today) is None
+
+
+@pytest.mark.unit
+def test_artifact_in_shared_directory_is_not_trusted(tmp_path, monkeypatch):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    monkeypatch.setattr(settings, "session_index_artifact_dir", str(shared))
+    si.clear_cache()
+    try:
+        si.session_index("XNYS")
+        (artifact,) = shared.glob("*.json")
+        payload = json.loads(artifact.read_text())
+        shared.chmod(0o777)
+
+        assert (
+            si._read_artifact(
+                artifact,
+                payload["exchange_calendars"],
+                date.fromisoformat(payload["built_on"]),
+            )
+            is None
+        )
+    finally:
+        shared.chmod(0o700)
+        si.clear_cache()
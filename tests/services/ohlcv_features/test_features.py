@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+from app.mcp_server.tooling.screening import enrichment
+from app.services.daily_candles.repository import DailyCandleRow
+from app.services.ohlcv_features.builder import (
+    build_feature_snapshot,
+    closed_rows,
+    last_closed_bar_date,
+)
+from app.services.ohlcv_features.freshness import StoredFeatures, feature_state
+
+pytestmark = [pytest.mark.unit]
+
+_NOW = dt.datetime(2026, 5, 6, 3, 0, tzinfo=dt.UTC)
+
+
+def _row(day: dt.date, close: float) -> DailyCandleRow:
+    return DailyCandleRow(
+        time_utc=dt.datetime.combine(day, dt.time(), dt.UTC),
+        symbol="KRW-BTC",
+        partition="upbit:KRW-BTC",
+        open=close,
+        high=close + 1,
+        low=close - 1,
+        close=close,
+        adj_close=None,
+        volume=1.0,
+        value=close,
+        source="upbit",
+    )
+
+
+def test_crypto_forming_bar_is_excluded() -> None:
+    rows = [_row(dt.date(2026, 5, day), 100.0 + day) for day in range(1, 7)]
+
+    assert last_closed_bar_date("crypto", now=_NOW) == dt.date(2026, 5, 5)
+    assert [r.time_utc.day for r in closed_rows(rows, market="crypto", now=_NOW)] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+    payload = build_feature_snapshot(
+        market="crypto", symbol="KRW-BTC", rows=rows, now=_NOW
+    )
+    assert payload is not None
+    assert payload.bar_time.date() == dt.date(2026, 5, 5)
+    assert payload.bars_used == 5
+    assert set(payload.features) >= {"sma", "rsi", "macd", "atr", "adx"}
+
+
+def test_no_closed_bar_builds_nothing() -> None:
+    rows = [_row(dt.date(2026, 5, 6), 100.0)]
+
+    assert (
+        build_feature_snapshot(market="crypto", symbol="KRW-BTC", rows=rows, now=_NOW)
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    ("bar_date", "expected", "state"),
+    [
+        (None, dt.date(2026, 5, 5), "missing"),
+        (dt.date(2026, 5, 5), dt.date(2026, 5, 5), "fresh"),
+        (dt.date(2026, 5, 4), dt.date(2026, 5, 5), "stale"),
+        (dt.date(2026, 5, 5), None, "stale"),
+    ],
+)
+def test_feature_state(bar_date, expected, state) -> None:
+    assert feature_state(bar_date, expected) == state
+
+
+@pytest.mark.asyncio
+async def test_screener_rsi_hydrates_only_from_fresh_vectors(monkeypatch) -> None:
+    def stored(symbol: str, rsi: float, state: str) -> StoredFeatures:
+        return StoredFeatures(
+            symbol=symbol,
+            bar_date=dt.date(2026, 5, 5),
+            close=1.0,
+            features={"rsi": {"14": rsi}},
+            computed_at=_NOW,
+            state=state,  # type: ignore[arg-type]
+        )
+
+    calls: list[set[str]] = []
+
+    async def fake_load(session, *, market, symbols, now=None):
+        calls.append(set(symbols))
+        return {
+            "005930": stored("005930", 28.5, "fresh"),
+            "000660": stored("000660", 71.0, "stale"),
+        }
+
+    monkeypatch.setattr(enrichment, "load_features", fake_load)
+    rows = [
+        {"short_code": "005930"},
+        {"short_code": "000660"},
+        {"short_code": "035420"},
+        {"short_code": "051910", "rsi": 40.0},
+    ]
+
+    filled = await enrichment._hydrate_rsi_from_feature_store(
+        rows, market="kr", session=object()
+    )
+
+    assert filled == 1
+    assert calls == [{"005930", "000660", "035420"}]
+    assert [row.get("rsi") for row in rows] == [28.5, None, None, 40.0]
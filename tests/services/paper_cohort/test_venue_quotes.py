@@ -9,6 +9,7 @@ import pytest
 from app.services.brokers.alpaca.config import AlpacaPaperSettings
 from app.services.brokers.alpaca.endpoints import PAPER_TRADING_BASE_URL
 from app.services.brokers.binance.dto import BinanceBookTicker
+from app.services.paper_cohort.runner import PaperCohortRunner
 from app.services.paper_cohort.venue_quotes import (
     AlpacaCryptoQuoteClient,
     ProductionVenueQuoteProvider,
@@ -94,3 +95,124 @@ async def test_production_quotes_use_distinct_exact_venue_read_boundaries() -> N
         ),
         ("GET", f"{PAPER_TRADING_BASE_URL}/v2/assets/BTCUSD"),
     ]
+
+
+@pytest.mark.asyncio
+async def test_batched_quotes_share_one_alpaca_data_request() -> None:
+    data_urls: list[str] = []
+
+    def data_handler(request: httpx.Request) -> httpx.Response:
+        data_urls.append(str(request.url))
+        return httpx.Response(
+            200,
+            json={
+                "quotes": {
+                    symbol: {
+                        "bp": "200",
+                        "bs": "4",
+                        "ap": "202",
+                        "as": "5",
+                        "t": "2026-07-14T01:00:01Z",
+                    }
+                    for symbol in ("BTC/USD", "ETH/USD")
+                }
+            },
+        )
+
+    def asset_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"min_order_size": "0.001", "min_trade_increment": "0.0001"},
+        )
+
+    async with (
+        httpx.AsyncClient(
+            base_url="https://data.alpaca.markets",
+            transport=httpx.MockTransport(data_handler),
+        ) as data_client,
+        httpx.AsyncClient(
+            base_url=PAPER_TRADING_BASE_URL,
+            transport=httpx.MockTransport(asset_handler),
+        ) as asset_client,
+    ):
+        alpaca = AlpacaCryptoQuoteClient(
+            data_client=data_client,
+            asset_client=asset_client,
+            alpaca_settings=AlpacaPaperSettings(
+                api_key="test-key", api_secret="test-secret"
+            ),
+        )
+        provider = ProductionVenueQuoteProvider(FakeBinance(), alpaca)  # type: ignore[arg-type]
+        alpaca_quotes = await provider.get_quotes("alpaca", ("BTCUSDT", "ETHUSDT"))
+        binance_quotes = await provider.get_quotes("binance", ("BTCUSDT", "ETHUSDT"))
+
+    assert data_urls == [
+        "https://data.alpaca.markets/v1beta3/crypto/us/latest/quotes"
+        "?symbols=BTC%2FUSD%2CETH%2FUSD"
+    ]
+    assert {key: quote.symbol for key, quote in alpaca_quotes.items()} == {
+        "BTCUSDT": "BTC/USD",
+        "ETHUSDT": "ETH/USD",
+    }
+    assert [quote.symbol for quote in binance_quotes.values()] == [
+        "BTCUSDT",
+        "ETHUSDT",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_runner_prefetches_each_signalled_venue_symbol_once() -> None:
+    calls: list[tuple[str, tuple[str, ...]]] = []
+
+    class BatchQuotes:
+        async def get_quote(self, venue: str, symbol: str):
+            raise AssertionError("batched providers are not asked per symbol")
+
+        async def get_quotes(self, venue: str, symbols):
+            calls.append((venue, tuple(symbols)))
+            return {
+                symbol: await FakeBinance().book_ticker(symbol) for symbol in symbols
+            }
+
+    runner = PaperCohortRunner(
+        None,  # type: ignore[arg-type]
+        capture=None,  # type: ignore[arg-type]
+        quote_provider=BatchQuotes(),  # type: ignore[arg-type]
+    )
+
+    quotes = await runner._prefetch_quotes(
+        ["binance", "alpaca"], ["BTCUSDT", "ETHUSDT", "BTCUSDT"]
+    )
+
+    assert calls == [
+        ("binance", ("BTCUSDT", "ETHUSDT")),
+        ("alpaca", ("BTCUSDT", "ETHUSDT")),
+    ]
+    assert list(quotes) == [
+        ("binance", "BTCUSDT"),
+        ("binance", "ETHUSDT"),
+        ("alpaca", "BTCUSDT"),
+        ("alpaca", "ETHUSDT"),
+    ]
+    assert await runner._prefetch_quotes(["binance"], []) == {}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_runner_prefetch_leaves_batch_misses_to_per_signal_reads() -> None:
+    class PartialBatch:
+        async def get_quote(self, venue: str, symbol: str):
+            raise AssertionError("prefetch never raises or falls back itself")
+
+        async def get_quotes(self, venue: str, symbols):
+            return {"BTCUSDT": await FakeBinance().book_ticker("BTCUSDT")}
+
+    runner = PaperCohortRunner(
+        None,  # type: ignore[arg-type]
+        capture=None,  # type: ignore[arg-type]
+        quote_provider=PartialBatch(),  # type: ignore[arg-type]
+    )
+
+    quotes = await runner._prefetch_quotes(["binance"], ["BTCUSDT", "ETHUSDT"])
+
+    assert list(quotes) == [("binance", "BTCUSDT")]
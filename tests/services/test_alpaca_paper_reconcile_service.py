@@ -845,3 +845,170 @@ async def test_bulk_limit_applies_after_eligibility_filters() -> None:
     assert result["count"] == 1
     assert result["reconciled"][0]["ledger_id"] == 201
     assert eligible.lifecycle_state == "filled"
+
+
+# ---------------------------------------------------------------------------
+# Run-scoped fill activity index — one feed read per run, optional watermark
+# ---------------------------------------------------------------------------
+
+
+def _order(order_id: str, client_order_id: str, qty: str) -> Order:
+    order = filled_order(qty=qty)
+    order.id = order_id
+    order.client_order_id = client_order_id
+    order.qty = Decimal(qty)
+    order.filled_avg_price = None
+    return order
+
+
+class MultiOrderFillsBroker(FillsBroker):
+    def __init__(self, orders: list[Order], activities: list[Any]) -> None:
+        super().__init__(None, activities)
+        self.orders = {order.client_order_id: order for order in orders}
+
+    async def get_order_by_client_order_id(self, client_order_id: str) -> Order:
+        return self.orders[client_order_id]
+
+
+@pytest.mark.asyncio
+async def test_one_fill_feed_read_serves_every_candidate() -> None:
+    from app.services.alpaca_paper_reconcile_service import AlpacaPaperReconcileService
+
+    orders = [_order(f"order-{n}", f"coid-{n}", "1") for n in range(5)]
+    activities = [
+        _fill(order.id, "1", "100", "1", fill_id=f"fill-{n}")
+        for n, order in enumerate(orders)
+    ]
+    ledger = Ledger([Row(id=n, client_order_id=f"coid-{n}") for n in range(5)])
+    broker = MultiOrderFillsBroker(orders, activities)
+
+    result = await AlpacaPaperReconcileService(ledger, broker).reconcile(dry_run=False)
+
+    assert broker.calls == [{"page_token": None, "page_size": 100, "direction": "desc"}]
+    assert [outcome["ledger_id"] for outcome in result["reconciled"]] == list(range(5))
+    assert {outcome["action"] for outcome in result["reconciled"]} == {"booked_filled"}
+    assert len(ledger.status_calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_fill_pagination_failure_escalates_every_order_needing_fills() -> None:
+    from app.services.alpaca_paper_reconcile_service import AlpacaPaperReconcileService
+
+    orders = [_order(f"order-{n}", f"coid-{n}", "1") for n in range(2)]
+    # Full pages whose last activity has no id: the cursor cannot advance.
+    activities = [_fill("other", "1", "1", "1", fill_id=None) for _ in range(100)]
+    ledger = Ledger([Row(id=n, client_order_id=f"coid-{n}") for n in range(2)])
+    broker = MultiOrderFillsBroker(orders, activities)
+
+    result = await AlpacaPaperReconcileService(ledger, broker).reconcile(dry_run=False)
+
+    assert [outcome["reason"] for outcome in result["reconciled"]] == [
+        "fill_pagination_token_missing",
+        "fill_pagination_token_missing",
+    ]
+    assert len(broker.calls) == 1
+    assert ledger.status_calls == []
+
+
+@pytest.mark.asyncio
+async def test_watermark_fetches_only_activities_newer_than_last_seen() -> None:
+    from app.services.alpaca_paper_reconcile_service import (
+        AlpacaPaperReconcileService,
+        FillActivityWatermark,
+    )
+
+    old = _order("order-old", "coid-old", "150")
+    history = [
+        _fill(old.id, "1", "100", str(150 - n), fill_id=f"old-{n}") for n in range(150)
+    ]
+    watermark = FillActivityWatermark()
+    first = MultiOrderFillsBroker([old], history)
+    await AlpacaPaperReconcileService(
+        Ledger([Row(id=1, client_order_id="coid-old")]),
+        first,
+        fill_watermark=watermark,
+    ).reconcile(dry_run=False)
+    assert len(first.calls) == 2
+    assert watermark.newest_id == "old-0"
+
+    new = _order("order-new", "coid-new", "2")
+    fresh = [
+        _fill(new.id, "1", "110", "2", fill_id="new-1"),
+        _fill(new.id, "1", "100", "1", fill_id="new-0"),
+    ]
+    second = MultiOrderFillsBroker([old, new], [*fresh, *history])
+    ledger = Ledger(
+        [
+            Row(id=1, client_order_id="coid-old"),
+            Row(id=2, client_order_id="coid-new"),
+        ]
+    )
+
+    result = await AlpacaPaperReconcileService(
+        ledger, second, fill_watermark=watermark
+    ).reconcile(dry_run=False)
+
+    assert second.calls == [{"page_token": None, "page_size": 100, "direction": "desc"}]
+    assert [outcome["action"] for outcome in result["reconciled"]] == [
+        "booked_filled",
+        "booked_filled",
+    ]
+    assert Decimal(result["reconciled"][1]["avg_price"]) == Decimal("105")
+    assert watermark.newest_id == "new-1"
+
+
+@pytest.mark.asyncio
+async def test_incomplete_incremental_set_triggers_one_full_rescan() -> None:
+    from app.services.alpaca_paper_reconcile_service import (
+        AlpacaPaperReconcileService,
+        FillActivityWatermark,
+    )
+
+    order = _order("order-1", "coid-1", "2")
+    seen = _fill(order.id, "1", "100", "1", fill_id="a")
+    late = _fill(order.id, "1", "120", "2", fill_id="late")
+    # The late-posted fill sorts *behind* the watermark in the desc feed.
+    watermark = FillActivityWatermark(fills={"a": seen}, newest_id="a")
+    broker = MultiOrderFillsBroker([order], [seen, late])
+
+    result = await AlpacaPaperReconcileService(
+        Ledger([Row(id=1, client_order_id="coid-1")]),
+        broker,
+        fill_watermark=watermark,
+    ).reconcile(dry_run=False)
+
+    assert len(broker.calls) == 2
+    assert result["reconciled"][0]["action"] == "booked_filled"
+    assert Decimal(result["reconciled"][0]["avg_price"]) == Decimal("110")
+    assert set(watermark.fills) == {"a", "late"}
+
+
+@pytest.mark.asyncio
+async def test_watermark_past_the_fill_window_is_refused_and_dropped() -> None:
+    from app.services.alpaca_paper_reconcile_service import (
+        AlpacaPaperReconcileService,
+        FillActivityWatermark,
+    )
+
+    history = [
+        _fill("order-old", "1", "100", "1", fill_id=f"old-{n}") for n in range(2000)
+    ]
+    watermark = FillActivityWatermark(
+        fills={fill.id: fill for fill in history}, newest_id="old-0"
+    )
+    new = _order("order-new", "coid-new", "1")
+    fresh = _fill(new.id, "1", "100", "1", fill_id="new-0")
+    ledger = Ledger([Row(id=1, client_order_id="coid-new")])
+    broker = MultiOrderFillsBroker([new], [fresh, *history])
+
+    result = await AlpacaPaperReconcileService(
+        ledger, broker, fill_watermark=watermark
+    ).reconcile(dry_run=False)
+
+    assert len(broker.calls) == 1
+    assert [outcome["reason"] for outcome in result["reconciled"]] == [
+        "fill_pagination_limit_exceeded"
+    ]
+    assert ledger.status_calls == []
+    assert watermark.fills == {}
+    assert watermark.newest_id is None
@@ -86,6 +86,7 @@ EXPECTED_UPBIT_API_RATE_LIMITS = {
     "GET /v1/accounts": {"rate": 30, "period": 1.0},
     "GET /v1/order": {"rate": 30, "period": 1.0},
     "GET /v1/orders/closed": {"rate": 30, "period": 1.0},
+    "GET /v1/orderbook": {"rate": 10, "period": 1.0},
     "GET /v1/ticker": {"rate": 10, "period": 1.0},
 }
 
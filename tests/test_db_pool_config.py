@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import pytest
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
-from app.core.db import build_engine
+from app.core.db import TimedAsyncAdaptedQueuePool, build_engine
 
 _URL = "postgresql+asyncpg://u:p@localhost:5432/db"
 
@@ -16,7 +16,8 @@ def test_default_is_async_queue_pool(monkeypatch: pytest.MonkeyPatch) -> None:
     # loops); clear it here to verify build_engine's TRUE default (queue).
     monkeypatch.delenv("DB_POOL_CLASS", raising=False)
     engine = build_engine(_URL)
-    assert type(engine.pool).__name__ == "AsyncAdaptedQueuePool"
+    assert type(engine.pool) is TimedAsyncAdaptedQueuePool
+    assert isinstance(engine.pool, AsyncAdaptedQueuePool)
     assert engine.pool.size() == 5  # default DB_POOL_SIZE
 
 
@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+import uuid
 from datetime import UTC, date, datetime
+from decimal import Decimal
 
 import pytest
 
+from app.models.review import TradeForecast
+from app.models.trading import InstrumentType
 from app.services.daily_candles.repository import DailyCandleRow
 from app.services.trade_journal import forecast_service as svc
 from app.services.trade_journal.forecast_service import (
@@ -350,3 +354,95 @@ def test_terminal_session_gate_tracks_us_dst_close():
 
     assert before_dst_close is not None
     assert after_dst_close is None
+
+
+def _due_price_target(symbol: str, start: date, review: date) -> TradeForecast:
+    return TradeForecast(
+        forecast_id=uuid.uuid4(),
+        created_by="claude",
+        symbol=symbol,
+        instrument_type=InstrumentType.equity_kr,
+        forecast_target={
+            "kind": "price_target",
+            "direction": "at_or_above",
+            "target_price": 100.0,
+            "outcome_rule_version": svc._PRICE_TOUCH_RULE_VERSION,
+        },
+        probability=Decimal("0.7"),
+        forecast_start_date=start,
+        review_date=review,
+        status="open",
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_due_forecasts_reads_each_symbol_once(monkeypatch):
+    due = [
+        _due_price_target("005930", date(2026, 6, 1), date(2026, 6, 3)),
+        _due_price_target("005930", date(2026, 6, 3), date(2026, 6, 5)),
+        _due_price_target("000660", date(2026, 6, 1), date(2026, 6, 5)),
+        _due_price_target("000660", date(2026, 6, 2), date(2026, 6, 4)),
+    ]
+    stored = {
+        "005930": [
+            _candle(high=95.0, low=90.0, t=datetime(2026, 6, 2, tzinfo=UTC)),
+            _candle(high=120.0, low=99.0, t=datetime(2026, 6, 4, tzinfo=UTC)),
+        ],
+        "000660": [],
+    }
+    reads: list[tuple[str, date, date]] = []
+    backfills: list[str] = []
+    partitions: list[str] = []
+
+    async def fake_due(_db, *, now, limit):
+        return due
+
+    async def fake_quarantined(_db, *, now, limit):
+        return []
+
+    async def fake_partition(_db, *, symbol, instrument_type):
+        partitions.append(symbol)
+        return svc.MarketKey.KR, "KRX"
+
+    async def fake_fetch(_db, *, market, symbol, partition, start_date, review_date):
+        reads.append((symbol, start_date, review_date))
+        return list(stored[symbol])
+
+    async def fake_backfill(*, symbol, market, partition, horizon_bars=200):
+        backfills.append(symbol)
+        return 0
+
+    async def forbidden(*_args, **_kwargs):
+        raise AssertionError("batch must not fall back to per-forecast reads")
+
+    monkeypatch.setattr(svc, "list_due_forecasts", fake_due)
+    monkeypatch.setattr(svc, "list_due_quarantined_forecasts", fake_quarantined)
+    monkeypatch.setattr(svc, "_resolve_candle_partition", fake_partition)
+    monkeypatch.setattr(svc, "_fetch_padded_window", fake_fetch)
+    monkeypatch.setattr(svc, "_backfill_daily_candles", fake_backfill)
+    monkeypatch.setattr(svc, "_read_window_candles", forbidden)
+
+    batch = await svc.resolve_due_forecasts(
+        object(), persist=False, now=datetime(2026, 6, 8, tzinfo=UTC)
+    )
+
+    statuses = [result["status"] for _, result in batch.results]
+    assert statuses == [
+        "previewed",
+        "previewed",
+        "unresolved_no_data",
+        "unresolved_no_data",
+    ]
+    assert [result["computed"]["outcome"] for _, result in batch.results[:2]] == [
+        False,
+        True,
+    ]
+    assert batch.results[0][1]["computed"]["resolution_detail"]["candles"] == 1
+    # One union-window read per symbol, plus one re-read after the backfill.
+    assert reads == [
+        ("005930", date(2026, 6, 1), date(2026, 6, 5)),
+        ("000660", date(2026, 6, 1), date(2026, 6, 5)),
+        ("000660", date(2026, 6, 1), date(2026, 6, 5)),
+    ]
+    assert backfills == ["000660"]
+    assert partitions == ["005930", "000660"]
@@ -112,7 +112,7 @@ async def test_save_missing_symbol_envelope():
 
 
 # ROB-712 — forecast_resolve must expose backfill_missing and forward it to
-# resolve_forecast on both the single and the batch path.
+# resolve_forecast (single) / resolve_due_forecasts (batch).
 @pytest.mark.asyncio
 async def test_forecast_resolve_passes_backfill_flag(monkeypatch):
     from app.mcp_server.tooling import forecast_tools
@@ -154,23 +154,29 @@ async def test_forecast_resolve_passes_backfill_flag(monkeypatch):
 @pytest.mark.asyncio
 async def test_due_batch_forwards_terminal_fail_closed_evidence(monkeypatch):
     from app.mcp_server.tooling import forecast_tools
+    from app.services.trade_journal import forecast_service as svc
 
-    due = SimpleNamespace(forecast_id="terminal-id", symbol="SMCI")
+    due = SimpleNamespace(
+        forecast_id="terminal-id",
+        symbol="SMCI",
+        forecast_target={"kind": "thesis_holds"},
+        instrument_type="equity_us",
+    )
     evidence = {
         "target_kind": "terminal_close",
         "outcome_rule_version": "terminal-close-v1-up-gte-down-lt",
         "review_date": "2026-08-20",
     }
 
-    async def fake_due(_db, *, limit):
+    async def fake_due(_db, *, now, limit):
         assert limit == 25
         return [due]
 
-    async def fake_quarantined(_db, *, limit):
+    async def fake_quarantined(_db, *, now, limit):
         assert limit == 25
         return []
 
-    async def fake_resolve(_db, **_kwargs):
+    async def fake_resolve(_db, _row, **_kwargs):
         return {
             "status": "unresolved_untrusted_source",
             "changed": False,
@@ -189,13 +195,9 @@ async def test_due_batch_forwards_terminal_fail_closed_evidence(monkeypatch):
         def __call__(self) -> _StubSession:
             return _StubSession()
 
-    monkeypatch.setattr(forecast_tools, "list_due_forecasts", fake_due)
-    monkeypatch.setattr(
-        forecast_tools,
-        "list_due_quarantined_forecasts",
-        fake_quarantined,
-    )
-    monkeypatch.setattr(forecast_tools, "resolve_forecast", fake_resolve)
+    monkeypatch.setattr(svc, "list_due_forecasts", fake_due)
+    monkeypatch.setattr(svc, "list_due_quarantined_forecasts", fake_quarantined)
+    monkeypatch.setattr(svc, "_resolve_row", fake_resolve)
     monkeypatch.setattr(forecast_tools, "_session_factory", lambda: _StubSessionMaker())
 
     result = await forecast_resolve(dry_run=True, backfill_missing=False)
@@ -208,22 +210,33 @@ async def test_due_batch_forwards_terminal_fail_closed_evidence(monkeypatch):
 @pytest.mark.asyncio
 async def test_due_batch_reports_quarantine_without_consuming_due_limit(monkeypatch):
     from app.mcp_server.tooling import forecast_tools
+    from app.services.trade_journal import forecast_service as svc
 
-    legacy = SimpleNamespace(forecast_id="legacy-id", symbol="OLD")
-    eligible = SimpleNamespace(forecast_id="eligible-id", symbol="NEW")
+    legacy = SimpleNamespace(
+        forecast_id="legacy-id",
+        symbol="OLD",
+        forecast_target={"kind": "price_target"},
+        instrument_type="equity_kr",
+    )
+    eligible = SimpleNamespace(
+        forecast_id="eligible-id",
+        symbol="NEW",
+        forecast_target={"kind": "thesis_holds"},
+        instrument_type="equity_kr",
+    )
     calls: list[str] = []
 
-    async def fake_quarantined(_db, *, limit):
+    async def fake_quarantined(_db, *, now, limit):
         assert limit == 1
         return [legacy]
 
-    async def fake_due(_db, *, limit):
+    async def fake_due(_db, *, now, limit):
         assert limit == 1
         return [eligible]
 
-    async def fake_resolve(_db, *, forecast_id, **_kwargs):
-        calls.append(forecast_id)
-        if forecast_id == "legacy-id":
+    async def fake_resolve(_db, row, **_kwargs):
+        calls.append(row.forecast_id)
+        if row.forecast_id == "legacy-id":
             return {
                 "status": "quarantined_legacy_price_target",
                 "changed": False,
@@ -242,13 +255,9 @@ async def test_due_batch_reports_quarantine_without_consuming_due_limit(monkeypa
         def __call__(self) -> _StubSession:
             return _StubSession()
 
-    monkeypatch.setattr(
-        forecast_tools,
-        "list_due_quarantined_forecasts",
-        fake_quarantined,
-    )
-    monkeypatch.setattr(forecast_tools, "list_due_forecasts", fake_due)
-    monkeypatch.setattr(forecast_tools, "resolve_forecast", fake_resolve)
+    monkeypatch.setattr(svc, "list_due_quarantined_forecasts", fake_quarantined)
+    monkeypatch.setattr(svc, "list_due_forecasts", fake_due)
+    monkeypatch.setattr(svc, "_resolve_row", fake_resolve)
     monkeypatch.setattr(forecast_tools, "_session_factory", lambda: _StubSessionMaker())
 
     result = await forecast_resolve(
@@ -0,0 +1,231 @@
+"""Conditional-GET / body-cache / gzip layer for the /invest/api read routes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.db import get_db
+from app.routers import invest_api, invest_http_cache
+from app.routers.dependencies import get_authenticated_user
+from app.routers.invest_api import get_invest_home_service
+from app.routers.invest_api import router as invest_api_router
+from app.schemas.invest_home import InvestHomeResponse, InvestHomeResponseMeta
+from app.services.invest_home_service import build_grouped_holdings, build_home_summary
+
+
+class _CountingHomeService:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_home(self, *, user_id: int, **kwargs: Any) -> InvestHomeResponse:
+        self.calls += 1
+        return InvestHomeResponse(
+            homeSummary=build_home_summary([]),
+            accounts=[],
+            holdings=[],
+            groupedHoldings=build_grouped_holdings([]),
+            meta=InvestHomeResponseMeta(warnings=[]),
+        )
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+
+
+class _CountingMomentumRepo:
+    calls = 0
+
+    def __init__(self, db: Any) -> None:
+        pass
+
+    async def list_momentum_events(self, **kwargs: Any) -> list[Any]:
+        type(self).calls += 1
+        return []
+
+
+@pytest.fixture
+def home_service() -> _CountingHomeService:
+    return _CountingHomeService()
+
+
+@pytest.fixture
+def client(home_service: _CountingHomeService) -> TestClient:
+    app = FastAPI()
+    app.include_router(invest_api_router)
+    app.dependency_overrides[get_authenticated_user] = lambda: type(
+        "U", (), {"id": 7}
+    )()
+    app.dependency_overrides[get_invest_home_service] = lambda: home_service
+
+    async def _db():
+        yield object()
+
+    app.dependency_overrides[get_db] = _db
+    return TestClient(app)
+
+
+@pytest.mark.unit
+def test_home_emits_weak_etag_and_answers_304(
+    client: TestClient, home_service: _CountingHomeService
+) -> None:
+    first = client.get("/invest/api/home")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/invest/api/home", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    # No watermark for live holdings: the body is rebuilt, only transfer is saved.
+    assert home_service.calls == 2
+
+
+@pytest.mark.unit
+def test_large_bodies_are_gzipped_when_accepted(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "invest_api_gzip_min_bytes", 16)
+
+    plain = client.get("/invest/api/home", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/invest/api/home", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert gzipped.json() == plain.json()
+    assert gzipped.headers["etag"] == plain.headers["etag"]
+
+
+@pytest.mark.unit
+def test_pure_route_answers_304_without_building(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _watermark(db: Any, *, market: str) -> str:
+        return f"{market}|2026-06-15T00:00:00+00:00"
+
+    monkeypatch.setattr(invest_api, "momentum_snapshot_watermark", _watermark)
+    monkeypatch.setattr(
+        invest_api, "InvestMomentumEventSnapshotsRepository", _CountingMomentumRepo
+    )
+    _CountingMomentumRepo.calls = 0
+
+    first = client.get("/invest/api/momentum/events")
+    assert first.status_code == 200
+    assert _CountingMomentumRepo.calls == 1
+
+    second = client.get(
+        "/invest/api/momentum/events",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert second.status_code == 304
+    assert _CountingMomentumRepo.calls == 1
+
+    async def _moved(db: Any, *, market: str) -> str:
+        return f"{market}|2026-06-15T00:10:00+00:00"
+
+    monkeypatch.setattr(invest_api, "momentum_snapshot_watermark", _moved)
+    third = client.get(
+        "/invest/api/momentum/events",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert third.status_code == 200
+    assert third.headers["etag"] != first.headers["etag"]
+    assert _CountingMomentumRepo.calls == 2
+
+
+@pytest.mark.unit
+def test_body_cache_short_circuits_the_builder(
+    client: TestClient,
+    home_service: _CountingHomeService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeRedis()
+
+    async def _client() -> _FakeRedis:
+        return fake
+
+    monkeypatch.setattr(invest_http_cache, "_get_redis_client", _client)
+
+    first = client.get("/invest/api/home")
+    second = client.get("/invest/api/home")
+    revalidated = client.get(
+        "/invest/api/home", headers={"If-None-Match": first.headers["etag"]}
+    )
+    other_params = client.get("/invest/api/home", params={"includePaper": "true"})
+
+    assert home_service.calls == 2  # first + the distinct includePaper key
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert revalidated.status_code == 304
+    assert other_params.status_code == 200
+    assert len(fake.store) == 2
+
+
+@pytest.mark.unit
+def test_body_cache_is_fail_open(
+    client: TestClient,
+    home_service: _CountingHomeService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _BrokenRedis:
+        async def get(self, key: str) -> str:
+            raise ConnectionError("down")
+
+        async def set(self, key: str, value: str, ex: int | None = None) -> None:
+            raise ConnectionError("down")
+
+    async def _client() -> _BrokenRedis:
+        return _BrokenRedis()
+
+    monkeypatch.setattr(invest_http_cache, "_get_redis_client", _client)
+
+    response = client.get("/invest/api/home")
+
+    assert response.status_code == 200
+    assert home_service.calls == 1
+
+
+class _FailingSavepointSession:
+    def __init__(self) -> None:
+        self.savepoint_rolled_back = False
+
+    def begin_nested(self) -> Any:
+        session = self
+
+        class _Savepoint:
+            async def __aenter__(self) -> None:
+                return None
+
+            async def __aexit__(self, exc_type: Any, *_: Any) -> bool:
+                session.savepoint_rolled_back = exc_type is not None
+                return False
+
+        return _Savepoint()
+
+    async def execute(self, stmt: Any) -> Any:
+        raise RuntimeError("relation does not exist")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_watermark_query_rolls_back_its_savepoint() -> None:
+    from app.services.invest_view_model.watermarks import news_ingestion_watermark
+
+    db = _FailingSavepointSession()
+
+    assert await news_ingestion_watermark(db) is None  # type: ignore[arg-type]
+    assert db.savepoint_rolled_back
@@ -616,3 +616,69 @@ async def test_calendar_keeps_forexfactory_when_tradingview_missing(
 
     event_ids = [event.eventId for event in resp.days[0].events]
     assert event_ids == ["ff-cpi", "ff-jobs"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_calendar_cache_reuses_days_until_watermark_moves(monkeypatch) -> None:
+    from app.services.invest_view_model import calendar_service as svc
+
+    svc.clear_calendar_cache()
+    fake_resp = MagicMock()
+    fake_resp.events = [
+        _fake_event(event_id="aapl", symbol="AAPL", ev_date=date(2026, 5, 4))
+    ]
+    fake_query_service = MagicMock()
+    fake_query_service.list_for_range = AsyncMock(return_value=fake_resp)
+    monkeypatch.setattr(svc, "MarketEventsQueryService", lambda db: fake_query_service)
+    freshness = _patch_freshness(monkeypatch, svc, date(2026, 5, 4), date(2026, 5, 7))
+    watermark = AsyncMock(return_value="w1")
+    monkeypatch.setattr(svc, "market_events_watermark", watermark)
+
+    async def build(from_date: date, to_date: date, resolver: RelationResolver):
+        return await svc.build_calendar(
+            db=MagicMock(),
+            resolver=resolver,
+            from_date=from_date,
+            to_date=to_date,
+            tab="all",
+            use_cache=True,
+        )
+
+    try:
+        await build(date(2026, 5, 4), date(2026, 5, 5), RelationResolver())
+        held = await build(
+            date(2026, 5, 4),
+            date(2026, 5, 5),
+            RelationResolver(held={("us", "AAPL")}),
+        )
+        assert fake_query_service.list_for_range.await_count == 1
+        assert freshness.get_coverage_matrix.await_count == 1
+        # Relations are per request even when the day comes from the cache.
+        assert held.days[0].events[0].relation == "held"
+        assert held.days[0].events[0].badges == ["holdings"]
+
+        # Only the uncached tail of a wider range is queried.
+        wider = await build(date(2026, 5, 4), date(2026, 5, 7), RelationResolver())
+        assert [day.date for day in wider.days] == [
+            date(2026, 5, 4),
+            date(2026, 5, 5),
+            date(2026, 5, 6),
+            date(2026, 5, 7),
+        ]
+        assert wider.days[0].events[0].relation == "none"
+        assert fake_query_service.list_for_range.await_args.args == (
+            date(2026, 5, 6),
+            date(2026, 5, 7),
+        )
+
+        # A new ingestion run invalidates every cached day.
+        watermark.return_value = "w2"
+        await build(date(2026, 5, 4), date(2026, 5, 5), RelationResolver())
+        assert fake_query_service.list_for_range.await_count == 3
+        assert fake_query_service.list_for_range.await_args.args == (
+            date(2026, 5, 4),
+            date(2026, 5, 5),
+        )
+    finally:
+        svc.clear_calendar_cache()
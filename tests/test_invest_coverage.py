@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 from decimal import Decimal
 from types import SimpleNamespace
@@ -24,7 +25,11 @@ from app.schemas.invest_coverage import (
     CoverageSourceCandidate,
     InvestCoverageSurface,
 )
-from app.services.invest_coverage_service import build_invest_coverage
+from app.services import invest_coverage_service
+from app.services.invest_coverage_service import (
+    build_invest_coverage,
+    clear_coverage_cache,
+)
 
 
 def test_coverage_surface_accepts_source_candidates_and_references_list():
@@ -57,6 +62,13 @@ def test_coverage_actionability_rejects_unexpected_fields():
         CoverageActionability(unexpected="run-now")  # type: ignore[call-arg]
 
 
+@pytest.fixture(autouse=True)
+def _clear_rollup_cache():
+    clear_coverage_cache()
+    yield
+    clear_coverage_cache()
+
+
 @pytest.fixture
 def app(db_session) -> FastAPI:
     app = FastAPI()
@@ -695,3 +707,100 @@ async def test_coverage_endpoint_exposes_naver_candidates_field_on_kr(
         assert surface["sourceOfTruth"] != "naver_finance"
 
     assert any("Naver" in note for note in payload["notes"])
+
+
+_SECTION_QUERIES = (
+    "_symbol_universe_surfaces",
+    "_screener_surfaces",
+    "_news_surfaces",
+    "_calendar_surfaces",
+    "_research_report_surfaces",
+    "_investor_flow_surfaces",
+    "_holdings_surfaces",
+    "_pending_order_surfaces",
+    "_orderbook_nxt_surfaces",
+    "_ohlcv_surfaces",
+    "_quote_surfaces",
+    "_valuation_surfaces",
+    "_symbol_rows",
+)
+
+
+class _FakeSessionFactory:
+    def __init__(self) -> None:
+        self.opened = 0
+
+    def __call__(self):
+        factory = self
+
+        class _Session:
+            async def __aenter__(self):
+                factory.opened += 1
+                return SimpleNamespace()
+
+            async def __aexit__(self, *exc):
+                return None
+
+        return _Session()
+
+
+def _stub_sections(monkeypatch, calls: list[str], slow: str | None = None) -> None:
+    for name in _SECTION_QUERIES:
+
+        async def query(*args, _name=name, **kwargs):
+            calls.append(_name)
+            if _name == slow:
+                await asyncio.sleep(5)
+            return []
+
+        monkeypatch.setattr(invest_coverage_service, name, query)
+
+
+@pytest.mark.asyncio
+async def test_section_over_budget_reports_error_without_failing(monkeypatch):
+    calls: list[str] = []
+    _stub_sections(monkeypatch, calls, slow="_ohlcv_surfaces")
+    factory = _FakeSessionFactory()
+
+    coverage = await build_invest_coverage(
+        SimpleNamespace(),
+        market="kr",
+        as_of=dt.date(2026, 5, 4),
+        session_factory=factory,
+        budget_seconds=0.05,
+    )
+
+    ohlcv = [s for s in coverage.surfaces if s.surface == "ohlcv"]
+    assert [s.state for s in ohlcv] == ["error"]
+    assert any(gap.startswith("ohlcv: ") for gap in coverage.gaps)
+    assert factory.opened == len(_SECTION_QUERIES)
+
+
+@pytest.mark.asyncio
+async def test_rollup_cache_is_keyed_by_ingestion_watermark(monkeypatch):
+    calls: list[str] = []
+    _stub_sections(monkeypatch, calls)
+    watermark = [(1, 1)]
+
+    async def fake_watermark(db):
+        return watermark[0]
+
+    monkeypatch.setattr(invest_coverage_service, "_ingestion_watermark", fake_watermark)
+
+    async def build():
+        return await build_invest_coverage(
+            SimpleNamespace(),
+            market="kr",
+            as_of=dt.date(2026, 5, 4),
+            session_factory=_FakeSessionFactory(),
+            use_cache=True,
+        )
+
+    first = await build()
+    await build()
+    assert calls.count("_ohlcv_surfaces") == 1
+
+    watermark[0] = (2, 1)
+    second = await build()
+    assert calls.count("_ohlcv_surfaces") == 2
+    assert second.surfaces == first.surfaces
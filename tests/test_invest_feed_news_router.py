@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -1040,3 +1040,105 @@ async def test_feed_news_emits_source_market_alongside_legacy_market(
     for item in resp.items:
         assert item.sourceMarket == item.market
         assert item.sourceMarket in ("kr", "us", "crypto")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_feed_news_query_pages_over_search_index_ids(monkeypatch) -> None:
+    from app.services.invest_view_model import feed_news_service as svc
+    from app.services.news_search_index import NewsSearchPage
+
+    search = MagicMock(return_value=NewsSearchPage(ids=[901], total=1))
+    monkeypatch.setattr(
+        svc,
+        "get_news_search_index",
+        AsyncMock(return_value=SimpleNamespace(search=search, covers_since=None)),
+    )
+    db = MagicMock()
+    scalar_result = MagicMock()
+    scalar_result.scalars.return_value.all.return_value = [
+        _fake_article(id=901, market="kr", symbol="005930", name="삼성전자"),
+    ]
+    summary_result = MagicMock()
+    summary_result.all.return_value = []
+    db.execute = AsyncMock(
+        side_effect=[scalar_result, summary_result, _empty_related_result()]
+    )
+    monkeypatch.setattr(
+        svc, "build_market_issues", AsyncMock(return_value=MagicMock(items=[]))
+    )
+    cursor = svc._encode_cursor(_NOW, 950)
+
+    resp = await svc.build_feed_news(
+        db=db,
+        resolver=RelationResolver(),
+        tab="kr",
+        limit=20,
+        cursor=cursor,
+        symbol_filter=("005930", "kr"),
+        q="삼성 HBM",
+    )
+
+    search.assert_called_once_with(
+        "삼성 HBM",
+        market="kr",
+        symbol=("005930", "kr"),
+        before=(_NOW, 950),
+        order="recent",
+        limit=21,
+    )
+    stmt = str(db.execute.await_args_list[0].args[0])
+    assert "news_articles.id IN" in stmt
+    assert "news_article_related_symbols" not in stmt
+    assert [i.id for i in resp.items] == [901]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_feed_news_query_continues_past_index_window_in_db(monkeypatch) -> None:
+    from app.services.invest_view_model import feed_news_service as svc
+    from app.services.news_search_index import NewsSearchPage
+
+    search = MagicMock(return_value=NewsSearchPage(ids=[901], total=1))
+    monkeypatch.setattr(
+        svc,
+        "get_news_search_index",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                search=search, covers_since=_NOW - timedelta(hours=168)
+            )
+        ),
+    )
+    db = MagicMock()
+    scalar_result = MagicMock()
+    scalar_result.scalars.return_value.all.return_value = [
+        _fake_article(id=901, market="kr", symbol="005930", name="삼성전자"),
+        _fake_article(id=12, market="kr", symbol="005930", name="삼성전자"),
+    ]
+    summary_result = MagicMock()
+    summary_result.all.return_value = []
+    db.execute = AsyncMock(
+        side_effect=[scalar_result, summary_result, _empty_related_result()]
+    )
+    monkeypatch.setattr(
+        svc, "build_market_issues", AsyncMock(return_value=MagicMock(items=[]))
+    )
+
+    resp = await svc.build_feed_news(
+        db=db,
+        resolver=RelationResolver(),
+        tab="kr",
+        limit=20,
+        cursor=None,
+        symbol_filter=("005930", "kr"),
+        q="삼성 HBM",
+    )
+
+    stmt = db.execute.await_args_list[0].args[0]
+    sql = str(stmt)
+    params = stmt.compile().params
+    assert "news_articles.id IN" in sql
+    assert "news_articles.article_published_at <" in sql
+    assert "EXISTS" in sql
+    assert {"%삼성%", "%HBM%"} <= {v for v in params.values() if isinstance(v, str)}
+    assert [i.id for i in resp.items] == [901, 12]
@@ -11,6 +11,7 @@ import pytest
 
 from app.models.manual_holdings import MarketType
 from app.services import invest_home_readers as readers
+from app.services.brokers.upbit import client as upbit_client
 
 
 class _FakeKISAccount:
@@ -349,7 +350,7 @@ async def test_upbit_reader_uses_coin_value_not_krw_cash(
         return {"KRW-BTC": 100_000_000.0}
 
     monkeypatch.setattr(readers, "fetch_my_coins", _coins)
-    monkeypatch.setattr(readers, "fetch_multiple_current_prices", _prices)
+    monkeypatch.setattr(upbit_client, "fetch_multiple_current_prices", _prices)
     monkeypatch.setattr(
         readers, "get_active_upbit_markets", AsyncMock(return_value={"KRW-BTC"})
     )
@@ -410,7 +411,7 @@ async def test_upbit_reader_falls_back_per_market_and_skips_zero_quantity(
         return {}
 
     monkeypatch.setattr(readers, "fetch_my_coins", _coins)
-    monkeypatch.setattr(readers, "fetch_multiple_current_prices", _prices)
+    monkeypatch.setattr(upbit_client, "fetch_multiple_current_prices", _prices)
 
     # Mock active/warning markets
     monkeypatch.setattr(
@@ -447,7 +448,7 @@ async def test_upbit_reader_filters_dust(monkeypatch: pytest.MonkeyPatch) -> Non
         return {"KRW-BTC": 100_000_000.0, "KRW-DOGE": 100.0}
 
     monkeypatch.setattr(readers, "fetch_my_coins", _coins)
-    monkeypatch.setattr(readers, "fetch_multiple_current_prices", _prices)
+    monkeypatch.setattr(upbit_client, "fetch_multiple_current_prices", _prices)
     monkeypatch.setattr(
         readers,
         "get_active_upbit_markets",
@@ -488,7 +489,7 @@ async def test_upbit_reader_does_not_show_loss_when_all_prices_missing(
         return {}
 
     monkeypatch.setattr(readers, "fetch_my_coins", _coins)
-    monkeypatch.setattr(readers, "fetch_multiple_current_prices", _prices)
+    monkeypatch.setattr(upbit_client, "fetch_multiple_current_prices", _prices)
     monkeypatch.setattr(
         readers, "get_active_upbit_markets", AsyncMock(return_value={"KRW-PCI"})
     )
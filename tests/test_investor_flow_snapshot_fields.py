@@ -143,7 +143,7 @@ async def test_builder_integration_with_html_fixture(monkeypatch: pytest.MonkeyP
         return BeautifulSoup(sample_html, "lxml")
 
     monkeypatch.setattr(
-        "app.services.naver_finance.investor._fetch_html", mock_fetch_html
+        "app.services.naver_finance.investor._fetch_document", mock_fetch_html
     )
 
     result = await build_investor_flow_snapshots(
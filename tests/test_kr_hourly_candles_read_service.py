@@ -13,7 +13,11 @@ from app.services import kr_intraday as _intraday_module
 from app.services.kr_intraday import _kis_api as _kis_api_module
 from app.services.kr_intraday import _repository as _repo_module
 from app.services.kr_intraday._types import _MinuteRow
-from app.services.kr_intraday._utils import _merge_overlay_into_intraday_frame
+from app.services.kr_intraday._utils import (
+    _aggregate_minutes_to_buckets,
+    _merge_minute_rows,
+    _merge_overlay_into_intraday_frame,
+)
 
 
 def _create_mock_kis_client(
@@ -1326,6 +1330,74 @@ async def test_hour_aggregation_from_minutes():
     assert row["datetime"] == pd.Timestamp("2026-02-23 09:00:00")
 
 
+def test_bucket_aggregation_keeps_row_order_skips_nan_and_unions_venues():
+    frame = pd.DataFrame(
+        {
+            # Out of time order within the 09:00 bucket; 07:00 is off-session.
+            "datetime": pd.to_datetime(
+                [
+                    "2026-02-23 09:03",
+                    "2026-02-23 07:00",
+                    "2026-02-23 09:01",
+                    "2026-02-23 10:00",
+                    "2026-02-23 09:02",
+                    "not-a-time",
+                ],
+                errors="coerce",
+            ),
+            "open": [10.0, 1.0, 11.0, 20.0, 12.0, 0.0],
+            "high": [15.0, 1.0, float("nan"), 21.0, 14.0, 0.0],
+            "low": [9.0, 1.0, 8.0, 19.0, float("nan"), 0.0],
+            "close": [13.0, 1.0, 10.5, 20.5, 12.5, 0.0],
+            "volume": [1.0, 5.0, float("nan"), 4.0, 2.0, 0.0],
+            "venues": [["NTX"], ["KRX"], [" krx "], "NTX", None, []],
+        }
+    )
+
+    result = _aggregate_minutes_to_buckets(frame, bucket_minutes=60)
+
+    assert result["datetime"].tolist() == [
+        pd.Timestamp("2026-02-23 09:00"),
+        pd.Timestamp("2026-02-23 10:00"),
+    ]
+    first = result.iloc[0]
+    assert (first["open"], first["high"], first["low"], first["close"]) == (
+        10.0,
+        15.0,
+        8.0,
+        12.5,
+    )
+    assert first["volume"] == 3.0
+    assert first["value"] == 0.0
+    assert first["session"] == "REGULAR"
+    assert result["venues"].tolist() == [["KRX", "NTX"], ["NTX"]]
+
+
+def test_merge_minute_rows_prefers_krx_prices_and_last_duplicate():
+    minute = datetime.datetime(2026, 2, 23, 15, 30)
+
+    def row(venue: str, price: float, volume: float, at=minute) -> _MinuteRow:
+        return _MinuteRow(at, venue, price, price, price, price, volume, volume * 10)
+
+    result = _merge_minute_rows(
+        [
+            row("NTX", 101.0, 1.0),
+            row("KRX", 100.0, 2.0),
+            row("KRX", 99.0, 3.0),
+            row("NTX", 50.0, 4.0, at=minute - datetime.timedelta(hours=8)),
+        ]
+    )
+
+    assert len(result) == 1
+    merged = result.iloc[0]
+    assert merged["datetime"] == pd.Timestamp(minute)
+    assert merged["close"] == 99.0
+    assert merged["volume"] == 4.0
+    assert merged["value"] == 40.0
+    assert merged["session"] == "AFTER_MARKET"
+    assert merged["venues"] == ["KRX", "NTX"]
+
+
 def test_normalize_intraday_rows_returns_naive_kst_minute_times():
     from app.services import kr_hourly_candles_read_service as svc
 
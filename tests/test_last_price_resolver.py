@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+import app.services.brokers.upbit.client as upbit_service
+import app.services.brokers.yahoo.client as yahoo_service
+from app.core.config import settings
+from app.services import last_price_resolver
+from app.services.last_price_resolver import (
+    PriceUnavailableError,
+    clear_price_snapshot,
+    resolve_last_prices,
+)
+from app.services.us_symbol_universe_service import USSymbolUniverseLookupError
+
+
+@pytest.fixture(autouse=True)
+def _clear_snapshot():
+    clear_price_snapshot()
+    yield
+    clear_price_snapshot()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_serves_repeat_reads_within_ttl(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "last_price_snapshot_ttl_seconds", 60.0)
+    fetch = AsyncMock(return_value={"KRW-BTC": 100.0})
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
+
+    first = await resolve_last_prices("CRYPTO", ["krw-btc "])
+    second = await resolve_last_prices("CRYPTO", ["KRW-BTC"])
+
+    assert first.prices == second.prices == {"KRW-BTC": 100.0}
+    fetch.assert_awaited_once_with(["KRW-BTC"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_of_one_symbol_share_a_fetch(monkeypatch) -> None:
+    release = asyncio.Event()
+    calls: list[list[str]] = []
+
+    async def fetch(symbols: list[str]) -> dict[str, float]:
+        calls.append(symbols)
+        await release.wait()
+        return dict.fromkeys(symbols, 1.0)
+
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
+
+    first = asyncio.create_task(resolve_last_prices("CRYPTO", ["KRW-BTC"]))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(resolve_last_prices("CRYPTO", ["KRW-BTC", "KRW-ETH"]))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await first).prices == {"KRW-BTC": 1.0}
+    assert (await second).prices == {"KRW-BTC": 1.0, "KRW-ETH": 1.0}
+    assert calls == [["KRW-BTC"], ["KRW-ETH"]]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_reader_does_not_cancel_shared_fetch(monkeypatch) -> None:
+    release = asyncio.Event()
+    calls: list[list[str]] = []
+
+    async def fetch(symbols: list[str]) -> dict[str, float]:
+        calls.append(symbols)
+        await release.wait()
+        return dict.fromkeys(symbols, 1.0)
+
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
+
+    first = asyncio.create_task(resolve_last_prices("CRYPTO", ["KRW-BTC"]))
+    second = asyncio.create_task(resolve_last_prices("CRYPTO", ["KRW-BTC"]))
+    while not calls:
+        await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert (await second).prices == {"KRW-BTC": 1.0}
+    assert calls == [["KRW-BTC"]]
+
+
+@pytest.mark.asyncio
+async def test_upbit_failed_batch_is_split_until_failures_are_isolated(
+    monkeypatch,
+) -> None:
+    calls: list[tuple[str, ...]] = []
+
+    async def fetch(symbols: list[str]) -> dict[str, float]:
+        calls.append(tuple(symbols))
+        if "KRW-FAKE" in symbols:
+            raise RuntimeError("404 not found")
+        return {symbol: 2.0 for symbol in symbols if symbol != "KRW-DROP"}
+
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
+
+    resolution = await resolve_last_prices(
+        "CRYPTO", ["KRW-A", "KRW-B", "KRW-FAKE", "KRW-DROP"]
+    )
+
+    assert resolution.prices == {"KRW-A": 2.0, "KRW-B": 2.0}
+    assert str(resolution.errors["KRW-FAKE"]) == "404 not found"
+    assert isinstance(resolution.errors["KRW-DROP"], PriceUnavailableError)
+    assert calls[0] == ("KRW-A", "KRW-B", "KRW-FAKE", "KRW-DROP")
+    assert ("KRW-FAKE",) in calls and ("KRW-DROP",) in calls
+
+
+@pytest.mark.asyncio
+async def test_us_symbols_outside_universe_are_not_fetched(monkeypatch) -> None:
+    lookup = AsyncMock(return_value={"AAPL": "NASD"})
+    monkeypatch.setattr(last_price_resolver, "get_us_exchanges_by_symbols", lookup)
+    fetch_price = AsyncMock(return_value=pd.DataFrame([{"close": 195.0}]))
+    monkeypatch.setattr(yahoo_service, "fetch_price", fetch_price)
+
+    resolution = await resolve_last_prices("US", ["AAPL", "NOPE"])
+
+    lookup.assert_awaited_once_with(["AAPL", "NOPE"], db=None)
+    fetch_price.assert_awaited_once_with("AAPL")
+    assert resolution.prices == {"AAPL": 195.0}
+    assert isinstance(resolution.errors["NOPE"], USSymbolUniverseLookupError)
+
+
+@pytest.mark.asyncio
+async def test_us_universe_lookup_uses_each_callers_session(monkeypatch) -> None:
+    release = asyncio.Event()
+    sessions: list[object] = []
+
+    async def lookup(symbols: list[str], db=None) -> dict[str, str]:
+        sessions.append(db)
+        return dict.fromkeys(symbols, "NASD")
+
+    async def fetch_price(symbol: str) -> pd.DataFrame:
+        await release.wait()
+        return pd.DataFrame([{"close": 195.0}])
+
+    monkeypatch.setattr(last_price_resolver, "get_us_exchanges_by_symbols", lookup)
+    monkeypatch.setattr(yahoo_service, "fetch_price", fetch_price)
+    first_db, second_db = object(), object()
+
+    first = asyncio.create_task(resolve_last_prices("US", ["AAPL"], db=first_db))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(
+        resolve_last_prices("US", ["AAPL", "MSFT"], db=second_db)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await first).prices == {"AAPL": 195.0}
+    assert (await second).prices == {"AAPL": 195.0, "MSFT": 195.0}
+    assert sessions == [first_db, second_db]
+
+
+@pytest.mark.asyncio
+async def test_kis_reads_are_bounded_and_report_empty_frames(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "last_price_kis_concurrency", 2)
+    active = 0
+    peak = 0
+
+    class FakeKIS:
+        async def inquire_price(self, symbol: str) -> pd.DataFrame:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if symbol == "000000":
+                return pd.DataFrame()
+            return pd.DataFrame([{"close": 1000.0}])
+
+    symbols = [f"{index:06d}" for index in range(6)]
+    resolution = await resolve_last_prices("KR", symbols, kis_client=FakeKIS())
+
+    assert peak == 2
+    assert set(resolution.prices) == set(symbols[1:])
+    assert isinstance(resolution.errors["000000"], PriceUnavailableError)
+    with pytest.raises(ValueError, match="kis_client"):
+        await resolve_last_prices("KR", symbols)
@@ -1534,3 +1534,59 @@ async def test_get_ohlcv_us_week_does_not_use_toss_fallback(monkeypatch):
         await market_data_service.get_ohlcv("AAPL", "us", "week", count=5)
 
     toss_mock.assert_not_awaited()
+
+
+def test_to_candle_rows_converts_columns_with_row_fallbacks() -> None:
+    frame = pd.DataFrame(
+        {
+            "datetime": pd.Series([None, dt.datetime(2026, 5, 4, 9)], dtype=object),
+            "date": [dt.date(2026, 5, 1), dt.date(2026, 5, 4)],
+            "open": pd.Series([None, 10.0], dtype=object),
+            "high": [11.0, 12.0],
+            "low": [9.0, 9.5],
+            "close": [10.5, 11.5],
+            "volume": [100, 200],
+            "value": pd.Series([None, 2300.0], dtype=object),
+        }
+    )
+
+    rows = market_data_service._to_candle_rows(
+        frame, symbol="005930", market="equity_kr", source="kis", period="1h"
+    )
+
+    assert [row.timestamp for row in rows] == [
+        dt.datetime(2026, 5, 1),
+        dt.datetime(2026, 5, 4, 9),
+    ]
+    assert [row.open for row in rows] == [0.0, 10.0]
+    assert [row.volume for row in rows] == [100.0, 200.0]
+    assert [row.value for row in rows] == [None, 2300.0]
+
+    hourly = pd.DataFrame(
+        {
+            "datetime": pd.date_range(
+                "2026-05-04 09:00", periods=3, freq="h", tz="Asia/Seoul"
+            ),
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": 1.5,
+            "volume": 10.0,
+        }
+    )
+    rows = market_data_service._to_candle_rows(
+        hourly, symbol="005930", market="equity_kr", source="kis", period="1h"
+    )
+    assert rows[-1].timestamp == dt.datetime(
+        2026, 5, 4, 11, tzinfo=hourly["datetime"].dt.tz
+    )
+    assert {row.value for row in rows} == {None}
+
+    with pytest.raises(ValidationError, match="datetime or date"):
+        market_data_service._to_candle_rows(
+            pd.DataFrame({"open": [1.0]}),
+            symbol="005930",
+            market="equity_kr",
+            source="kis",
+            period="1h",
+        )
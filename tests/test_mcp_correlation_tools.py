@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock
 import pandas as pd
 import pytest
 
+from app.mcp_server.tooling.return_panel import clear_return_panel_cache
 from tests._mcp_tooling_support import _patch_runtime_attr, build_tools
 
 _CORRELATION_COMPANY_NAME_ERROR = (
@@ -14,6 +15,13 @@ _CORRELATION_COMPANY_NAME_ERROR = (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_panel_cache():
+    clear_return_panel_cache()
+    yield
+    clear_return_panel_cache()
+
+
 def _price_frame(closes: Sequence[float]) -> pd.DataFrame:
     return pd.DataFrame(
         {
@@ -127,7 +135,10 @@ async def test_get_correlation_keeps_partial_success_with_invalid_company_name(
     assert result["errors"] == [
         f"삼성전자: {_CORRELATION_COMPANY_NAME_ERROR}",
     ]
-    assert result["correlation_matrix"] == [[1.0, 1.0], [1.0, 1.0]]
+    matrix = result["correlation_matrix"]
+    assert [len(row) for row in matrix] == [2, 2]
+    assert matrix[0][0] == matrix[1][1] == 1.0
+    assert matrix[0][1] == matrix[1][0] == pytest.approx(1.0, abs=1e-4)
 
 
 @pytest.mark.asyncio
@@ -1181,14 +1181,28 @@ class TestAnalyzeStockBatch:
 
 
 @pytest.mark.asyncio
-async def test_get_correlation_tool_uses_analysis_screening_correlation_alias(
+async def test_get_correlation_tool_correlates_returns_on_shared_dates(
     monkeypatch,
 ):
     tools = build_tools()
+    dates = pd.date_range("2026-01-05", periods=6, freq="D").date
+    frames = {
+        "AAPL": pd.DataFrame(
+            {"date": dates, "close": [100.0, 102.0, 101.0, 104.0, 103.0, 106.0]}
+        ),
+        # No candle on the third day: its returns into and out of that day
+        # have no same-interval AAPL counterpart.
+        "MSFT": pd.DataFrame(
+            {
+                "date": [dates[0], dates[1], dates[3], dates[4], dates[5]],
+                "close": [50.0, 51.0, 52.0, 51.5, 53.0],
+            }
+        ),
+    }
 
     async def fake_fetch(symbol, market_type, count):
-        _ = symbol, market_type, count
-        return pd.DataFrame({"close": [100.0, 101.0, 102.0, 103.0]})
+        _ = market_type, count
+        return frames[symbol]
 
     monkeypatch.setattr(
         analysis_screening,
@@ -1198,17 +1212,19 @@ async def test_get_correlation_tool_uses_analysis_screening_correlation_alias(
     monkeypatch.setattr(
         analysis_tool_handlers, "_fetch_ohlcv_for_indicators", fake_fetch
     )
-    monkeypatch.setattr(
-        analysis_screening,
-        "_calculate_pearson_correlation",
-        lambda left, right: 0.42,
-    )
 
     result = await tools["get_correlation"](["aapl", "msft"], period=60)
 
+    expected = np.corrcoef(
+        [102 / 100 - 1, 103 / 104 - 1, 106 / 103 - 1],
+        [51 / 50 - 1, 51.5 / 52 - 1, 53 / 51.5 - 1],
+    )[0, 1]
     assert result["success"] is True
     assert result["symbols"] == ["AAPL", "MSFT"]
-    assert result["correlation_matrix"][0][1] == pytest.approx(0.42)
+    assert result["correlation_matrix"][0][1] == pytest.approx(expected)
+    assert result["correlation_matrix"][1][0] == pytest.approx(expected)
+    assert result["metadata"]["alignment"] == "date"
+    assert result["metadata"]["return_observations"] == [[5, 3], [3, 3]]
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,110 @@
+"""
+Tests for the universe-wide batch indicator API.
+
+Every batch row must reproduce ``_compute_indicators`` for that symbol exactly.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.mcp_server.tooling import market_data_indicators
+from app.mcp_server.tooling.market_data_indicators_batch import (
+    IndicatorBatch,
+    compute_indicator_batch,
+    indicator_rows,
+)
+
+_ALL_INDICATORS: list[market_data_indicators.IndicatorType] = [
+    "sma",
+    "ema",
+    "rsi",
+    "macd",
+    "bollinger",
+    "atr",
+    "pivot",
+    "adx",
+    "stoch_rsi",
+    "obv",
+]
+
+
+def _ragged_universe(seed: int) -> dict[str, pd.DataFrame]:
+    """Symbols with ragged histories, flat/rounded closes and NaN holes."""
+    rng = np.random.default_rng(seed)
+    frames: dict[str, pd.DataFrame] = {}
+    for i, n in enumerate([1, 2, 5, 15, 20, 29, 35, 60, 199, 250, 250, 250]):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        if i == 10:
+            close = np.round(close)
+        if i == 11:
+            close = np.full(n, 50.0)
+        if n > 40:
+            close[n // 2] = np.nan
+        frames[f"S{i}"] = pd.DataFrame(
+            {
+                "close": close,
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "volume": rng.integers(1, 1000, n).astype(float),
+            }
+        )
+    return frames
+
+
+@pytest.mark.unit
+class TestIndicatorBatch:
+    """Tests for IndicatorBatch stacking."""
+
+    def test_right_aligns_and_pads(self):
+        batch = IndicatorBatch.from_frames(
+            {
+                "A": pd.DataFrame({"close": [1.0, 2.0, 3.0]}),
+                "B": pd.DataFrame({"close": [4.0]}),
+            }
+        )
+
+        assert batch.close.shape == (2, 3)
+        assert np.isnan(batch.close[1, :2]).all()
+        assert batch.close[1, 2] == 4.0
+        assert batch.mask.tolist() == [[True, True, True], [False, False, True]]
+        assert batch.high is None
+
+    def test_raises_on_missing_close(self):
+        with pytest.raises(ValueError, match="Missing required columns"):
+            IndicatorBatch.from_frames({"A": pd.DataFrame({"open": [1.0]})})
+
+
+@pytest.mark.unit
+class TestComputeIndicatorBatch:
+    """Tests for compute_indicator_batch / indicator_rows."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_rows_match_per_symbol_helper_exactly(self, seed):
+        frames = _ragged_universe(seed)
+        batch = IndicatorBatch.from_frames(frames)
+
+        rows = indicator_rows(batch, compute_indicator_batch(batch, _ALL_INDICATORS))
+
+        for symbol, frame in frames.items():
+            expected = market_data_indicators._compute_indicators(
+                frame, _ALL_INDICATORS
+            )
+            # repr() so NaN/None placement and float bits are compared too.
+            assert repr(rows[symbol]) == repr(expected), symbol
+
+    def test_columns_are_one_value_per_symbol(self):
+        batch = IndicatorBatch.from_frames(_ragged_universe(0))
+
+        result = compute_indicator_batch(batch, ["rsi", "macd"])
+
+        assert set(result) == {"rsi", "macd"}
+        assert result["macd"]["macd"].shape == (len(batch.symbols),)
+        # A one-bar history cannot produce an RSI.
+        assert np.isnan(result["rsi"]["14"][0])
+
+    def test_raises_on_missing_columns(self):
+        batch = IndicatorBatch.from_frames({"A": pd.DataFrame({"close": [1.0, 2.0]})})
+
+        with pytest.raises(ValueError, match="Missing required columns"):
+            compute_indicator_batch(batch, ["atr"])
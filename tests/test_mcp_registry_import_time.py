@@ -0,0 +1,128 @@
+"""Per-profile import-time benchmark for the lazy MCP registration manifest.
+
+Each profile is registered in a fresh interpreter under ``python -X importtime``
+so the measured module set is exactly what a cold profile container pays for.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from app.mcp_server.profiles import McpProfile
+from app.mcp_server.tooling.registry import (
+    _REGISTRARS,
+    PROFILE_REGISTRARS,
+    profile_tool_modules,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_SCRIPT = textwrap.dedent(
+    """
+    import sys
+    from app.core.config import settings
+    from app.mcp_server.profiles import McpProfile
+    from app.mcp_server.tooling.registry import register_all_tools
+
+    # Enable the flag-gated branches so the measurement covers the widest
+    # registration each profile can perform.
+    settings.PAPER_EXECUTION_ENABLED = True
+    settings.alpaca_paper_crypto_enabled = True
+
+    class _MCP:
+        def tool(self, *args, **kwargs):
+            return lambda fn: fn
+
+    register_all_tools(_MCP(), profile=McpProfile(sys.argv[1]))
+    """
+)
+
+
+def _import_profile(profile: McpProfile) -> dict[str, int]:
+    """Return ``{module: cumulative_us}`` imported while registering ``profile``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT, profile.value],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|", 2))
+        if cumulative.isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_every_profile_has_a_manifest_entry() -> None:
+    assert set(PROFILE_REGISTRARS) == set(McpProfile)
+    for names in PROFILE_REGISTRARS.values():
+        assert names <= set(_REGISTRARS)
+
+
+def test_manifest_rejects_registrars_outside_profile() -> None:
+    from app.mcp_server.tooling import registry
+
+    load = registry._profile_loader(McpProfile.SHADOW_REPLAY)
+    with pytest.raises(RuntimeError, match="registration manifest"):
+        load("register_order_tools")
+
+
+# Heavy third-party stacks that must stay out of a profile's cold start.
+# yfinance is only touched inside tool bodies (via ``LazyModule``), so no
+# profile imports it at registration; pandas is still pulled in by the broker
+# clients, so only the profiles that reach none of them are held to it.
+_DEFERRED_EVERYWHERE = ("yfinance", "tvscreener")
+_PANDAS_FREE_PROFILES = frozenset(
+    {
+        McpProfile.SHADOW_REPLAY,
+        McpProfile.PAPER_EXECUTION,
+        McpProfile.ALPACA_PAPER_CLEAN,
+    }
+)
+# Upper bound on modules loaded per profile (measured counts plus ~15%
+# headroom); a regression that re-introduces an eager heavy import trips it.
+_MODULE_BUDGET = {
+    McpProfile.SHADOW_REPLAY: 1060,
+    McpProfile.PAPER_EXECUTION: 1020,
+    McpProfile.ALPACA_PAPER_CLEAN: 800,
+}
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("profile", list(McpProfile), ids=lambda p: p.value)
+def test_profile_import_time_is_scoped_to_manifest(profile: McpProfile) -> None:
+    modules = _import_profile(profile)
+
+    # Registering the profile never loads a registrar outside its manifest
+    # entry, directly or through a sibling registration module.
+    all_registrar_modules = {module for module, _ in _REGISTRARS.values()}
+    foreign = all_registrar_modules - profile_tool_modules(profile)
+    assert not foreign & set(modules), sorted(foreign & set(modules))
+
+    for heavy in _DEFERRED_EVERYWHERE:
+        assert heavy not in modules, f"{profile.value} imports {heavy}"
+    if profile in _PANDAS_FREE_PROFILES:
+        assert "pandas" not in modules, f"{profile.value} imports pandas"
+    if profile in _MODULE_BUDGET:
+        assert len(modules) <= _MODULE_BUDGET[profile], len(modules)
+
+
+@pytest.mark.slow
+def test_narrow_profile_imports_less_than_default() -> None:
+    narrow = _import_profile(McpProfile.SHADOW_REPLAY)
+    default = _import_profile(McpProfile.DEFAULT)
+
+    assert len(narrow) < len(default)
+    assert "app.services.action_report.snapshot_backed.collectors.registry" not in (
+        narrow
+    )
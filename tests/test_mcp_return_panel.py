@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.mcp_server.tooling.return_panel import (
+    ReturnPanel,
+    cached_return_panel,
+    clear_return_panel_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_panel_cache():
+    clear_return_panel_cache()
+    yield
+    clear_return_panel_cache()
+
+
+def _random_frames(seed: int, count: int) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    calendar = pd.date_range("2025-01-01", periods=160, freq="D")
+    frames: dict[str, pd.DataFrame] = {}
+    for index in range(count):
+        dates = calendar if index % 3 == 0 else calendar[calendar.dayofweek < 5]
+        dates = dates[-int(rng.integers(30, len(dates))) :]
+        keep = rng.random(len(dates)) > 0.05
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+        frames[f"S{index:02d}"] = pd.DataFrame(
+            {"date": dates[keep].date, "close": closes[keep]}
+        )
+    return frames
+
+
+def _reference_returns(panel: ReturnPanel) -> pd.DataFrame:
+    closes = pd.DataFrame(panel.closes, columns=list(panel.symbols))
+    return closes / closes.shift(1) - 1
+
+
+def test_pairwise_statistics_match_pandas_on_ragged_calendars():
+    panel = ReturnPanel.from_frames(_random_frames(seed=7, count=24))
+    returns = _reference_returns(panel)
+
+    np.testing.assert_allclose(panel.returns, returns.to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(
+        panel.correlation, returns.corr().to_numpy(), atol=1e-12, equal_nan=True
+    )
+    np.testing.assert_allclose(
+        panel.covariance, returns.cov().to_numpy(), atol=1e-15, equal_nan=True
+    )
+    np.testing.assert_allclose(
+        panel.correlation_matrix("spearman"),
+        returns.corr("spearman").to_numpy(),
+        atol=1e-12,
+        equal_nan=True,
+    )
+    valid = returns.notna().astype(int).to_numpy()
+    np.testing.assert_array_equal(panel.observations, valid.T @ valid)
+
+
+def test_rolling_beta_matches_pandas_rolling_cov_over_var():
+    panel = ReturnPanel.from_frames(_random_frames(seed=3, count=6))
+    returns = _reference_returns(panel)
+    benchmark = returns["S00"]
+    expected = np.column_stack(
+        [
+            returns[symbol].rolling(5).cov(benchmark) / benchmark.rolling(5).var()
+            for symbol in panel.symbols
+        ]
+    )
+
+    beta = panel.rolling_beta("S00", 5)
+
+    assert np.isfinite(beta).sum() > 0
+    np.testing.assert_allclose(beta, expected, atol=1e-10, equal_nan=True)
+    with pytest.raises(ValueError, match="window"):
+        panel.rolling_beta("S00", 1)
+
+
+def test_crypto_and_equity_returns_pair_only_over_identical_intervals():
+    days = pd.date_range("2026-01-02", "2026-01-06", freq="D").date  # Fri..Tue
+    crypto = pd.DataFrame({"date": days, "close": [100.0, 110.0, 99.0, 90.0, 99.0]})
+    equity = pd.DataFrame(
+        {"date": [days[0], days[3], days[4]], "close": [50.0, 40.0, 44.0]}
+    )
+
+    panel = ReturnPanel.from_frames({"KRW-BTC": crypto, "AAPL": equity})
+
+    assert panel.close_date == date(2026, 1, 6)
+    # Fri→Mon equity move is not paired with crypto's Sun→Mon return.
+    assert np.isnan(panel.returns[3, 1])
+    assert panel.observations[0, 1] == 1
+    assert panel.returns[4, 0] == pytest.approx(panel.returns[4, 1])
+
+
+def test_tz_aware_candles_keep_their_local_calendar_date():
+    # Daily bars stamped at KST midnight fall on the previous UTC day.
+    kst = pd.date_range("2026-01-05", periods=3, freq="D", tz="Asia/Seoul")
+    expected = [date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7)]
+    panel = ReturnPanel.from_frames(
+        {
+            "COLUMN": pd.DataFrame({"date": kst, "close": [1.0, 2.0, 3.0]}),
+            "INDEX": pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=kst),
+            "OBJECTS": pd.DataFrame(
+                {"date": list(kst.to_pydatetime()), "close": [1.0, 2.0, 3.0]},
+                dtype=object,
+            ),
+        }
+    )
+
+    assert panel.aligned_by_date is True
+    assert panel.dates.astype(object).tolist() == expected
+
+
+def test_undated_frames_fall_back_to_tail_alignment():
+    panel = ReturnPanel.from_frames(
+        {
+            "A": pd.DataFrame({"close": [1.0, 100.0, 101.0, 103.0]}),
+            "B": pd.DataFrame({"close": [200.0, 202.0, 206.0]}),
+        }
+    )
+
+    assert panel.aligned_by_date is False
+    assert panel.close_date is None
+    assert panel.correlation[0, 1] == pytest.approx(1.0)
+    assert panel.observations.tolist() == [[3, 2], [2, 2]]
+
+
+def test_cached_panel_is_reused_until_latest_close_changes():
+    frames = _random_frames(seed=1, count=4)
+
+    first = cached_return_panel(frames, period=60)
+    _ = first.correlation
+
+    assert cached_return_panel(dict(frames), period=60) is first
+    assert cached_return_panel(frames, period=90) is not first
+
+    moved = dict(frames)
+    moved["S01"] = frames["S01"].assign(
+        close=frames["S01"]["close"].where(
+            frames["S01"].index < len(frames["S01"]) - 1, 1.0
+        )
+    )
+    assert cached_return_panel(moved, period=60) is not first
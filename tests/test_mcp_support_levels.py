@@ -0,0 +1,88 @@
+"""
+Tests for the shared support/resistance level engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.mcp_server.tooling import market_data_indicators
+from app.mcp_server.tooling.market_data_levels import (
+    support_resistance_batch,
+    support_resistance_levels,
+)
+
+
+def _frame(seed: int, n: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {
+            "high": close * (1 + np.abs(rng.normal(0, 0.01, n))),
+            "low": close * (1 - np.abs(rng.normal(0, 0.01, n))),
+            "close": close,
+            "volume": rng.integers(0, 10_000, n).astype(float),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestClusterPriceLevels:
+    """Tests for the sort-and-sweep _cluster_price_levels."""
+
+    def test_merges_levels_within_tolerance_of_running_mean(self):
+        levels = [
+            (103.0, "c"),
+            (100.0, "a"),
+            (101.0, "b"),
+            (110.0, "d"),
+            (-5.0, "neg"),
+        ]
+
+        result = market_data_indicators._cluster_price_levels(levels, 0.02)
+
+        # 100 and 101 merge (mean 100.5); 103 is 2.49% above it.
+        assert result == [
+            {"price": 100.5, "strength": "moderate", "sources": ["a", "b"]},
+            {"price": 103.0, "strength": "weak", "sources": ["c"]},
+            {"price": 110.0, "strength": "weak", "sources": ["d"]},
+        ]
+
+    def test_repeated_source_counts_once(self):
+        levels = [(100.0, "bb_lower"), (100.5, "bb_lower"), (101.0, "fib_50")]
+
+        result = market_data_indicators._cluster_price_levels(levels, 0.02)
+
+        assert result == [
+            {"price": 100.5, "strength": "moderate", "sources": ["bb_lower", "fib_50"]}
+        ]
+
+
+@pytest.mark.unit
+class TestSupportResistanceBatch:
+    """Tests for support_resistance_batch."""
+
+    def test_batch_matches_single_frame_engine(self):
+        frames = {f"S{seed}": _frame(seed, n=20 + seed * 7) for seed in range(6)}
+        frames["S5"].loc[10, ["high", "volume"]] = np.nan
+        frames["flat"] = _frame(9).assign(high=50.0, low=50.0, close=50.0)
+
+        batch = support_resistance_batch(frames)
+
+        for symbol, frame in frames.items():
+            current_price = round(float(frame["close"].iloc[-1]), 2)
+            assert batch[symbol] == support_resistance_levels(frame, current_price)
+
+    def test_failures_are_reported_per_symbol(self):
+        frames = {
+            "ok": _frame(1),
+            "no_high": _frame(2).drop(columns=["high"]),
+            "no_volume": _frame(3).assign(volume=0.0),
+        }
+
+        batch = support_resistance_batch(frames)
+
+        assert list(batch) == ["ok", "no_high", "no_volume"]
+        assert isinstance(batch["ok"], tuple)
+        assert str(batch["no_high"]) == "Missing required column: high"
+        assert isinstance(batch["no_volume"], ValueError)
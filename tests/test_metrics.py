@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastmcp import Client, FastMCP
+from prometheus_client import REGISTRY
+
+from app.core.async_rate_limiter import AsyncSlidingWindowRateLimiter
+from app.core.config import Settings, settings
+from app.mcp_server.lifecycle import register_metrics_route
+from app.mcp_server.metrics_middleware import (
+    UNREGISTERED_TOOL_LABEL,
+    McpToolMetricsMiddleware,
+)
+from app.middleware.auth import AuthMiddleware
+from app.monitoring.metrics import (
+    endpoint_label,
+    observe_broker_request,
+    record_ohlcv_cache,
+)
+from app.routers import metrics as metrics_router
+
+pytestmark = [pytest.mark.unit]
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/v1/candles/minutes/60", "/v1/candles/minutes/{id}"),
+        ("/v2/orders/7f3c-11aa?nested=true", "/v2/orders/{id}"),
+        ("/api/v3/exchangeInfo", "/api/v3/exchangeInfo"),
+        ("/v2/positions/AAPL", "/v2/positions/{id}"),
+        ("/v1/ticker", "/v1/ticker"),
+        ("", "/"),
+    ],
+)
+def test_endpoint_label_collapses_ids(path: str, expected: str) -> None:
+    assert endpoint_label(path) == expected
+
+
+def test_observe_broker_request_labels_outcome() -> None:
+    ok = {"broker": "test", "endpoint": "/v1/x", "outcome": "ok"}
+    failed = {"broker": "test", "endpoint": "/v1/x", "outcome": "TimeoutError"}
+    ok_before = _sample("auto_trader_broker_request_seconds_count", ok)
+    failed_before = _sample("auto_trader_broker_request_seconds_count", failed)
+
+    with observe_broker_request("test", "/v1/x"):
+        pass
+    with pytest.raises(TimeoutError), observe_broker_request("test", "/v1/x"):
+        raise TimeoutError
+
+    assert _sample("auto_trader_broker_request_seconds_count", ok) == ok_before + 1
+    assert (
+        _sample("auto_trader_broker_request_seconds_count", failed) == failed_before + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_wait_is_observed() -> None:
+    labels = {"limiter": "test|metrics"}
+    before = _sample("auto_trader_rate_limiter_wait_seconds_count", labels)
+    limiter = AsyncSlidingWindowRateLimiter(rate=1, period=0.05, name="test|metrics")
+
+    await limiter.acquire()
+    await limiter.acquire()
+
+    assert _sample("auto_trader_rate_limiter_wait_seconds_count", labels) == before + 1
+
+
+@pytest.fixture
+def scrape_enabled(monkeypatch) -> dict[str, str]:
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    monkeypatch.setattr(settings, "metrics_bearer_token", "scrape-secret")
+    return {"Authorization": "Bearer scrape-secret"}
+
+
+def _api_client(*, with_auth_middleware: bool = False) -> TestClient:
+    app = FastAPI()
+    if with_auth_middleware:
+        app.add_middleware(AuthMiddleware)
+    app.include_router(metrics_router.router)
+    return TestClient(app)
+
+
+def test_metrics_are_disabled_by_default() -> None:
+    assert Settings.model_fields["metrics_enabled"].default is False
+
+
+def test_api_metrics_exposes_collectors(scrape_enabled) -> None:
+    record_ohlcv_cache("test_cache", "hit")
+
+    response = _api_client().get("/metrics", headers=scrape_enabled)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'auto_trader_ohlcv_cache_events_total{cache="test_cache",event="hit"}'
+        in response.text
+    )
+
+
+def test_api_metrics_requires_bearer_token(monkeypatch, scrape_enabled) -> None:
+    client = _api_client()
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers=scrape_enabled).status_code == 200
+
+    monkeypatch.setattr(settings, "metrics_bearer_token", None)
+    assert client.get("/metrics", headers=scrape_enabled).status_code == 401
+
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    assert client.get("/metrics").status_code == 404
+
+
+def test_auth_middleware_gates_metrics_by_token_only(
+    monkeypatch, scrape_enabled
+) -> None:
+    with _api_client(with_auth_middleware=True) as client:
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers=scrape_enabled).status_code == 200
+
+        monkeypatch.setattr(settings, "metrics_bearer_token", None)
+        assert client.get("/metrics").status_code == 403
+
+        monkeypatch.setattr(settings, "metrics_enabled", False)
+        assert client.get("/metrics").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_latency_and_metrics_route(scrape_enabled) -> None:
+    mcp = FastMCP(name="metrics-test")
+    mcp.add_middleware(McpToolMetricsMiddleware())
+    register_metrics_route(mcp)
+
+    @mcp.tool
+    def ping() -> str:
+        return "pong"
+
+    labels = {"tool": "ping", "outcome": "ok"}
+    before = _sample("auto_trader_mcp_tool_seconds_count", labels)
+    async with Client(mcp) as client:
+        await client.call_tool("ping", {})
+        with pytest.raises(Exception):  # noqa: B017 — any unknown-tool error
+            await client.call_tool("no_such_tool_a1b2", {})
+
+    assert _sample("auto_trader_mcp_tool_seconds_count", labels) == before + 1
+    with TestClient(mcp.http_app()) as client:
+        assert client.get("/metrics").status_code == 401
+        response = client.get("/metrics", headers=scrape_enabled)
+    assert response.status_code == 200
+    assert "auto_trader_mcp_tool_seconds_bucket" in response.text
+    assert 'tool="no_such_tool_a1b2"' not in response.text
+    assert f'tool="{UNREGISTERED_TOOL_LABEL}"' in response.text
@@ -621,7 +621,7 @@ class TestFetchNews:
         ) -> BeautifulSoup:
             return BeautifulSoup(SAMPLE_NEWS_HTML, "lxml")
 
-        monkeypatch.setattr(naver_finance.news, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.news, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_news("005930", limit=10)
 
@@ -637,7 +637,7 @@ class TestFetchNews:
         ) -> BeautifulSoup:
             return BeautifulSoup(SAMPLE_NEWS_HTML, "lxml")
 
-        monkeypatch.setattr(naver_finance.news, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.news, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_news("005930", limit=1)
 
@@ -649,7 +649,7 @@ class TestFetchNews:
         ) -> BeautifulSoup:
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.news, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.news, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_news("005930")
         assert result == []
@@ -711,7 +711,7 @@ class TestFetchInvestorTrends:
         ) -> BeautifulSoup:
             return BeautifulSoup(SAMPLE_INVESTOR_TRENDS_HTML, "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investor_trends("005930", days=20)
 
@@ -741,7 +741,7 @@ class TestFetchInvestorTrends:
         ) -> BeautifulSoup:
             return BeautifulSoup(SAMPLE_INVESTOR_TRENDS_HTML, "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investor_trends("005930", days=1)
 
@@ -766,7 +766,7 @@ class TestFetchInvestorTrends:
         ) -> BeautifulSoup:
             return BeautifulSoup(html, "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investor_trends("005930", days=20)
 
@@ -845,7 +845,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions("005930", limit=10)
 
@@ -894,7 +894,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions("005930", limit=1)
 
@@ -908,7 +908,7 @@ class TestFetchInvestmentOpinions:
         ) -> BeautifulSoup:
             return BeautifulSoup("<html><table class='type_1'></table></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions("005930", limit=10)
 
@@ -943,7 +943,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions("005930", limit=10)
 
@@ -983,7 +983,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions("005930", limit=10)
 
@@ -1018,7 +1018,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML_005880, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions("005880", limit=10)
 
@@ -1065,7 +1065,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML_005880, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions(
             "005880", limit=10, window_months=24
@@ -1103,7 +1103,7 @@ class TestFetchInvestmentOpinions:
                 return BeautifulSoup(SAMPLE_CURRENT_PRICE_HTML_005880, "lxml")
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.investor, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.investor, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_investment_opinions(
             "005880", limit=10, window_months=24
@@ -1171,7 +1171,7 @@ class TestFetchKrSnapshot:
         monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: mock_client)
         monkeypatch.setattr(
             naver_finance.investor,
-            "_fetch_html_with_client",
+            "_fetch_document_with_client",
             mock_fetch_html_with_client,
             raising=False,
         )
@@ -1234,7 +1234,7 @@ class TestFetchKrSnapshot:
         monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: mock_client)
         monkeypatch.setattr(
             naver_finance.investor,
-            "_fetch_html_with_client",
+            "_fetch_document_with_client",
             mock_fetch_html_with_client,
             raising=False,
         )
@@ -1325,7 +1325,7 @@ class TestFetchValuation:
         async def fake_integration(code: str, client: Any) -> dict[str, Any]:  # noqa: ARG001
             return {"eps": 5432.0, "bps": 50000.0, "market_cap": 400_000_000_000_000.0}
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
         monkeypatch.setattr(
             naver_finance.valuation, "_fetch_integration", fake_integration
         )
@@ -1354,7 +1354,7 @@ class TestFetchValuation:
         async def boom(code: str, client: Any) -> dict[str, Any]:  # noqa: ARG001
             raise RuntimeError("mobile api down")
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
         monkeypatch.setattr(naver_finance.valuation, "_fetch_integration", boom)
 
         result = await naver_finance.fetch_valuation("005930")
@@ -1374,7 +1374,7 @@ class TestFetchValuation:
             else:  # sise.naver
                 return BeautifulSoup(SAMPLE_VALUATION_SISE_HTML, "lxml")
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_valuation("005930")
 
@@ -1404,7 +1404,7 @@ class TestFetchValuation:
             else:
                 return BeautifulSoup(SAMPLE_VALUATION_MINIMAL_SISE_HTML, "lxml")
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_valuation("298040")
 
@@ -1446,7 +1446,7 @@ class TestFetchValuation:
                 return BeautifulSoup(main_html, "lxml")
             return BeautifulSoup(sise_html, "lxml")
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_valuation("000000")
 
@@ -1477,7 +1477,7 @@ class TestFetchValuation:
                 return BeautifulSoup(main_html, "lxml")
             return BeautifulSoup(sise_html, "lxml")
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_valuation("000000")
 
@@ -1491,7 +1491,7 @@ class TestFetchValuation:
         ) -> BeautifulSoup:
             return BeautifulSoup("<html></html>", "lxml")
 
-        monkeypatch.setattr(naver_finance.valuation, "_fetch_html", mock_fetch_html)
+        monkeypatch.setattr(naver_finance.valuation, "_fetch_document", mock_fetch_html)
 
         result = await naver_finance.fetch_valuation("000000")
 
@@ -1510,6 +1510,8 @@ class TestFetchSectorPeers:
         sector_gets: list[tuple[str, dict[str, Any] | None]] = []
 
         class FakeResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
             content = """
                 <html>
                 <head><title>반도체 : Npay 증권</title></head>
@@ -1634,6 +1636,8 @@ class TestFetchSectorPeersConcurrency:
             }
 
         class FakeResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
             content = b"<html><head><title>x : Npay</title></head></html>"
 
         class FakeClient:
@@ -1693,6 +1697,8 @@ class TestFetchSectorPeersPeerTimeout:
             return base
 
         class FakeResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
             content = b"<html><head><title>x : Npay</title></head></html>"
 
         class FakeClient:
@@ -1755,6 +1761,8 @@ class TestFetchSectorPeersTrim:
         sector_gets: list[Any] = []
 
         class FakeResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
             content = (
                 "<html><head><title>반도체 : Npay 증권</title></head>"
                 "<body><table class='type_5'>"
@@ -1855,6 +1863,8 @@ class TestFetchSectorPeersCache:
             }
 
         class FakeResponse:
+            status_code = 200
+            headers: dict[str, str] = {}
             content = b"<html><head><title>x : Npay</title></head></html>"
 
         class FakeClient:
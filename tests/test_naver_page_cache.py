@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from app.services.naver_finance import investor, news, page_cache, parser, valuation
+
+pytestmark = [pytest.mark.unit]
+
+_FIXTURES = Path(__file__).parent / "fixtures" / "naver_finance"
+_SECTOR_URL = "https://finance.naver.com/sise/sise_group_detail.naver"
+
+
+@pytest.fixture(autouse=True)
+def _clear_page_cache():
+    page_cache.clear()
+    yield
+    page_cache.clear()
+
+
+class _RevalidatingClient:
+    """Answers 304 whenever the request carries the current ETag."""
+
+    def __init__(self, etag: str | None = '"v1"') -> None:
+        self.etag = etag
+        self.requests: list[dict[str, str]] = []
+
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        sent = dict(headers or {})
+        self.requests.append(sent)
+        request = httpx.Request("GET", url, params=params)
+        response_headers = {"etag": self.etag} if self.etag else {}
+        if self.etag and sent.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers=response_headers, request=request)
+        return httpx.Response(
+            200,
+            headers=response_headers,
+            content=(_FIXTURES / "sise_group_detail.html").read_bytes(),
+            request=request,
+        )
+
+
+@pytest.mark.asyncio
+async def test_second_fetch_revalidates_and_reuses_body() -> None:
+    client = _RevalidatingClient()
+
+    first = await valuation._fetch_sector_soup("278", client)
+    second = await valuation._fetch_sector_soup("278", client)
+
+    assert "If-None-Match" not in client.requests[0]
+    assert client.requests[1]["If-None-Match"] == '"v1"'
+    assert valuation._parse_sector_stock_codes(second) == (
+        valuation._parse_sector_stock_codes(first)
+    )
+    assert valuation._parse_sector_name(second) == "반도체와반도체장비"
+
+
+@pytest.mark.asyncio
+async def test_pages_without_validators_are_not_stored() -> None:
+    client = _RevalidatingClient(etag=None)
+
+    await valuation._fetch_sector_soup("278", client)
+    await valuation._fetch_sector_soup("278", client)
+
+    assert client.requests == [{}, {}]
+
+
+@pytest.mark.asyncio
+async def test_dynamic_pages_are_never_revalidated() -> None:
+    client = _RevalidatingClient()
+    main_url = "https://finance.naver.com/item/main.naver"
+
+    await parser._fetch_document_with_client(client, main_url, {"code": "005930"})
+    await parser._fetch_document_with_client(client, main_url, {"code": "005930"})
+
+    assert page_cache.page_key(main_url, {"code": "005930"}) is None
+    assert all("If-None-Match" not in sent for sent in client.requests)
+
+
+@pytest.mark.asyncio
+async def test_disabled_setting_bypasses_cache(monkeypatch) -> None:
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "naver_page_revalidate_enabled", False)
+    client = _RevalidatingClient()
+
+    await valuation._fetch_sector_soup("278", client)
+    await valuation._fetch_sector_soup("278", client)
+
+    assert all("If-None-Match" not in sent for sent in client.requests)
+
+
+def test_lru_is_bounded(monkeypatch) -> None:
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "naver_page_cache_max_entries", 2)
+    for no in ("1", "2", "3"):
+        key = page_cache.page_key(_SECTOR_URL, {"type": "upjong", "no": no})
+        page_cache.store(
+            key,
+            httpx.Response(200, headers={"etag": f'"{no}"'}, content=b"<html/>"),
+        )
+
+    assert (
+        page_cache.get(page_cache.page_key(_SECTOR_URL, {"type": "upjong", "no": "1"}))
+        is None
+    )
+    assert (
+        page_cache.get(page_cache.page_key(_SECTOR_URL, {"type": "upjong", "no": "3"}))
+        is not None
+    )
+
+
+def _soup(name: str) -> BeautifulSoup:
+    content = (_FIXTURES / name).read_bytes()
+    return BeautifulSoup(parser._decode_html_content(content), "lxml")
+
+
+def _document(name: str) -> Any:
+    return parser._parse_document((_FIXTURES / name).read_bytes())
+
+
+@pytest.mark.parametrize(
+    ("page", "extract"),
+    [
+        ("main.html", lambda p: valuation._parse_valuation_from_soups("005930", p, p)),
+        ("main.html", valuation._parse_industry_info),
+        ("sise.html", lambda p: valuation._parse_valuation_from_soups("005930", p, p)),
+        ("news_news.html", lambda p: news._parse_news_soup(p, 20)),
+        ("frgn.html", lambda p: investor._parse_investor_trends_soup(p, "005930", 20)),
+        ("company_list.html", lambda p: investor._collect_opinion_report_infos(p, 30)),
+        ("company_read.html", investor._parse_report_detail_soup),
+        ("sise_group_detail.html", valuation._parse_sector_stock_codes),
+    ],
+)
+def test_compiled_extractors_match_soup_input(page: str, extract: Any) -> None:
+    from_document = extract(_document(page))
+
+    assert from_document == extract(_soup(page))
+    assert from_document not in (None, [], {})
+
+
+def test_fixture_pages_extract_expected_values() -> None:
+    valuation_row = valuation._parse_valuation_from_soups(
+        "005930", _document("main.html"), _document("sise.html")
+    )
+    trends = investor._parse_investor_trends_soup(_document("frgn.html"), "005930", 5)
+
+    assert valuation_row["name"] == "삼성전자"
+    assert valuation_row["current_price"] == 72500
+    assert valuation_row["per"] == 14.25
+    assert valuation_row["high_52w"] == 88800
+    assert valuation_row["low_52w"] == 49900
+    assert len(trends["data"]) == 5
+    assert trends["data"][0]["date"] == "2026-10-30"
+    assert trends["data"][0]["foreign_holding_rate"] == 50.0
+
+
+def test_empty_body_parses_to_empty_document() -> None:
+    assert news._parse_news_soup(parser._parse_document(b""), 5) == []
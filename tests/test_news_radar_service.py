@@ -439,3 +439,59 @@ async def test_service_returns_plain_text_snippets_for_html_summaries(
     assert "&amp;" not in item.snippet
     assert "Bitcoin Magazine" in item.snippet
     assert "risk assets & oil" in item.snippet
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_service_query_pages_over_search_index_matches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services import news_radar_service
+    from app.services.market_news_briefing_formatter import MarketNewsBriefing
+
+    match = FakeArticle(
+        id=7,
+        title="호르무즈 해협 유조선 피격",
+        url="https://example.test/hormuz",
+        market="kr",
+        feed_source="rss_yonhap",
+        article_published_at=_now() - timedelta(hours=3),
+    )
+    search_calls: list[dict[str, Any]] = []
+
+    async def fake_search_news_articles(q: str, **kwargs: Any):
+        search_calls.append({"q": q, **kwargs})
+        return ([match], 1)
+
+    async def unexpected_get_news_articles(**_: Any):
+        raise AssertionError("query path must not over-fetch unfiltered rows")
+
+    async def fake_get_news_readiness(**_: Any) -> NewsReadinessResponse:
+        return _readiness()
+
+    monkeypatch.setattr(
+        news_radar_service, "search_news_articles", fake_search_news_articles
+    )
+    monkeypatch.setattr(
+        news_radar_service, "get_news_articles", unexpected_get_news_articles
+    )
+    monkeypatch.setattr(
+        news_radar_service, "get_news_readiness", fake_get_news_readiness
+    )
+    monkeypatch.setattr(
+        news_radar_service,
+        "format_market_news_briefing",
+        lambda *args, **kwargs: MarketNewsBriefing("kr", [], [], {}),
+    )
+
+    response = await news_radar_service.build_news_radar(
+        market="kr",
+        hours=48,
+        q="호르무즈",
+        risk_category=None,
+        include_excluded=True,
+        limit=10,
+    )
+
+    assert search_calls == [{"q": "호르무즈", "market": "kr", "hours": 48, "limit": 50}]
+    assert [item.title for item in response.items] == ["호르무즈 해협 유조선 피격"]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services import news_search_index
+from app.services.news_search_index import (
+    NewsSearchDocument,
+    NewsSearchIndex,
+    tokenize,
+)
+
+_NOW = datetime(2026, 5, 5, 12, 0)
+
+
+def _doc(
+    id: int,
+    title: str,
+    *,
+    summary: str | None = None,
+    market: str = "kr",
+    hours_ago: float = 1.0,
+    entities: tuple[str, ...] = (),
+    symbols: frozenset[tuple[str, str]] = frozenset(),
+) -> NewsSearchDocument:
+    return NewsSearchDocument(
+        id=id,
+        market=market,
+        published_at=_NOW - timedelta(hours=hours_ago),
+        title=title,
+        summary=summary,
+        entities=entities,
+        symbols=symbols,
+    )
+
+
+def _index(*documents: NewsSearchDocument) -> NewsSearchIndex:
+    index = NewsSearchIndex()
+    index.add_many(documents)
+    return index
+
+
+@pytest.mark.unit
+def test_tokenize_bigrams_hangul_and_keeps_latin_words():
+    assert tokenize("삼성전자, HBM3E 양산!") == [
+        "삼성",
+        "성전",
+        "전자",
+        "hbm3e",
+        "양산",
+    ]
+    assert tokenize("ＢＴＣ 급") == ["btc", "급"]
+    assert tokenize(None) == []
+
+
+@pytest.mark.unit
+def test_korean_partial_terms_match_and_every_token_is_required():
+    index = _index(
+        _doc(1, "삼성전자 HBM 공급 확대"),
+        _doc(2, "SK하이닉스 실적 발표", summary="삼성 대비 HBM 점유율"),
+        _doc(3, "전자 부품 업황"),
+    )
+
+    assert sorted(index.search("삼성").ids) == [1, 2]
+    assert index.search("삼성 hbm 공급").ids == [1]
+    assert index.search("없는단어").ids == []
+    assert index.search("   ").total == 0
+
+
+@pytest.mark.unit
+def test_relevance_prefers_title_and_entity_hits_over_summary():
+    index = _index(
+        _doc(1, "Market wrap", summary="Nvidia mentioned in passing", hours_ago=0.5),
+        _doc(2, "Nvidia beats estimates", hours_ago=5),
+        _doc(3, "Chip stocks rally", entities=("NVDA", "Nvidia"), hours_ago=2),
+    )
+
+    page = index.search("nvidia", limit=2)
+
+    assert page.ids == [2, 3]
+    assert page.total == 3
+
+
+@pytest.mark.unit
+def test_market_time_and_symbol_filters_run_inside_the_index():
+    index = _index(
+        _doc(1, "Bitcoin ETF inflows", market="crypto", hours_ago=1),
+        _doc(2, "Bitcoin miners rally", market="us", hours_ago=2),
+        _doc(
+            3,
+            "Bitcoin treasury buys",
+            market="us",
+            hours_ago=30,
+            symbols=frozenset({("MSTR", "us")}),
+        ),
+    )
+
+    assert index.search("bitcoin", market="crypto").ids == [1]
+    assert sorted(index.search("bitcoin", since=_NOW - timedelta(hours=24)).ids) == [
+        1,
+        2,
+    ]
+    assert index.search("bitcoin", symbol=("MSTR", "us")).ids == [3]
+
+
+@pytest.mark.unit
+def test_recent_order_pages_with_keyset_cursor():
+    documents = {
+        i: _doc(i, f"금리 인하 기대 {i}", hours_ago=i // 2) for i in range(1, 8)
+    }
+    index = _index(*documents.values())
+
+    first = index.search("금리", order="recent", limit=3)
+    last = documents[first.ids[-1]]
+    second = index.search(
+        "금리", order="recent", limit=3, before=(last.published_at, last.id)
+    )
+
+    assert first.ids == [1, 3, 2]
+    assert second.ids == [5, 4, 7]
+    assert second.total == 4
+
+
+@pytest.mark.unit
+def test_remove_and_evict_drop_postings():
+    index = _index(
+        _doc(1, "유가 급등", hours_ago=1),
+        _doc(2, "유가 급락", hours_ago=200),
+    )
+
+    assert index.evict_before(_NOW - timedelta(hours=168)) == 1
+    assert index.search("유가").ids == [1]
+    index.remove(1)
+    assert len(index) == 0
+    assert index.search("유가").total == 0
+    assert index.max_id == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_index_loads_only_new_rows_when_refresh_is_due(monkeypatch):
+    calls: list[int] = []
+
+    async def fake_load(db, *, after_id, since):
+        del db, since
+        calls.append(after_id)
+        return [_doc(after_id + 1, f"뉴스 {after_id + 1}", hours_ago=0)]
+
+    monkeypatch.setattr(news_search_index, "load_news_search_documents", fake_load)
+    monkeypatch.setattr(news_search_index, "now_kst_naive", lambda: _NOW)
+    monkeypatch.setattr(news_search_index, "_RESCAN_ID_MARGIN", 0)
+    news_search_index.reset_news_search_index()
+    try:
+        index = await news_search_index.get_news_search_index(object())
+        again = await news_search_index.get_news_search_index(object())
+        assert index.refreshed_at is not None
+        index.refreshed_at -= news_search_index._REFRESH_INTERVAL_SECONDS
+        refreshed = await news_search_index.get_news_search_index(object())
+    finally:
+        news_search_index.reset_news_search_index()
+
+    assert index is again is refreshed
+    assert calls == [0, 1]
+    assert refreshed.search("뉴스").total == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_index_rescans_trailing_ids_and_rebuilds_periodically(
+    monkeypatch,
+):
+    calls: list[int] = []
+    stored = {
+        1: _doc(1, "유가 급등", hours_ago=1),
+        3: _doc(3, "환율 급등", hours_ago=1),
+    }
+
+    async def fake_load(db, *, after_id, since):
+        del db, since
+        calls.append(after_id)
+        return [doc for doc_id, doc in sorted(stored.items()) if doc_id > after_id]
+
+    monkeypatch.setattr(news_search_index, "load_news_search_documents", fake_load)
+    monkeypatch.setattr(news_search_index, "now_kst_naive", lambda: _NOW)
+    news_search_index.reset_news_search_index()
+    try:
+        index = await news_search_index.get_news_search_index(object())
+        assert index.covers_since == _NOW - timedelta(
+            hours=news_search_index.INDEX_RETENTION_HOURS
+        )
+        # id 2 commits after id 3 was indexed; the trailing rescan finds it.
+        stored[2] = _doc(2, "금리 인하", hours_ago=1)
+        index.refreshed_at -= news_search_index._REFRESH_INTERVAL_SECONDS
+        refreshed = await news_search_index.get_news_search_index(object())
+        assert refreshed is index
+        assert refreshed.search("금리").ids == [2]
+
+        # An updated article is re-indexed by the periodic rebuild.
+        stored[1] = _doc(1, "유가 하락", hours_ago=1)
+        refreshed.refreshed_at -= news_search_index._REFRESH_INTERVAL_SECONDS
+        refreshed.rebuilt_at -= news_search_index._REBUILD_INTERVAL_SECONDS
+        rebuilt = await news_search_index.get_news_search_index(object())
+    finally:
+        news_search_index.reset_news_search_index()
+
+    assert calls == [0, 0, 0]
+    assert rebuilt is not index
+    assert rebuilt.search("하락").ids == [1]
+    assert rebuilt.search("급등").ids == [3]
@@ -8,9 +8,10 @@ import pandas as pd
 import pytest
 
 import app.services.brokers.upbit.client as upbit_service
+import app.services.brokers.yahoo.client as yahoo_service
+from app.services import last_price_resolver as last_price_resolver_module
 from app.services import portfolio_overview_service as portfolio_overview_module
 from app.services.portfolio_overview_service import PortfolioOverviewService
-from app.services.us_symbol_universe_service import USSymbolNotRegisteredError
 
 
 @pytest.mark.asyncio
@@ -124,19 +125,19 @@ async def test_fill_missing_prices_fetches_market_buckets_concurrently(
         KISClient, "inquire_price", lambda *args, **kwargs: gated("kr_upstream")
     )
     monkeypatch.setattr(
-        portfolio_overview_module.yahoo_service,
+        yahoo_service,
         "fetch_price",
         lambda *args, **kwargs: gated("us_upstream"),
     )
     monkeypatch.setattr(
-        service,
-        "_fetch_upbit_prices_resilient",
+        upbit_service,
+        "fetch_multiple_current_prices",
         lambda *args, **kwargs: gated("crypto_upstream"),
     )
     monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_us_exchange_by_symbol",
-        AsyncMock(return_value="NASD"),
+        last_price_resolver_module,
+        "get_us_exchanges_by_symbols",
+        AsyncMock(return_value={"AAPL": "NASD"}),
     )
 
     components = [
@@ -381,13 +382,13 @@ async def test_fill_missing_prices_uses_us_provider_for_missing_us_prices(
     service = PortfolioOverviewService(AsyncMock())
 
     monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_us_exchange_by_symbol",
-        AsyncMock(return_value="NASD"),
+        last_price_resolver_module,
+        "get_us_exchanges_by_symbols",
+        AsyncMock(return_value={"AAPL": "NASD", "MSFT": "NASD"}),
     )
     mock_fetch_price = AsyncMock(return_value=pd.DataFrame([{"close": 195.0}]))
     monkeypatch.setattr(
-        portfolio_overview_module.yahoo_service,
+        yahoo_service,
         "fetch_price",
         mock_fetch_price,
     )
@@ -427,12 +428,12 @@ async def test_fill_missing_prices_raises_on_us_yahoo_error(
     service = PortfolioOverviewService(AsyncMock())
 
     monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_us_exchange_by_symbol",
-        AsyncMock(return_value="NASD"),
+        last_price_resolver_module,
+        "get_us_exchanges_by_symbols",
+        AsyncMock(return_value={"AAPL": "NASD", "MSFT": "NASD"}),
     )
     monkeypatch.setattr(
-        portfolio_overview_module.yahoo_service,
+        yahoo_service,
         "fetch_price",
         AsyncMock(side_effect=RuntimeError("upstream timeout")),
     )
@@ -485,19 +486,15 @@ async def test_fill_missing_prices_filters_invalid_us_symbols_before_provider_fe
 ) -> None:
     service = PortfolioOverviewService(AsyncMock())
 
-    async def mock_get_us_exchange_by_symbol(symbol: str, db=None) -> str:
-        if symbol == "AAPL":
-            return "NASD"
-        raise USSymbolNotRegisteredError("not registered")
-
+    get_exchanges = AsyncMock(return_value={"AAPL": "NASD"})
     monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_us_exchange_by_symbol",
-        mock_get_us_exchange_by_symbol,
+        last_price_resolver_module,
+        "get_us_exchanges_by_symbols",
+        get_exchanges,
     )
     mock_fetch_price = AsyncMock(return_value=pd.DataFrame([{"close": 205.0}]))
     monkeypatch.setattr(
-        portfolio_overview_module.yahoo_service,
+        yahoo_service,
         "fetch_price",
         mock_fetch_price,
     )
@@ -538,63 +535,62 @@ async def test_fill_missing_prices_filters_invalid_us_symbols_before_provider_fe
 
     await service._fill_missing_prices(AsyncMock(), components, warnings)
 
+    get_exchanges.assert_awaited_once()
     mock_fetch_price.assert_awaited_once_with("AAPL")
     assert components[0]["current_price"] == pytest.approx(205.0)
     assert components[1]["current_price"] is None
     assert warnings == []
 
 
+def _crypto_component(symbol: str, quantity: float = 1.0) -> dict[str, object]:
+    return {
+        "market_type": "CRYPTO",
+        "symbol": symbol,
+        "name": symbol,
+        "account_key": "manual:1",
+        "broker": "manual",
+        "account_name": "crypto",
+        "source": "manual",
+        "quantity": quantity,
+        "avg_price": 1.0,
+        "current_price": None,
+        "evaluation": None,
+        "profit_loss": None,
+        "profit_rate": None,
+    }
+
+
 @pytest.mark.asyncio
-async def test_fetch_upbit_prices_resilient_recovers_with_tradable_filter(
+async def test_fill_missing_crypto_prices_skips_symbols_outside_active_universe(
     monkeypatch,
 ) -> None:
     service = PortfolioOverviewService(AsyncMock())
-    warnings: list[str] = []
-
-    calls: list[tuple[str, ...]] = []
-
-    async def mock_fetch_multiple_current_prices(
-        symbols: list[str],
-    ) -> dict[str, float]:
-        key = tuple(symbols)
-        calls.append(key)
-        if key == ("KRW-BTC", "KRW-ETH", "KRW-FAKE"):
-            raise RuntimeError("404 not found")
-        if key == ("KRW-BTC", "KRW-ETH"):
-            return {"KRW-BTC": 100000000.0, "KRW-ETH": 5000000.0}
-        raise AssertionError(f"unexpected symbols: {symbols}")
-
-    monkeypatch.setattr(
-        upbit_service,
-        "fetch_multiple_current_prices",
-        mock_fetch_multiple_current_prices,
-    )
-    monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_active_upbit_markets",
-        AsyncMock(return_value=["KRW-BTC", "KRW-ETH"]),
-    )
+    fetch = AsyncMock(return_value={"KRW-BTC": 100000000.0, "KRW-ETH": 5000000.0})
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
+    components = [
+        _crypto_component("KRW-BTC"),
+        _crypto_component("KRW-ETH"),
+        _crypto_component("KRW-FAKE"),
+    ]
 
-    result = await service._fetch_upbit_prices_resilient(
-        ["KRW-BTC", "KRW-ETH", "KRW-FAKE"],
-        warnings,
-        stage="collect_upbit_components",
+    warnings = await service._fill_missing_crypto_prices(
+        components, active_upbit_set={"KRW-BTC", "KRW-ETH"}
     )
 
-    assert result == pytest.approx({"KRW-BTC": 100000000.0, "KRW-ETH": 5000000.0})
-    assert calls == [
-        ("KRW-BTC", "KRW-ETH", "KRW-FAKE"),
-        ("KRW-BTC", "KRW-ETH"),
+    fetch.assert_awaited_once_with(["KRW-BTC", "KRW-ETH"])
+    assert [item["current_price"] for item in components] == [
+        pytest.approx(100000000.0),
+        pytest.approx(5000000.0),
+        None,
     ]
     assert warnings == []
 
 
 @pytest.mark.asyncio
-async def test_fetch_upbit_prices_resilient_falls_back_to_single_symbol(
+async def test_fill_missing_crypto_prices_splits_failed_batch_down_to_single_symbol(
     monkeypatch,
 ) -> None:
     service = PortfolioOverviewService(AsyncMock())
-    warnings: list[str] = []
 
     async def mock_fetch_multiple_current_prices(
         symbols: list[str],
@@ -613,70 +609,26 @@ async def test_fetch_upbit_prices_resilient_falls_back_to_single_symbol(
         "fetch_multiple_current_prices",
         mock_fetch_multiple_current_prices,
     )
-    monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_active_upbit_markets",
-        AsyncMock(return_value=["KRW-BTC", "KRW-ETH"]),
-    )
-
-    result = await service._fetch_upbit_prices_resilient(
-        ["KRW-BTC", "KRW-ETH"],
-        warnings,
-        stage="manual_crypto",
-    )
+    components = [_crypto_component("KRW-BTC"), _crypto_component("KRW-ETH")]
 
-    assert result == pytest.approx({"KRW-BTC": 110000000.0})
-    assert warnings == [
-        "Upbit price fetch failed (manual_crypto) for KRW-ETH: single failed"
-    ]
+    warnings = await service._fill_missing_crypto_prices(components)
 
-
-@pytest.mark.asyncio
-async def test_fetch_upbit_prices_resilient_raises_when_tradable_lookup_fails(
-    monkeypatch,
-) -> None:
-    service = PortfolioOverviewService(AsyncMock())
-    warnings: list[str] = []
-
-    monkeypatch.setattr(
-        upbit_service,
-        "fetch_multiple_current_prices",
-        AsyncMock(side_effect=RuntimeError("initial failed")),
-    )
-    monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_active_upbit_markets",
-        AsyncMock(side_effect=RuntimeError("upbit universe unavailable")),
-    )
-
-    with pytest.raises(RuntimeError, match="upbit universe unavailable"):
-        await service._fetch_upbit_prices_resilient(
-            ["KRW-BTC", "KRW-ETH"],
-            warnings,
-            stage="collect_upbit_components",
-        )
-
-    assert warnings == []
+    assert components[0]["current_price"] == pytest.approx(110000000.0)
+    assert components[1]["current_price"] is None
+    assert warnings == ["Upbit price fetch failed (crypto) for KRW-ETH: single failed"]
 
 
 @pytest.mark.asyncio
-async def test_fetch_upbit_prices_resilient_recovers_missing_symbol_from_retry_batch(
+async def test_fill_missing_crypto_prices_refetches_symbols_missing_from_batch(
     monkeypatch,
 ) -> None:
     service = PortfolioOverviewService(AsyncMock())
-    warnings: list[str] = []
-
-    call_count = 0
 
     async def mock_fetch_multiple_current_prices(
         symbols: list[str],
     ) -> dict[str, float]:
-        nonlocal call_count
-        call_count += 1
         key = tuple(symbols)
-        if call_count == 1 and key == ("KRW-BTC", "KRW-ETH"):
-            raise RuntimeError("initial failed")
-        if call_count == 2 and key == ("KRW-BTC", "KRW-ETH"):
+        if key == ("KRW-BTC", "KRW-ETH"):
             return {"KRW-BTC": 101000000.0}
         if key == ("KRW-ETH",):
             return {"KRW-ETH": 5100000.0}
@@ -687,19 +639,12 @@ async def test_fetch_upbit_prices_resilient_recovers_missing_symbol_from_retry_b
         "fetch_multiple_current_prices",
         mock_fetch_multiple_current_prices,
     )
-    monkeypatch.setattr(
-        portfolio_overview_module,
-        "get_active_upbit_markets",
-        AsyncMock(return_value=["KRW-BTC", "KRW-ETH"]),
-    )
+    components = [_crypto_component("KRW-BTC"), _crypto_component("KRW-ETH")]
 
-    result = await service._fetch_upbit_prices_resilient(
-        ["KRW-BTC", "KRW-ETH"],
-        warnings,
-        stage="manual_crypto",
-    )
+    warnings = await service._fill_missing_crypto_prices(components)
 
-    assert result == pytest.approx({"KRW-BTC": 101000000.0, "KRW-ETH": 5100000.0})
+    assert components[0]["current_price"] == pytest.approx(101000000.0)
+    assert components[1]["current_price"] == pytest.approx(5100000.0)
     assert warnings == []
 
 
@@ -745,13 +690,12 @@ async def test_collect_upbit_components_returns_raw_components_without_price_fil
 
 
 @pytest.mark.asyncio
-async def test_fill_missing_prices_uses_resilient_fetch_helper_for_manual_crypto() -> (
-    None
-):
+async def test_fill_missing_prices_resolves_manual_crypto_through_upbit_batch(
+    monkeypatch,
+) -> None:
     service = PortfolioOverviewService(AsyncMock())
-    service._fetch_upbit_prices_resilient = AsyncMock(
-        return_value={"KRW-BTC": 115000000.0}
-    )
+    fetch = AsyncMock(return_value={"KRW-BTC": 115000000.0})
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
 
     components = [
         {
@@ -774,13 +718,7 @@ async def test_fill_missing_prices_uses_resilient_fetch_helper_for_manual_crypto
 
     await service._fill_missing_prices(AsyncMock(), components, warnings)
 
-    service._fetch_upbit_prices_resilient.assert_awaited_once_with(
-        ["KRW-BTC"],
-        warnings,
-        stage="crypto",
-        active_upbit_markets=None,
-        enforce_upbit_universe=True,
-    )
+    fetch.assert_awaited_once_with(["KRW-BTC"])
     assert components[0]["current_price"] == pytest.approx(115000000.0)
     assert components[0]["evaluation"] == pytest.approx(23000000.0)
     assert components[0]["profit_loss"] == pytest.approx(3000000.0)
@@ -839,14 +777,13 @@ async def test_collect_manual_components_filters_non_tradable_crypto_symbols(
 
 
 @pytest.mark.asyncio
-async def test_fill_missing_prices_crypto_targets_all_sources() -> None:
+async def test_fill_missing_prices_crypto_targets_all_sources(monkeypatch) -> None:
     """After W2-3 refactor, _fill_missing_crypto_prices targets all crypto regardless
     of source (live Upbit and manual). Live Upbit price fill is no longer in the
     collector; it's handled here."""
     service = PortfolioOverviewService(AsyncMock())
-    service._fetch_upbit_prices_resilient = AsyncMock(
-        return_value={"KRW-BTC": 120000000.0}
-    )
+    fetch = AsyncMock(return_value={"KRW-BTC": 120000000.0, "KRW-ETH": 4100000.0})
+    monkeypatch.setattr(upbit_service, "fetch_multiple_current_prices", fetch)
 
     components = [
         {
@@ -885,13 +822,7 @@ async def test_fill_missing_prices_crypto_targets_all_sources() -> None:
     await service._fill_missing_prices(AsyncMock(), components, warnings)
 
     # Both KRW-BTC (manual) and KRW-ETH (live) should be included in the batch
-    service._fetch_upbit_prices_resilient.assert_awaited_once_with(
-        ["KRW-BTC", "KRW-ETH"],
-        warnings,
-        stage="crypto",
-        active_upbit_markets=None,
-        enforce_upbit_universe=True,
-    )
+    fetch.assert_awaited_once_with(["KRW-BTC", "KRW-ETH"])
 
 
 @pytest.mark.asyncio
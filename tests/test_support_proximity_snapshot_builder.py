@@ -157,3 +157,53 @@ async def test_builder_skips_support_engine_failure_instead_of_marking_no_match(
 def test_candidate_pool_has_hard_upper_bound():
     assert builder.DEFAULT_CANDIDATE_POOL_LIMIT <= builder.MAX_CANDIDATE_POOL_LIMIT
     assert builder.MAX_CANDIDATE_POOL_LIMIT == 100
+
+
+@pytest.mark.asyncio
+async def test_bulk_build_computes_levels_in_one_batch(monkeypatch):
+    frame = pd.DataFrame(
+        {
+            "date": pd.date_range("2026-05-22", periods=60, freq="D"),
+            "high": [51000.0 + 50 * i for i in range(60)],
+            "low": [48000.0 + 50 * i for i in range(60)],
+            "close": [49500.0 + 50 * i for i in range(60)],
+            "volume": [1_000_000] * 60,
+        }
+    )
+    monkeypatch.setattr(
+        builder, "_fetch_ohlcv_for_indicators", AsyncMock(return_value=frame)
+    )
+    monkeypatch.setattr(
+        builder,
+        "resolve_support_proximity_candidates",
+        AsyncMock(return_value=(dt.date(2026, 7, 17), [_candidate()])),
+    )
+    batch_calls: list[list[str]] = []
+    real_batch = builder.support_resistance_batch
+
+    def _batch(frames):
+        batch_calls.append(list(frames))
+        return real_batch(frames)
+
+    monkeypatch.setattr(builder, "support_resistance_batch", _batch)
+    now = dt.datetime(2026, 7, 20, 12, 0, tzinfo=dt.UTC)
+    clock = lambda: dt.datetime(2026, 7, 20, 12, 1, tzinfo=dt.UTC)  # noqa: E731
+
+    batch = await builder.build_support_proximity_snapshots(
+        AsyncMock(), now=now, clock=clock
+    )
+
+    import app.mcp_server.tooling.fundamentals._support_resistance as sr_module
+
+    monkeypatch.setattr(
+        sr_module,
+        "get_support_resistance_impl",
+        sr_module._DEFAULT_GET_SUPPORT_RESISTANCE_IMPL,
+    )
+    single = await builder.build_support_proximity_snapshot_for_candidate(
+        _candidate(), now=now, clock=clock
+    )
+
+    assert batch_calls == [["005930"]]
+    assert batch.payloads == (single,)
+    assert single is not None and single.support_price is not None
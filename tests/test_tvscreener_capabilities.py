@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -7,6 +9,8 @@ import pandas as pd
 import pytest
 
 import app.services.tvscreener_service as tvscreener_service
+from app.core.config import settings
+from app.services import tvscreener_capability_store
 from app.services.tvscreener_service import (
     TvScreenerCapabilityState,
     TvScreenerMalformedRequestError,
@@ -239,3 +243,121 @@ async def test_stock_capabilities_reuse_cached_usable_probe_results(
     assert first.status("volume") is TvScreenerCapabilityState.USABLE
     assert second.status("volume") is TvScreenerCapabilityState.USABLE
     assert probe.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stock_capabilities_probe_concurrently_within_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "tvscreener_capability_probe_concurrency", 2)
+    monkeypatch.setattr(tvscreener_service, "_probe_semaphore", None)
+    service = TvScreenerService(
+        capability_registry=tvscreener_service._TvScreenerCapabilityRegistry()
+    )
+    active = 0
+    peak = 0
+
+    async def probe(*, columns, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return pd.DataFrame({column: ["005930"] for column in columns})
+
+    monkeypatch.setattr(
+        "app.services.tvscreener_service._import_tvscreener",
+        lambda: _fake_stock_module(SECTOR="sector"),
+    )
+    monkeypatch.setattr(service, "query_stock_screener", probe)
+
+    snapshot = await service.get_stock_capabilities(
+        market="kr",
+        capability_names={"volume", "change_rate", "rsi", "adx", "sector"},
+    )
+
+    assert peak == 2
+    assert all(
+        status is not TvScreenerCapabilityState.UNKNOWN
+        for status in snapshot.statuses.values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_stock_capabilities_start_from_persisted_matrix(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = TvScreenerService(
+        capability_registry=tvscreener_service._TvScreenerCapabilityRegistry()
+    )
+    probe = AsyncMock()
+    load = AsyncMock(
+        return_value={"volume": (TvScreenerCapabilityState.USABLE, time.time())}
+    )
+    save = AsyncMock()
+
+    monkeypatch.setattr(
+        "app.services.tvscreener_service._import_tvscreener",
+        lambda: _fake_stock_module(VOLUME="volume"),
+    )
+    monkeypatch.setattr(service, "query_stock_screener", probe)
+    monkeypatch.setattr(tvscreener_capability_store, "load_capability_matrix", load)
+    monkeypatch.setattr(tvscreener_capability_store, "save_capability_matrix", save)
+
+    for _ in range(2):
+        snapshot = await service.get_stock_capabilities(
+            market="kr",
+            capability_names={"volume"},
+        )
+        assert snapshot.status("volume") is TvScreenerCapabilityState.USABLE
+
+    load.assert_awaited_once_with("FakeStockScreener", "kr")
+    probe.assert_not_awaited()
+    save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stock_capabilities_serve_stale_status_and_refresh_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "tvscreener_capability_ttl_seconds", 60)
+    registry = tvscreener_service._TvScreenerCapabilityRegistry()
+    service = TvScreenerService(capability_registry=registry)
+    probe = AsyncMock(side_effect=TvScreenerMalformedRequestError("bad column"))
+    save = AsyncMock()
+
+    monkeypatch.setattr(
+        "app.services.tvscreener_service._import_tvscreener",
+        lambda: _fake_stock_module(VOLUME="volume"),
+    )
+    monkeypatch.setattr(service, "query_stock_screener", probe)
+    monkeypatch.setattr(
+        tvscreener_capability_store,
+        "load_capability_matrix",
+        AsyncMock(
+            return_value={
+                "volume": (TvScreenerCapabilityState.USABLE, time.time() - 120)
+            }
+        ),
+    )
+    monkeypatch.setattr(tvscreener_capability_store, "save_capability_matrix", save)
+
+    snapshot = await service.get_stock_capabilities(
+        market="kr",
+        capability_names={"volume"},
+    )
+
+    assert snapshot.status("volume") is TvScreenerCapabilityState.USABLE
+    refresh_task = registry.get_refresh_task("stock", "kr")
+    assert refresh_task is not None
+    await refresh_task
+
+    assert probe.await_count == 1
+    assert (
+        registry.get_status("stock", "kr", "volume")
+        is TvScreenerCapabilityState.UNSUPPORTED
+    )
+    save.assert_awaited_once()
+    assert save.await_args.args[2]["volume"][0] is (
+        TvScreenerCapabilityState.UNSUPPORTED
+    )
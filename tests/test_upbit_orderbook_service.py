@@ -2,175 +2,138 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock
 
+import fakeredis.aioredis
 import httpx
 import pytest
 
+import app.services.brokers.upbit.client as upbit_client
+import app.services.upbit_public_read_model as read_model_package
+from app.core.async_rate_limiter import RateLimitExceededError
+from app.core.config import settings
 from app.services import upbit_orderbook
+from app.services.upbit_public_read_model import UpbitPublicReadModel
 
 
-class DummyResponse:
-    def __init__(self, status_code: int, payload):
-        self.status_code = status_code
-        self._payload = payload
-        self._url = "https://api.upbit.com/v1/orderbook"
+def _rows(*markets: str) -> list[dict]:
+    return [{"market": market, "orderbook_units": []} for market in markets]
 
-    def bind_url(self, url: str) -> None:
-        self._url = url
 
-    def raise_for_status(self) -> None:
-        if self.status_code < 400:
-            return
+class FakeRequestJson:
+    def __init__(self, failures: dict[str, Exception] | None = None):
+        self.calls: list[str] = []
+        self._failures = failures or {}
 
-        request = httpx.Request("GET", self._url)
-        response = httpx.Response(
-            self.status_code,
-            request=request,
-            json=self._payload if isinstance(self._payload, (dict, list)) else None,
-        )
-        raise httpx.HTTPStatusError(
-            f"HTTP {self.status_code}", request=request, response=response
-        )
+    async def __call__(self, url: str, params=None):
+        assert url == "https://api.upbit.com/v1/orderbook"
+        markets = params["markets"]
+        self.calls.append(markets)
+        if markets in self._failures:
+            raise self._failures[markets]
+        return _rows(*markets.split(","))
 
-    def json(self):
-        return self._payload
 
+@pytest.fixture
+def markets_by_coins(monkeypatch):
+    lookup = AsyncMock(
+        side_effect=lambda coins: {
+            coin: f"KRW-{coin}" for coin in coins if coin in {"BTC", "ETH", "XRP"}
+        }
+    )
+    monkeypatch.setattr(upbit_orderbook, "get_upbit_markets_by_coins", lookup)
+    return lookup
 
-class DummyAsyncClient:
-    def __init__(self, responses: list[DummyResponse], calls: list[str], timeout: int):
-        self._responses = responses
-        self._calls = calls
-        self.timeout = timeout
 
-    async def __aenter__(self):
-        return self
+@pytest.mark.asyncio
+async def test_fetch_multiple_orderbooks_batches_and_deduplicates(
+    monkeypatch, markets_by_coins
+):
+    request_json = FakeRequestJson()
+    monkeypatch.setattr(upbit_orderbook, "_request_json", request_json)
+    monkeypatch.setattr(upbit_orderbook, "MAX_MARKETS_PER_REQUEST", 2)
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
+    result = await upbit_orderbook.fetch_multiple_orderbooks(
+        ["btc", "KRW-ETH", "xrp", "BTC", "DOGE"]
+    )
 
-    async def get(self, url: str):
-        self._calls.append(url)
-        response = self._responses.pop(0)
-        response.bind_url(url)
-        return response
+    markets_by_coins.assert_awaited_once_with(["BTC", "XRP", "BTC", "DOGE"])
+    assert request_json.calls == ["KRW-BTC,KRW-ETH", "KRW-XRP"]
+    assert set(result.keys()) == {"KRW-BTC", "KRW-ETH", "KRW-XRP"}
 
 
 @pytest.mark.asyncio
-async def test_fetch_orderbook_normalizes_symbol(monkeypatch):
-    calls: list[str] = []
-    responses = [
-        DummyResponse(
-            200,
-            [
-                {
-                    "market": "KRW-BTC",
-                    "timestamp": 123,
-                    "total_ask_size": 1.0,
-                    "total_bid_size": 2.0,
-                    "orderbook_units": [],
-                }
-            ],
-        )
-    ]
-
-    monkeypatch.setattr(
-        upbit_orderbook,
-        "get_upbit_market_by_coin",
-        AsyncMock(return_value="KRW-BTC"),
-    )
-    monkeypatch.setattr(
-        upbit_orderbook.httpx,
-        "AsyncClient",
-        lambda timeout: DummyAsyncClient(responses, calls, timeout),
+async def test_fetch_multiple_orderbooks_keeps_chunks_after_a_failed_one(
+    monkeypatch, markets_by_coins
+):
+    request_json = FakeRequestJson(
+        {"KRW-BTC,KRW-ETH": RateLimitExceededError("retries exhausted")}
     )
+    monkeypatch.setattr(upbit_orderbook, "_request_json", request_json)
+    monkeypatch.setattr(upbit_orderbook, "MAX_MARKETS_PER_REQUEST", 2)
+
+    result = await upbit_orderbook.fetch_multiple_orderbooks(["BTC", "ETH", "XRP"])
 
-    result = await upbit_orderbook.fetch_orderbook("btc")
+    assert sorted(request_json.calls) == ["KRW-BTC,KRW-ETH", "KRW-XRP"]
+    assert set(result.keys()) == {"KRW-XRP"}
 
-    assert result["market"] == "KRW-BTC"
-    assert calls == ["https://api.upbit.com/v1/orderbook?markets=KRW-BTC"]
+    with pytest.raises(RateLimitExceededError):
+        await upbit_orderbook.fetch_multiple_orderbooks(["BTC", "ETH"])
 
 
 @pytest.mark.asyncio
-async def test_fetch_multiple_orderbooks_batches_and_deduplicates(monkeypatch):
-    calls: list[str] = []
-    responses = [
-        DummyResponse(
-            200,
-            [
-                {"market": "KRW-BTC", "orderbook_units": []},
-                {"market": "KRW-ETH", "orderbook_units": []},
-            ],
-        ),
-        DummyResponse(
-            200,
-            [
-                {"market": "KRW-XRP", "orderbook_units": []},
-            ],
-        ),
-    ]
-
-    async def fake_get_upbit_market_by_coin(currency: str) -> str:
-        return {
-            "BTC": "KRW-BTC",
-            "ETH": "KRW-ETH",
-            "XRP": "KRW-XRP",
-        }[currency]
+async def test_orderbook_request_backs_off_and_resumes_after_429(monkeypatch):
+    monkeypatch.setattr(settings, "api_rate_limit_retry_429_base_delay", 0.0)
+    statuses = [429, 200]
+    calls: list[dict] = []
 
-    monkeypatch.setattr(
-        upbit_orderbook,
-        "get_upbit_market_by_coin",
-        fake_get_upbit_market_by_coin,
-    )
-    monkeypatch.setattr(upbit_orderbook, "MAX_MARKETS_PER_REQUEST", 2)
-    monkeypatch.setattr(
-        upbit_orderbook.httpx,
-        "AsyncClient",
-        lambda timeout: DummyAsyncClient(responses, calls, timeout),
-    )
+    class FakeClient:
+        def __init__(self, timeout):
+            del timeout
 
-    result = await upbit_orderbook.fetch_multiple_orderbooks(
-        ["btc", "KRW-ETH", "xrp", "BTC"]
-    )
+        async def __aenter__(self):
+            return self
 
-    assert len(calls) == 2
-    assert "markets=KRW-BTC,KRW-ETH" in calls[0]
-    assert "markets=KRW-XRP" in calls[1]
-    assert set(result.keys()) == {"KRW-BTC", "KRW-ETH", "KRW-XRP"}
+        async def __aexit__(self, *exc_info):
+            return False
 
+        async def get(self, url, params=None):
+            calls.append(params)
+            return httpx.Response(
+                statuses.pop(0),
+                json=_rows("KRW-BTC"),
+                request=httpx.Request("GET", url),
+            )
 
-@pytest.mark.asyncio
-async def test_fetch_multiple_orderbooks_returns_partial_on_429(monkeypatch):
-    calls: list[str] = []
-    responses = [
-        DummyResponse(
-            200,
-            [
-                {"market": "KRW-BTC", "orderbook_units": []},
-                {"market": "KRW-ETH", "orderbook_units": []},
-            ],
-        ),
-        DummyResponse(429, []),
-    ]
-
-    async def fake_get_upbit_market_by_coin(currency: str) -> str:
-        return {
-            "BTC": "KRW-BTC",
-            "ETH": "KRW-ETH",
-            "XRP": "KRW-XRP",
-        }[currency]
+    monkeypatch.setattr(upbit_client.httpx, "AsyncClient", FakeClient)
 
-    monkeypatch.setattr(
-        upbit_orderbook,
-        "get_upbit_market_by_coin",
-        fake_get_upbit_market_by_coin,
+    result = await upbit_orderbook.fetch_multiple_orderbooks(["KRW-BTC"])
+
+    assert calls == [{"markets": "KRW-BTC"}, {"markets": "KRW-BTC"}]
+    assert set(result) == {"KRW-BTC"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_orderbook_reads_through_shared_cache(
+    monkeypatch, markets_by_coins
+):
+    request_json = FakeRequestJson()
+    monkeypatch.setattr(upbit_orderbook, "_request_json", request_json)
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=False)
+    read_model = UpbitPublicReadModel(
+        redis=redis,
+        ticker_fetcher=AsyncMock(return_value=[]),
+        orderbook_fetcher=upbit_orderbook.fetch_multiple_orderbooks,
+        trades_fetcher=AsyncMock(return_value=[]),
     )
-    monkeypatch.setattr(upbit_orderbook, "MAX_MARKETS_PER_REQUEST", 2)
     monkeypatch.setattr(
-        upbit_orderbook.httpx,
-        "AsyncClient",
-        lambda timeout: DummyAsyncClient(responses, calls, timeout),
+        read_model_package, "get_default_read_model", AsyncMock(return_value=read_model)
     )
-
-    result = await upbit_orderbook.fetch_multiple_orderbooks(["BTC", "ETH", "XRP"])
-
-    assert len(calls) == 2
-    assert set(result.keys()) == {"KRW-BTC", "KRW-ETH"}
+    try:
+        first = await upbit_orderbook.fetch_orderbook("btc")
+        second = await upbit_orderbook.fetch_orderbook("KRW-BTC")
+        missing = await upbit_orderbook.fetch_orderbook("DOGE")
+    finally:
+        await redis.aclose()
+
+    assert first["market"] == second["market"] == "KRW-BTC"
+    assert missing == {}
+    assert request_json.calls == ["KRW-BTC"]
@@ -531,3 +531,37 @@ async def test_get_us_common_stock_flags_empty_input_returns_empty(tmp_path: Pat
             )
             == {}
         )
+
+
+@pytest.mark.asyncio
+async def test_get_us_exchanges_by_symbols_returns_active_exchanges(tmp_path: Path):
+    rows = [
+        USSymbolUniverse(
+            symbol="AAPL",
+            exchange="NASD",
+            name_kr="애플",
+            name_en="Apple Inc.",
+            is_active=True,
+        ),
+        USSymbolUniverse(
+            symbol="BRK.B",
+            exchange="NYSE",
+            name_kr="버크셔B",
+            name_en="Berkshire Hathaway B",
+            is_active=True,
+        ),
+        USSymbolUniverse(
+            symbol="DEAD",
+            exchange="NASD",
+            name_kr="상폐",
+            name_en="Delisted Co",
+            is_active=False,
+        ),
+    ]
+
+    async with _search_session(tmp_path / "exchanges.db", rows) as db:
+        exchanges = await us_symbol_universe_service.get_us_exchanges_by_symbols(
+            ["aapl", "BRK-B", "DEAD", "MISSING", ""], db=db
+        )
+
+    assert exchanges == {"aapl": "NASD", "BRK-B": "NYSE"}
@@ -1,11 +1,12 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pandas as pd
 import pytest
 
-from app.services.daily_candles.repository import MarketKey
+from app.services.daily_candles.crypto_identity import upbit_daily_candle_partition
+from app.services.daily_candles.repository import DailyCandleRow, MarketKey
 from app.services.daily_candles.sync_service import (
     DailyCandleSyncService,
     SyncTarget,
@@ -399,3 +400,101 @@ async def test_kr_kis_exception_without_toss_fetcher_reraises():
 
     repo.upsert_rows.assert_not_awaited()
     repo.session.commit.assert_not_awaited()
+
+
+def _crypto_rows(days: int) -> list[DailyCandleRow]:
+    """Daily Upbit rows ending with today's (still forming) UTC bar."""
+    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    return [
+        DailyCandleRow(
+            time_utc=today - timedelta(days=offset),
+            symbol="KRW-BTC",
+            partition="upbit:KRW-BTC",
+            open=100.0 + offset,
+            high=101.0 + offset,
+            low=99.0 + offset,
+            close=100.5 + offset,
+            adj_close=None,
+            volume=1.0,
+            value=100.0,
+            source="upbit",
+        )
+        for offset in reversed(range(days))
+    ]
+
+
+def _feature_sync_service(repo, features) -> DailyCandleSyncService:
+    return DailyCandleSyncService(
+        repository=repo,
+        kis_kr_fetcher=AsyncMock(),
+        kis_us_fetcher=AsyncMock(),
+        yahoo_us_fetcher=AsyncMock(),
+        upbit_crypto_fetcher=AsyncMock(return_value=pd.DataFrame()),
+        feature_repository=features,
+    )
+
+
+def _feature_repo(rows: list[DailyCandleRow]) -> MagicMock:
+    repo = MagicMock()
+    repo.upsert_rows = AsyncMock(return_value=0)
+    repo.fetch_recent = AsyncMock(side_effect=lambda **kwargs: rows[-kwargs["count"] :])
+    repo.session = MagicMock()
+    repo.session.commit = AsyncMock()
+    repo.session.rollback = AsyncMock()
+    return repo
+
+
+_CRYPTO_TARGET = SyncTarget(
+    market=MarketKey.CRYPTO,
+    symbol="KRW-BTC",
+    partition=upbit_daily_candle_partition("KRW-BTC"),
+)
+
+
+@pytest.mark.asyncio
+async def test_new_closed_bar_refreshes_feature_vector_without_forming_bar():
+    rows = _crypto_rows(40)
+    repo = _feature_repo(rows)
+    features = MagicMock()
+    features.get_bar_time = AsyncMock(return_value=rows[-3].time_utc)
+    features.upsert = AsyncMock()
+
+    await _feature_sync_service(repo, features).sync_one(
+        target=_CRYPTO_TARGET, horizon_bars=1
+    )
+
+    payload = features.upsert.await_args.args[0]
+    assert payload.bar_time == rows[-2].time_utc
+    assert payload.bars_used == 39
+    assert payload.features["rsi"]["14"] is not None
+    assert repo.fetch_recent.await_args.kwargs["count"] == 251
+
+
+@pytest.mark.asyncio
+async def test_unchanged_closed_bar_skips_feature_recompute():
+    rows = _crypto_rows(40)
+    repo = _feature_repo(rows)
+    features = MagicMock()
+    features.get_bar_time = AsyncMock(return_value=rows[-2].time_utc)
+    features.upsert = AsyncMock()
+
+    await _feature_sync_service(repo, features).sync_one(
+        target=_CRYPTO_TARGET, horizon_bars=1
+    )
+
+    features.upsert.assert_not_awaited()
+    assert repo.fetch_recent.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_feature_refresh_failure_does_not_fail_sync():
+    repo = _feature_repo(_crypto_rows(5))
+    features = MagicMock()
+    features.get_bar_time = AsyncMock(side_effect=RuntimeError("db error"))
+
+    result = await _feature_sync_service(repo, features).sync_one(
+        target=_CRYPTO_TARGET, horizon_bars=1
+    )
+
+    assert result.target == _CRYPTO_TARGET
+    repo.session.rollback.assert_awaited_once()
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -111,3 +112,64 @@ async def test_orderbook_cache_returns_fresh_when_redis_is_unavailable():
     assert block.meta.state == "fresh"
     assert block.spreadsPct["KRW-BTC"] == pytest.approx((100 - 99) / 99 * 100)
     assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_orderbook_cache_concurrent_misses_share_one_fetch(fake_redis):
+    release = asyncio.Event()
+    calls: list[list[str]] = []
+
+    async def fetcher(markets):
+        calls.append(markets)
+        await release.wait()
+        return {m: _book(m) for m in markets}
+
+    cache = OrderbookCache(redis=fake_redis, fetcher=fetcher)
+    first = asyncio.create_task(cache.get(["KRW-BTC"]))
+    second = asyncio.create_task(cache.fetch(["KRW-BTC", "KRW-ETH"]))
+    while len(calls) < 2:
+        await asyncio.sleep(0)
+    release.set()
+
+    assert set((await first).orderbooks) == {"KRW-BTC"}
+    assert set(await second) == {"KRW-BTC", "KRW-ETH"}
+    assert calls == [["KRW-BTC"], ["KRW-ETH"]]
+
+
+@pytest.mark.asyncio
+async def test_orderbook_cache_cancelled_caller_does_not_cancel_shared_fetch(
+    fake_redis,
+):
+    release = asyncio.Event()
+    calls: list[list[str]] = []
+
+    async def fetcher(markets):
+        calls.append(markets)
+        await release.wait()
+        return {m: _book(m) for m in markets}
+
+    cache = OrderbookCache(redis=fake_redis, fetcher=fetcher)
+    first = asyncio.create_task(cache.fetch(["KRW-BTC"]))
+    second = asyncio.create_task(cache.fetch(["KRW-BTC"]))
+    while not calls:
+        await asyncio.sleep(0)
+    for _ in range(5):
+        await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert set(await second) == {"KRW-BTC"}
+    assert calls == [["KRW-BTC"]]
+
+
+@pytest.mark.asyncio
+async def test_orderbook_cache_fetch_raises_instead_of_serving_stale(fake_redis):
+    async def fail(markets):
+        raise RuntimeError("boom")
+
+    cache = OrderbookCache(redis=fake_redis, fetcher=fail)
+    with pytest.raises(RuntimeError, match="boom"):
+        await cache.fetch(["KRW-BTC"])
+    assert await cache.fetch([]) == {}